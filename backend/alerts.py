@@ -0,0 +1,96 @@
+import asyncio
+import itertools
+import json
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Optional, Set
+
+# Pharmacy stock alerts
+#
+# The medicine write paths call medicine_alerts() with the row before and after the
+# write and publish whatever thresholds were crossed. Subscribers (pharmacist UIs)
+# receive them over a Server-Sent Events stream instead of polling low-stock scans.
+# The broker is process-local: each uvicorn worker streams the alerts raised by the
+# writes it handled.
+
+EXPIRY_WARNING_DAYS = 30
+HEARTBEAT_SECONDS = 15
+
+def expiry_state(expiry_date: date) -> Optional[str]:
+    today = date.today()
+    if expiry_date < today:
+        return "expired"
+    if expiry_date <= today + timedelta(days=EXPIRY_WARNING_DAYS):
+        return "expiring"
+    return None
+
+def medicine_alerts(medicine, before: Optional[dict] = None) -> list:
+    """Alerts for thresholds medicine crossed since before (None for a new medicine).
+
+    ``before`` holds the previous current_stock, minimum_stock and expiry_date.
+    """
+    alerts = []
+    is_low = medicine.current_stock <= medicine.minimum_stock
+    was_low = before is not None and before["current_stock"] <= before["minimum_stock"]
+    if is_low and not was_low:
+        alerts.append("low_stock")
+
+    state = expiry_state(medicine.expiry_date)
+    if state and (before is None or state != expiry_state(before["expiry_date"])):
+        alerts.append(state)
+
+    return [
+        {
+            "type": alert_type,
+            "medicine_id": medicine.id,
+            "name": medicine.name,
+            "current_stock": medicine.current_stock,
+            "minimum_stock": medicine.minimum_stock,
+            "expiry_date": medicine.expiry_date,
+            "raised_at": datetime.now()
+        }
+        for alert_type in alerts
+    ]
+
+def medicine_snapshot(medicine) -> dict:
+    return {
+        "current_stock": medicine.current_stock,
+        "minimum_stock": medicine.minimum_stock,
+        "expiry_date": medicine.expiry_date,
+    }
+
+class AlertBroker:
+    """Fans published alerts out to every connected subscriber"""
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._ids = itertools.count(1)
+
+    def publish(self, alerts: list):
+        for alert in alerts:
+            event = (next(self._ids), alert)
+            for queue in self._subscribers:
+                try:
+                    queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    # A stalled client loses its oldest alert rather than blocking writers
+                    queue.get_nowait()
+                    queue.put_nowait(event)
+
+    async def stream(self, is_disconnected) -> AsyncIterator[str]:
+        """Yield SSE frames for new alerts until is_disconnected() returns True"""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.add(queue)
+        try:
+            yield f"retry: {HEARTBEAT_SECONDS * 1000}\n\n"
+            while not await is_disconnected():
+                try:
+                    event_id, alert = await asyncio.wait_for(queue.get(), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"id: {event_id}\nevent: {alert['type']}\ndata: {json.dumps(alert, default=str)}\n\n"
+        finally:
+            self._subscribers.discard(queue)
+
+alert_broker = AlertBroker()
@@ -2,13 +2,22 @@ from fastapi import APIRouter, HTTPException, Depends
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from typing import Optional
 from datetime import datetime, timedelta
+from collections import OrderedDict
+import copy
+import time
 from jose import JWTError, jwt
-# from passlib.context import CryptContext
-import hashlib
-from backend.models import Patient, Practitioner
+from passlib.context import CryptContext
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import os
+from backend.models import Patient, Practitioner, UserDirectory
+from backend.user_directory import user_model
 from pydantic import BaseModel
 from tortoise.exceptions import DoesNotExist
-import smtplib
+from tortoise.signals import post_save, post_delete
+from tortoise.transactions import in_transaction
+from backend.email_queue import EmailQueue
+from backend.kv_store import create_store
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import random
@@ -27,15 +36,137 @@ SMTP_PORT = 587  # Gmail's SMTP port
 SMTP_USERNAME = "biomedicalwork49@gmail.com"  # Your Gmail address
 SMTP_PASSWORD = "bvnr tjdk mejr stdb"  # Your Gmail app password
 
-# Store verification codes (in production, use Redis or a database)
-verification_codes = {}
+# Outgoing mail is delivered by background workers over reused SMTP sessions
+email_queue = EmailQueue(SMTP_SERVER, SMTP_PORT, SMTP_USERNAME, SMTP_PASSWORD)
+
+# Verification codes live in an expiring store. The SQLite backend is shared by all
+# uvicorn workers on the host; set VERIFICATION_STORE=memory for a single process.
+VERIFICATION_CODE_TTL_SECONDS = 10 * 60
+VERIFICATION_STORE = os.getenv("VERIFICATION_STORE", "sqlite")
+VERIFICATION_STORE_PATH = os.getenv(
+    "VERIFICATION_STORE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "kv_store.sqlite3")
+)
+VERIFICATION_STORE_MAX_ENTRIES = int(os.getenv("VERIFICATION_STORE_MAX_ENTRIES", "10000"))
+
+verification_codes = create_store(
+    VERIFICATION_STORE, VERIFICATION_STORE_PATH, max_entries=VERIFICATION_STORE_MAX_ENTRIES
+)
+
+# Principal cache settings
+PRINCIPAL_CACHE_SIZE = 10000
+PRINCIPAL_CACHE_TTL_SECONDS = 60
+
+# Roles allowed to read operational endpoints such as the principal cache stats
+STAFF_ROLES = ["practitioner", "pharmacist", "laborist"]
+
+class PrincipalCache:
+    """Bounded LRU cache with a TTL for authenticated users.
+
+    Entries are keyed by (kind, id), where kind is "patient" or "practitioner" (the
+    table the user lives in), so every request with a valid token can skip the
+    Patient/Practitioner lookup. Writes to either model invalidate the entry through
+    the post_save/post_delete signals below; the TTL bounds staleness for bulk
+    updates that bypass signals.
+    """
+    
+    def __init__(self, maxsize: int = PRINCIPAL_CACHE_SIZE, ttl: float = PRINCIPAL_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+    
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+    
+    def put(self, key, user):
+        self._entries[key] = (time.monotonic() + self.ttl, user)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def invalidate(self, key):
+        self._entries.pop(key, None)
+    
+    def clear(self):
+        self._entries.clear()
+    
+    def stats(self) -> dict:
+        return {"size": len(self._entries), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+principal_cache = PrincipalCache()
+
+def _principal_key(user_role: str, user_id: int):
+    return ("patient" if user_role == "patient" else "practitioner", user_id)
+
+@post_save(Patient, Practitioner)
+async def _invalidate_saved_principal(sender, instance, created, using_db, update_fields):
+    principal_cache.invalidate(("patient" if sender is Patient else "practitioner", instance.id))
+
+@post_delete(Patient, Practitioner)
+async def _invalidate_deleted_principal(sender, instance, using_db):
+    principal_cache.invalidate(("patient" if sender is Patient else "practitioner", instance.id))
+
+async def _load_principal(user_role: str, user_id: int):
+    """Return the active user for a token, using the principal cache"""
+    key = _principal_key(user_role, user_id)
+    user = principal_cache.get(key)
+    if user is None:
+        if user_role == "patient":
+            user = await Patient.get_or_none(id=user_id)
+        else:
+            user = await Practitioner.get_or_none(id=user_id)
+        if user is None or not user.active:
+            return None
+        principal_cache.put(key, user)
+    return user
+
+# Password hashing
+# bcrypt cost factor and the size of the thread pool hashes run in. Legacy unsalted
+# SHA-256 hex digests still verify and are transparently rehashed with bcrypt on login.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+
+pwd_context = CryptContext(
+    schemes=["bcrypt", "hex_sha256"],
+    deprecated=["hex_sha256"],
+    bcrypt__rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+)
+
+# bcrypt releases the GIL, so a small dedicated pool keeps hashing off the event loop
+# without letting a login storm take over the default executor.
+password_hash_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
 
-# Simple password hashing (temporary solution)
 def hash_password(password: str) -> str:
-    return hashlib.sha256(password.encode()).hexdigest()
+    return pwd_context.hash(password)
 
 def verify_password(password: str, hashed: str) -> bool:
-    return hashlib.sha256(password.encode()).hexdigest() == hashed
+    return pwd_context.verify(password, hashed)
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password in the password hashing pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_hash_executor, hash_password, password)
+
+async def verify_and_update_password(password: str, hashed: str):
+    """Verify a password in the password hashing pool.
+
+    Returns (valid, new_hash); new_hash is set when the stored hash is a legacy
+    SHA-256 digest or uses a lower cost than BCRYPT_ROUNDS and should be replaced.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_hash_executor, pwd_context.verify_and_update, password, hashed)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
@@ -76,32 +207,23 @@ def send_verification_email(email: str, code: str):
     
     msg.attach(MIMEText(body, 'plain'))
 
+    # Hand off to the email queue; delivery and retries happen in the background
     try:
-        print(f"Connecting to SMTP server: {SMTP_SERVER}:{SMTP_PORT}")
-        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
-        server.starttls()
-        print("TLS started")
-        print(f"Attempting to login with username: {SMTP_USERNAME}")
-        server.login(SMTP_USERNAME, SMTP_PASSWORD)
-        print("Login successful")
-        server.send_message(msg)
-        print("Email sent successfully")
-        server.quit()
+        email_queue.enqueue(msg)
+        print("Email queued for delivery")
     except Exception as e:
-        print(f"Error sending email: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to send email: {str(e)}")
+        print(f"Error queueing email: {str(e)}")
+        raise HTTPException(status_code=503, detail="Email service is busy, please try again shortly")
 
 @router.post("/register")
 async def register(user_data: dict):
     try:
         # Check if user already exists
-        if await Patient.filter(email=user_data["email"]).exists():
-            raise HTTPException(status_code=400, detail="Email already registered")
-        if await Practitioner.filter(email=user_data["email"]).exists():
+        if await UserDirectory.filter(email=user_data["email"]).exists():
             raise HTTPException(status_code=400, detail="Email already registered")
 
         # Hash password
-        hashed_password = hash_password(user_data["password"])
+        hashed_password = await hash_password_async(user_data["password"])
         
         # Determine user role based on license number or explicit role
         user_role = user_data.get("role", "patient")
@@ -116,52 +238,53 @@ async def register(user_data: dict):
         elif license_number and user_role == "patient":
             user_role = "practitioner"
         
-        # Create user based on role
-        if user_role == "patient":
-            user = await Patient.create(
-                name=[{
-                    "use": "official",
-                    "text": user_data["name"]
-                }],
-                email=user_data["email"],
-                identifier=[{
-                    "system": "national_id",
-                    "value": user_data.get("nationalId", "")
-                }],
-                telecom=[{
-                    "system": "phone",
-                    "value": user_data.get("phone", "")
-                }],
-                birth_date=datetime.strptime(user_data["dateOfBirth"], "%Y-%m-%d").date(),
-                password_hash=hashed_password
-            )
-        else:
-            # Both practitioners and pharmacists are stored in Practitioner table
-            specialty_list = []
-            if user_role == "pharmacist":
-                specialty_list = ["Pharmacy"]
-            elif user_role == "laborist":
-                specialty_list = ["Laboratory"]
-            elif user_data.get("specialty"):
-                specialty_list = [user_data["specialty"]]
+        # Create user based on role; the user row and its directory entry commit together
+        async with in_transaction():
+            if user_role == "patient":
+                user = await Patient.create(
+                    name=[{
+                        "use": "official",
+                        "text": user_data["name"]
+                    }],
+                    email=user_data["email"],
+                    identifier=[{
+                        "system": "national_id",
+                        "value": user_data.get("nationalId", "")
+                    }],
+                    telecom=[{
+                        "system": "phone",
+                        "value": user_data.get("phone", "")
+                    }],
+                    birth_date=datetime.strptime(user_data["dateOfBirth"], "%Y-%m-%d").date(),
+                    password_hash=hashed_password
+                )
+            else:
+                # Both practitioners and pharmacists are stored in Practitioner table
+                specialty_list = []
+                if user_role == "pharmacist":
+                    specialty_list = ["Pharmacy"]
+                elif user_role == "laborist":
+                    specialty_list = ["Laboratory"]
+                elif user_data.get("specialty"):
+                    specialty_list = [user_data["specialty"]]
             
-            user = await Practitioner.create(
-                name=[{
-                    "use": "official",
-                    "text": user_data["name"]
-                }],
-                email=user_data["email"],
-                identifier=[{
-                    "system": "license",
-                    "value": license_number
-                }],
-                telecom=[{
-                    "system": "phone",
-                    "value": user_data.get("phone", "")
-                }],
-                specialty=specialty_list,
-                password_hash=hashed_password
-            )
+                user = await Practitioner.create(
+                    name=[{
+                        "use": "official",
+                        "text": user_data["name"]
+                    }],
+                    email=user_data["email"],
+                    identifier=[{
+                        "system": "license",
+                        "value": license_number
+                    }],
+                    telecom=[{
+                        "system": "phone",
+                        "value": user_data.get("phone", "")
+                    }],
+                    specialty=specialty_list,
+                    password_hash=hashed_password
+                )
 
         return {"message": "User created successfully", "user_id": user.id, "role": user_role}
     except Exception as e:
@@ -169,76 +292,45 @@ async def register(user_data: dict):
 
 @router.post("/token")
 async def login(form_data: OAuth2PasswordRequestForm = Depends()):
-    # Try to find user in both Patient and Practitioner models
-    user = None
-    user_role = None
+    # One indexed lookup gives the table, id, precomputed role and password hash
+    user = await UserDirectory.get_or_none(email=form_data.username)
     
-    # Check Patient table first
-    patient = await Patient.get_or_none(email=form_data.username)
-    if patient:
-        user = patient
-        user_role = "patient"
-    else:
-        # Check Practitioner table
-        practitioner = await Practitioner.get_or_none(email=form_data.username)
-        if practitioner:
-            user = practitioner
-            # Determine if practitioner is a pharmacist
-            license_number = ""
-            if practitioner.identifier:
-                for identifier in practitioner.identifier:
-                    if identifier.get("system") == "license":
-                        license_number = identifier.get("value", "")
-                        break
-            
-            # Check if pharmacist by license number or specialty
-            is_pharmacist = (
-                license_number.startswith('F') or 
-                (practitioner.specialty and "Pharmacy" in practitioner.specialty)
-            )
-            
-            # Check if laborist by license number or specialty
-            is_laborist = (
-                license_number.startswith('L') or 
-                (practitioner.specialty and "Laboratory" in practitioner.specialty)
-            )
-            
-            if is_pharmacist:
-                user_role = "pharmacist"
-            elif is_laborist:
-                user_role = "laborist"
-            else:
-                user_role = "practitioner"
+    password_valid, new_hash = False, None
+    if user:
+        password_valid, new_hash = await verify_and_update_password(form_data.password, user.password_hash)
     
-    if not user or not verify_password(form_data.password, user.password_hash):
+    if not password_valid:
         raise HTTPException(
             status_code=401,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    
+    # Deactivated accounts would get a token that every later request rejects
+    if not user.active:
+        raise HTTPException(status_code=403, detail="Account is inactive")
+    
+    # Upgrade legacy or low-cost hashes now that we know the plaintext
+    if new_hash:
+        account = await user_model(user).get(id=user.user_id)
+        account.password_hash = new_hash
+        await account.save(update_fields=["password_hash"])
 
     # Create access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email, "id": user.id, "role": user_role},
+        data={"sub": user.email, "id": user.user_id, "role": user.role},
         expires_delta=access_token_expires
     )
 
-    # Extract name from FHIR HumanName structure
-    name = ""
-    if isinstance(user.name, list) and len(user.name) > 0:
-        name = user.name[0].get("text", "")
-    elif isinstance(user.name, dict):
-        name = user.name.get("text", "")
-
     return {
         "access_token": access_token,
         "token_type": "bearer",
         "user": {
-            "id": user.id,
+            "id": user.user_id,
             "email": user.email,
-            "name": name,
-            "role": user_role
+            "name": user.display_name,
+            "role": user.role
         }
     }
 
@@ -250,16 +342,14 @@ class UserDetails(BaseModel):
 async def verify_user_details(details: UserDetails):
     try:
         # Check if user exists with the provided email
-        patient = await Patient.filter(email=details.email).first()
-        practitioner = await Practitioner.filter(email=details.email).first()
+        user = await UserDirectory.get_or_none(email=details.email)
         
-        if not patient and not practitioner:
+        if not user:
             raise HTTPException(status_code=404, detail="User not found with this email")
         
         # Verify mobile number
-        user = patient or practitioner
-        if user.telecom and any(t.get('value') == details.mobileNumber for t in user.telecom):
-            return {"message": "Details verified successfully", "userId": user.id}
+        if details.mobileNumber in user.phones:
+            return {"message": "Details verified successfully", "userId": user.user_id}
         else:
             raise HTTPException(status_code=400, detail="Mobile number does not match our records")
             
@@ -274,31 +364,28 @@ class ResetCodeRequest(BaseModel):
 async def send_reset_code(request: ResetCodeRequest):
     try:
         # Check if user exists with the provided email
-        patient = await Patient.filter(email=request.email).first()
-        practitioner = await Practitioner.filter(email=request.email).first()
+        user = await UserDirectory.get_or_none(email=request.email)
         
-        if not patient and not practitioner:
+        if not user:
             raise HTTPException(status_code=404, detail="User not found with this email")
         
         # Verify mobile number
-        user = patient or practitioner
-        if not user.telecom or not any(t.get('value') == request.mobileNumber for t in user.telecom):
+        if request.mobileNumber not in user.phones:
             raise HTTPException(status_code=400, detail="Mobile number does not match our records")
         
         # Generate verification code
         code = generate_verification_code()
         
         # Store the code with expiration (10 minutes)
-        verification_codes[request.email] = {
-            'code': code,
-            'expires': datetime.utcnow() + timedelta(minutes=10)
-        }
+        await verification_codes.set(request.email, {'code': code}, VERIFICATION_CODE_TTL_SECONDS)
         
         # Send verification code via email
         send_verification_email(request.email, code)
         
         return {"message": "Verification code sent successfully"}
             
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -310,15 +397,10 @@ class VerifyCodeRequest(BaseModel):
 @router.post("/verify-reset-code")
 async def verify_reset_code(request: VerifyCodeRequest):
     try:
-        # Check if verification code exists and is valid
-        stored_data = verification_codes.get(request.email)
+        # Check if verification code exists and is valid (expired codes are never returned)
+        stored_data = await verification_codes.get(request.email)
         if not stored_data:
-            raise HTTPException(status_code=400, detail="No verification code found. Please request a new code.")
-        
-        # Check if code has expired
-        if datetime.utcnow() > stored_data['expires']:
-            del verification_codes[request.email]
-            raise HTTPException(status_code=400, detail="Verification code has expired. Please request a new code.")
+            raise HTTPException(status_code=400, detail="No valid verification code found. It may have expired. Please request a new code.")
         
         # Verify the code
         if stored_data['code'] != request.code:
@@ -331,7 +413,7 @@ async def verify_reset_code(request: VerifyCodeRequest):
         )
         
         # Remove the used code
-        del verification_codes[request.email]
+        await verification_codes.delete(request.email)
         
         return {"message": "Code verified successfully", "token": reset_token}
             
@@ -347,19 +429,18 @@ class ResetPasswordRequest(BaseModel):
 async def reset_password(request: ResetPasswordRequest):
     try:
         # Find the user
-        patient = await Patient.filter(email=request.email).first()
-        practitioner = await Practitioner.filter(email=request.email).first()
-        if not patient and not practitioner:
+        user = await UserDirectory.get_or_none(email=request.email)
+        if not user:
             raise HTTPException(status_code=404, detail="User not found")
         # Verify mobile number
-        user = patient or practitioner
-        if not user.telecom or not any(t.get('value') == request.mobileNumber for t in user.telecom):
+        if request.mobileNumber not in user.phones:
             raise HTTPException(status_code=400, detail="Mobile number does not match our records")
         # Hash the new password
-        hashed_password = hash_password(request.newPassword)
-        # Update the user's password
-        user.password_hash = hashed_password
-        await user.save()
+        hashed_password = await hash_password_async(request.newPassword)
+        # Update the user's password (the save signal refreshes the directory entry)
+        account = await user_model(user).get(id=user.user_id)
+        account.password_hash = hashed_password
+        await account.save(update_fields=["password_hash"])
         return {"message": "Password reset successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -380,11 +461,8 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
     except JWTError:
         raise credentials_exception
     
-    # Get user from database based on role
-    if user_role == "patient":
-        user = await Patient.get_or_none(id=user_id)
-    else:
-        user = await Practitioner.get_or_none(id=user_id)
+    # Get user based on role (cached)
+    user = await _load_principal(user_role, user_id)
     
     if user is None:
         raise credentials_exception
@@ -415,10 +493,20 @@ async def get_current_practitioner(token: str = Depends(oauth2_scheme)):
             detail="Access denied. Only practitioners can access this resource."
         )
     
-    # Get practitioner from database
-    practitioner = await Practitioner.get_or_none(id=user_id)
+    # Get practitioner (cached)
+    practitioner = await _load_principal(user_role, user_id)
     
     if practitioner is None:
         raise credentials_exception
     
-    return practitioner 
\ No newline at end of file
+    # The cached instance is shared across requests. Handlers only read it or pass it as a
+    # foreign key, so a shallow copy is enough to keep attribute writes per request; the
+    # JSON fields (name, telecom, specialty...) stay shared and must not be mutated.
+    return copy.copy(practitioner)
+
+@router.get("/principal-cache/stats")
+async def get_principal_cache_stats(current_user: dict = Depends(get_current_user)):
+    """Hit/miss counters for the authenticated-user cache (staff only)"""
+    if current_user["role"] not in STAFF_ROLES:
+        raise HTTPException(status_code=403, detail="Access denied")
+    return principal_cache.stats()
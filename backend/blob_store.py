@@ -0,0 +1,68 @@
+import asyncio
+import glob
+import os
+import uuid
+from fastapi import UploadFile
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+from backend.models import Blob
+from backend.uploads import MAX_UPLOAD_BYTES, hash_upload, remove_file, save_upload
+
+# Content-addressed blob store
+#
+# Uploaded files are stored once per distinct content under BLOB_DIR/<sha[:2]>/<sha>
+# and shared by every MedicalUpload/MedicalDocument row with that hash. Each Blob row
+# counts its references. An upload is hashed first without writing anything; if the
+# blob already exists only its reference count goes up, otherwise the file is written
+# to a temporary path and moved into place. Reference changes and the file move or
+# removal happen inside one transaction, so a blob being released and the same
+# content being uploaded again cannot lose the file. Files derived from a blob (its
+# thumbnails) live next to it as <sha>.<name> and are removed together with it.
+
+BLOB_DIR = os.getenv("BLOB_DIR", "uploads/blobs")
+
+def blob_path(sha256: str) -> str:
+    return os.path.join(BLOB_DIR, sha256[:2], sha256)
+
+async def add_reference(sha256: str, connection=None) -> bool:
+    """Count one more reference to an existing blob; False if there is no such blob"""
+    updated = await Blob.filter(sha256=sha256).using_db(connection).update(ref_count=F("ref_count") + 1)
+    return updated > 0
+
+async def store_upload(file: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> Blob:
+    """Store an uploaded file (or reference the identical blob already stored) and return its Blob"""
+    _, sha256 = await hash_upload(file, max_bytes)
+    if await add_reference(sha256):
+        return await Blob.get(sha256=sha256)
+    
+    # New content: stream it to a temporary file, then move it into the store
+    await file.seek(0)
+    stored = await save_upload(file, os.path.join(BLOB_DIR, "tmp", uuid.uuid4().hex), max_bytes)
+    return await adopt_file(stored.path, stored.size, stored.sha256)
+
+async def adopt_file(path: str, size: int, sha256: str) -> Blob:
+    """Move a file with a known hash into the store (or drop it if the blob exists)"""
+    async with in_transaction() as connection:
+        if await add_reference(sha256, connection):
+            await asyncio.to_thread(remove_file, path)
+            return await Blob.get(sha256=sha256, using_db=connection)
+        await asyncio.to_thread(_move, path, blob_path(sha256))
+        return await Blob.create(sha256=sha256, size=size, ref_count=1, using_db=connection)
+
+async def release_blob(sha256: str):
+    """Drop one reference; the blob and its file are deleted with the last one"""
+    async with in_transaction() as connection:
+        await Blob.filter(sha256=sha256).using_db(connection).update(ref_count=F("ref_count") - 1)
+        deleted = await Blob.filter(sha256=sha256, ref_count__lte=0).using_db(connection).delete()
+        if deleted:
+            await asyncio.to_thread(_remove_blob_files, sha256)
+
+def _remove_blob_files(sha256: str):
+    path = blob_path(sha256)
+    for derived in glob.glob(glob.escape(path) + ".*"):
+        remove_file(derived)
+    remove_file(path)
+
+def _move(source: str, destination: str):
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    os.replace(source, destination)
@@ -0,0 +1,16 @@
+# Database configuration
+#
+# Shared by the API (main.py), the aerich migrations (pyproject.toml) and command-line
+# tools such as `python -m backend.text_extraction reindex`, so they all open the same
+# database.
+TORTOISE_ORM = {
+    "connections": {
+        "default": "sqlite://backend/db.sqlite3"
+    },
+    "apps": {
+        "models": {
+            "models": ["backend.models", "aerich.models"],
+            "default_connection": "default",
+        }
+    }
+}
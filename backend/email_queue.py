@@ -0,0 +1,156 @@
+import asyncio
+import smtplib
+from email.message import Message
+from typing import List, Optional, Tuple
+
+# Outbound email queue
+#
+# Request handlers enqueue messages and return immediately. Background workers drain
+# the queue in batches, each over a long-lived authenticated SMTP session that is
+# reused across batches (checked with NOOP and reopened when the server drops it).
+# smtplib is blocking, so every SMTP round trip runs in a worker thread. Failed
+# messages are retried with exponential backoff and dropped after max_retries.
+
+class EmailQueue:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = True,
+        workers: int = 2,
+        batch_size: int = 20,
+        max_retries: int = 3,
+        backoff_seconds: float = 1.0,
+        maxsize: int = 1000,
+        timeout: float = 30.0
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.sent = 0
+        self.failed = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._retry_handles = set()
+
+    def enqueue(self, message: Message):
+        """Queue a message for delivery without waiting for SMTP.
+
+        Raises asyncio.QueueFull when the queue is at capacity.
+        """
+        self._ensure_started()
+        self._queue.put_nowait((message, 0))
+
+    def _ensure_started(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self, timeout: float = 10.0):
+        """Wait (up to timeout) for queued messages to be delivered, then stop the workers"""
+        if self._queue is not None and self._tasks:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout)
+            except asyncio.TimeoutError:
+                print(f"Email queue stopped with {self._queue.qsize()} undelivered messages")
+        for handle in self._retry_handles:
+            handle.cancel()
+        self._retry_handles.clear()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self):
+        session = None
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                while len(batch) < self.batch_size and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                try:
+                    session, failed = await asyncio.to_thread(self._send_batch, session, batch)
+                except Exception as e:
+                    print(f"Error sending email batch: {str(e)}")
+                    session, failed = None, [(item, e) for item in batch]
+                self.sent += len(batch) - len(failed)
+                for item, error in failed:
+                    self._retry(item, error)
+                for _ in batch:
+                    self._queue.task_done()
+        finally:
+            if session is not None:
+                await asyncio.to_thread(self._close_session, session)
+
+    def _retry(self, item: Tuple[Message, int], error: Exception):
+        message, attempt = item
+        if attempt >= self.max_retries:
+            self.failed += 1
+            print(f"Giving up on email to {message['To']} after {attempt + 1} attempts: {str(error)}")
+            return
+        delay = self.backoff_seconds * (2 ** attempt)
+        loop = asyncio.get_running_loop()
+
+        def requeue():
+            self._retry_handles.discard(handle)
+            try:
+                self._queue.put_nowait((message, attempt + 1))
+            except asyncio.QueueFull:
+                self.failed += 1
+                print(f"Email queue full, dropping retry for {message['To']}")
+
+        handle = loop.call_later(delay, requeue)
+        self._retry_handles.add(handle)
+
+    # The methods below run in a worker thread
+
+    def _open_session(self) -> smtplib.SMTP:
+        session = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.use_tls:
+            session.starttls()
+        if self.username:
+            session.login(self.username, self.password)
+        return session
+
+    def _close_session(self, session: smtplib.SMTP):
+        try:
+            session.quit()
+        except OSError:
+            session.close()
+
+    def _session_alive(self, session: smtplib.SMTP) -> bool:
+        try:
+            return session.noop()[0] == 250
+        except OSError:
+            return False
+
+    def _send_batch(self, session: Optional[smtplib.SMTP], batch):
+        """Send a batch over one session; returns the session to reuse and the failed items"""
+        if session is None or not self._session_alive(session):
+            if session is not None:
+                self._close_session(session)
+            session = self._open_session()
+
+        failed = []
+        for index, item in enumerate(batch):
+            try:
+                session.send_message(item[0])
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+                failed.append((item, e))
+            except OSError as e:
+                # The connection is gone (SMTPException is an OSError); retry this and the
+                # rest of the batch later
+                self._close_session(session)
+                return None, failed + [(rest, e) for rest in batch[index:]]
+        return session, failed
@@ -0,0 +1,173 @@
+from abc import ABC, abstractmethod
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+# Expiring key-value stores
+#
+# Short-lived values such as password reset codes live here instead of in module-level
+# dicts. Every store has O(1) get/set, drops entries once their TTL has passed and
+# holds at most max_entries values, evicting the oldest first. MemoryExpiringStore is
+# process-local; SQLiteExpiringStore keeps its data in a SQLite file so every uvicorn
+# worker on the host sees the same values.
+
+class ExpiringStore(ABC):
+    """Interface shared by the expiring stores"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the value for key, or None if it is missing or expired"""
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float):
+        """Store value under key for ttl seconds"""
+
+    @abstractmethod
+    async def delete(self, key: str):
+        """Remove key if present"""
+
+class MemoryExpiringStore(ExpiringStore):
+    """In-process store with lazy expiry on read and a periodic TTL sweeper"""
+
+    def __init__(self, max_entries: int = 10000, sweep_interval: float = 60.0):
+        self.max_entries = max_entries
+        self.sweep_interval = sweep_interval
+        self._entries = OrderedDict()  # key -> (expires_at, value), oldest write first
+        self._sweeper: Optional[asyncio.Task] = None
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.time():
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    async def set(self, key: str, value: Any, ttl: float):
+        self._ensure_sweeper()
+        self._entries.pop(key, None)
+        self._entries[key] = (time.time() + ttl, value)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str):
+        self._entries.pop(key, None)
+
+    def sweep(self) -> int:
+        """Remove expired entries and return how many were removed"""
+        now = time.time()
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        return len(expired)
+
+    def _ensure_sweeper(self):
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_forever())
+
+    async def _sweep_forever(self):
+        while self._entries:
+            await asyncio.sleep(self.sweep_interval)
+            self.sweep()
+
+class SQLiteExpiringStore(ExpiringStore):
+    """Store backed by a SQLite file, shared by every process that opens the same path.
+
+    Expired rows are never returned and are purged every sweep_every writes. A write
+    that takes the table over max_entries evicts the entries closest to expiry, so the
+    table never holds more than max_entries rows.
+    """
+
+    def __init__(self, path: str, max_entries: int = 100000, sweep_every: int = 100):
+        self.path = path
+        self.max_entries = max_entries
+        self.sweep_every = sweep_every
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # kv_store_meta holds the row count, kept by triggers, so writes can check the
+            # cap without counting the table; it starts from the rows already stored
+            conn.execute("BEGIN IMMEDIATE")
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS kv_store ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_kv_store_expires_at ON kv_store (expires_at)")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS kv_store_meta ("
+                    "id INTEGER PRIMARY KEY CHECK (id = 0), entries INTEGER NOT NULL)"
+                )
+                conn.execute("INSERT OR IGNORE INTO kv_store_meta (id, entries) SELECT 0, COUNT(*) FROM kv_store")
+                conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS kv_store_count_insert AFTER INSERT ON kv_store "
+                    "BEGIN UPDATE kv_store_meta SET entries = entries + 1 WHERE id = 0; END"
+                )
+                conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS kv_store_count_delete AFTER DELETE ON kv_store "
+                    "BEGIN UPDATE kv_store_meta SET entries = entries - 1 WHERE id = 0; END"
+                )
+            self._conn = conn
+        return self._conn
+
+    def _get(self, key: str):
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value FROM kv_store WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _set(self, key: str, value: Any, ttl: float):
+        with self._lock:
+            conn = self._connect()
+            now = time.time()
+            conn.execute("BEGIN IMMEDIATE")
+            with conn:
+                # An upsert rather than INSERT OR REPLACE: REPLACE deletes the old row
+                # without firing the delete trigger, which would skew the row count
+                conn.execute(
+                    "INSERT INTO kv_store (key, value, expires_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at",
+                    (key, json.dumps(value, default=str), now + ttl)
+                )
+                self._writes += 1
+                if self._writes % self.sweep_every == 0:
+                    conn.execute("DELETE FROM kv_store WHERE expires_at <= ?", (now,))
+                # Enforce the cap by evicting the entries closest to expiry
+                excess = conn.execute("SELECT entries FROM kv_store_meta WHERE id = 0").fetchone()[0] - self.max_entries
+                if excess > 0:
+                    conn.execute(
+                        "DELETE FROM kv_store WHERE key IN (SELECT key FROM kv_store ORDER BY expires_at LIMIT ?)",
+                        (excess,)
+                    )
+
+    def _delete(self, key: str):
+        with self._lock:
+            self._connect().execute("DELETE FROM kv_store WHERE key = ?", (key,))
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: Any, ttl: float):
+        await asyncio.to_thread(self._set, key, value, ttl)
+
+    async def delete(self, key: str):
+        await asyncio.to_thread(self._delete, key)
+
+def create_store(backend: str, path: Optional[str] = None, max_entries: int = 10000) -> ExpiringStore:
+    """Build a store from configuration ("memory" or "sqlite")"""
+    if backend == "memory":
+        return MemoryExpiringStore(max_entries=max_entries)
+    if backend == "sqlite":
+        return SQLiteExpiringStore(path, max_entries=max_entries)
+    raise ValueError(f"Unknown store backend: {backend}")
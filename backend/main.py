@@ -1,9 +1,16 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from tortoise.contrib.fastapi import register_tortoise
-from backend.auth import router as auth_router
-from backend.models import Patient, Practitioner, Practitioner_Pydantic
-from typing import List, Dict, Any
+from tortoise.transactions import in_transaction
+from backend.auth import router as auth_router, email_queue
+from backend.config import TORTOISE_ORM
+from backend.models import Patient, Practitioner, Patient_Pydantic, Practitioner_Pydantic
+from backend.pagination import paginate, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from backend.search import ensure_search_indexes
+from backend.patient_search import sync_missing_patients
+from backend.thumbnails import shutdown_thumbnail_pool
+from backend.text_extraction import text_extraction_queue
+from typing import List, Dict, Any, Optional
 from backend.routers import appointments, pharmacy, laborist, medical_records
 
 app = FastAPI(
@@ -28,19 +35,6 @@ app.include_router(pharmacy.router, prefix="/api/pharmacy", tags=["pharmacy"])
 app.include_router(laborist.router, prefix="/api/laborist", tags=["laborist"])
 app.include_router(medical_records.router, prefix="/api/medical-records", tags=["medical-records"])
 
-# Database configuration
-TORTOISE_ORM = {
-    "connections": {
-        "default": "sqlite://backend/db.sqlite3"
-    },
-    "apps": {
-        "models": {
-            "models": ["backend.models", "aerich.models"],
-            "default_connection": "default",
-        }
-    }
-}
-
 # Register Tortoise ORM
 register_tortoise(
     app,
@@ -49,6 +43,35 @@ register_tortoise(
     add_exception_handlers=True,
 )
 
+@app.on_event("startup")
+async def create_search_indexes():
+    await sync_missing_patients()
+    await ensure_search_indexes()
+
+@app.on_event("startup")
+async def start_text_extraction():
+    text_extraction_queue.start()
+
+@app.on_event("startup")
+async def start_upload_session_collector():
+    laborist.start_upload_session_gc()
+
+@app.on_event("shutdown")
+async def flush_email_queue():
+    await email_queue.stop()
+
+@app.on_event("shutdown")
+async def stop_thumbnail_workers():
+    shutdown_thumbnail_pool()
+
+@app.on_event("shutdown")
+async def stop_text_extraction():
+    await text_extraction_queue.stop()
+
+@app.on_event("shutdown")
+async def stop_upload_session_collector():
+    await laborist.stop_upload_session_gc()
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to Aura Hospital API"}
@@ -56,13 +79,20 @@ async def root():
 # Patient endpoints
 @app.post("/patients/")
 async def create_patient(patient_data: Dict[str, Any]):
-    patient = await Patient.create(**patient_data)
+    # One transaction, so a rejected directory entry never leaves an orphaned patient
+    async with in_transaction():
+        patient = await Patient.create(**patient_data)
     return await patient
 
 @app.get("/patients/", response_model=List[Dict[str, Any]])
-async def get_patients():
-    patients = await Patient.all()
-    return [await patient for patient in patients]
+async def get_patients(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+):
+    patients = await paginate(Patient.all(), request, response, cursor, limit)
+    return [Patient_Pydantic.model_validate(patient).dict() for patient in patients]
 
 @app.get("/patients/{patient_id}", response_model=Dict[str, Any])
 async def get_patient(patient_id: int):
@@ -74,12 +104,19 @@ async def get_patient(patient_id: int):
 # Practitioner endpoints
 @app.post("/practitioners/")
 async def create_practitioner(practitioner_data: Dict[str, Any]):
-    practitioner = await Practitioner.create(**practitioner_data)
+    async with in_transaction():
+        practitioner = await Practitioner.create(**practitioner_data)
     return await practitioner
 
 @app.get("/practitioners/", response_model=List[Practitioner_Pydantic])
-async def get_practitioners():
-    return await Practitioner_Pydantic.from_queryset(Practitioner.all())
+async def get_practitioners(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+):
+    practitioners = await paginate(Practitioner.all(), request, response, cursor, limit)
+    return [Practitioner_Pydantic.model_validate(practitioner) for practitioner in practitioners]
 
 @app.get("/practitioners/{practitioner_id}", response_model=Dict[str, Any])
 async def get_practitioner(practitioner_id: int):
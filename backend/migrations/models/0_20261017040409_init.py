@@ -0,0 +1,538 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "medicines" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "name" VARCHAR(255) NOT NULL,
+    "generic_name" VARCHAR(255) NOT NULL,
+    "brand_name" VARCHAR(255),
+    "manufacturer" VARCHAR(255) NOT NULL,
+    "dosage_form" VARCHAR(100) NOT NULL,
+    "strength" VARCHAR(100) NOT NULL,
+    "category" VARCHAR(100) NOT NULL,
+    "description" TEXT,
+    "unit_price" VARCHAR(40) NOT NULL,
+    "current_stock" INT NOT NULL,
+    "minimum_stock" INT NOT NULL,
+    "expiry_date" DATE NOT NULL,
+    "batch_number" VARCHAR(100) NOT NULL,
+    "barcode" VARCHAR(100),
+    "prescription_required" INT NOT NULL,
+    "active" INT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL
+);
+CREATE TABLE IF NOT EXISTS "patients" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "identifier" JSON NOT NULL,
+    "active" INT NOT NULL,
+    "name" JSON NOT NULL,
+    "telecom" JSON NOT NULL,
+    "email" VARCHAR(255) NOT NULL UNIQUE,
+    "gender" VARCHAR(10),
+    "birth_date" DATE,
+    "address" JSON,
+    "marital_status" JSON,
+    "communication" JSON NOT NULL,
+    "password_hash" VARCHAR(255) NOT NULL
+);
+CREATE TABLE IF NOT EXISTS "family_history" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "relationship" VARCHAR(50) NOT NULL,
+    "condition" VARCHAR(255) NOT NULL,
+    "age_of_onset" INT,
+    "age_at_death" INT,
+    "cause_of_death" VARCHAR(255),
+    "status" VARCHAR(20) NOT NULL,
+    "notes" TEXT,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE
+) /* Patient family medical history */;
+CREATE TABLE IF NOT EXISTS "practitioners" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "identifier" JSON NOT NULL,
+    "active" INT NOT NULL,
+    "name" JSON NOT NULL,
+    "telecom" JSON NOT NULL,
+    "email" VARCHAR(255) NOT NULL UNIQUE,
+    "gender" VARCHAR(10),
+    "birth_date" DATE,
+    "address" JSON,
+    "qualification" JSON NOT NULL,
+    "specialty" JSON NOT NULL,
+    "organization" JSON,
+    "password_hash" VARCHAR(255) NOT NULL
+);
+CREATE TABLE IF NOT EXISTS "appointments" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "date" DATE NOT NULL,
+    "time" VARCHAR(5) NOT NULL,
+    "duration" INT NOT NULL,
+    "status" VARCHAR(20) NOT NULL,
+    "reason" TEXT NOT NULL,
+    "notes" TEXT,
+    "follow_up" INT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "doctor_id" INT NOT NULL REFERENCES "practitioners" ("id") ON DELETE CASCADE,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS "lab_tests" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "test_type" VARCHAR(100) NOT NULL,
+    "test_name" VARCHAR(255) NOT NULL,
+    "status" VARCHAR(20) NOT NULL,
+    "urgent" INT NOT NULL,
+    "scheduled_date" DATE NOT NULL,
+    "scheduled_time" VARCHAR(5),
+    "completed_date" TIMESTAMP,
+    "instructions" TEXT,
+    "results" JSON,
+    "notes" TEXT,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "laborist_id" INT REFERENCES "practitioners" ("id") ON DELETE CASCADE,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE,
+    "requested_by_id" INT NOT NULL REFERENCES "practitioners" ("id") ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS "laborist_records" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "department" VARCHAR(100) NOT NULL,
+    "shift" VARCHAR(20) NOT NULL,
+    "certifications" JSON NOT NULL,
+    "experience_years" INT NOT NULL,
+    "specializations" JSON NOT NULL,
+    "work_schedule" JSON NOT NULL,
+    "emergency_contact" JSON,
+    "bio" TEXT,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "laborist_id" INT NOT NULL UNIQUE REFERENCES "practitioners" ("id") ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS "medical_records" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "record_type" VARCHAR(50) NOT NULL,
+    "title" VARCHAR(255) NOT NULL,
+    "description" TEXT,
+    "date_of_service" TIMESTAMP NOT NULL,
+    "department" VARCHAR(100) NOT NULL,
+    "facility" VARCHAR(255) NOT NULL,
+    "chief_complaint" TEXT,
+    "clinical_summary" TEXT,
+    "treatment_plan" TEXT,
+    "follow_up_instructions" TEXT,
+    "discharge_notes" TEXT,
+    "status" VARCHAR(20) NOT NULL,
+    "confidentiality_level" VARCHAR(20) NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "created_by_id" INT NOT NULL REFERENCES "practitioners" ("id") ON DELETE CASCADE,
+    "last_updated_by_id" INT REFERENCES "practitioners" ("id") ON DELETE CASCADE,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE
+) /* Main medical record that consolidates all patient medical information */;
+CREATE TABLE IF NOT EXISTS "clinical_notes" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "note_type" VARCHAR(50) NOT NULL,
+    "note_date" TIMESTAMP NOT NULL,
+    "subjective" TEXT,
+    "objective" TEXT,
+    "assessment" TEXT,
+    "plan" TEXT,
+    "note_content" TEXT NOT NULL,
+    "priority" VARCHAR(20) NOT NULL,
+    "signed" INT NOT NULL,
+    "signed_date" TIMESTAMP,
+    "amended" INT NOT NULL,
+    "amendment_reason" TEXT,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "author_id" INT NOT NULL REFERENCES "practitioners" ("id") ON DELETE CASCADE,
+    "medical_record_id" INT REFERENCES "medical_records" ("id") ON DELETE CASCADE,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE
+) /* Clinical notes and observations */;
+CREATE TABLE IF NOT EXISTS "diagnoses" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "icd_10_code" VARCHAR(10),
+    "diagnosis_name" VARCHAR(255) NOT NULL,
+    "diagnosis_type" VARCHAR(50) NOT NULL,
+    "onset_date" DATE,
+    "resolved_date" DATE,
+    "severity" VARCHAR(20),
+    "status" VARCHAR(20) NOT NULL,
+    "clinical_notes" TEXT,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "diagnosed_by_id" INT NOT NULL REFERENCES "practitioners" ("id") ON DELETE CASCADE,
+    "medical_record_id" INT REFERENCES "medical_records" ("id") ON DELETE CASCADE,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE
+) /* Patient diagnoses */;
+CREATE TABLE IF NOT EXISTS "lab_results" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "test_name" VARCHAR(255) NOT NULL,
+    "component_name" VARCHAR(255) NOT NULL,
+    "result_value" VARCHAR(100) NOT NULL,
+    "result_unit" VARCHAR(50),
+    "reference_range" VARCHAR(100),
+    "abnormal_flag" VARCHAR(20),
+    "result_status" VARCHAR(20) NOT NULL,
+    "test_date" TIMESTAMP NOT NULL,
+    "reported_date" TIMESTAMP NOT NULL,
+    "performing_lab" VARCHAR(255) NOT NULL,
+    "lab_technician" VARCHAR(255),
+    "notes" TEXT,
+    "lab_test_id" INT REFERENCES "lab_tests" ("id") ON DELETE CASCADE,
+    "medical_record_id" INT REFERENCES "medical_records" ("id") ON DELETE CASCADE,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE
+) /* Detailed lab test results */;
+CREATE TABLE IF NOT EXISTS "medical_documents" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "document_type" VARCHAR(50) NOT NULL,
+    "title" VARCHAR(255) NOT NULL,
+    "description" TEXT,
+    "file_name" VARCHAR(255) NOT NULL,
+    "original_filename" VARCHAR(255) NOT NULL,
+    "file_path" VARCHAR(500) NOT NULL,
+    "file_type" VARCHAR(50) NOT NULL,
+    "file_size" INT NOT NULL,
+    "mime_type" VARCHAR(100) NOT NULL,
+    "provider_name" VARCHAR(255),
+    "document_date" DATE,
+    "extracted_text" TEXT,
+    "metadata" JSON,
+    "tags" JSON NOT NULL,
+    "status" VARCHAR(20) NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "medical_record_id" INT REFERENCES "medical_records" ("id") ON DELETE CASCADE,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE,
+    "uploaded_by_id" INT NOT NULL REFERENCES "practitioners" ("id") ON DELETE CASCADE
+) /* Medical documents and files */;
+CREATE TABLE IF NOT EXISTS "medical_procedures" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "cpt_code" VARCHAR(10),
+    "procedure_name" VARCHAR(255) NOT NULL,
+    "procedure_type" VARCHAR(100) NOT NULL,
+    "body_site" VARCHAR(100),
+    "procedure_date" TIMESTAMP NOT NULL,
+    "duration_minutes" INT,
+    "anesthesia_type" VARCHAR(50),
+    "complications" TEXT,
+    "outcome" VARCHAR(50),
+    "post_op_instructions" TEXT,
+    "procedure_notes" TEXT,
+    "follow_up_required" INT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL,
+    "medical_record_id" INT REFERENCES "medical_records" ("id") ON DELETE CASCADE,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE,
+    "performed_by_id" INT NOT NULL REFERENCES "practitioners" ("id") ON DELETE CASCADE
+) /* Medical procedures performed */;
+CREATE TABLE IF NOT EXISTS "patient_allergies" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "allergen" VARCHAR(255) NOT NULL,
+    "allergen_type" VARCHAR(50) NOT NULL,
+    "reaction" TEXT NOT NULL,
+    "severity" VARCHAR(20) NOT NULL,
+    "onset_date" DATE,
+    "verified" INT NOT NULL,
+    "status" VARCHAR(20) NOT NULL,
+    "notes" TEXT,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "medical_record_id" INT REFERENCES "medical_records" ("id") ON DELETE CASCADE,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE,
+    "verified_by_id" INT REFERENCES "practitioners" ("id") ON DELETE CASCADE
+) /* Patient allergies and adverse reactions */;
+CREATE TABLE IF NOT EXISTS "patient_medications" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "medication_name" VARCHAR(255) NOT NULL,
+    "dosage" VARCHAR(100) NOT NULL,
+    "frequency" VARCHAR(100) NOT NULL,
+    "route" VARCHAR(50) NOT NULL,
+    "start_date" DATE NOT NULL,
+    "end_date" DATE,
+    "indication" VARCHAR(255) NOT NULL,
+    "status" VARCHAR(20) NOT NULL,
+    "adherence" VARCHAR(20),
+    "side_effects" TEXT,
+    "notes" TEXT,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "medical_record_id" INT REFERENCES "medical_records" ("id") ON DELETE CASCADE,
+    "medicine_id" INT REFERENCES "medicines" ("id") ON DELETE CASCADE,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE,
+    "prescribed_by_id" INT NOT NULL REFERENCES "practitioners" ("id") ON DELETE CASCADE
+) /* Current and past medications */;
+CREATE TABLE IF NOT EXISTS "prescriptions" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "dosage" VARCHAR(100) NOT NULL,
+    "frequency" VARCHAR(100) NOT NULL,
+    "duration" VARCHAR(100) NOT NULL,
+    "quantity_prescribed" INT NOT NULL,
+    "quantity_dispensed" INT NOT NULL,
+    "instructions" TEXT,
+    "status" VARCHAR(20) NOT NULL,
+    "prescribed_date" TIMESTAMP NOT NULL,
+    "dispensed_date" TIMESTAMP,
+    "medicine_id" INT NOT NULL REFERENCES "medicines" ("id") ON DELETE CASCADE,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE,
+    "pharmacist_id" INT REFERENCES "practitioners" ("id") ON DELETE CASCADE,
+    "prescriber_id" INT NOT NULL REFERENCES "practitioners" ("id") ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS "scans" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "scan_type" VARCHAR(100) NOT NULL,
+    "body_part" VARCHAR(100) NOT NULL,
+    "status" VARCHAR(20) NOT NULL,
+    "urgent" INT NOT NULL,
+    "scheduled_date" DATE NOT NULL,
+    "scheduled_time" VARCHAR(5),
+    "completed_date" TIMESTAMP,
+    "instructions" TEXT,
+    "findings" TEXT,
+    "image_urls" JSON NOT NULL,
+    "notes" TEXT,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "laborist_id" INT REFERENCES "practitioners" ("id") ON DELETE CASCADE,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE,
+    "requested_by_id" INT NOT NULL REFERENCES "practitioners" ("id") ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS "imaging_results" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "study_type" VARCHAR(100) NOT NULL,
+    "body_region" VARCHAR(100) NOT NULL,
+    "contrast_used" INT NOT NULL,
+    "contrast_type" VARCHAR(100),
+    "technique" TEXT,
+    "findings" TEXT NOT NULL,
+    "impression" TEXT NOT NULL,
+    "recommendations" TEXT,
+    "image_count" INT NOT NULL,
+    "image_urls" JSON NOT NULL,
+    "study_date" TIMESTAMP NOT NULL,
+    "reported_date" TIMESTAMP NOT NULL,
+    "facility" VARCHAR(255) NOT NULL,
+    "accession_number" VARCHAR(100),
+    "medical_record_id" INT REFERENCES "medical_records" ("id") ON DELETE CASCADE,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE,
+    "radiologist_id" INT NOT NULL REFERENCES "practitioners" ("id") ON DELETE CASCADE,
+    "scan_id" INT REFERENCES "scans" ("id") ON DELETE CASCADE
+) /* Detailed imaging results */;
+CREATE TABLE IF NOT EXISTS "medical_uploads" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "file_name" VARCHAR(255) NOT NULL,
+    "original_name" VARCHAR(255) NOT NULL,
+    "file_path" VARCHAR(500) NOT NULL,
+    "file_type" VARCHAR(100) NOT NULL,
+    "file_size" INT NOT NULL,
+    "description" TEXT,
+    "uploaded_at" TIMESTAMP NOT NULL,
+    "lab_test_id" INT REFERENCES "lab_tests" ("id") ON DELETE CASCADE,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE,
+    "scan_id" INT REFERENCES "scans" ("id") ON DELETE CASCADE,
+    "uploaded_by_id" INT NOT NULL REFERENCES "practitioners" ("id") ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS "social_history" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "smoking_status" VARCHAR(20),
+    "smoking_packs_per_day" VARCHAR(40),
+    "smoking_years" INT,
+    "alcohol_use" VARCHAR(20),
+    "alcohol_drinks_per_week" INT,
+    "drug_use" VARCHAR(20),
+    "drug_types" JSON,
+    "occupation" VARCHAR(255),
+    "education_level" VARCHAR(50),
+    "marital_status" VARCHAR(20),
+    "living_situation" VARCHAR(100),
+    "exercise_frequency" VARCHAR(50),
+    "diet_type" VARCHAR(50),
+    "insurance_provider" VARCHAR(255),
+    "emergency_contact" JSON,
+    "notes" TEXT,
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "patient_id" INT NOT NULL UNIQUE REFERENCES "patients" ("id") ON DELETE CASCADE
+) /* Patient social history */;
+CREATE TABLE IF NOT EXISTS "vital_signs" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "measurement_date" TIMESTAMP NOT NULL,
+    "systolic_bp" INT,
+    "diastolic_bp" INT,
+    "heart_rate" INT,
+    "respiratory_rate" INT,
+    "body_temperature" VARCHAR(40),
+    "oxygen_saturation" INT,
+    "weight" VARCHAR(40),
+    "height" VARCHAR(40),
+    "bmi" VARCHAR(40),
+    "pain_score" INT,
+    "blood_glucose" INT,
+    "notes" TEXT,
+    "created_at" TIMESTAMP NOT NULL,
+    "medical_record_id" INT REFERENCES "medical_records" ("id") ON DELETE CASCADE,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE,
+    "recorded_by_id" INT NOT NULL REFERENCES "practitioners" ("id") ON DELETE CASCADE
+) /* Patient vital signs measurements */;
+CREATE TABLE IF NOT EXISTS "aerich" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "version" VARCHAR(255) NOT NULL,
+    "app" VARCHAR(100) NOT NULL,
+    "content" JSON NOT NULL
+);
+CREATE TABLE IF NOT EXISTS "medical_procedures_practitioners" (
+    "medical_procedures_id" INT NOT NULL REFERENCES "medical_procedures" ("id") ON DELETE CASCADE,
+    "practitioner_id" INT NOT NULL REFERENCES "practitioners" ("id") ON DELETE CASCADE
+);
+CREATE UNIQUE INDEX IF NOT EXISTS "uidx_medical_pro_medical_b2470f" ON "medical_procedures_practitioners" ("medical_procedures_id", "practitioner_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
+
+
+MODELS_STATE = (
+    "eJztXWuv27i1/SuGP80Fzg2STE5bFEWBk9edtEnOIDnTFi0uBFqibd7oNZR0Ek+b/35JPa"
+    "wHSVmUJVmi95czE5uLthe3+Nhrc+9/r73AwW705C4MA+LHHvbj9R9X/177yMPsf2Rv36zW"
+    "KAzLN/kLMdq4aXtUNkzfQJsopsjmnW6RG2H2koMjm5IwJoHPXvUT1+UvBjZrSPxd+VLik1"
+    "8TbMXBDsd7TNkb//pf9jLxHfwNR8U/wy/WlmDXqX1r4vDPTl+34kOYvvbOj9+mDfmnbSw7"
+    "cBPPLxuHh3gf+MfWJPuhO+xjimLMu49pwr8+/3b5ry1+UfZNyybZV6xgHLxFiRtXfu7GKl"
+    "9bW9bH+wfr85sHy1prEGQHPieXcKr5r9/xr/Dfz5+9+P2LP/z4uxd/YE3Sr3l85fffs48u"
+    "icmAKT0fH9bf0/dRjLIWKcclqewNLNL6mr0q57Vo32CWvxwTDz8p3q9yXDDaRnLxQslyaV"
+    "kT0NzC4eu7hzcpiSVp/JeKpL3aIyonrWjfII19gQVStfbQN8vF/i7es3/etjD3t7tPr366"
+    "+/TD7X/xjwvYjJFNJx/zN57zd+rMOgljgn+h7k96FXL6eR+K4B+fzvqBLxmNYhQnkY61lo"
+    "jp7HUd2XvsJC4uvs7IZvv8aQe7ff5Uabj8rTrPFKNIZrcP+JvCcEuEEfNCC6EPb/7xwHv2"
+    "ouhXt0rkDx/u/pFy7B3yd97ff/yfonmF+Ffv7182CPeDGEvsWs33EdCL7nzRv1a2t4HrBl"
+    "+tJBQZfxkELka+nPQarkH8hgHHMvTjK9Ny//L+/n2N+5fvmuT+8uHlm08/PEsHgjUiMZZP"
+    "3DabHxgnForl+zO+qZBzXke27dSKjcnCpho+dTr3vnvIn8u2h+HdhzefH+4+/FwbFb6n4+"
+    "88rz0Nxas//K4x7x87Wf393cNPK/7P1T/vP75J6Q2ieEfTTyzbPfxzzb8TSuLA8pn5I6dy"
+    "biheLVirjXoSOj1HvY6EUZ/LqBccVYY9//aVbW9gxwG1tE64Ncx0G9/Zn3VLVkN2LsB+rE"
+    "drHQS85rxyr8z2i9SFkDMmcvw2oJjs/L/iQ0r1O/alkG/LTsK5Q+rnsqeFUfy9MKPi1XK6"
+    "p+jr0ZnVsC7GAPvdONsBvLr7/Oru9Zu1ZGIYglruryP8Z+EFHy5O8lubFOX0ckveIPvLV0"
+    "Qdq2bS/J3gedB45dhWfMt77jVfQT7apfTw38G/dc7/K5f4xEbuxyD9OoIvtvb+TZsz1s5b"
+    "WsfzzEl37LrofZViVsh3VsEmwvQx9ZyknVTHoEt7cOTOy5HLRyrjR+BW7eqpgYzwQjS8k1"
+    "3cPLdqN8+t4OZJGVM7zdXb8xrQwN35cnfj4iEsSjb/h9ly+SgZZbV/qY4CJ5O+kynoQ3sA"
+    "rJ/HOooiHEWedAuvpr2OAt71eQ9dpKUXFO2B635iAT89xJpW3sQZsUea3NApCSiJDzo70y"
+    "pmQhmSBklMfLyeZHc6vAgZkZ2PJaerVommBIE+o6HPZLT1Ogs0oAOcBhY0vS/tMMD+w0jU"
+    "fagqKHiqNJ6qlDe+q7T0AypkWNgs6a/XoDyrF/BlapCgPF/jqHdRntl7e13luYYBhVSyin"
+    "nYSSUaiu2AOnrsSrG9WJ7ZMgby/nx5BXn/IvJ+/VkfgOIPWYefjv0ta4royrN0jjxNd7Zw"
+    "DWHJ1xFNUVvo5xRN8ZqgnR9EJJvGGqEU5Zs3bXEUTtasawhFPnmtarBa0IS0BYRJzCtMgt"
+    "iO9ewpI87RCpRowEzwKtR90c+6+KKfqX3RzwRftFM8hlb6igbZItII2aXh/L/tcnWOtVK7"
+    "/2/F63NH5nQjgUSkgZwPHw7EPg3HLRqAImShhjrzKu3MphW9m7QUR4H72CqjqC7PNYDXzG"
+    "KEH7GuwFrFmLecjSCtLuMeLTqGQi2RZDG2uav2IyJNMGpQfmYzFAvVAED5ucZR76L8FG4K"
+    "x9ocNG8eikhwpIMKBCrQ0nkFFQhUoAXx3FMFqi5foAV1vlkrLvpzUoTeIo+4h59IFAf0sJ"
+    "aoQvUGN23K0DZtau0rbTvLQxl2lZvmqtKHVCtSNwfhaF7CEcVudvl5TyQ5kNReoCYO3Ood"
+    "3Ors4xwizwOoZroGMpDmURQjNptawdZKFQmNWaMJg5OJJJSdcYRi9j0RGz49aqswoFaSGw"
+    "0lUWqACnJbJgkBaYKfeIKJAvSPCfQPyGkJascshmKhfm9QO65x1LuoHeAmBjfxzDxqXdzE"
+    "l3GmvfPQjv3CTzjKiBGcafUGN23ONJI1tWjatmOw9WscI+JiZ5WjVxV0zY/W1hA8aPPyoE"
+    "Vx4hy0A1PrKAPdOs+edgu9bou9Fg4Sm4CRRvFO04XWgAHb3djmCYIoimIribQTRQhYSBeh"
+    "kyS/YE93WhGAJhygJzD1GNv77NcKZKu9FDWQCURP7anYst/Jvo+Wa6iKMWIin5p04oVsNx"
+    "lJl1A17XUUEN+DeB7P4fFcPmW26a7sS6Aw3/Qxfa5C2UEiO8qrD0J11HT+kqXUYssISqgr"
+    "sem/fL7/2EZrgWq6HYkdr/6zckk0GrvrP20T3+bcrTYJcWPiR0/45/15LJWlhVPOUru1Nw"
+    "37pu5K5B00rT07YvZK5FdDGugRXq4HWHT8UxwGNO6ZslEAw2DPerC3yCau5pXIKsaIjdsU"
+    "8UO2ne12LT/xNliSXEXNtwxrwm5tgmM4XC2BqyWL5ZUihwRusGN7SD1uRSDwK8tMbSNfj9"
+    "gKAiYCELnhLtTieO55F4o/+AOQ/DnvxkxuK7PjaUYra9QQE8R1XC4TF/Y5hcO8Rxt1KEz5"
+    "5k1bGAwboZ4hMAy5inEUn46BkbWEIJh5BcHw8dFOiFcDgWeim2fCDryQTZu+Pt0iEjjvxn"
+    "k28ViPyJUFCLRdkqzjDOR7FDdQzhv7xZLNxkm6C5h5Prfhb6RSvMUUs72aRZG/0zRuAWoe"
+    "46OYN9r4AfXYqWbrop2WZ7kJNI/w4S+f5bOC/kU/ATjhfb8t8ZE7lhA9NuPpvq6PGlkDgh"
+    "I5ayUSZOcrGuwQ0y1befiFF0a3ziQqIg3cBI9y6OCulSzC2CYyb6aacxFp4D5hDMrhnvqU"
+    "0ZiZmeqKpQ0U6HqQoPMiJEMUBYjSM5ObQJSetShdrFwDEP0ebR5wp9D4hVLcWOVnJpum3M"
+    "tF02JY2iVT/tO6CaZqZkECnaEEqntftwYy8GQ80mVdEJshO16FzxCnd4KX6i9P6E66xW1N"
+    "sFCCILOCRmaFyN5jJ3F7lGYTkWfWZpvbfNIyALLibEc6Cv985ylCQJrgPWso9V2EerVOLw"
+    "v64dvffmqLiB5AbpkZ/SapLYT/ssTWzhLQxJnwWE2fpOEYY1qnXX2RvQI56xb7cpgf5bo6"
+    "iC9T2jkkCVav5MtMFwtJgq9x1CUbCiFJMKM8oNq3Uhso0ABBA5zsJjVmPyuKe9TwlCCBYV"
+    "BZL6myVk1yCIKv5Oqk+CB3UljTJWt6mme20GnIrNU1XldmrRSfzC9rWsrz88u8h7d//ZSX"
+    "jlOTX7t8agbzjW24GyCHsbVlnJ3JVR5z8UvapUF8jSzhp2afB6rIlfxqi5sTgn72EGXxIK"
+    "Drm6XrOzhENPak2yO1yFFHTaiFppaLjtVZl6nwR3uy1aL7CJiQaQdNRPHwirONaUy2bN1Q"
+    "aAxqZ7eIhMytg7vC8bcQU5LerT1gRCUDpJzVZVDIWCxEAYTYJsglv+k/ABIoPAGDPwFfA/"
+    "rFKgIFdIZHAM5jcPjHGjM42MM8+Mg+8G17zHe5GgMkBYNu2n80NiTQUU3z5qCZgmYK6hlo"
+    "ptc46vPWTM3zrgjCk87FnS7e/XsfPwTsz0QSykUHZDzX/lku1dwN/Tqwk9TpJfGpNpvctD"
+    "lVizt2Tt66Y3rJ/DNWR9gK+c7q6GavJZg80Rb8sDPzw+bDpH3HSgAaePtn+MxwbIKUnbxb"
+    "LlgVAAPpHeVyVfWbCTyrD3ANGBzk+tSddLH2BcIaCGy8m42zLciOp7JLlW5dxqVgYL4b86"
+    "m5hoh9gK6NFyADmb7tJFbetoiVt6JYmZKmuympgYxkeugNScpYRH6T0KzcW9cwEAgqyxVF"
+    "PH3jrYEMNN5RYhpCGjwSB1PtjYcANGHLN8X+ujj36d70FoBnXvSeGfV697zZOYS7XPhtbf"
+    "a/OgcVEWmC4U59VvFwjLhPREdjrWJAWu0vrcZopxUbUrSfR8yBUQEhC8lEw4WFRzwW6aOH"
+    "BYLAbZjU2UXghnSxcFV0sbwer9Lo3hQVgcAvXBTV2PpAOt6Z8NwzHW9lAhjCnK/jWq44a8"
+    "4pNW9u8D/TwMZOQvFaHYVStrnpEoYSFs0141BK3CqvhIKzpUgWiKJqDJEo84pEscOYsebo"
+    "Fd+sYExwgzUd5p385S3ucom3PHsW+rjLG0gDFYpRHOYlc7qCkIg0kPNRVKFN4BysiMgECj"
+    "XdNZCJs8k48ltuon1SqIpoA31cC/FpScL3RacWG6v0gqblET+RJpZUboNkUHBpia4X5OOI"
+    "7UcjgrTXCwnUvGls+BCYNJGz+ta+WooVgCawPbUSGyQx41EvgrGEmMD42PbNFwErCK2+Cb"
+    "BVeBO4n9raK8co3cTMEiiMQI8o9cB12aYnCS2eDI9QLPHltJYIkXcA5UI0yoWAIq5eDEAR"
+    "B0X8jOMDKOIj8VpIB9qSuAQJDIMmDpr48njuqYlXZ4Ah7Pk6RHHJvDmxKl5xykURUSYb/4"
+    "D8w0PA/040gHPNlJH+PKsRGdD8sZTnXmZMCtTWgwHY0Kdj9AUfUmOo9JIbw3EY8yZiUEHe"
+    "MN7TINntFW2qPUdKI2OvW8Iwfe8SNqHOhixMmqcDJnRyITO7JP4qR64y5Creo3jFxy5wCT"
+    "8lRSvkuqt8/Tg2Jj5/8o4psuthFUP1CvEX84q/yBc1XdGhATNQoYYsIMsLuoAsIJfyr/L5"
+    "3wq2VoTpI7G1QwIkcAO9fAvx6nWLCVhUJv9lh9tskU1cEksOIS05MSoYA3keZfmw9wRvrV"
+    "TfR0Rm2C1BASIUlpEeWYFd4qdHnijxPEQlFt8yBBIsjIH+GMRcbEtTNjBb1tpHiUjg/xyp"
+    "um/ohroHGI8eW1sS2WyZ3fUI3pBAYQT0RwDyFUyRryDwt8RhkzcvyBIf2Ec9YleHc2UHEw"
+    "6Bz12N7mKHAAJkrjBABmoimDbqEgeKUBOheGJ140oEHESVSOJ2XBTFVvF46FIsB0PYGYSd"
+    "QVDUpc8cgwdFlfPpEPReR4yOsAZ1qSZfm1On53pmM3FXquVrUf/a8kcnqcKXoVMt/VXe18"
+    "dgwZlb24vLOwTt/CA6l6nXWTckMpQm4qEd68Ri22P24WeS9S7r7FPal6GEse8+DFnv0cZo"
+    "omolq/rTJCmXZSBZjVjKc9mqpXUykC7kupjuyLls5Xvqu7S3g6FcZdGcCiWqB1sfjv0ZSt"
+    "gjibkUzba0ZxL2N97R56IfQ5iaIHHdL2l2vbU6AjtvcNMlAjtL1dctAlvNDsQ+zyv2GUqX"
+    "TRVZdaw+1rtsGTAOJcugZNlimB4nDhaqlo0g4sCliUvFNR0TQPeR/mtQ0P7nov13ifjg3r"
+    "8YR5q6aQMFejTo0VPxGtnI1yO1ggBDhUorEEBxcYrHCqCA0h8jlv6Q7RoGYPk92jzgBRet"
+    "7BA2UdsrnSaXr1cDEPs578ZMViuL+uwq1RAfr1W+fv7ezUk3P2sFDn6zHPy63mZwMus5mV"
+    "NGiK3t1W/igO9ufG8o8h1ttusoExx1E1DNVptky1aBhGYb0a5kN3Fg2h1T9wQRW90tnitM"
+    "h+4GzEC2R1FS2Mdl/WtQXcUAz914thkbu0CWx6LlHm0FAzx34xk0rItpWD6JrZDKc35hm3"
+    "jIVXgya8CmgJUhn+Q9LNDoW8bh9ZtX7z7cvWd2fPO8UTShGJAX4kySUMrdclEc2F80jooC"
+    "bjp/8dOx5pOBnfEe8YmXeNrUCrjpqH22FG7xt5DQQ0uZQDm1DVibvG3Y3HD38KZ56EOxvb"
+    "f8xNvonUSaONhLdKwiiqhuQeIKxIQ9xCQVRMuv1rckk7KPCasyFd7SxRZlKpMWaTBfgoBq"
+    "qH8FwV6Q3ueaRr3gqJneRwhA6XIhvwi3gAt22pddy87PpYzW/UALe4wucsuuCISSaO6VGC"
+    "m15J7bPSjuZinuWQJI9o7kqPqXz/cfVexWUc2Vjtjx6j8rl3QKWOr1cK7/tE38NEvuapMQ"
+    "NyZ+9IR/3p/X0284OUvtXtqmQ7axevEOml5a2OVPtsuXq/Nq21fo8hNY/WU8XKPYd4xdbA"
+    "cS5VjNewUCE87gA4I9RLSyBx8Bw7gpL7vIThJ55ei5g0uEiS7KTh7KFgel4AQmNN5ryxZ1"
+    "1JmqxcwY1xMt2EmZzQ6Sc5l6Qq5AzpqQl8PbKDOvh2iWekaRNF89ACISxqH/OLC9hZf4FR"
+    "9M12EQgLA9GXxwQhRFX3kByz2KtILgBKCBqupgG5ZeDlEUhgH7XgMk/bsre1rgmHRygl4w"
+    "nesi+bpAPtdF8rRFHnEP1p7N+dLoVR2y3qZ9/VR2ZSJhF82Au0jGLpICd7FM8cus5/PU8d"
+    "LvIlkqUjVeLGPwIlm7YMrgRfJVWBnFNjsFDEPap7Qv0xmrpFA9m7EydauJjF0qL/Uiybpo"
+    "3MwiGYPAGS26eNKLM2nqmBVkkfRcJs/5YqjSCsGqGF1gE0bryfP3vY8fAvangw2mPXY/hc"
+    "/Tey8nWD9srVgU1dFrlWXzZBCbVVuxT0azrfOPWB1hK+Q7K+Q8YhrhFcWoLNhdZUYHB3Fx"
+    "84qLy4YMS4QgtdZQxYDM0C0uouAsY6oH2UeggYzfdst+3pL8vEl3MeeITKsv3VcxRpA89Z"
+    "X7CLMJn8RaSSWqGCNIH7sWO/s0HGsHANVR1xwAxM2NNdW901mFTRh1fHxlsWHHqnCftnw+"
+    "ijCfESeESkz5EicFhcquXuuOABNiLqde5+C+rNrQl3lzEu7LXuOoFxw178uqdTW9nPhSLF"
+    "QdgPIYU/FabFq1qzmIQDBbKOZwwWIO9al0AIp1QxxmZspdeZYuQafprjz/Q5izXu2MhVIt"
+    "zplzqkUgRhGoJaZ6qMFplakR6nBaZ3qV5X5MVaIQRfGq0UNNXDrVGBSleSlK5fBoJ4SXQE"
+    "30CY+XplyH7BJhIMfjlHnlufywb2sJHDUQMN2NaRokMn1DzfIRYCDDw6ujbMNG9TWkOuqq"
+    "U99i39FPHVzBXLMAx76k8vKx+gGvowx8ykfZFYD4NoH4hhx27MC+rNBAS1hPFWSCCDc2yx"
+    "FxsIW3W2zLblCplc4mzgSupxY8QV4GeXkWQ7FQoRHk5WscdZCXZyKDFlV0e9BbooBY0O0n"
+    "4zW7vrjpodzLoMAxiPdDKp0g3s9avPcqpeWHIDrvymCOy1X+NLu1CXaI6UIvOGKxc4ZkXZ"
+    "pVfER1GGShEY1haomKqLSEKhJmxTZAFQmdSUHGMVSRwNOTDlUklm3fUEViZgMCVSSgisSU"
+    "IVadIqygisQ4MwhUkZjRzPtrgly2ldavXiAAYVkcfHCiEPNkXrIMIOqBqYFgUAYflIDukE"
+    "9+035gmjiYtaCsx7x3kIK8o3YlQlmPfhmAE/bDKXagrEfHJMDIwRbU9uhYqsKPMQ0p5rFM"
+    "edmK8xi7inIVbIEgO59RNnk1hnmu6e1spZexovgSdC3SurLk+IwuqF6hlcoc021APcYb1L"
+    "HQLByWhzBDHYvuj6hzOcaWuAYc57QtcQd6LM2u+3HMbHGpAiBLtLJKwAuUAtEvhxiF2I/S"
+    "9fNSRUEWbHRQQkXz7DRdLZUlWlV5aIKaMyeI4tsmxlNafAbqzgxXd4b9zoCSKFbGkOsXnn"
+    "mfd2ncXleMfK3PeOmT3HYu/YD8w0PA/+rF4591OL1oSEtLFHP6E61GNLDsB1Nucdw13qQ6"
+    "DxMPaGrhX/Ah7SiP7S/HIQ+KPj4KecNqOHHeJN7TINntFd0I8cfSMGv2utWM7P1+IkK6xq"
+    "0kQrq+YWiLkG7sUiBCejrpbeQIachDBnnIzGGazajamYqqGOC5G8+/Jshna9bBKr0mGnOz"
+    "Ag3XXiXx+0euji6WPkTXwNPx/HQhJBPee2IrvDDqtDlNnAmhzFNnz1lIyjP2+Dh5gMMEEV"
+    "aDZ+OqeLfVUeTqlDUSOOStmUvemi7ZikoHfZ/hF9EDjP6C5r0ZDXbBSetoXy6Bzuweacig"
+    "swxe2WrvIZt7jPWobeIg7VNLeiLaMzcRBdOFxETDuOfPSkxUGuQQ9F5ZIhc684RESyVYPy"
+    "PRcc2a3opnttJ1NuLmMj+nVERphIREYCsiJ9TC2jE8AwS1RS3/Ny2CGh/TjB+B2xaXVhUE"
+    "IkQ3EWITOAcrRFQyjaqZroGA6W5Mg49WJHp4H21Cd9KDQ2tWrBI0YVas4yuLTYsV2XvsJG"
+    "6rP1Q1VTeRV11ZqaSjcPt2X/OaSBPks0YpsA5zhPqavJBmyQ680E3v2/bx4oto8OLP2YsP"
+    "qvTlVOktSbcSWrxXMcC5Puc8hwC2EioLxG9J1lpDQT6i9mHpkQsHiklN+RBAMSn11src8A"
+    "woJmXaqEt2eML1s+MlKS1HbAMFgjdEaUzFa3mxVLfMkQQJDEMwwaAaoWYwQdUkhyD4OsIJ"
+    "JA/yaaqLJWt6mme20HVlubHG66rdlbhfHCPiptmGeFK9M6+46yboWwj7s8k2tBS+Ro2mCH"
+    "h26Z+Y8Qf0sJaFVdQa3LTGV6RNrX2l7alAi3W+UK4y7KqCrRLW0gwCMmYWkOEFX9jnWz1E"
+    "bAFpgkdrbBm7YC1k00FkhZhaDpJssF5jm3jIbWde6KPp4Mg6eZJ3trzBaBNb37x69+Hu/Q"
+    "8/3jTl7GJYXii5P2BEJaaunEsEHHgVxNMvcu1gH7hWEmnp3A0YTCGnp5CCMod9i/z5/4rx"
+    "Fw2DbukBTFs0bYcmO127rmLAqE8bdcpX1o/AslrerKOgpscZdVVsOwm1s4PUUQba+Rjl4L"
+    "CTZPlO2ec8Yr3CeyLUPNJvu0wut+rJ5VaYXDxEefrBHoccEWke38NP5i55TE+GJE60pxQZ"
+    "1jzORwlEZz+L2iTCVq+UWnK0edQPP704BMfal1pqIGD5NMvEjxLK5Q+eHvKRaFZUlaPN43"
+    "2cHYuH+UUK+8C93TF3EGvs0aVg2KpDyCGEHELwGYQcwqjPJ+RwNpFxi5cchagtneQDHSK8"
+    "isT448d3zTWTu3Z013BBCJVaDpIIhHqlB3X4wWPmWDk27Bx7kAJXKXDlYcT29fhYy08ahd"
+    "AGgHiEecUjVMan1zVOGd7ARXi5i66414oOURy4xLY2ocYD1UCBbinRLQnqw2wTBtSK1O4x"
+    "orFFpROUktg6CGiVXaGIQsJ+fkAPuuTKoECxSHGa4ifGXsg5yIv9aMSeyeBXGHb2QiPsLP"
+    "h2YL/fijhfCjlMadVSLJi1aNZfMdntZc6aNmMuQVdowrc3zzub8L4Pu3tgtxu7G4/ozsIZ"
+    "4gp51Zl4Q9axFdmBbJFrcedVQTDVSnYQbhA41s5N7EAWE6lkVsABuSK5IO6BuDeLoViozN"
+    "NF3CvKjGbVd3uUAWliYSKDLBPTuUjyqtz6SSaaQOAXckxMrUKq5+EBKM5vlJtWA73Js3QN"
+    "6pLS4zgBDGHO15LRozlrzqm4wh2mxN6vJSp8/s5NmwKPyjZQYWFJ69XNSi2gP2IaaV65qE"
+    "AMzPk/SkQ0f6g0GM6bG8juKBdZeKC4dNOljjKvQKbPcrvw4PKzgvXOXcy+/z/oSlfj"
+)
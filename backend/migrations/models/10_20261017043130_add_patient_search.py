@@ -0,0 +1,208 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "patient_search" (
+    "id" INT NOT NULL PRIMARY KEY,
+    "display_name" VARCHAR(255) NOT NULL,
+    "name_folded" VARCHAR(500) NOT NULL,
+    "identifiers" TEXT NOT NULL,
+    "phones" TEXT NOT NULL
+) /* Normalized copies of a patient's name, identifiers and phones for indexed search. */;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "patient_names_fts";
+        DROP TABLE IF EXISTS "patient_numbers_fts";
+        DROP TABLE IF EXISTS "patient_search";"""
+
+
+MODELS_STATE = (
+    "eJztXWmT2za2/SssfZlMldKx29125mVqqtpLJk685Lnb86bGTrEgEpIwpkiGS9vKjP/7A7"
+    "iICwCKkEiKhO4XLxIOJB1cYrn34N7/zDaejZ3w4sb3PeJGG+xGs/8x/jNz0QbTf4jenhsz"
+    "5PvFm+yFCC2cpD0qGiZvoEUYBchinS6RE2L6ko1DKyB+RDyXvurGjsNe9CzakLir4qXYJb"
+    "/H2Iy8FY7WOKBvfPiNvkxcG3/BIfvvBwaLvMAkNvssG0U4+TKEfnfa9MPMRxGh36T8/m+s"
+    "D/+TuSTYsSs/NW2UvG5GWz957aUb/Zg0ZPCFaXlOvHGLxv42WnvurjVJ2VlhFwf0s1j3UR"
+    "Cz38x+UkZRTkP684om6e8qYWy8RLETlThamMVrM9N88/bOvH1xZ5ozBVYtz2UjQtj4sF+/"
+    "Yl/h28uHV0+uvn/0+Op72iT5mrtXnnxNP7ogJgUm9Ly5m339mlKL0hbJwBSk5mNSpfU5fV"
+    "XMa96+xix7mQ3rRf5+meOc0SaS8xcKlgtzHIDmBg6f39y9SEgsSEsMmCPt2RoFYtLy9jXS"
+    "6BeYIFWzDfpiOthdRWv63+sG5v5x8+7ZTzfvvrn+M/s4j04z6Rz0Jnvjkr1TZdaOKRPsC7"
+    "V/0suQ/c97VwQ/ejDqB75gNIxQFIcq1loghrPXWWitsR07OP86PZvt5YMWdnv5QGq47K0q"
+    "zwFGochu7/AXieEWCC3mhQZC71788471vAnD350ykd+8vvlnwvFmm73z6u2bv+fNS8Q/e/"
+    "X2aY1w14uwwK7lfO8AB9GdLfrnyvbScxzvsxn7PONPPc/ByBWTXsHViF9QYF+GvntlWO6f"
+    "vn37qsL905d1ct+/fvri3TcPk4GgjUiExRO3RecHyomJIvH+jG0qxJxXkU07tXxjMrGphk"
+    "2d9lvX2WbPZdPD8PL1i9u7m9e/VkaF7enYO5eVpyF/9ZvHtXl/14nxfy/vfjLYf41/vX3z"
+    "IqHXC6NVkHxi0e7uXzP2nVAceaZLzR/ZpXND/mrOWmXUY98+cNSrSBj1sYx6zlFp2LNvX9"
+    "r2lo/Jbfe9ZcxwG9/Rn3ULVqvehZa0VkHAa8Yr88osPwldCBljPMc/egEmK/cXvE2ofkm/"
+    "FHIt0Uk482L9WvQ0MYq/5maUv1pM9wH6vHNm1ayLMkB/N053AM9ubp/dPH8xE0wMXVDLnH"
+    "yE/Sw84cPFXn4rk6KYXmbJC2R9+owC26yYNHvHu/Rqr+za8m9tLjf1V5CLVgk97Hewb53x"
+    "/9TxFjOB4zZ5fd7ksV3QFu1ctbNnnhtR6/qWLjx0bQqxbSyJg42QHvXpvxdbA9/jYGvEvu"
+    "Mh+zvKVcz8wMZnEq2NaE0b0u9m3P508+3l9eOLWW1guu39o/vRDfCSjmhM25AwaeHGmwUO"
+    "DG9pvMY2sZDzPunLQK6dv/I87zbwPodG4sumX89AtI/oh49uiLHBBgy79neMODOk5oAv/G"
+    "3yc/Z7rMH5PKTzmZoOtQUl39QO0Y3P5LT0VlxSj69auKQeX0ldUuytmuuP/CFwUz8lK6nh"
+    "5gidtj1/ubx89OjJ5YNHj7+/vnry5Pr7Bzsz5t9qsuenL//OTLpCP7/p3E1qCvNFBTMc91"
+    "NxYYMnRE71NM/EMk8Id8o4zWbtmUNcttl44yV7R27TVnm/cfNmZS3NnfO5xS4uwxgJJtn8"
+    "0B0gDu6TMFfI78v2t28Tqq8eTVhfJgTkh98TJcQn/ChsiyogLaJJtShzm3DdtTxcd82F6w"
+    "r7VlxSKkANV5SJrCACryrvTA/jxb+xFZF7wSjL44RVFAQL1YOF3iG0e8D6cayjMMRhuBG6"
+    "YuW0V1HAuzrvvoOUdB95e+D6MNEH8wJHilZex2mxRxrc0APiBSTaquxMy5gB5WSBF0fExb"
+    "NBdqfdi8lCsnKx4HTVKLUpQKCzUdDZpLQddBaoQTs4DUxoep/aYYD+RUlUfahKKHiqFJ6q"
+    "hDe2qzTVhbEiLGyW1Ndr8JvLF3C9/OagINR51NsoCOl7a1UFYQWjU8i3s8jjJhWd0HXI8g"
+    "JbjV0h9iCWR7aMgUxzvLyCTPMkMs3qs94BxZna7d2uv2lNEW15Fs6R++lOF64uLPk8VLGV"
+    "hX5MqtjniDjbW+Tg8J3nOLE/E4gtuDbzJsGFzVqbIWtuBkX7vaKLX3HwrY22c8On/0jMkr"
+    "jYsEnoYzdkCtPIiyjSWOA1HexMz0o/xAiw7wURr5Y9tkMmkH2fbsgN4hYCWvo73JBZrcde"
+    "RFHeJVN+GH5Q/Kq5EXoJLO3Q8Oi+96O7RiH9ZCO0UNpnylGqpqUfQ6LQYJ9p0E9ZYZlo9g"
+    "OlOfHo5r+LmdZvIKU9aR4HgVu+KY2DyCN/Xlkcfo+RGwnDGVJrLENAp8n7/MS61+fYIhvk"
+    "yJx9EuGrnaIuMvTUyG2yxRfPXr6+efXNw8v5Zc2Rmnv9rriQUHlqF1x7lx+U6jiwW+EpP1"
+    "vF2hNbQ8ERdP8RNKesqwNS1tXESFY6HBUGNqp9O0Er1wtJOBNt2HdvNu/U02ZtVdGZ08Go"
+    "wKo7blELdeVzlv4GZM+D7l+JZZsPH1DibCXhcw2mQ5Swqi152EZb8lCuLXnIbSTs/PE0k1"
+    "cUyOaRWsioamKe6zYpzWgruZznmk9rtmNOVdnPIzXkvHt5P/00HDVoeiQS5ArqyMPxyKYV"
+    "tbMxPTR4zn2jLEp2lbEGPGcWQ3YjXlEwWcbot5z1IJWcRn5DtLvaMEWS+WuMbbVcPFIHow"
+    "Yl12iGYqKaHlByneOot1Fy5e4L21xsFTPC8UjwSoKqC1RdU+cVVF2g6poQzwequsrLVxf2"
+    "fB7aLsGiP6ZI0Y9oQ5ztT4Tl4dvOBNGiaoN5U8RomTQ116W2rcNGKdbITNMo9SGMIcmbKw"
+    "aUIIw0aBgpwE6a9WhNBJnq5T6hOg6c7C2c7PTjbCKu1iJnugLSkOZe4kd0bjW9pZnEJxRm"
+    "jToMzikC0RrlCEX0eyI6fGrUlmFArSBvI4rDxAAl5DZMEhxSB6/xABMFREMGiIZA5SGIfY"
+    "xiKCbqBYfYxzmOepvYBziNwWk8Mv9aG6fxaVxrLzdoRX/hOxymxHCutWqDeZNrjaRNzSBp"
+    "21KS/RxHiDjsfmKKNkroiletqeEhAu3Y3kJu6hN411LmVSWsVZSGLp+HD9qJtJtU2twhY+"
+    "FR0gK8UnSv1WDAdju2WWrQAIWRGYfKKeI4LCSKUylzmrOnOq1wQB0O1wOYeoStdfprObLl"
+    "HowKSAeih/ZiLOnvpN9HyW1UxmgxkQ9NOtmw28+hcAmV015FAfEHEM+UHxuWxbMoQdOWfQ"
+    "EU5ptDTJ9FqFQLkdVQkCqgvltJCYoDR2DTP9++fdNEa46quySJFRn/NRwS9sbu7K/L2E1T"
+    "Bi1i4kTEDS/Y5/2trwhMA6eMpWZrrxv2vOpmZB3Urb3kEuCGZU8K7wpSQ2/xdL3DfFAgzW"
+    "R1YLJ2DgyDPerBXiKLOIqXJ8sYLTZuQ2iLLCvd7Zpp+WUVvkVYHXZrAxzD4RIKXEKZLK8B"
+    "sonneCu6h1TjlgcCv6KaNBZy1YgtIWAigAA43JqaHM8H3ppiD34HJN9m3ejJbWl23M9oaY"
+    "3qYoI4j2to/MI+JqnMK7SQy2SKN+dNEhk6QgfKYyjSiHAY7dfHiFqqC2RYD6CPOYE+JiFe"
+    "NateBQROi3ZOC8vb+HRGddXp5pHAeTvO0znJvEeOSDvQdLeyitOQ7148RBlv9BcL9iF76c"
+    "5h+rnjur/IGuAlDjDdxplJ2Qs1tjmofoz3Yt5o4XrBhh54lg5aKTmd60D9CO/+zlo2K6jf"
+    "D+SAA14TXBI3LfwwRcaLXTjHdnOgsgKEIOWog5QQkT6jwfZxsKQrD7snQ+lWmUR5pIab4F"
+    "4OHczrkoqPLSJydMo555Ea7hP6oByutw8p1EzNVDWOWkNByA+yfJ6EZBBYQLx6ZJEoiFeP"
+    "Ol6dr1wdEP0KLe5wK9X8RCmurfIji6gm3IvjqfmwNEdT2U9rF0uVM9smOko/ywuKwHThyo"
+    "qDFZsLKQCKwI0mfqp6D7gC0vBY3dMlYIhUQ0a+Ep8+Tu4aT9XZns3kHMuNiRsKEGRsUMjY"
+    "EFprbMfOAcXheORZF6Av6Mid+62nCA6pg+utFuZvE+WXB/lFiiG2dz4sVMOjO4jVjIx+nU"
+    "I1hP2y2FLOPlDH6fBYDZ/8YaddrdIuvyBfghx1O346zPdyDR4iN0PaOSQmlq/k00xRC4mJ"
+    "z3HUBRsKLjFxzYXYPkpbRkEAEQKIg93QxvRnhdEBVUQFSGAYQrSnDNGWTbILgs/kSib/IL"
+    "cKzyZL1vA0j2yhU4jRltd41RhtqfxldgnUlJ6fn2Y9/PjLu6xcnZz8yqVWPZivbcMdD9mU"
+    "rSXl7EiuMsHG+6RLrfkywzRd05GEpUzdFklSNSGsZ8FEMk9ksiCxbqLcYr5HPpHOOqn6pn"
+    "8VBQghhhRC2NhHQbQR7iflUaEqasDgcWK5aFdQd5qSiHBNlkp07wADMm2jgSjuPkRv4SAi"
+    "S7rQSoIy8ugAj4QUup3HDvAXHwckucm8xSgQDJB0VhdBIXU0J5vwsUWQQ/5QfwAEUHgCOn"
+    "8CPnvBJzNXVqgMDwccx+Cwj9VmcPAGM7WWtWXb9ojtchUGSAiGQPPho7EgHs+/PMycNYcg"
+    "MwSZIdwIQeZzHPVxB5n1865wkTqVa1JtwiFvXXzn0T8GijmddED6i4Uc5VLN/PbPPStOnF"
+    "4Cn2q9ybzJqZrfaLSz1i3zfGafYexgBnJtYxeXqGT63NP2kGK4+WWR0noP19aG9dZmg6l8"
+    "dY0DanipqvtsfXQaFZ3PG+6t5QAN6e3lzlr5m3E8y495NRgc9w4pE+pg5XuZFRDYeDsbpx"
+    "uVFUsvmAgIVBkXgoH5dswn5kp3MWtlG89BGjJ93Sqked0Q0rzmQ5oJaaqbkgpIS6a73pAk"
+    "jIXkDwHN0r11BQP6WlG8bI0urx+rWG6B0GHrUbXax1ctrPbxldRq2Vu1/Ghkoz45VEAaTg"
+    "69KEv8wLsnNg6UN3YcUD+77uf8kp+rVRMUcMAj8xOMjHq19AT0nMccXyzJAP2nykGQR+pg"
+    "uEOfBTc4QsznxDMvj3SXMRDgPjzAHaGVkkInbz8O5YdWspyJJFBi4Z173BfpvYszQWagWc"
+    "C5jcwAUiTDDefJ8rq7AaZ6wZkHAr9wv1lh6wMpqEfC84EpqEsTQBfmfB63yflZs9d01OVU"
+    "tV8iM/Mo0N9m/tsTlN7Jb6/mqqz9d1iZ9+LFrtef0071eEy+Hqaj+jXwLGzHAZ7JhVRFm3"
+    "kbJZWfN1eUUhU4IyudhNN1XKSlkjVWF1PteoLqySeQUVl+RFmz1ar5ljA6+Bjr0YhWwYiG"
+    "WIQgFJFZ+AGxiBpSw/BPL9GIgjnVaBuP1JDzXkJuC8/emiERRX/kdFdAOs4m/cQ2y0smx3"
+    "az85BHa+hAnIjDUHBDhfcY0rFK9tXmhrixMNmsdBskgoK/kPdrIReHdL8aEqS8Xgig+k1j"
+    "3eu3kuTu8sQU8jg3B9SB7aHD3F4cUR7V5LcFRAfG+7ZvtgiYnm8emhRfhteB+6GtvXSMUk"
+    "3WLoDCCBxwxcJzHLrpiX2TJcgkARb4chrLBok7gBJCCiWEQG4gXwxAbgBygyOODyA36InX"
+    "PLSgrDcQIIFhEBx0GZwFwcGoBQflGaALez4PxYFg3hy4AnbJKReGRFqA4DVyt3ce+3OgAR"
+    "xrMpjk55k15UD9xwZMmkGZ5KitigXo0Cdj9AlvE2Mo9ZIZw24Ysya86CBrGK0DL16tJW3K"
+    "PYdSI6Ovm9wwfW0jq5An/OYmzf2CCpV039QuiWtkSCNFGtEaRQYbO88h7JQUGshxjGz92D"
+    "UmLnvydgqaquyiq17V9Rmsa9NbmiEO7okFAo2BBRrZqqcalajBNAxhQ46b6akyIMfNqRyw"
+    "9VmcY7/ZAyiAa+gGnIjbr51oYFLVLKatx1kiizgkEpxSGjK+lDAa8tzL8mGtCV6aiQAAEZ"
+    "FhN6gGeCgsIwdkxnaIm5yJwnizQYHA4huGQICFMVAfg4hF45KEGdSWlfZRPBL4PyaWfai2"
+    "Q94DjMcBW1sSWnSZXR2g7hBAYQTURwCyRQyRLcJzl8SmkzcrShRt6UfdY0eFc2kHAw6By3"
+    "yRzmSHABQ0Z6iggboguo26wIHC1QXJn1hV4QmHA9mJQNjjoDAy88dDlWIxGHRpoEsD1dSp"
+    "zxydq6aK+bQLes9DxMOtQftprs2pw3M9spm4LdXitUhVMiVwsEp8GXnOlR9/2Z9t5VnW1x"
+    "tvwnlz+UQrVd8PWrleeCxTz9NuSKgpTWSDVrQTk26P6YcfSdbLtLN3SV+aEka/ezdkvUIL"
+    "rYmqlG07nCZByTgNyaqJLY9lq5IXSkO6kOPgYEWOZSvbU98kvW015SqVe0oiUQew9XrXn6"
+    "aE3ZOIhaLplvZIwv7BOrrN+9GEqSM1/G0k2u+T3IYzuUQ7azBvI9FOEyW2k2jL2VEUR9P3"
+    "PiQ7BbpTL14ILeQm/wGd9JA6aSjiN5QKa1eH7+ACfsA4FO+D4n2TYbofzSzU7+sh4AP1+/"
+    "qt3wcXWE6lMdulQj9EhlGBgg5jLDqMNuqb8vmq/UpRQ4E2ALQBgy3B2fm/PaklBBgq1BwC"
+    "McvJKe5LzAJFcHosgiPaNXTA8iu0uMMTLt/aQsJS2SvtJ5etVx0Qe5t1oyerpUV94ARK+4"
+    "MvxMUzWdyFvTffG3KhrYYItiRfMImqWNRAVl56aTR9FcIrQ4ZXVH394OJXc/EnjBBLOaZS"
+    "xwHf7fheBMi1ldmuonRw4w1ANV2L4iVdI+Ig3aa2JbuOA9NumWTJC+nab7K0byp012Aast"
+    "1LHIt+XNq/AtVlDPDcjufyBrD1jecSBnhuxzNEuE4W4XJJZPqBODsbtsgGORI/ZwVYD2+l"
+    "yIushwkafcM4PH/x7OXrm1fUjueXtfoX+YBc8TNJHATMaRdGnvVJ4ajI4YbzJj/oaz7p2F"
+    "W/IS7ZxBtlajnccNQ+nAq3+ItPgm1DxUcxtTVYU/Bbs7nh5u5F/dCHImttuvFmoXYSqeNg"
+    "L9GyICwKVGtLlyCd7CFO65QbohRs8dUOra0l7WPA8lr5sEy2ulaRXEqB+QIEVEMhMxCCQR"
+    "qmcxr1nKN6GiZOnNImcYKNiLM1Q+QcnQuAdXTL+nnnOU7sT9Ae2l1x9zq5tE1c/MrTSeMj"
+    "FEnC9Vrlq+5F58dSFlR9i7rY2RAyD/ZoNig9sid3v9jDzGeL/QWQbpkPh9UownRraxsxZT"
+    "0wPBcbySnaSE/RPxjIyPv+U2hUXGsGCY1ojY0w3hje0iBRaOSfXqmJ1OcHtRGn7LhJNSRl"
+    "R0siWam8AGqVIdUq4OgZ1gsBvsmjfZO/x8iNhDVEpLNBGQKxiLqXIF8YDjgw1qBwYhzLib"
+    "F1wfNiWW4bgaqi4KLI/osim5Jc+EgpeFl5PDGS2+rBawY2Jk14fk9HcFAoXeGRHxKyQ3L/"
+    "gnDYRA+5iU5rRdB3BFvon2/fvpGxW0bVl05iRcZ/DYe0uk9z0KM+++sydpOCOsYiJk5E3P"
+    "CCfd7fZsNv8xhLlVWTkwnVFUG15ZB1UJcJQaBpsECTWB4ut32JMHwAqz/NMaYX+47osmh5"
+    "AumynPcSBCaczgcEbxBRKjS0A3TjPhmRhKOvqz+2mpuqQOigs637p1q5pxq8U5wKiQTRWt"
+    "k3VUUd6ZoaGeNqnil69KazgyCII5+QS5CjJuTp8NbLzLtBQZqlVlJfTz4APBLG4fBxoHuL"
+    "TeyWArZth4EDwvak88HxURh+9gLbXKNQ6RYWB9Qw2tPZhuUgTQ7yfY9+rw7qA9wUPU1wTF"
+    "opJk5Y+WWSfJ2g9MskeVqiDVPGremcL7w+qULWj0lfPxVd6UjYSYvlTJKxk1TLmSxTLNfS"
+    "8Ty1zEk1SZbyqg4nKy40SdZOWF1oknzlVhZgi54CuiHtXdKX7oyVqq0czVhR5UVHxk5Vwm"
+    "qSZJ1UZD9JxkBlr0QXy8l4JE0tk1ZOkp50WjfpkTo83p7Sef027UtXxk5TRG4yVCmJ1kqP"
+    "qWcRSutej8VbF9959I8WT23SY3u/xTjjHWKC1YV++TZCrvcrbTT2yv7Myh5n//2g7COMHc"
+    "xArm0g+x4HITYCjKzdala57qOAU6zjN2e+/iROBtd0BlUYpkOJBSE1edSmjIGATTuFSc5Z"
+    "ytQBZO+AGjJ+3a6MXEMVuTrd+VzEMy3Pn1fGaEFy042SPrLnhZguBML7Uw15OEsYLUivzS"
+    "VtLPtSbtmXnGXTT8ORspSqijpnKRUzN9pUNUFTGTagfnv3ymQF3DLhVFNqXolgqscJoaTO"
+    "n+KkINEryNe6HUAH9erQ6xwkv5Ibur6XWiH5lW6jnnNUT34lj1AecKG5joXyglAHcyhe80"
+    "2rctlGHghmC1UbT1i1sTqVdkCxqlhkZKaslPKgvgTtp7v0/HdhzmpFMidKNT9njjDBREmP"
+    "IQ89VUUb+6NPNdHI/vjTszQFXBI98lEYGbUeKkGnfY0h0jSe1XHeEGkqhk255psAqqOvuL"
+    "9KZCpkFwgNOe4l9d6SJezHrqUU+KiAgOl2TAdeLIp7yFneATRkuPuoKV0YA/XYUhV11hkk"
+    "sWurZ+AsYc45MEe/pPR6t/wBr6I0fMp72RVAUG6AoByy6XEEu6Jagg1ynzJIh+Bc3yyHxM"
+    "YmXi6xJbqjJo+A1nE6cD10IBTCzhB2HsVQTDQACWHncxx1CDuPJDx6ujTlmhML8fyeeE0v"
+    "iC4OiOiLoMAxBPW7jIBCUH/UQf3TFIuYMsf7akVI5+Yupgs10cRk5wzBujRC3cQtRoG1ns"
+    "k1E1mDeRu9RFi03SuVeOMFG+SQP7BtWJ7Prtx6SwMZWVd/Cg32deZGUfIhvZPrU4uibZde"
+    "YGQGYKSfejGrDV/3n/DR/ei+dbEReJ8NHwd5T8Y3Ie2I9vPnufEJ+xGFGeHWtYzF1mDX9+"
+    "nvZy+xYcOu/V2VrAt/m3zzsRUoafMkaq3qsEnoO2irLOmo4waMKgwUT+gjbsP+NpeeY4vu"
+    "r8nJrsG04/q6ldbgukFrcM1rDUoTnoqLuwbTgOuh/dzpyqLCeYEAulvRzR14T7S5Ku9xRX"
+    "ur2h64YWtVaglF0PTaYkARtGPnDSiChocnHYqgTdu+oQjayAYEiqBBEbQh9eut5OtQBK2f"
+    "GQSKoI1o5v09Rg7dSqsX3+KAsCx2Pjihj1lmVVHaNfnAVEAwKJ0PiheskEv+UH5g6jiYta"
+    "Aq3bh3kAquRKhKd1gBi5j+8ADbUJWuZQ0LZGMTStO1rLTmRjjwA8yE4lnVteMYO4tqa3SB"
+    "ICuXUjZ4MbFxrunNbCU33cPoFHRN0rrSIiCULii+plSJBwdLL9hQ3qAMm2Ld2+x+GJRha/"
+    "+I2qdjbIprwG5OWxKno8dS77J1u3Rip6pfN0UrK6mJoZKdejXv0MdumKyfp6ppN2GjgwqA"
+    "imen4UoBTtGqikMTlEyEkokdmxbbaFLLSmonQtnE7som0t/pBSSMpFca1esmvsq61O50wG"
+    "uFq2tEMvc1neRfI3d757E/1a6HHnWcP6kIqOFSXfITzZp+WvSDA2ZxLJhQpzq7tegFiYV/"
+    "wtuko+yqaTEO2R293aOQNSwLsLMm0Trw4tVa0g2n2Bbe+qOvm3Ut9Nc9mvIKtwJNeXWL1a"
+    "Qpr+3retWUfyilWCt24omuh7aEFMatQpx9X3aDZLqQTFcbpuk8rJxus4wBntvx/HuMXLrS"
+    "bc3CO6UwN0vQkLtFcE9ix9VuAT2E6Ap4OJ4fTIRkwnqPLYm3q+FibA2ng2R86KuxE8nbSx"
+    "8fOxOSDKBk6zylbCmKIFfry/MuCuCQfHEsyRfbpNysHb8Uh59HdzD6E5r3RjTYOSeNo326"
+    "LJCje6QhDeQ0eKWr/QZZzM+sRm0dB7lLG3JsBgcm2AzAdCG7ZjdO/aOyaxYG2QW9Z5aNMB"
+    "h5Vs2pEqyeVnO3Zg1vxSNb6VobcX2ZH1M+zUSJIgjL5QoVeThuJ4PpOQy3i+FXIm0MHKzY"
+    "CgPRuJFE45hBpPxw3Db4w8ogiGC0i2AsPHtr+igQzMFypisgYLod0+Dg5Ynu3sGbzeQcy4"
+    "2pywrQgKnLdq9MNndZaK2xHTuNzlTZVF1HnnVt0YKO3Gfcfs2rI3WIvdVSALeYI+S5DLhc"
+    "WJa38Z3kUvQhIQAeDSGAMYcAIKR9upD2kiRbCSXeyxjgXJ1zlugBm3Eg0v43ZNStoCBpVP"
+    "OwHJCwCMqpDvkQQDlV+dZKX20HlFPVbdQFOzzuxlvNp9vSEVtDQbQcJB5D8Vrc/lUt9ClA"
+    "AsOgROg0wKioRCibZBcEn4cWQfAg76c6X7KGp3lkC11blmtrvGqovCQaxhEiTpISimU+PP"
+    "JWvWoWxYmwP5qUUNPl60SJLqZCWK/aFY/lTP+JzhZesJ2JRCyVBvNGNUvS1FyX2u6tBZvt"
+    "LIwUa5SwlYKu8mZQ2WxkCpaN94l+vnlA1J9D6uAC7Dvun7Pm0+kgNH0cmDYS7EifY4tskN"
+    "PMPNdH3SOUdnKRdTa9wWiKTr949vL1zatvHs3r8f98WK6k3G8xEhVUlc4lHA7cMLy7ADmW"
+    "t/YcMw6VhAE1GEwh+6eQnDKbfovs+f+M8ScFg27oAUybN207iFeqdl3GgFHvN+qEr7Qfjm"
+    "V5PLiKgko1R1QLsqzYV87FUkVpaOd9FDnEdpxm8aWfc4/VyknyUP1Iv24zuVzLJ5drbnLZ"
+    "oICliDzgkMMj9eO7+8ncIffJyZBEsfKUIsLqx3kvyn36swKLhNg8KIGZGK0f9d1PLzbBkf"
+    "ItoAoIWN7PMnHDOGDxIpbC854o1gkWo/XjvZ8dywazmyfWlnm7I+YgVtijC8GwVQeNJmg0"
+    "Qa0HGk0Y9fFoNEcjJZx8yJGTuamkemghicuLF/QviBtrtn1lOVx3IgS203jxJVEK0N/zs7"
+    "eYCYQIfKN5kxghos1NvGtv/ttbtMu0MfvfGMfYNlgHRtGBsfQCAxm1upM/GCHGBmMBu/Z3"
+    "tc+88HkhQ9edt8n+ge4RScyRrSGQ0GNQOQQdWEtwjG+8lb/DwKV8hUv5KIrwxheJFOVhyx"
+    "IEkmJzhJanDcVNax2r4bZ1uttU/nTioJCuLUHgCVxgcjdAFQW+APAFwKmwVS7ubH+ndiys"
+    "oeBc2OW50C7VkT/qYNhBXfpJHBBr1tj3CTGV9j9bx+6nmeBsWH573nQqzO4bWKxlD4kXP8"
+    "yymwwZLW68YblqfwNF+gmPYNkgtCe2AMAtU1H2M/KH4EQrFztnzYFLEZeV6aLK6Pv3L59L"
+    "KK2gasTGMbEvGHaC9DZwl2y1H6W7tvJ+LPmljdegw+JC2JHXR3WtpFxf3Kv2NaZUy9URkO"
+    "4ESkO0dy9Qvnu43znMbq9uWA9GCjeIa/iBx6wx/MFYEhc5dL5jL0de4dFNv5XhUesy8D0O"
+    "tkayAzFQEJB7bHNe4t4+pY27uBRwVHMWyyes7ieq/TuWUmqt5JPYH1enyKu1Z+Zq2rqwW8"
+    "RpVWOO7IbCoWWQhkmKe1EkJaSpSu4qIA2Z7qdEa7VWdVtnYw0G3kZ1b2PkJcpz4fb9KVlJ"
+    "d/BVnE77+L9cXj569OTywaPH319fPXly/f2D3Yaef6tpZ//05d/Z5r4yBPxuP1mOJQMgZb"
+    "8K0on97k5Ra3R5/Vhl5i4QOkwk1Vn78VWLSfvxlXTOZm9BmALCFCBZ1G3U20gWKeVmhA9I"
+    "K1lGwaVvSCs52OLPqh8pkVpCgKHyhO5ymKmm6eSBYLCQpbNLx7Rqls6SRXbB73kk6eQf41"
+    "Y5OpP1vwOWX6HFHZ7wtb026TnLe6X95IZZHckjic3LUerJamlRPzzhaaELqXnHlLNQ7rQo"
+    "mkwSvSahfB/i4DkJsCVLQlltMG+M6oUsfV2l7d6g3osNIo6RMG549zgwsnUmNJBrG35p2g"
+    "8N2r9tLLZZgI2epNaG43mfYv+Ci+J10+1H9yN9yP2IxQDDrWsZnwl9M1vrvyuvScbngNCJ"
+    "hXUT0pmB/laGye+PVIm58Lc/fHSjNTYCz8EGCen3wazGV0xN1Qg9+ukrCrY92p/rRcYa3W"
+    "Mj8uhPCELa3KafTejoBt+FPmYpOaOtwa4WX0iCjB/ScUlHaZ6NEn1aQRl1SmUUZgaq4jbd"
+    "AboJdp2W3P6DilWbb0tyFaVhWLGH4qfhrrp927NqgYBDqqhYh6dmtHl7MNc2uQlJ6Dtoq6"
+    "zsqOMGrI48m+4s7FOO1LJAFgioCFgJW3SRbcZHYfjZo0eGNQrXKtbPAXWca/p4ANgJ4V71"
+    "EnIBGvAWcr7/m+wlZIiZyg1dr5jpURfPunOd/INlE72lp/2UvZrfpPTuvMlpcp/mJN01bF"
+    "22IwEm3obQ2GAUxgFmt8JCzhfSBtBGnFyNAJR6SMuSQ3aLQR0IHP+Kk54Ir+HUN92pjlcF"
+    "hdsw8hximQtfJeReRUHYXVAUgKBDmK3DgFqe2jVGQWQGwglKSmwVBLSKCrqGPqE/3wu2qu"
+    "SKoEAxT/HCs7cmS1LEOKArpWCBbSrsJIKfYU2nK4WaTt6XLf39Zsj4kuSal1q1EAtmzZv1"
+    "Z0xWa9ERucmYC9AZmvD1/LK1Ca8PYXcN7LZjd7EhqrNwijhDXlUmXp92bIaWJ1rkGvTRZR"
+    "BMtYIdhON5trlyYssTFRyTMsvhgFyeXMicP+T9VbiGJjfsaTrX21xD26TJLUwmTwtsNZWH"
+    "EAsTGVxOGs5FwgzvgLs0PBD4hbs0Cqty53dpqnNpBxRnWYve7fqb1hTclmfhGrSf7tIE0I"
+    "U5n8fVJX7WHFPyshscEGs9E8Tps3fmTTF6VLTpNGcpKPBPGEC/x4E4N6FcBleCgACupQDO"
+    "F0RU5QxnzTVkt5eEXqwKo3DTJRfYliDDK2xP4xHpTEt7UuHZ1/8HSnNX7g=="
+)
@@ -0,0 +1,222 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_scans_patient_a9ec5e";
+        DROP INDEX IF EXISTS "idx_scans_laboris_877989";
+        DROP INDEX IF EXISTS "idx_prescriptio_status_24955b";
+        DROP INDEX IF EXISTS "idx_prescriptio_patient_08b257";
+        DROP INDEX IF EXISTS "idx_lab_tests_patient_1c1fb1";
+        DROP INDEX IF EXISTS "idx_lab_tests_laboris_8c8125";
+        CREATE INDEX IF NOT EXISTS "idx_lab_tests_patient_efdcbd" ON "lab_tests" ("patient_id");
+        CREATE INDEX IF NOT EXISTS "idx_lab_tests_laboris_6cf577" ON "lab_tests" ("laborist_id");
+        CREATE INDEX IF NOT EXISTS "idx_prescriptio_patient_20db48" ON "prescriptions" ("patient_id");
+        CREATE INDEX IF NOT EXISTS "idx_prescriptio_status_45f285" ON "prescriptions" ("status");
+        CREATE INDEX IF NOT EXISTS "idx_scans_patient_20e324" ON "scans" ("patient_id");
+        CREATE INDEX IF NOT EXISTS "idx_scans_laboris_5ad709" ON "scans" ("laborist_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_scans_laboris_5ad709";
+        DROP INDEX IF EXISTS "idx_scans_patient_20e324";
+        DROP INDEX IF EXISTS "idx_prescriptio_status_45f285";
+        DROP INDEX IF EXISTS "idx_prescriptio_patient_20db48";
+        DROP INDEX IF EXISTS "idx_lab_tests_laboris_6cf577";
+        DROP INDEX IF EXISTS "idx_lab_tests_patient_efdcbd";
+        CREATE INDEX IF NOT EXISTS "idx_lab_tests_laboris_8c8125" ON "lab_tests" ("laborist_id", "status", "urgent");
+        CREATE INDEX IF NOT EXISTS "idx_lab_tests_patient_1c1fb1" ON "lab_tests" ("patient_id", "status");
+        CREATE INDEX IF NOT EXISTS "idx_prescriptio_patient_08b257" ON "prescriptions" ("patient_id", "status");
+        CREATE INDEX IF NOT EXISTS "idx_prescriptio_status_24955b" ON "prescriptions" ("status", "dispensed_date");
+        CREATE INDEX IF NOT EXISTS "idx_scans_laboris_877989" ON "scans" ("laborist_id", "status", "urgent");
+        CREATE INDEX IF NOT EXISTS "idx_scans_patient_a9ec5e" ON "scans" ("patient_id", "status");"""
+
+
+MODELS_STATE = (
+    "eJztXWmT2za2/SssfZlMVadjt7vtzMvUVLWXTJx4yXO3502NnWJBJCRhTBEMl7aVGf/3B3"
+    "ARFwAUIZGUiL5fvEg4kHRwieXeg3v/M1tTF3vR+XUQUOLHa+zHs/+x/jPz0Rqzf8jePrNm"
+    "KAjKN/kLMZp7aXtUNkzfQPMoDpHDO10gL8LsJRdHTkiCmFCfveonnsdfpA5rSPxl+VLik9"
+    "8TbMd0ieMVDtkbH35jLxPfxV9wxP/7gcNiGtrE5Z/lohinX4aw786afpgFKCbsm1Tf/433"
+    "EXyyFwR7bu2nZo3S1+14E6SvvfTjH9OGHD63Heola79sHGziFfW3rUnGzhL7OGSfxbuPw4"
+    "T/Zv6TcooKGrKfVzbJflcF4+IFSry4wtHcLl+b2fabt7f2zYtb255psOpQn48I4ePDf/2S"
+    "f4VvLx5ePrn8/tHjy+9Zk/Rrbl958jX76JKYDJjS8+Z29vVrRi3KWqQDU5JajEmd1ufsVT"
+    "mvRfsGs/xlPqznxftVjgtG20guXihZLs1xBJpbOHx+ffsiJbEkLTVggbRnKxTKSSvaN0hj"
+    "X2CCVM3W6IvtYX8Zr9h/r1qY+8f1u2c/Xb/75urP/OMom2ayOehN/sYFf6fOrJswJvgX6v"
+    "6kVyG7n/e+CH704KQf+JLRKEZxEulYa4kYz15nkbPCbuLh4usMbLYXDzrY7cUDpeHyt+o8"
+    "hxhFMru9xV8UhlsijJgXWgi9ffHPW97zOop+96pEfvP6+p8px+tN/s6rt2/+XjSvEP/s1d"
+    "unDcJ9GmOJXav53gL2ojtf9O8r2wvqefSznQQi408p9TDy5aTXcA3i5ww4lKFvXxmX+6dv"
+    "376qcf/0ZZPc96+fvnj3zcN0IFgjEmP5xO2w+YFxYqNYvj/jmwo553Vk206t2JhMbKrhU6"
+    "f71vc2+XPZ9jC8fP3i5vb69a+1UeF7Ov7ORe1pKF795nFj3t92Yv3fy9ufLP5f619v37xI"
+    "6aVRvAzTTyzb3f5rxr8TSmJq+8z8kVs5NxSvFqzVRj0J3D1HvY6EUT+VUS84qgx7/u0r29"
+    "7qMbnrvreKGW/je/Jn3ZLVunehI611EPCa88q9MotPUhdCzpjI8Y80xGTp/4I3KdUv2ZdC"
+    "viM7CederF/LniZG8dfCjIpXy+k+RJ+3zqyGdTEG2O/G2Q7g2fXNs+vnL2aSiaEParmTj/"
+    "CfhSd8uNjJb21SlNPLLXmOnE+fUejaNZPm79AL2nhl21Z8a32xbr6CfLRM6eG/g3/rnP+n"
+    "Hp3PJI7b9PWzNo/tnLXo5qqdPaN+zKzrW7bwsLUpwq61IB62InbUZ/+ebyx8h8ONlQQeRe"
+    "53jKuE+4GtzyReWfGKNWTfzbr56frbi6vH57PGwPTb+0f/ox/iBRvRhLUhUdrCT9ZzHFp0"
+    "Yb3GLnGQ9z7ty0K+W7zyvOg2pJ8jK/Vls69nIdZH/MNHP8LY4gOGffc7TpwdMXPA58Em/T"
+    "m7PdbgfB7T+cxMh9mClm9qi+jHZ3JcemsuqceXHVxSjy+VLin+VsP1R/6QuKmfkqXScAuE"
+    "Sduev1xcPHr05OLBo8ffX10+eXL1/YOtGYtvtdnz05d/5yZdo1/cdG4nNY35ooYZj/upuL"
+    "DBE6KmeppnYpUnRDhlHGez9swjPt9svKHp3lHYtNXeb928OXlLe+t87rCLyzFWikk3P2wH"
+    "iMO7NMwVifuy3e27hOrrRxPelw0B+fH3RCnxKT8a26IayIhoUiPK3CVcd6UO110J4brSvj"
+    "WXlBrQwBVlIiuIxKsqOtOjZP5v7MTkTjLK6jhhHQXBQv1gId2HdgqsH8Y6iiIcRWupK1ZN"
+    "ex0FvOvzHnhIS/dRtAeu9xN9cC9wrGnlTZwRe6TRDT0kNCTxRmdnWsWMKCcLaRITH89G2Z"
+    "32LyaLyNLHktNVq9SmBIHORkNnk9G211mgAe3hNDCh6X1qhwH2FyNR96GqoOCp0niqUt74"
+    "rtLWF8bKsLBZ0l+vwW+uXsDN8puDgtDkUe+iIGTvrXQVhDWMSSHf3iKP60x0wtYhh4auHr"
+    "tS7F4sn9gyBjLN0+UVZJpHkWnWn/UeKM7Vbu+2/U1riujKs3SO3E13tnD1Ycn3QxVbW+hP"
+    "SRX7HBFvc4M8HL2jnpcEM4nYQmhz1ia4cHlrO+LN7bBsv1N08SsOv3XR5swK2D9SsyQ+tl"
+    "wSBdiPuMI0pjFDWnO8YoOd61nZh1ghDmgYi2rZQzvkAtn32YbcIn4poGW/w4+41VL+IoqL"
+    "LrnywwrC8ledWRFNYVmHFmX73o/+CkXsk63IQVmfGUeZmpZ9DIkji3+mxT5liVWi2Q+M5t"
+    "SjW/wublq/gZT2qHkcJG75tjQOMo/8/cri8HuC/FgazlBaYxUCOk3R5yfXvT7HDlkjT+Xs"
+    "Uwhf3Qx1nqOnRm6bLb549vL19atvHl6cXTQcqYXX71IICVWndsm1d/VBqYkDu5We8vNVrD"
+    "uxDRQcQXcfQQvK+jog5V1NjGStw1FpYCe1bydo6dOIRDPZhn37ZvtOPWvWVRWdOx2sGqy+"
+    "45a10Fc+5+lvQPY86v6VOK798AEjztUSPjdgJkQJ69qSh120JQ/V2pKHwkbCLR5PO31Fg2"
+    "wRaYSMqiHmueqS0oy1Ust5rsS0ZlvmdJX9ItJAzvuX97NPw3GLpkchQa6hDjwcn9i0onc2"
+    "ZocG6t21yqJUVxkbwPvMYsRvxGsKJqsY85azAaSS08hviLZXG6ZIsniNsauWS0SaYNSg5D"
+    "qZoZiopgeUXPdx1LsouQr3hWvPN5oZ4UQkeCVB1QWqrqnzCqouUHVNiOc9VV3V5asPe74f"
+    "2i7Jon9KkaIf0Zp4m58Iz8O3mUmiRfUGZ20Ro0Xa1F5V2nYOG2VYKzdNq9KHNIakbq4ZUI"
+    "Iw0qhhpBB7WdajFZFkqlf7hJo4cLJ3cLKzj3OJvFqLmukayECaB4kfsbnVpgs7jU9ozBpN"
+    "GJxTJKI1xhGK2fdEbPj0qK3CgFpJ3kaURKkBKshtmSQEpAle4xEmCoiGjBANgcpDEPs4ia"
+    "GYqBccYh/3cdS7xD7AaQxO4xPzr3VxGh/HtfZyjZbsF77DUUaM4FqrNzhrc62RrKkdpm07"
+    "SrKf4xgRj99PzNBWBV3zqrU13EegnbgbyE19BO9axryuhLWOMtDl8/BBN5F2m0pbOGTMKS"
+    "MtxEtN91oDBmx3Y5unBg1RFNtJpJ0iTsBCojidMqcFe7rTigA04XA9gqnH2Fllv1YgW+3B"
+    "qIFMIHpsL8aC/U72fbTcRlWMERP52KSTNb/9HEmXUDXtdRQQvwfxXPmx5lk8yxI0XdmXQG"
+    "G+2cf0eYRKtxBZAwWpApq7lYygJPQkNv3zzds3bbQWqKZLkjix9V/LI9Fg7M7+ukj8LGXQ"
+    "PCFeTPzonH/e34aKwLRwyllqt/amYZ/V3Yy8g6a1V1wCwrDsSOFdQxroLZ6ud1gMCmSZrP"
+    "ZM1i6AYbBPerAXyCGe5uXJKsaIjdsY2iLHyXa7dlZ+WYdvGdaE3doIx3C4hAKXUCbLa4hc"
+    "Qj26ZHtIPW5FIPArq0njIF+P2AoCJgIIgMOtqcnxvOetKf7g90DyTd6NmdxWZsfdjFbWqD"
+    "4miPtxDU1c2E9JKvMKzdUymfLNszaJDBuhPeUxDGnFOIp362NkLfUFMrwH0MccQR+TEq+b"
+    "Va8GAqdFN6eFQ9cBm1F9fbpFJHDejfNsTrLvkCfTDrTdrazjDOR7EA9Rzhv7xZJ9yE66C5"
+    "h57rj+L7KGeIFDzLZxdlr2Qo9tAWoe44OYN5r7NFyzA8/CQ0stp3MTaB7h/d9Zy2cF/fuB"
+    "AnDEa4IL4meFH6bIeLkLF9huD1TWgBCkPOkgJUSk79FgBzhcsJWH35NhdOtMoiLSwE3wII"
+    "cO7nXJxMcOkTk61ZyLSAP3CUNQDtfbxxRqZmaqG0dtoCDkB1k+j0IyCCwgXn1ikSiIV590"
+    "vLpYuXog+hWa3+JOqvmJUtxY5U8soppyL4+nFsPSHk3lP61bLFXNbJfoKPssGuaBafYm5O"
+    "c8coRU96ZvDWTgwXmga74Qi4acexU+A5zeJp6qOz0Jl9IdcGtqhhIEORk0cjJEzgq7ibdH"
+    "+TcRea9LzJd0FO77zlOEgDTBudYI5HeJ46vD+DJNEN8d7xeMEdE9RGNOjH6TgjGE/7LE0c"
+    "4v0MSZ8FiNn95hq06t066+Al+BHHT/fTrMD3LRHWIzY9o5pB5Wr+TTTEILqYfv46hLNhRC"
+    "6uGqk1AY9rY4bBUFIUIIEY52BxuznxXFe9QJlSCBYQjCHjMIWzXJPgi+J5cuxQe5UwA2Xb"
+    "LGp/nEFjqNKGx1jdeNwlYKXObXPG3l+flp3sOPv7zLC9Kpya9dWzWD+cY23KPIZWwtGGcH"
+    "cpVLMt6nXRrNlx1lCZkOJCxj6qZMg2oIYQNLItJ5Ihf+yJUR1RZnOwQS2ayT6WuG10mAEG"
+    "JMIYSLAxTGa+l+Uh0VqqNGDB6nlou2JXOnKYmIVmShRfcWMCLTLhqJ4v5D9A4OY7JgC60i"
+    "KKOODohISJLbe+wAfwlwSNK7yhuMQskAKWd1GRSSQwuyiQA7BHnkD/0HQAKFJ6D3J+AzDT"
+    "/ZhbJCZ3gE4GkMDv9YYwYHrzFXazkbvm2P+S5XY4CkYAg07z8ac0JF/tVh5rw5BJkhyAzh"
+    "Rggy38dRP+0gs3neFSFSp3MRqks45K2Pbyn7Y6SY01EHZLhYyEEu1dxv/5w6Ser0kvhUm0"
+    "3O2pyqxZ1FN2/dMZNn/hnWFmYh37W2cYlaLs8dbfcpd1tcFqms93BtbVxvbT6Y2lfXBKCB"
+    "l6r6z8fHplHZ+bzl3loBMJDeQe6sVb+ZwLP6mNeAwXFvn0KgHta+l1kDgY13s3G2UVnyBI"
+    "KpgECXcSkYmO/GfGqubBez0rbxAmQg01edQppXLSHNKzGkmZKmuympgYxkuu8NScpYRP6Q"
+    "0KzcW9cwoK+VxctW6OLqsY7llggTth51q3182cFqH18qrZa/1ciARtb6k0MNZODkMIiyJA"
+    "jpHXFxqL2xE4Dm2fUw55fiXK2boEAAHpif4MSo10tPwM553PHFkwywf+ocBEWkCYY79llw"
+    "jWPEfU4i8+pIdxUDAe79A9wxWmopdIr2p6H8MEqWM5EESjy8c4eHIn1wcSbIDAwLOHeRGU"
+    "ASZLjhPFletzfAdC84i0DgF+43a2x9IMn0ifC8Z5LpygTQhznfj9vk4qw5aMLpaqraL7Gd"
+    "exTYb7P/TSXFdYrbq4Uqa/cdVu69eLHt9eesUzMek6/76ah+DamD3STEM7WQqmxz1kVJFR"
+    "TNNaVUJc7KiyPhbB2XaalUjfXFVNueoD7yEWRUThAz1ly9er0VjAk+xmY0olMwoiUWIQlF"
+    "5Ba+RyyigTQw/DNINKJkTjfaJiIN5HyQkNucuhs7IrLoj5ruGsjE2WSY2GZ1yRTYbnceim"
+    "gDHYgTcRhKbqiIHkM2Vum+2l4TP5Emm1Vug2RQ8BeKfi3k44jtVyOCtNcLCdS8aax//Vaa"
+    "3F2dmEId5xaAJrA9dpibJjHjUU9+W0JMYHxo++aLgE0De9+k+Cq8CdyPbe2VY5RusnYJFE"
+    "ZgjysW1PPYpicJbJ4gk4RY4stpLRsk7wBKCGmUEAK5gXoxALkByA0OOD6A3GAgXovQgrbe"
+    "QIIEhkFw0GdwFgQHJy04qM4Afdjz/VAcSObNkWtcV5xyUUSUBQheI39zS/mfIw3gqSaDSX"
+    "+e3VAONH9syKUZjEmB2rpYgA19Okaf8CY1hkovuTFshzFvIooO8obxKqTJcqVoU+05UhoZ"
+    "e90WhulrF1mFOuG3MGnuFlTopPtmdkl8K0daGdKKVyi2+NhRj/BTUmQhz7Py9WPbmPj8yd"
+    "sqaOqyi7561ddn8K5turAjHN4RBwQaIws08lVPNyrRgBkYwoYcN9NTZUCOm2M5YJuzuMB+"
+    "uwdQAjfQDTgRt1830cCkqllMW4+zQA7xSCw5pbRkfKlgDOR5kOXDWRG8sFMBACIyw25RDY"
+    "hQWEb2yIztET89E0XJeo1CicW3DIEEC2OgPwYxj8alCTOYLWvto0Qk8H9ILHtfbYe6BxiP"
+    "Pba2JHLYMrvcQ90hgcII6I8AZIsYI1sE9RfEZZM3L0oUb9hH3WFPh3NlByMOgc99kd5khw"
+    "AUNPdQQQN1QUwbdYkDRagLUjyxusITAQeyE4mwx0NRbBePhy7FcjDo0kCXBqqpY585eldN"
+    "lfNpH/TeDxGPsAbtprkxp47P9YnNxF2plq9FupIpiYNV4csocq78+MvubCvP8r7e0AnnzR"
+    "UTrdR9P2jp0+hQpp5n3ZDIUJrIGi1ZJzbbHrMPP5Csl1ln79K+DCWMffd+yHqF5kYTVSvb"
+    "tj9NkpJxBpLVEFseylYtL5SBdCHPw+GSHMpWvqe+TnvbGMpVJvdURKL2YOv1tj9DCbsjMQ"
+    "9Fsy3tgYT9g3d0U/RjCFMHavi7SLTfp7kNZ2qJdt7grItEO0uU2E2irWZHUxzN3vuQ7hTY"
+    "Tr18IXKQn/4HdNJj6qShiN9YKqxtHb69C/gB41C8D4r3TYbpYTSzUL9vgIAP1O8btn4fXG"
+    "A5lsZsmwp9HxlGDQo6jFPRYXRR31TPV91XigYKtAGgDRhtCc7P/91JrSDAUKHmEIhZjk7x"
+    "UGIWKIIzYBEc2a6hB5ZfofktnnD51g4SltpeaTe5fL3qgdibvBszWa0s6iMnUNodfCE+nq"
+    "niLvy9s50hF9ZqjGBL+gXTqIrDDGRJs0uj2asQXhkzvKLr6wcXv56LP2WEONoxlSYO+O7G"
+    "9zxEvqvNdh1lghtvBKrZWpQs2BqRhNk2tSvZTRyYdsckSzRia7/N077p0N2AGcj2IHEs9n"
+    "FZ/xpUVzHAczeeqxvAzjeeKxjguRvPEOE6WoTLJ7EdhPLsbNgha+Qp/Jw1YDO8lSHP8x4m"
+    "aPQt4/D8xbOXr69fMTs+u2jUvygG5FKcSZIw5E67KKbOJ42jooAbz5v8YKj5pGdX/Zr4ZJ"
+    "2stakVcONR+3Aq3OIvAQk3LRUf5dQ2YG3Bb8PmhuvbF81DH4qdle0n67neSaSJg71Ex4Kw"
+    "KNStLV2B9LKHOK5TboxSsOVX27e2lrKPEctrFcMy2epaZXIpDeZLEFANhcxACAZpmO7TqB"
+    "ccNdMwCeKULokTXES8jR0h7+BcALyjG97PO+p5STBBe+h2xZ32cmmb+PgVNUnjIxVJwvVa"
+    "7avuZeeHUhbWfYum2NkYMg/+aLYoPfInd7fYwy5mi90FkG64D4fXKMJsa+taCWM9tKiPrf"
+    "QUbWWn6B8sZBV9/ymyaq41i0RWvMJWlKwturBIHFnFp9dqIg35QV3EKVtuMg1J1dGSSlZq"
+    "L4BaZUy1Cjh6xvVCgG/yYN/k7wnyY2kNEeVsUIVALKLpJSgWhj0OjA0onBhP5cTYueB5uS"
+    "x3jUDVUXBRZPdFkXVFLnygFLyqPJ4YyV314A0DOyVNeHFPR3JQqFzhUR8S8kPy8IJw2ESP"
+    "uYnOakWwdyRb6J9v3r5RsVtFNZdO4sTWfy2PdLpPs9ejPvvrIvHTgjrWPCFeTPzonH/e32"
+    "bjb/M4S7VVU5AJNRVBjeWQd9CUCUGgabRAk1werrZ9hTB8BKs/zjFmEPuO2bLoUIl0Wc17"
+    "BQITTu8DgteIaBUa2gL6cZ+ckIRjqKs/rp6bqkSYoLNt+qc6uadavFOCComE8UrbN1VHHe"
+    "iaOjHG9TxT7OjNZgdJEEc9IVcgB03I0+FtkJl3jcIsS62ivp56AEQkjMP+48D2FuvErwRs"
+    "uw6DAITtSe+DE6Ao+kxD116hSOsWlgA0MNrT24ZlL00OCgLKvlcP9QGuy54mOCadFBNHrP"
+    "wySb6OUPplkjwt0Jor41Zszpden9Qh68e0r5/Krkwk7KjFcibJ2FGq5UyWKZ5r6XCeOuak"
+    "miRLRVWHoxUXmiRrR6wuNEm+CisLscNOAf2Q9i7ty3TGKtVWDmasrPJiImPHKmE1SbKOKr"
+    "KfJGOgsteii+dkPJCmjkkrJ0lPNq3b7EgdHW5P2bx+k/VlKmPHKSI3Gaq0RGuVx5Q6hNG6"
+    "02Px1se3lP3R4alNe+zutzjNeIecYH2hX7GNUOv9KhuNnbI/u7bH2X0/KP8IawuzkO9ayL"
+    "3DYYStECNnu5rVrvto4DTr+J1xX38aJ4NrOqMqDLOhxJKQmjpqU8VAwKabwqTgLGNqD7K3"
+    "QAMZv+pWRq6lilyT7mIuEplW58+rYowgue1GyRDZ8yLMFgLp/amWPJwVjBGkN+aSLpZ9ob"
+    "bsC8Gy2afhWFtKVUfdZykVNzfWVDdBUxU2on57+8pkBdwq4VRbal6FYGrACaGizp/ipKDQ"
+    "K6jXui3ABPXq2OscJL9SG7q5l1oh+ZVpo15w1Ex+pY5Q7nGhuYmF8oJQB3MsXotNq3bZRh"
+    "EIZgtVG49YtbE+lfZAsa5Y5MRMWSvlQXMJ2k135fnvw5z1imROlGpxzjzBBBMVPYY69FQX"
+    "beyOPjVEI7vjT8+yFHBp9ChAUWw1eqgFnXY1hkjT6ayOZy2RpnLYtGu+SaAm+oqHq0SmQ3"
+    "aJMJDjQVLvLXjCfuw7WoGPGgiY7sZ0SBNZ3EPN8hZgIMP9R03Zwhjqx5bqqHudQRL7rn4G"
+    "zgrmPgfm2JdUXu9WP+B1lIFP+SC7AgjKjRCUQy47jmBfVkuwRe5TBZkQnBua5Yi42MaLBX"
+    "Zkd9TUEdAmzgSuxw6EQtgZws4nMRQTDUBC2Pk+jjqEnU8kPHq8NOWGEwvx/IF4zS6IzveI"
+    "6MugwDEE9fuMgEJQ/6SD+scpFjFljnfVilDOzX1MF3qiicnOGZJ16QR1EzcYhc5qptZM5A"
+    "3OuuglorLtTqnEGxqukUf+wK7l0IBfuaULC1l5V3+KLP51zqyy5EN2JzdgFsXaLmho5QZg"
+    "ZZ96PmsMX/+f8NH/6L/1sRXSz1aAw6In65uIdcT6+fOZ9QkHMYNZ0cZ3rPnG4tf32e/nL/"
+    "Fhw777XZ2s82CTfvNTK1DS5Uk0WtXhkijw0EZb0tHEjRhVGCmeMETchv9tL6jnyu6vqclu"
+    "wIzj+qqT1uCqRWtwJWoNKhOejou7ATOA67H93NnKosN5iQC6O9EtHHiPtLmq7nFle6vGHr"
+    "hla1VpCUXQzNpiQBG0Q+cNKIKGxycdiqBN276hCNqJDQgUQYMiaGPq1zvJ16EI2jAzCBRB"
+    "O6GZ9/cEeWwrrV98SwDCstj74EQB5plVZWnX1ANTA8Gg9D4oNFwin/yh/cA0cTBrQVW609"
+    "5BargSoSrdfgUsEvbDQ+xCVbqONSyQi20oTdex0pof4zAIMReK51XXDmPsXlRbYwsEWfqM"
+    "stGLiZ3mmt7OVnrTPYqPQdckrSsrAsLoguJrWpV4cLig4ZrxBmXYNOve5vfDoAxb90fUPR"
+    "5jU1wDtnPagng9PZZml63bphM7Vv26KVpZRU0Mlez0q3lHAfajdP08Vk27CRsdVADUPDuN"
+    "VwpwilZVHpqgZCKUTOzZtPhGk1lWWjsRyib2VzaR/U4akihWXmnUr5v4Ku/SuNOBqBWurx"
+    "Hp3Nd2kn+N/M0t5X/qXQ896Dh/VBFQy6W69CfaDf207AeH3OJ4MKFJdX5rkYaphX/Cm7Sj"
+    "/KppOQ75Hb3to5A3rAqw8ybxKqTJcqXoRlBsS2/9sdftphb66w5NeY1biaa8vsVq05Q39n"
+    "WDaso/bNMSn1m1hMWQpnjcC22QMBcS5hrDNJtrtVNqVjHAczeef0+Qz1azjV16oDTmZgUa"
+    "8rNI7kJsudq6q/YhugYej+cHEyGZ8N4TR+HRarn82sCZIAsf+/rrRHLzssfHzcUiI6jVek"
+    "8bW4kUqBX56tyKEjgkWDyVBItd0mqWwY59hl9E9zD6E5r3TmiwC05aR/t4mR5P7pGGVI/T"
+    "4JWt9mvkcF+yHrVNHOQnbcmjGe6ZRDME04UMmv047g/KoFkaZB/03rOMg+GJZ86cKsH6qT"
+    "O3a9b4VnxiK11nI24u86eUMzNVm0hCb4UKRR1y20pdBg61beP0PL4G8bZjxtv4kGf8CNy2"
+    "eLyqIIhRdItRzKm7sQMUSmZZNdM1EDDdjWlw4YpE9+/CTcKl9FzRmoCsBI2YgGz7ymQzkE"
+    "XOCruJ1+ouVU3VTeS9rhBa0lF4hbuveU2kCdG1RiLfDnOEOiOBkNHKoevAS6827+PkF9Hg"
+    "5D9lJz8ErY8XtF6QdCuhxXsVA5zrc87TNWA7CWUK/pa8uDUUpH5qH5Y90g5BUdQxHwIoiq"
+    "reWpmr3oCiqKaNumSHJ9xbq3pthWFXOmIbKIiHg4hjLF7LO7y65TolSGAYtAa9hhA1tQZV"
+    "k+yD4PuhNpA8yLupLpas8Wk+sYWuK8uNNV43GF6RBeMYES9N7MTzFx54N143F+JE2D+ZxE"
+    "7T5etI6SqmQtig6hTKM5//xGYLGm5mMplKrcFZq14lbWqvKm13VnTNdxZWhrUq2FpZVnUz"
+    "qE92YgqWNf3EPt/eI+ovIE1wAQ4d9y9YC9h0ENkBDm0XSXakz7FD1shrZ17oo+kRyjo5zz"
+    "ub3mC0RadfPHv5+vrVN4/OmvH/YlguldxvMJKVRVXOJQIO3DCiuwB5Dl1Rz04iLWFAAwZT"
+    "yO4ppKDMZd8if/4/Y/xJw6BbegDTFk3bDZOlrl1XMWDUu4065SvrR2BZHQ+uo6DezAE1fx"
+    "wnCbSzrdRRBtr5EKUKsZtkuXjZ59xhvaKQItQ80q+6TC5X6snlSphc1ijkiR73OOSISPP4"
+    "7n8y98hdejIkcaI9pciw5nE+iHKf/azQIRG290pRJkebR33/04tLcKx9C6gGApZ3s0z8KA"
+    "l5vIgn4rwjmtV+5WjzeB9mx7LG/OaJs+He7pg7iDX26FIwbNVBowkaTVDrgUYTRv10NJon"
+    "IyWcfMhRkLnpJHPoIIkrShAML4g71Zz52nK4/kQIfKfx4kuqFGC/52c6n0mECGKjszYxQs"
+    "ya23jb3v43nXfLpTH73wQn2LV4B1bZgbWgoYWsRvXIH6wIY4uzgH33u8ZnngeikKHvzrvk"
+    "90B3iKTmyNcQSOgxqhyCDawjOca33srfYuBSvsalfBTHeB3IRIrqsGUFAmmvBUKr04bmpr"
+    "WJNXDbOt1tqng68VDE1pYwpBIXmNoNUEeBLwB8AXAq7JRtO9/f6R0LGyg4F/Z5LnQr1eAP"
+    "Ohj2UF1+EgfEhjUOfULMpP3PVon/aSY5G1bfPms7Feb3DRzecoDUih9m+U2GnBY/WfNstL"
+    "+BIv2IR7B8ELoTWwLglqks+xn5Q3KiVYud8+bApYzL2nRRZ/T9+5fPFZTWUA1ik4S45xw7"
+    "QXpbuEu32o+yXVt1P5b+0tZr0FF5IezA66Om1kNuLu51+zqlZMr1EVDuBCpDtHMvUL17uN"
+    "s5zG+vrnkPVga3iG8FIeXWGP1gLYiPPDbf8ZdjWnp0s29lUWZdFr7D4cZKdyAWCkNyh13B"
+    "SzzYp3RxF1cCjnrOYvWE1f9EtXvHUkmtlX4S/+PyGHm1dsxcbVsXfos4q00skN1SGrQKMj"
+    "BJ8SCKpJQ0XcldDWQg08MUYa1XnO7qbGzAwNuo722Maao8l27fn5Klcgdfx5m0j//LxcWj"
+    "R08uHjx6/P3V5ZMnV98/2G7oxbfadvZPX/6db+5rQyDu9tPlWDEASvbrIJPY7+8UtUIXV4"
+    "91Zu4SYcJEUp+1H192mLQfXyrnbP4WhCkgTAGSRdNGvYtkkVFux3iPtJJVFFz6hrSSoy3+"
+    "vPqRFqkVBBiqSOg2h5lumk4RCAYLWTr7dEzrZumsWGQf/N6PJJ3iY9wpR2e6/vfA8is0v8"
+    "UTvrbXJT1nda+0m9worxR5ILFFwUkzWa0s6vsnPC11IQ3vmHYWyq0WxZBJYtAklO8jHD4n"
+    "IXZUSSjrDc5ao3oRT19Xa7szqPdijYhnpYxb9A6HVr7ORBbyXSuoTPuRxfp3rfkmD7Cxk9"
+    "TK8ij9lATnQhSvn24/+h/ZQx7EPAYYbXzH+kzYm/la/111TbI+h4RNLLybiM0M7LdyTHF/"
+    "pE7MebD54aMfr7AVUg9bJGLfB/MaXwkzVSui7NOXDOxS1p9PY2uF7rAVU/YTwog1d9lnEz"
+    "a64XdRgHlKznhj8avF54og44dsXLJROstHqSgvC8qoIymjMDdQHbfpFtBPsOu45A4fVKzb"
+    "fFeS6ygDw4oDFD+NtvXru55VSwQcUmXFOqie0RbtwVy75CYkUeChjbayo4kbsTrybLqzcM"
+    "A40ssCWSKgImAtbNFHtpkARdFnyo4MKxStdKxfAJo41wzxAPATwp3uJeQSNOIt5GL/N9lL"
+    "yBAzVRu6WTHTgy6e9ec6+QfPJnrDTvsZew2/SeXdszanyV2Wk3TbsHPZjhSYehsia41RlI"
+    "SY3wqLBF9IF0AXcXI9AlDpIStLDtktRnUgCPxrTnoyvIFT33SnOlEVFG2imHrEseeBTsi9"
+    "joKwu6QoAEH7MNuEAbUitSuMwtgOpROUktg6CGiVFXSNAsJ+Pg03uuTKoECxSPGcuhubJy"
+    "niHLCVUrLAthV2ksHvYU2nS42aTvTLhv1+O+J8KXLNK61aigWzFs36MybLleyI3GbMJege"
+    "mvDV2UVnE17tw+4K2O3G7nxNdGfhDHEPedWZeAPWsR05VLbIteijqyCYaiU7CI9S1156iU"
+    "NlBceUzAo4IFckFzLnj3l/Fa6hqQ17ms71LtfQ1llyC5vL00JXT+UhxcJEBpeTxnORcMPb"
+    "4y6NCAR+4S6Nxqrc+12a+lzaA8V51qJ32/6mNQV35Vm6Bu2muzIB9GHO9+PqkjhrnlLysm"
+    "scEmc1k8Tp83fO2mL0qGzTa85SUOAfMYB+h0N5bkK1DK4CAQFcRwFcIImoqhnOmxvI7iAJ"
+    "vXgVRummSy2wrUDGV9gexyPSm5b2qMKzr/8P5N07VA=="
+)
@@ -0,0 +1,207 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "patient_search" ADD "email" VARCHAR(255) NOT NULL DEFAULT '';
+        UPDATE "patient_search" SET "email" = (
+            SELECT lower(p."email") FROM "patients" AS p WHERE p."id" = "patient_search"."id"
+        );"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TRIGGER IF EXISTS "patient_email_fts_ai";
+        DROP TRIGGER IF EXISTS "patient_email_fts_ad";
+        DROP TRIGGER IF EXISTS "patient_email_fts_au";
+        DROP TABLE IF EXISTS "patient_email_fts";
+        ALTER TABLE "patient_search" DROP COLUMN "email";"""
+
+
+MODELS_STATE = (
+    "eJztXWmT2za2/SssfZlMldKx29125mVqqtpLJk685Lnb86bGTrEgEpIwpkiGS9vKjP/7A7"
+    "iICwCKkEiKhO4XLxIOJB1cYrn34N7/zDaejZ3w4sb3PeJGG+xGs/8x/jNz0QbTf4jenhsz"
+    "5PvFm+yFCC2cpD0qGiZvoEUYBchinS6RE2L6ko1DKyB+RDyXvurGjsNe9CzakLir4qXYJb"
+    "/H2Iy8FY7WOKBvfPiNvkxcG3/BIfvvBwaLvMAkNvssG0U4+TKEfnfa9MPMRxGh36T8/m+s"
+    "D/+TuSTYsSs/NW2UvG5GWz957aUb/Zg0ZPCFaXlOvHGLxv42WnvurjVJ2VlhFwf0s1j3UR"
+    "Cz38x+UkZRTkP684om6e8qYWy8RLETlThamMVrM9N88/bOvH1xZ5ozBVYtz2UjQtj4sF+/"
+    "Yl/h28uHV0+uvn/0+Op72iT5mrtXnnxNP7ogJgUm9Ly5m339mlKL0hbJwBSk5mNSpfU5fV"
+    "XMa96+xix7mQ3rRf5+meOc0SaS8xcKlgtzHIDmBg6f39y9SEgsSEsMmCPt2RoFYtLy9jXS"
+    "6BeYIFWzDfpiOthdRWv63+sG5v5x8+7ZTzfvvrn+M/s4j04z6Rz0Jnvjkr1TZdaOKRPsC7"
+    "V/0suQ/c97VwQ/ejDqB75gNIxQFIcq1loghrPXWWitsR07OP86PZvt5YMWdnv5QGq47K0q"
+    "zwFGochu7/AXieEWCC3mhQZC71788471vAnD350ykd+8vvlnwvFmm73z6u2bv+fNS8Q/e/"
+    "X2aY1w14uwwK7lfO8AB9GdLfrnyvbScxzvsxn7PONPPc/ByBWTXsHViF9QYF+GvntlWO6f"
+    "vn37qsL905d1ct+/fvri3TcPk4GgjUiExRO3RecHyomJIvH+jG0qxJxXkU07tXxjMrGphk"
+    "2d9lvX2WbPZdPD8PL1i9u7m9e/VkaF7enYO5eVpyF/9ZvHtXl/14nxfy/vfjLYf41/vX3z"
+    "IqHXC6NVkHxi0e7uXzP2nVAceaZLzR/ZpXND/mrOWmXUY98+cNSrSBj1sYx6zlFp2LNvX9"
+    "r2lo/Jbfe9ZcxwG9/Rn3ULVqvehZa0VkHAa8Yr88osPwldCBljPMc/egEmK/cXvE2ofkm/"
+    "FHIt0Uk482L9WvQ0MYq/5maUv1pM9wH6vHNm1ayLMkB/N053AM9ubp/dPH8xE0wMXVDLnH"
+    "yE/Sw84cPFXn4rk6KYXmbJC2R9+owC26yYNHvHu/Rqr+za8m9tLjf1V5CLVgk97Hewb53x"
+    "/9TxFjOB4zZ5fd7ksV3QFu1ctbNnnhtR6/qWLjx0bQqxbSyJg42QHvXpvxdbA9/jYGvEvu"
+    "Mh+zvKVcz8wMZnEq2NaE0b0u9m3P508+3l9eOLWW1guu39o/vRDfCSjmhM25AwaeHGmwUO"
+    "DG9pvMY2sZDzPunLQK6dv/I87zbwPodG4sumX89AtI/oh49uiLHBBgy79neMODOk5oAv/G"
+    "3yc/Z7rMH5PKTzmZoOtQUl39QO0Y3P5LT0VlxSj69auKQeX0ldUuytmuuP/CFwUz8lK6nh"
+    "5gidtj1/ubx89OjJ5YNHj7+/vnry5Pr7Bzsz5t9qsuenL//OTLpCP7/p3E1qCvNFBTMc91"
+    "NxYYMnRE71NM/EMk8Id8o4zWbtmUNcttl44yV7R27TVnm/cfNmZS3NnfO5xS4uwxgJJtn8"
+    "0B0gDu6TMFfI78v2t28Tqq8eTVhfJgTkh98TJcQn/ChsiyogLaJJtShzm3DdtTxcd82F6w"
+    "r7VlxSKkANV5SJrCACryrvTA/jxb+xFZF7wSjL44RVFAQL1YOF3iG0e8D6cayjMMRhuBG6"
+    "YuW0V1HAuzrvvoOUdB95e+D6MNEH8wJHilZex2mxRxrc0APiBSTaquxMy5gB5WSBF0fExb"
+    "NBdqfdi8lCsnKx4HTVKLUpQKCzUdDZpLQddBaoQTs4DUxoep/aYYD+RUlUfahKKHiqFJ6q"
+    "hDe2qzTVhbEiLGyW1Ndr8JvLF3C9/OagINR51NsoCOl7a1UFYQWjU8i3s8jjJhWd0HXI8g"
+    "JbjV0h9iCWR7aMgUxzvLyCTPMkMs3qs94BxZna7d2uv2lNEW15Fs6R++lOF64uLPk8VLGV"
+    "hX5MqtjniDjbW+Tg8J3nOLE/E4gtuDbzJsGFzVqbIWtuBkX7vaKLX3HwrY22c8On/0jMkr"
+    "jYsEnoYzdkCtPIiyjSWOA1HexMz0o/xAiw7wURr5Y9tkMmkH2fbsgN4hYCWvo73JBZrcde"
+    "RFHeJVN+GH5Q/Kq5EXoJLO3Q8Oi+96O7RiH9ZCO0UNpnylGqpqUfQ6LQYJ9p0E9ZYZlo9g"
+    "OlOfHo5r+LmdZvIKU9aR4HgVu+KY2DyCN/Xlkcfo+RGwnDGVJrLENAp8n7/MS61+fYIhvk"
+    "yJx9EuGrnaIuMvTUyG2yxRfPXr6+efXNw8v5Zc2Rmnv9rriQUHlqF1x7lx+U6jiwW+EpP1"
+    "vF2hNbQ8ERdP8RNKesqwNS1tXESFY6HBUGNqp9O0Er1wtJOBNt2HdvNu/U02ZtVdGZ08Go"
+    "wKo7blELdeVzlv4GZM+D7l+JZZsPH1DibCXhcw2mQ5Swqi152EZb8lCuLXnIbSTs/PE0k1"
+    "cUyOaRWsioamKe6zYpzWgruZznmk9rtmNOVdnPIzXkvHt5P/00HDVoeiQS5ArqyMPxyKYV"
+    "tbMxPTR4zn2jLEp2lbEGPGcWQ3YjXlEwWcbot5z1IJWcRn5DtLvaMEWS+WuMbbVcPFIHow"
+    "Yl12iGYqKaHlByneOot1Fy5e4L21xsFTPC8UjwSoKqC1RdU+cVVF2g6poQzwequsrLVxf2"
+    "fB7aLsGiP6ZI0Y9oQ5ztT4Tl4dvOBNGiaoN5U8RomTQ116W2rcNGKdbITNMo9SGMIcmbKw"
+    "aUIIw0aBgpwE6a9WhNBJnq5T6hOg6c7C2c7PTjbCKu1iJnugLSkOZe4kd0bjW9pZnEJxRm"
+    "jToMzikC0RrlCEX0eyI6fGrUlmFArSBvI4rDxAAl5DZMEhxSB6/xABMFREMGiIZA5SGIfY"
+    "xiKCbqBYfYxzmOepvYBziNwWk8Mv9aG6fxaVxrLzdoRX/hOxymxHCutWqDeZNrjaRNzSBp"
+    "21KS/RxHiDjsfmKKNkroiletqeEhAu3Y3kJu6hN411LmVSWsVZSGLp+HD9qJtJtU2twhY+"
+    "FR0gK8UnSv1WDAdju2WWrQAIWRGYfKKeI4LCSKUylzmrOnOq1wQB0O1wOYeoStdfprObLl"
+    "HowKSAeih/ZiLOnvpN9HyW1UxmgxkQ9NOtmw28+hcAmV015FAfEHEM+UHxuWxbMoQdOWfQ"
+    "EU5ptDTJ9FqFQLkdVQkCqgvltJCYoDR2DTP9++fdNEa46quySJFRn/NRwS9sbu7K/L2E1T"
+    "Bi1i4kTEDS/Y5/2trwhMA6eMpWZrrxv2vOpmZB3Urb3kEuCGZU8K7wpSQ2/xdL3DfFAgzW"
+    "R1YLJ2DgyDPerBXiKLOIqXJ8sYLTZuQ2iLLCvd7Zpp+WUVvkVYHXZrAxzD4RIKXEKZLK8B"
+    "sonneCu6h1TjlgcCv6KaNBZy1YgtIWAigAA43JqaHM8H3ppiD34HJN9m3ejJbWl23M9oaY"
+    "3qYoI4j2to/MI+JqnMK7SQy2SKN+dNEhk6QgfKYyjSiHAY7dfHiFqqC2RYD6CPOYE+JiFe"
+    "NateBQROi3ZOC8vb+HRGddXp5pHAeTvO0znJvEeOSDvQdLeyitOQ7148RBlv9BcL9iF76c"
+    "5h+rnjur/IGuAlDjDdxplJ2Qs1tjmofoz3Yt5o4XrBhh54lg5aKTmd60D9CO/+zlo2K6jf"
+    "D+SAA14TXBI3LfwwRcaLXTjHdnOgsgKEIOWog5QQkT6jwfZxsKQrD7snQ+lWmUR5pIab4F"
+    "4OHczrkoqPLSJydMo555Ea7hP6oByutw8p1EzNVDWOWkNByA+yfJ6EZBBYQLx6ZJEoiFeP"
+    "Ol6dr1wdEP0KLe5wK9X8RCmurfIji6gm3IvjqfmwNEdT2U9rF0uVM9smOko/ywuywDR9E/"
+    "JznjhCqnrTtwLS8ODc0zVfiEVDzr0Snz5ObhNP1Z0eByvhDrgxNUMBgpwMCjkZQmuN7dg5"
+    "oPwbjzzrEvMFHbn7vvUUwSF1cK7VAvlt4vjyML5IE8R2x4cFY3h0B9GYkdGvUzCGsF8WW8"
+    "r5Beo4HR6r4dM77NSpVdrlV+BLkKPuv0+H+V4uukNsZkg7h9TD8pV8mkloIfXwOY66YEPB"
+    "pR4uOwm5YW+Kw5ZRECKEEOFgd7Ax/VlhdECdUAESGIYg7CmDsGWT7ILgM7l0yT/IrQKwyZ"
+    "I1PM0jW+gUorDlNV41ClsqcJld8zSl5+enWQ8//vIuK0gnJ79ybVUP5mvbcMdDNmVrSTk7"
+    "kqtMkvE+6VJrvswwTch0JGEpU7dFGlRNCOtZEpHME5nwR6yMKLeY7xFIpLNOqq/pXycBQo"
+    "ghhRA29lEQbYT7SXlUqIoaMHicWC7alcydpiQiXJOlEt07wIBM22ggirsP0Vs4iMiSLrSS"
+    "oIw8OsAjIUlu57ED/MXHAUnuKm8xCgQDJJ3VRVBIDs3JJnxsEeSQP9QfAAEUnoDOn4DPXv"
+    "DJzJUVKsPDAccxOOxjtRkcvMFMrWVt2bY9YrtchQESgiHQfPhoLIjH8y8PM2fNIcgMQWYI"
+    "N0KQ+RxHfdxBZv28K1ykTuUiVJtwyFsX33n0j4FiTicdkP5iIUe5VDO//XPPihOnl8CnWm"
+    "8yb3Kq5ncW7ax1y0ye2WcYO5iBXNvYxSUquTz3tD2k3G1+WaS03sO1tWG9tdlgKl9d44Aa"
+    "XqrqPh8fnUZF5/OGe2s5QEN6e7mzVv5mHM/yY14NBse9QwqBOlj5XmYFBDbezsbpRmXFEg"
+    "gmAgJVxoVgYL4d84m50l3MWtnGc5CGTF+3CmleN4Q0r/mQZkKa6qakAtKS6a43JAljIflD"
+    "QLN0b13BgL5WFC9bo8vrxyqWWyB02HpUrfbxVQurfXwltVr2Vi0DGtmoTw4VkIaTQy/KEj"
+    "/w7omNA+WNHQfUz677Ob/k52rVBAUc8Mj8BCOjXi09AT3nMccXSzJA/6lyEOSROhju0GfB"
+    "DY4Q8znxzMsj3WUMBLgPD3BHaKWk0Mnbj0P5oZUsZyIJlFh45x73RXrv4kyQGWgWcG4jM4"
+    "AkyHDDebK87m6AqV5w5oHAL9xvVtj6QJLpkfB8YJLp0gTQhTmfx21yftbsNeF0OVXtl8jM"
+    "PAr0t5n/9gTFdfLbq7kqa/8dVua9eLHr9ee0Uz0ek6+H6ah+DTwL23GAZ3IhVdFm3kZJ5e"
+    "fNFaVUBc7IiiPhdB0XaalkjdXFVLueoD7yCWRUlh9R1my1er0ljA4+xno0olUwoiEWIQhF"
+    "ZBZ+QCyihtQw/NNLNKJgTjXaxiM15LyXkNvCs7dmSETRHzndFZCOs0k/sc3yksmx3ew85N"
+    "EaOhAn4jAU3FDhPYZ0rJJ9tbkhbixMNivdBomg4C/k/VrIxSHdr4YEKa8XAqh+01j3+q0k"
+    "ubs8MYU8zs0BdWB76DC3F0eURzX5bQHRgfG+7ZstAqbnm4cmxZfhdeB+aGsvHaNUk7ULoD"
+    "ACB1yx8ByHbnpi32QJMkmABb6cxrJB4g6ghJBCCSGQG8gXA5AbgNzgiOMDyA164jUPLSjr"
+    "DQRIYBgEB10GZ0FwMGrBQXkG6MKez0NxIJg3B65xXXLKhSGRFiB4jdztncf+HGgAx5oMJv"
+    "l5Zk05UP+xAZNmUCY5aqtiATr0yRh9wtvEGEq9ZMawG8asCS86yBpG68CLV2tJm3LPodTI"
+    "6OsmN0xf28gq5Am/uUlzv6BCJd03tUviGhnSSJFGtEaRwcbOcwg7JYUGchwjWz92jYnLnr"
+    "ydgqYqu+iqV3V9Buva9JZmiIN7YoFAY2CBRrbqqUYlajANQ9iQ42Z6qgzIcXMqB2x9FufY"
+    "b/YACuAaugEn4vZrJxqYVDWLaetxlsgiDokEp5SGjC8ljIY897J8WGuCl2YiAEBEZNgNqg"
+    "EeCsvIAZmxHeImZ6Iw3mxQILD4hiEQYGEM1McgYtG4JGEGtWWlfRSPBP6PiWUfqu2Q9wDj"
+    "ccDWloQWXWZXB6g7BFAYAfURgGwRQ2SL8NwlsenkzYoSRVv6UffYUeFc2sGAQ+AyX6Qz2S"
+    "EABc0ZKmigLohuoy5woHB1QfInVlV4wuFAdiIQ9jgojMz88VClWAwGXRro0kA1deozR+eq"
+    "qWI+7YLe8xDxcGvQfpprc+rwXI9sJm5LtXgtUpVMCRysEl9GnnPlx1/2Z1t5lvX1xptw3l"
+    "w+0UrV94NWrhcey9TztBsSakoT2aAV7cSk22P64UeS9TLt7F3Sl6aE0e/eDVmv0EJroipl"
+    "2w6nSVAyTkOyamLLY9mq5IXSkC7kODhYkWPZyvbUN0lvW025SuWekkjUAWy93vWnKWH3JG"
+    "KhaLqlPZKwf7CObvN+NGHqSA1/G4n2+yS34Uwu0c4azNtItNNEie0k2nJ2FMXR9L0PyU6B"
+    "7tSLF0ILucl/QCc9pE4aivgNpcLa1eE7uIAfMA7F+6B432SY7kczC/X7egj4QP2+fuv3wQ"
+    "WWU2nMdqnQD5FhVKCgwxiLDqON+qZ8vmq/UtRQoA0AbcBgS3B2/m9PagkBhgo1h0DMcnKK"
+    "+xKzQBGcHovgiHYNHbD8Ci3u8ITLt7aQsFT2SvvJZetVB8TeZt3oyWppUR84gdL+4Atx8U"
+    "wWd2HvzfeGXGirIYItyRdMoioWNZCVl14aTV+F8MqQ4RVVXz+4+NVc/AkjxFKOqdRxwHc7"
+    "vhcBcm1ltqsoHdx4A1BN16J4SdeIOEi3qW3JruPAtFsmWfJCuvabLO2bCt01mIZs9xLHoh"
+    "+X9q9AdRkDPLfjubwBbH3juYQBntvxDBGuk0W4XBKZfiDOzoYtskGOxM9ZAdbDWynyIuth"
+    "gkbfMA7PXzx7+frmFbXj+WWt/kU+IFf8TBIHAXPahZFnfVI4KnK44bzJD/qaTzp21W+ISz"
+    "bxRplaDjcctQ+nwi3+4pNg21DxUUxtDdYU/NZsbri5e1E/9KHIWptuvFmonUTqONhLtCwI"
+    "iwLV2tIlSCd7iNM65YYoBVt8tUNra0n7GLC8Vj4sk62uVSSXUmC+AAHVUMgMhGCQhumcRj"
+    "3nqJ6GiROntEmcYCPibM0QOUfnAmAd3bJ+3nmOE/sTtId2V9y9Ti5tExe/8nTS+AhFknC9"
+    "Vvmqe9H5sZQFVd+iLnY2hMyDPZoNSo/syd0v9jDz2WJ/AaRb5sNhNYow3draRkxZDwzPxU"
+    "ZyijbSU/QPBjLyvv8UGhXXmkFCI1pjI4w3hrc0SBQa+adXaiL1+UFtxCk7blINSdnRkkhW"
+    "Ki+AWmVItQo4eob1QoBv8mjf5O8xciNhDRHpbFCGQCyi7iXIF4YDDow1KJwYx3JibF3wvF"
+    "iW20agqii4KLL/osimJBc+UgpeVh5PjOS2evCagY1JE57f0xEcFEpXeOSHhOyQ3L8gHDbR"
+    "Q26i01oR9B3BFvrn27dvZOyWUfWlk1iR8V/DIa3u0xz0qM/+uozdpKCOsYiJExE3vGCf97"
+    "fZ8Ns8xlJl1eRkQnVFUG05ZB3UZUIQaBos0CSWh8ttXyIMH8DqT3OM6cW+I7osWp5Auizn"
+    "vQSBCafzAcEbRJQKDe0A3bhPRiTh6Ovqj63mpioQOuhs6/6pVu6pBu8Up0IiQbRW9k1VUU"
+    "e6pkbGuJpnih696ewgCOLIJ+QS5KgJeTq89TLzblCQZqmV1NeTDwCPhHE4fBzo3mITu6WA"
+    "bdth4ICwPel8cHwUhp+9wDbXKFS6hcUBNYz2dLZhOUiTg3zfo9+rg/oAN0VPExyTVoqJE1"
+    "Z+mSRfJyj9MkmelmjDlHFrOucLr0+qkPVj0tdPRVc6EnbSYjmTZOwk1XImyxTLtXQ8Ty1z"
+    "Uk2Spbyqw8mKC02StRNWF5okX7mVBdiip4BuSHuX9KU7Y6VqK0czVlR50ZGxU5WwmiRZJx"
+    "XZT5IxUNkr0cVyMh5JU8uklZOkJ53WTXqkDo+3p3Rev0370pWx0xSRmwxVSqK10mPqWYTS"
+    "utdj8dbFdx79o8VTm/TY3m8xzniHmGB1oV++jZDr/Uobjb2yP7Oyx9l/Pyj7CGMHM5BrG8"
+    "i+x0GIjQAja7eaVa77KOAU6/jNma8/iZPBNZ1BFYbpUGJBSE0etSljIGDTTmGSc5YydQDZ"
+    "O6CGjF+3KyPXUEWuTnc+F/FMy/PnlTFakNx0o6SP7HkhpguB8P5UQx7OEkYL0mtzSRvLvp"
+    "Rb9iVn2fTTcKQspaqizllKxcyNNlVN0FSGDajf3r0yWQG3TDjVlJpXIpjqcUIoqfOnOClI"
+    "9ArytW4H0EG9OvQ6B8mv5Iau76VWSH6l26jnHNWTX8kjlAdcaK5jobwg1MEcitd806pctp"
+    "EHgtlC1cYTVm2sTqUdUKwqFhmZKSulPKgvQfvpLj3/XZizWpHMiVLNz5kjTDBR0mPIQ09V"
+    "0cb+6FNNNLI//vQsTQGXRI98FEZGrYdK0GlfY4g0jWd1nDdEmophU675JoDq6CvurxKZCt"
+    "kFQkOOe0m9t2QJ+7FrKQU+KiBguh3TgReL4h5ylncADRnuPmpKF8ZAPbZURZ11Bkns2uoZ"
+    "OEuYcw7M0S8pvd4tf8CrKA2f8l52BRCUGyAoh2x6HMGuqJZgg9ynDNIhONc3yyGxsYmXS2"
+    "yJ7qjJI6B1nA5cDx0IhbAzhJ1HMRQTDUBC2PkcRx3CziMJj54uTbnmxEI8vyde0wuiiwMi"
+    "+iIocAxB/S4joBDUH3VQ/zTFIqbM8b5aEdK5uYvpQk00Mdk5Q7AujVA3cYtRYK1ncs1E1m"
+    "DeRi8RFm33SiXeeMEGOeQPbBuW57Mrt97SQEbW1Z9Cg32duVGUfAjnhk/NKbubm+QBN5Ze"
+    "YGR2YKQffjGrjWJvH/TR/ei+dbEReJ8NHwd5h8Y3Ie2PdvfnufEJ+xGFGeHWtYzF1mCX+S"
+    "kb7CU2iNi1v6tSd+Fvkx8wtnIlbZ5LrTUeNgl9B22VBR513IAxhoGiC31Ecdjf5tJzbNFt"
+    "NjnZNZh2XF+3Uh5cNygPrnnlQWneU3F412AacD201ztdY1Q4LxBAtzLdp640MqJ55BSJu3"
+    "vdypZPFKKdbO3E0bCRLbWEknN6beGg5Nyx8zKUnMPDkw4l56Zt31BybmQDcuqNIJScqxMM"
+    "Jeeg5ByUnBsVb73MvL/HyKFbafVSZxwQlsXOByf0MctjK0pyJx+YCggGpfNB8YIVcskfyg"
+    "9MHQezFtQAHPcOUsGVCDUADysXEtMfHmAbagC2rBiCbGxCIcCWde3cCAd+gJksP6txdxxj"
+    "Z1Hbji4QZOVSygYv3TbONb2ZrSSvQBidgq5JWldacoXSBaXulOoe4WDpBRvKGxS9U6wynN"
+    "3Gg6J37R9R+3SMTXEN2M1pS+J09FjqXSRwl7ztVNUCp2hlJe021A1Ur50e+tgNk/XzVBUE"
+    "J2x0UG9R8ew0XOHFKVpVcWiCApVQoLJj02IbTWpZSaVKKFLZXZFK+ju9gISR9AKpepXKV1"
+    "mX2p0OeK1wdY1I5r6mk/xr5G7vPPan2mXco47zJxUBNVxhTH6iWdNPi35wwCyOBRPqVGd3"
+    "RL0gsfBPeJt0lF3sLcYhuxG5exSyhmUBdtYkWgdevFpLuuEU28I7lvR1s66F/rpHU17hVq"
+    "Apr26xmjTltX1dr5ryD7sk0HOjkh4akkIPe2EQ0hNDemJtmKZzrXIC0zIGeG7H8+8xculq"
+    "tjULD5TC3CxBQzYcwV2IHVc7d9UhRFfAw/H8YCIkE9Z7bEk8Wg2Xi2s4HWThQ993nUgmZP"
+    "r42JlYZAC1WudJekuRArkiX57JUgCHdJZjSWfZJolpEew4ZPh5dAejP6F5b0SDnXPSONqn"
+    "y6s5ukcaEmtOg1e62m+QxXzJatTWcZANtiFraXBgytIATBfylXbjuD8qX2lhkF3Qe2b5HY"
+    "OR5ymdKsHqiUp3a9bwVjyyla61EdeX+TFlKE3UJoLQW65CkYfcdlKXnkNtuzg9i69BvO2U"
+    "8TY25Ck/HLcNHq8yCGIU7WIUC8/emj4KBLOsnOkKCJhuxzS4cHmiu3fhxsFKeK5oTEBWgA"
+    "ZMQLZ7ZbIZyEJrje3YaXSXyqbqOvKs67EWdORe4fZrXh2pQ3Stlii5xRwhz0jAZbSyvI3v"
+    "JFebD3Hy82hw8o/ZyQ9B69MFrZck2Uoo8V7GAOfqnLN0DdiMA5GCvyEvbgUFqZ+ah+WAtE"
+    "NQgnbIhwBK0Mq3VvqqN6AErW6jLtjhcffWyl5bbtiljtgaCuLhIOIYitfiDq9qcVQBEhgG"
+    "rUGnIURFrUHZJLsg+DzUBoIHeT/V+ZI1PM0jW+jaslxb41WD4SVZMI4QcZLETix/4ZF341"
+    "VzIU6E/dEkdpouXydKVzEVwnpVp3gs8/lPdLbwgu1MJFOpNJg36lWSpua61HZv/dxsZ2Gk"
+    "WKOErVS/lTeD+mQjU7BsvE/0880Dov4cUgcXYN9x/5w1n04HoenjwLSRYEf6HFtkg5xm5r"
+    "k+6h6htJOLrLPpDUZTdPrFs5evb15982hej//nw3Il5X6LkajsrHQu4XDghuHdBcixvLXn"
+    "mHGoJAyowWAK2T+F5JTZ9Ftkz/9njD8pGHRDD2DavGnbQbxStesyBox6v1EnfKX9cCzL48"
+    "FVFNSbOaLmj2XFvnK2lSpKQzvvo1QhtuM0Fy/9nHusVhSSh+pH+nWbyeVaPrlcc5PLBgUs"
+    "0eMBhxweqR/f3U/mDrlPToYkipWnFBFWP857Ue7TnxVYJMTmQSnKxGj9qO9+erEJjpRvAV"
+    "VAwPJ+lokbxgGLF7FEnPdEsdqvGK0f7/3sWDaY3TyxtszbHTEHscIeXQiGrTpoNEGjCWo9"
+    "0GjCqI9HozkaKeHkQ46czE0lmUMLSVxegqB/QdxYc+Yry+G6EyGwncaLL4lSgP6en73FTC"
+    "BE4BvNm8QIEW1u4l1789/eol0ujdn/xjjGtsE6MIoOjKUXGMioVY/8wQgxNhgL2LW/q33m"
+    "hc8LGbruvE1+D3SPSGKObA2BhB6DyiHowFqCY3zjrfwdBi7lK1zKR1GEN75IpCgPW5YgkP"
+    "aaI7Q8bShuWutYDbet092m8qcTB4V0bQkCT+ACk7sBqijwBYAvAE6FrbJtZ/s7tWNhDQXn"
+    "wi7PhXapGvxRB8MOqstP4oBYs8a+T4iptP/ZOnY/zQRnw/Lb86ZTYXbfwGIte0it+GGW3W"
+    "TIaHHjDctG+xso0k94BMsGoT2xBQBumYqyn5E/BCdaudg5aw5cirisTBdVRt+/f/lcQmkF"
+    "VSM2jol9wbATpLeBu2Sr/SjdtZX3Y8kvbbwGHRYXwo68PqprPeT64l61rzElU66OgHQnUB"
+    "qivXuB8t3D/c5hdnt1w3owUrhBXMMPPGaN4Q/GkrjIofMdeznyCo9u+q0Mj1qXge9xsDWS"
+    "HYiBgoDcY5vzEvf2KW3cxaWAo5qzWD5hdT9R7d+xlFJrJZ/E/rg6RV6tPTNX09aF3SJOax"
+    "NzZDeUBi2DNExS3IsiKSFNVXJXAWnIdD9FWKsVp9s6G2sw8DaqexsjL1GeC7fvT8lKuoOv"
+    "4nTax//l8vLRoyeXDx49/v766smT6+8f7Db0/FtNO/unL//ONveVIeB3+8lyLBkAKftVkE"
+    "7sd3eKWqPL68cqM3eB0GEiqc7aj69aTNqPr6RzNnsLwhQQpgDJom6j3kaySCk3I3xAWsky"
+    "Ci59Q1rJwRZ/Vv1IidQSAgyVJ3SXw0w1TScPBIOFLJ1dOqZVs3SWLLILfs8jSSf/GLfK0Z"
+    "ms/x2w/Aot7vCEr+21Sc9Z3ivtJzfMKkUeSWxecFJPVkuL+uEJTwtdSM07ppyFcqdF0WSS"
+    "6DUJ5fsQB89JgC1ZEspqg3ljVC9k6esqbfcG9V5sEHGMhHHDu8eBka0zoYFc2/BL035o0P"
+    "5tY7HNAmz0JLU2HM/7FPsXXBSvm24/uh/pQ+5HLAYYbl3L+Ezom9la/115TTI+B4ROLKyb"
+    "kM4M9LcyTH5/pErMhb/94aMbrbEReA42SEi/D2Y1vmJqqkbo0U9fUbDt0f5cLzLW6B4bkU"
+    "d/QhDS5jb9bEJHN/gu9DFLyRltDXa1+EISZPyQjks6SvNslPLysqCMOpEyCjMDVXGb7gDd"
+    "BLtOS27/QcWqzbcluYrSMKzYQ/HTcFe/vu1ZtUDAIVVUrMNTM9q8PZhrm9yEJPQdtFVWdt"
+    "RxA1ZHnk13FvYpR2pZIAsEVASshC26yDbjozD87NEjwxqFaxXr54A6zjV9PADshHCvegm5"
+    "AA14Cznf/032EjLETOWGrlfM9KiLZ925Tv7Bsone0tN+yl7Nb1J6d97kNLlPc5LuGrYu25"
+    "EAE29DaGwwCuMAs1thIecLaQNoI06uRgBKPaRlySG7xaAOBI5/xUlPhNdw6pvuVMergsJt"
+    "GHkOscyFrxJyr6Ig7C4oCkDQIczWYUAtT+0aoyAyA+EEJSW2CgJaRQVdQ5/Qn+8FW1VyRV"
+    "CgmKd44dlbkyUpYhzQlVKwwDYVdhLBz7Cm05VCTSfvy5b+fjNkfElyzUutWogFs+bN+jMm"
+    "q7XoiNxkzAXoDE34en7Z2oTXh7C7BnbbsbvYENVZOEWcIa8qE69POzZDyxMtcg366DIIpl"
+    "rBDsLxPNtcObHliQqOSZnlcEAuTy5kzh/y/ipcQ5Mb9jSd622uoW3S5BYmk6cFtprKQ4iF"
+    "iQwuJw3nImGGd8BdGh4I/MJdGoVVufO7NNW5tAOKs6xF73b9TWsKbsuzcA3aT3dpAujCnM"
+    "/j6hI/a44pedkNDoi1ngni9Nk786YYPSradJqzFBT4Jwyg3+NAnJtQLoMrQUAA11IA5wsi"
+    "qnKGs+YasttLQi9WhVG46ZILbEuQ4RW2p/GIdKalPanw7Ov/A8nUrkM="
+)
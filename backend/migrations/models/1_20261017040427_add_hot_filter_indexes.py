@@ -0,0 +1,205 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_appointment_patient_d97997" ON "appointments" ("patient_id", "date");
+        CREATE INDEX IF NOT EXISTS "idx_appointment_doctor__d403df" ON "appointments" ("doctor_id", "date", "time");
+        CREATE INDEX IF NOT EXISTS "idx_clinical_no_patient_1698ab" ON "clinical_notes" ("patient_id", "note_date");
+        CREATE INDEX IF NOT EXISTS "idx_diagnoses_patient_469c0b" ON "diagnoses" ("patient_id", "status");
+        CREATE INDEX IF NOT EXISTS "idx_family_hist_patient_035e97" ON "family_history" ("patient_id");
+        CREATE INDEX IF NOT EXISTS "idx_imaging_res_patient_e75b0b" ON "imaging_results" ("patient_id", "study_date");
+        CREATE INDEX IF NOT EXISTS "idx_lab_results_patient_7f2b54" ON "lab_results" ("patient_id", "test_date");
+        CREATE INDEX IF NOT EXISTS "idx_lab_tests_laboris_8c8125" ON "lab_tests" ("laborist_id", "status", "urgent");
+        CREATE INDEX IF NOT EXISTS "idx_lab_tests_patient_1c1fb1" ON "lab_tests" ("patient_id", "status");
+        CREATE INDEX IF NOT EXISTS "idx_medical_doc_patient_8cc74b" ON "medical_documents" ("patient_id", "status", "created_at");
+        CREATE INDEX IF NOT EXISTS "idx_medical_pro_patient_5e5c4a" ON "medical_procedures" ("patient_id", "procedure_date");
+        CREATE INDEX IF NOT EXISTS "idx_medical_rec_patient_6b0c9c" ON "medical_records" ("patient_id", "date_of_service");
+        CREATE INDEX IF NOT EXISTS "idx_medical_upl_lab_tes_6e76a4" ON "medical_uploads" ("lab_test_id");
+        CREATE INDEX IF NOT EXISTS "idx_medical_upl_scan_id_e0a950" ON "medical_uploads" ("scan_id");
+        CREATE INDEX IF NOT EXISTS "idx_medical_upl_patient_e05f2a" ON "medical_uploads" ("patient_id");
+        CREATE INDEX IF NOT EXISTS "idx_medicines_categor_e8174c" ON "medicines" ("category", "name");
+        CREATE INDEX IF NOT EXISTS "idx_medicines_name_f55639" ON "medicines" ("name");
+        CREATE INDEX IF NOT EXISTS "idx_patient_all_patient_7630b8" ON "patient_allergies" ("patient_id", "status");
+        CREATE INDEX IF NOT EXISTS "idx_patient_med_patient_34299d" ON "patient_medications" ("patient_id", "status");
+        CREATE INDEX IF NOT EXISTS "idx_prescriptio_status_24955b" ON "prescriptions" ("status", "dispensed_date");
+        CREATE INDEX IF NOT EXISTS "idx_prescriptio_patient_08b257" ON "prescriptions" ("patient_id", "status");
+        CREATE INDEX IF NOT EXISTS "idx_scans_laboris_877989" ON "scans" ("laborist_id", "status", "urgent");
+        CREATE INDEX IF NOT EXISTS "idx_scans_patient_a9ec5e" ON "scans" ("patient_id", "status");
+        CREATE INDEX IF NOT EXISTS "idx_vital_signs_patient_cb1892" ON "vital_signs" ("patient_id", "measurement_date");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_vital_signs_patient_cb1892";
+        DROP INDEX IF EXISTS "idx_scans_patient_a9ec5e";
+        DROP INDEX IF EXISTS "idx_scans_laboris_877989";
+        DROP INDEX IF EXISTS "idx_prescriptio_patient_08b257";
+        DROP INDEX IF EXISTS "idx_prescriptio_status_24955b";
+        DROP INDEX IF EXISTS "idx_patient_med_patient_34299d";
+        DROP INDEX IF EXISTS "idx_patient_all_patient_7630b8";
+        DROP INDEX IF EXISTS "idx_medicines_name_f55639";
+        DROP INDEX IF EXISTS "idx_medicines_categor_e8174c";
+        DROP INDEX IF EXISTS "idx_medical_upl_patient_e05f2a";
+        DROP INDEX IF EXISTS "idx_medical_upl_scan_id_e0a950";
+        DROP INDEX IF EXISTS "idx_medical_upl_lab_tes_6e76a4";
+        DROP INDEX IF EXISTS "idx_medical_rec_patient_6b0c9c";
+        DROP INDEX IF EXISTS "idx_medical_pro_patient_5e5c4a";
+        DROP INDEX IF EXISTS "idx_medical_doc_patient_8cc74b";
+        DROP INDEX IF EXISTS "idx_lab_tests_patient_1c1fb1";
+        DROP INDEX IF EXISTS "idx_lab_tests_laboris_8c8125";
+        DROP INDEX IF EXISTS "idx_lab_results_patient_7f2b54";
+        DROP INDEX IF EXISTS "idx_imaging_res_patient_e75b0b";
+        DROP INDEX IF EXISTS "idx_family_hist_patient_035e97";
+        DROP INDEX IF EXISTS "idx_diagnoses_patient_469c0b";
+        DROP INDEX IF EXISTS "idx_clinical_no_patient_1698ab";
+        DROP INDEX IF EXISTS "idx_appointment_doctor__d403df";
+        DROP INDEX IF EXISTS "idx_appointment_patient_d97997";"""
+
+
+MODELS_STATE = (
+    "eJztXWuv27i1/SuGP80Fzg2STE5bFEWBk8d00iY5g+RMW3RQCLRE27yRJQ8lncTT5r9fUg"
+    "/rQVImZUmW6P0lM8fmou3FLT722tz7P8td6GE/enK334ckiHc4iJd/XPxnGaAdZv8je/tm"
+    "sUT7ffkmfyFGKz9tj8qG6RtoFcUUubzTNfIjzF7ycORSso9JGLBXg8T3+YuhyxqSYFO+lA"
+    "Tk1wQ7cbjB8RZT9sYv/2Yvk8DDX3HE//yFw+KQOsTjn+WhGKdfhrDvzpr+styjmLBvUn3/"
+    "37yP/WdnTbDv1X5q1ih93YkP+/S1t0H8Q9qQw1eOG/rJLigb7w/xNgyOrUnGzgYHmLLP4t"
+    "3HNOG/mf+knKKChuznlU2y31XBeHiNEj+ucLRyyteWjvPh/sH59ObBcZYGrLphwEeE8PHh"
+    "v37Dv8L/Pn/24vcv/vD97178gTVJv+bxld9/yz66JCYDpvR8eFh++5ZRi7IW6cCUpBZjUq"
+    "f1NXtVzmvRvsEsf5kP65Pi/SrHBaNtJBcvlCyX5jgCzS0cvr57eJOSWJKWGrBA2qstonLS"
+    "ivYN0tgXmCFVyx366vg42MRb9udtC3N/v/v46se7j9/d/g//uJBNM9kc9CF/4zl/p86slz"
+    "Am+BfSf9KrkNPPe18Ef/900g98yWgUoziJTKy1RIxnr8vI3WIv8XHxdQY22+dPNez2+VOl"
+    "4fK36jxTjCKZ3T7grwrDLRFWzAsthD68+ecD73kXRb/6VSK/e3/3z5Tj3SF/5939h78UzS"
+    "vEv3p3/7JBeBDGWGLXar6PgE5054v+tbK9Dn0//OIke5Hxl2HoYxTISa/hGsSvGHAoQz++"
+    "Mi73L+/v39W4f/m2Se7P71+++fjds3QgWCMSY/nE7bL5gXHioFi+P+ObCjnndWTbTq3YmM"
+    "xsquFTp3cf+If8uWx7GN6+f/Pp4e79T7VR4Xs6/s7z2tNQvPrd7xrz/rGTxT/ePvy44H8u"
+    "/nX/4U1KbxjFG5p+Ytnu4V9L/p1QEodOwMwfeZVzQ/FqwVpt1JO913HU60gY9amMesFRZd"
+    "jzb1/Z9laPybr73ipmvI3v5M+6Jat174ImrXUQ8Jrzyr0y689SF0LOmMjxDyHFZBP8DR9S"
+    "qt+yL4UCV3YSzr1YP5U9zYzib4UZFa+W0z1FX47OrIZ1MQbY78bZDuDV3adXd6/fLCUTQx"
+    "/Ucicf4T8Lz/hwcZLf2qQop5db8gq5n78g6jk1k+bvhM/DxivHtuJbu+e75isoQJuUHv47"
+    "+LfO+X/lk4C4yP8Qpl9HcODW3r9p8+C6eUvneJ456cNdFr0vUswCBd4iXEWYPqaek7ST6h"
+    "jotNfx/tatnfflgI93qHVP7eNNiU/5EbhVe4FqICscFA3HpY4H6FbtAboVPEClfRvu3GtA"
+    "Czfu892oi+ezKFn9H2Yr6aNklNWupzoK/E/m/qewC+0hsH4e6yiKcBTtpLt7Ne11FPBuzv"
+    "veR0ZSQtEeuO6mI/CDRWxo5U2cFXuk0Q2dkpCS+GCyM61iRlQoaZjEJMDLUXan/euTEdkE"
+    "WHK6alVvShBINwbSTUZbp7NAA9rDaWBG0/vcDgPsP4xE04eqgoKnyuCpSnnju0rHPNZCho"
+    "XNkvl6DaK0egGfpzwJovQ1jrqOKM3e25qK0jUMiKeSVWyHvVS9odgNqWfGrhTbieWJLWOg"
+    "/E+XV1D+L6L815/1Hih+n3X48djfvKYIXZ6lc+RpurOFqw9Lvo5Ai9pCP6VAi9cEbYIwIt"
+    "k01oiyKN+8aQux8LJmutEV+eS1qMFq8RTSFuYRFPnNDAifGDV8grie8+wpI84zCqBowGzw"
+    "NtR91M90fNTP1D7qZ4KP2iseTyd9xYBsEWmFHNMQBW51btuxVmpZ4Fa8cXdkzjRCSERayH"
+    "n/YULs03Dcog0oQhlqqDNv305sWjG7fEtxFPqPrfKK6r5dA3jNLEb4EZsKr1WMfcvZAJLr"
+    "PK7eomOI1BxJFsOhdTUhEWmDUYMiNJmhmKk2AIrQNY66jiJUuC88Z3UwvKwoIsHBDuoQqE"
+    "Nz5xXUIVCHZsRzR3WounyBRqR9GVdc9KekFP2AdsQ//EiiOKSHpUQtqje4aVOM1mlTZ1tp"
+    "qy0bZdhFbpqLSh9SDUnd3FBQAhlpVBmJYj+7Pb0lkiRKap9QEwdOdg0nO/s4j8gTCaqZro"
+    "EspHkQ/YjNrU64dlJ9wmDWaMLgnCIJeGccoZh9T8SGz4zaKgyolSRXQ0mUGqCC3JZJQkDa"
+    "4DUeYaIANWQENQSSYoL2MYmhmKkXHLSPaxx1He0DnMbgNJ6Yf03HaXwZ19rbHdqwX/gRRx"
+    "kxgmut3uCmzbVGsqYOTdtqhmS/xjEiPvYWOXpRQde8am0NuwRoJ94BctxdwLuWMW8awlpH"
+    "WejyefZUL0i7LUpbOGSsQkYaxRtD91oDBmzrsc1TDFEUxU4SGaeaELCQcMIkA3/Bnum0Ig"
+    "BtOFyPYOoxdrfZrxXIVnswaiAbiB7bi7Fmv5N9HyO3URVjxUQ+Nulkt2c7zUi6hKppr6OA"
+    "+A7E88iPHc8GVKay1mVfAoX5povpc4XKDRPZMV99EKqjxvOlzKXQW0ZQQn2JTf/10/2HNl"
+    "oLVNMlSdx48d+FT6LB2F3+aZ0ELudusUqIH5MgesI/789DKTAtnHKW2q29adg3dTcj76Bp"
+    "7RWXgDAsJ1IB1pAWeovn6x0WRQGK9yGNOyZ9FMAw2JMe7DVyiW94ebKKsWLjNkZsketmu1"
+    "0nSHYrLEnPouZbhrVhtzbCMRwuocAllNnySpFHQj/csD2kGbciEPiV5bZ2UWBGbAUBEwEI"
+    "4HBranY8d7w1xR/8Hkj+lHdjJ7eV2fE0o5U1qo8J4jquoYkL+5RCZd6hlTpMpnzzpi1Eho"
+    "1Qx/AYhlzEOIpPx8fIWpoHyPAeID7mAvExKfGmWfVqIHBa6Dkt3HC3ZzNqYE63iATO9TjP"
+    "5iTnEfmy2IG2u5V1nIV8D+Ihynljv1iyDzlJdwGzzx3X/0VWiteYYraNcygKNobGLUDtY3"
+    "wQ80arIKQ7duBZ+2hj5HRuAu0jvP87a/msYH4/UACOeE1wTQLkD6VRD814uQsX2G4XKmtA"
+    "ECknLVKCIn1Fg73HdM1WHn5PhtFtMomKSAs3wYMcOrjXJQs+donM0anmXERauE8YgnK43j"
+    "5moGZmpqY6agMFkh9k+bwIyRBgAXr1xJQo0KsnrVcXK1cPRL9DqwesFTU/U4obq/zEFNWU"
+    "e7meWgxLu5rKf5qelqpmVkcdZZ8V0lKYLl1ZCd3wuZABoAjcZPRT03vANZCFx+qBLgGDUg"
+    "0Z+Sp87nF613iuzvZ8JhdYbk3cUIIgY4NBxobI3WIv8TsUhxORZ1aHm9p80jIAsvJwRzoK"
+    "5772FCEgbXC9NWR+HZVfLfLLIob43rmbVCOie9BqJka/TVIN4b8scY2zDzRxNjxW4yd/OM"
+    "au1mlXX5CvQM66HT8f5ge5Bg/KzZh2DomJ1Sv5PFPUQmLiaxx1yYZCSEzccCHqq7RVFAiI"
+    "ICCOdkMbs58VxR2qiEqQwDBItJeUaKsm2QfBV3IlU3yQteTZdMkan+aJLXQGGm11jTfVaC"
+    "vlL/NLoI7y/Pwy7+GHv33My9Wpya9darWD+cY23A+Rx9haM87O5CoP2Pg57dIivgbW/1Oz"
+    "z6Nc5GEA1RY3J6IBsocoCyYZPigAdP0xdX0P7xGNd9LtkVrkqKNG1EJTy0XH+rDzVPijLV"
+    "kb0X0EjMi0h0aiuH/F2cU0Jmu2big0BrWzW0RCRtjeXeH46x5Tkl7MPWBEJQOknNVlUMiE"
+    "LEQB7LFLkE9+M38AJFB4Anp/Ar6E9LNTBAqYDI8AnMbg8I+1ZnDwDvPgI/fAt+0x3+UaDJ"
+    "AUDLpp99FYkdBENc2bg2YKmimoZ6CZXuOoT1sztc+7IghPJrd+dLz79wF+CNk/I0koFx2Q"
+    "4Vz7Z7lUczf069BNUqeXxKfabHLT5lQtLuh5eWvNtJX5ZyyOsAUKvMXRzV5LXHmibZfars"
+    "Xdh8p6D7ewxvXW5oNpfBNLAFp4R6j/5HNsGpWdz1uuYRUAC+kd5ApW9ZsJPKuPeQ0YHPe6"
+    "VL30sfE1wxoIbFzPxtlGZcOz5aV6uCnjUjAwr8d8aq5sF7M1tvECZCHTt1qS5m2LpHkrSp"
+    "opaaabkhrISqb73pCkjEXkNwnNyr11DQPhorJ0VGRnbrw1kIXGO0jkw56Gj8TD1HjjIQBt"
+    "2PKNsb8uzn2m98EF4JnXwSdGvdltcHYO4Y4Zfqeb/a/JQUVE2mC4Y59VdjhG3CciMq9WYq"
+    "sYEGC7C7Ax2hhFkBTtpxGZYFXYyEzy1XD54REPRfrgwYMgg1smiOrI4JCRFi6UzpbX44Ub"
+    "0/ukIhD4heukBlsfyPg7EZ47ZvytTAB9mPN1XN4VZ80pZf/NDf4nGrrYSyheqmNVyjY3Os"
+    "Eq+6K5YbRKiVvkxVZwthTJwlVUjc3jVY49Qb3VC0SquPuYseaZ1f+sYGxwkzUd6lr+9BZ3"
+    "usSbnlt4B3d6A2mhgjGIQ71kzlQwEpEWcj6IarQKvYMTEZmAoaa7BrJxNhlGnqsumQLb7f"
+    "4vEW2hD2wmPi/JJQDR6cXGKr3m6exIkEjTUyq3QTIouLxE1wwKcMT2qxFBxuuFBGrfNNZ/"
+    "iEyaDlp9918t1QpAG9geW6kNk5jxaBbhWEJsYHxo++aLgBPuna5ptFV4G7gf29orxyjT9M"
+    "4SKIxAhyj20PfZpifZOzylHqFY4stpLTQi7wCKjhgUHQHFXL0YgGIOivkZxwdQzAfitZAW"
+    "jCVzCRIYBs0cNPP58dxRM6/OAH3Y83WI5pJ5c2TVvOKUiyKiTFn+HgWHh5D/O9IATjXfRv"
+    "rznEbkQPPHUp7BmTEpUFsPFmBDn47RZ3xIjaHSS24Mx2HMm4hBB3nDeEvDZLNVtKn2HCmN"
+    "jL3uCMP0TSesQp1TWZg0TwdUmGRUZnZJgkWOXGTIRbxF8YKPXegTfkqKFsj3F/n6cWxMAv"
+    "7kHRNt18Mu+urVPD6Dd+2EayfC9JG4EKAxcoBGvuqZqhINmIUSNqQRmV9UBqQRuZQDtjmL"
+    "C+y3ewAlcAvdgDNx++kFDcyqYMC843HWyCU+iSWnlJakGhWMhTwPsny4W4LXThoAgIjMsF"
+    "uiBkQoLCMdkg/7JEjPRFGy2yEqsfiWIZBgYQzMxyDmalya84HZstE+SkQC/+do2V1jO9Q9"
+    "wHh02NqSyGXL7KZDdIcECiNgPgKQ8GCMhAdhsCYem7x53Zf4wD7qEfsmnCs7GHEIAu6L9G"
+    "c7BBBBc4URNFB6wbZRlzhQhNILxRNrGngi4CDsRBLY46ModorHw5RiORji0iAuDaKmLn3m"
+    "6D1qqpxP+6D3OoJ4hDVIp2h9bU4dn+uJzcS6VMvXou4l7I9OUoUvw6Qo+6u8rw/hjFO/tt"
+    "ew9wjaBGF0LlOvs25IZClNZIc2rBOHbY/Zh59J1tuss49pX5YSxr57P2S9QyuriapVxupO"
+    "k6Qql4VkNYItz2WrlhfKQrqQ72O6Ieeyle+p79LeDpZylYV7KpSoDmy9P/ZnKWGPJOZSNN"
+    "vSnknY33lHn4p+LGFqhMx3P6fp+ZbqEO28wY1OiHaW608vRFvNjmFwNHvvl3SnwHbq5QuR"
+    "i4L0D4iTHjNOGuqkjRWFdSx11rlGGjAO9dGgPtpsmB4mZhZKpA0g+MAFi0vFQB2zTXcJE6"
+    "hBIU5gKnECOtEh1f2//kzWQIF2Ddr1WLwW51N9UisIMFQo6wLBFheneKhgC6gzMmCdEdmu"
+    "oQeW36HVA55xhUyNEIvaXuk0uXy96oHYT3k3drJaWdQnVxaHBHip0gX4ezcnJQHWagwxIP"
+    "2CqdffZQayCbNLjdmr4P4f0/1v6osGF7SZCzplhLjGPv8mDvjW43tFUeAZs11H2eDGG4Fq"
+    "thYla7ZGJDTbpuqS3cSBaWsmAQojtvY7PC2ZCd0NmIVsD6KzsI/L+jeguooBnvV4rm4AtW"
+    "/kVjDAsx7PoHBdTOEKSOzsqTx7GHbJDvkKP2cN2JS3MuSTvIcZGn3LOLx+8+rt+7t3zI5v"
+    "njfqMxQD8kKcSRJKudMuikP3s8FRUcCN501+OtR80rOrfkcCskt2xtQKuPGofTYXbvHXPa"
+    "GHloqEcmobsDbx27K54e7hTfPQh2J36wTJbmV2EmniYC+hWbAUUdPaxxWIDXuIUYqVll+t"
+    "a/UnZR8jFoAqvKWzrf9Upj8yYL4EAdVQagtCwSBR0DWNesFRM1GQEJ6ic7W/CMaAq3rG12"
+    "bLzs+ljNb9QDN7jC5yX68Ik5Io8pUIKrUgn9v98Ho8KO5jKu5ZKkn2juSo+tdP9x9U7FZR"
+    "zZWOuPHivwufaIUzdXo4l39aJ0Gab3exSogfkyB6wj/vz8vxN5ycpXYvbdMh21i9eAdNLy"
+    "3s8kfb5cvVebXtK3T5Eaz+Mh6uQew7xj52Q4lyrOa9AoEJp/cBwTtEjPIQHwH9uCkvu8iO"
+    "EnnlmbmDS4SNLkotD2WLg1JwAhMab41lizrqTNViYoybiRbspMxmB8m5TD0hVyBnTcjz4W"
+    "2QmXeHaJbERpF+Xz0AIhLGofs4sL3FLgkqPhjdYRCAsD3pfXD2KIq+8FKYWxQZBcEJQAtV"
+    "1d42LJ0comi/D9n36iF94F3Z0wzHRMsJesHEsLPk6wKZYWfJ0xrtiH9wtmzOl0avmpD1Q9"
+    "rXj2VXNhJ20Vy6s2TsIsl0Z8sUv+p6Pk+aV4JnyVKR9PFiuYdnydoFkw/Pkq/Cyih22Smg"
+    "H9I+pn3ZzlglGevZjJVJYG1k7FIZrmdJ1kXjZmbJGATOGNHFU2KcSZNmzpBZ0nOZjOmzoc"
+    "ooBKtidKFLGK0nz9/3AX4I2T8aNpj2qH8Kn6b3Xk6wedhasSiqo9cqy+bJIDantmKfjGZb"
+    "5h+xOMIWKPAWyHvENMILilFZ+rvKjAnOMGn9zbH4MmSoGTVeLhtKLBGI1BpEFQPyg168RM"
+    "FZxlQHso9ACxm/1cuZ3pIyvUl3MReJTKsv41cxVpA89lX8CLOFgMRGySaqGCtIH7raO/s0"
+    "HBsHBtVR1xwYxM2NNTW961mFjRiNfHxltuHIqjCgtjw/ivCfASeESqz5HCcFhfquXuuOAB"
+    "tiMcde5+AerdrQ53mjEu7RXuOoFxw179Gq9TazTPpSLNQqgKIaY/FabFqNa0CIQDBbKAFx"
+    "wRIQ9am0B4pNQx8mZsq6PEuXoNN0V57/PszZrOLGTKkW58wpVTAQowvU0lM9BOG0+tQIgT"
+    "itP73KckKm6tEeRfGi0UNNdDrVGJSm6ayONy1KUzlsxgnkJVAbfcXDpTU3IbtEWMjxMEVj"
+    "ee4/HLhGwkcNBEzrMU3DRKZ7qFk+AixkuH/VlC2M1FxbqqOuOlUuDjzzVMMVzDULc+xLKi"
+    "8rqx/wOsrCp3yQXQGIciOIcshjxxEcyAoTtIT7VEE2iHNDsxwRDzt4vcau7MaVWgFt4mzg"
+    "emwhFGRnkJ0nMRQzFSBBdr7GUQfZeSLyaFGTtwO9JQqIBT1/NF6z646rDoq+DAocg6jfpw"
+    "IKov6kRf1dpVB9H0TnXVnMcbnKn2a3NsH2MV2YBU3Mds6QrEuTipuoDoMsZKIxTC3REpWW"
+    "UHXCrtgGqDphMinIOIaqE3h80qHqxLztG6pOTGxAoOoEVJ0YM8RKK8IKqk4MM4NA1YkJzb"
+    "y/JshnW2nzagcCEJbF3gcn2mOe/EuWGUQ9MDUQDErvgxLSDQrIb8YPTBMHsxaUAZn2DlKQ"
+    "d9SuRCgD0i1jcMJ+OMUelAHRTBqMPOxALRDN0hZBjOmeYh7LlJe5OI+xqyhvwRYIsgkYZa"
+    "NXb5jmmt7OVnoZK4ovQdcsrStLps/ogmoXRqnPMV2HdMd4g7oXhoXG8hBmqHuh/4h6l2Ns"
+    "jmvAcU5bE7+nx9LuOiHHjBeXKhgyRyurBLxA6RDz8onRHgdRun5eqojIjI0OSq4Ynp3Gq7"
+    "0yR6sqD01Qo+YEUXzbxHhKi9VAnZr+6tSw3xlSEsXKGHLzQjXv8i6t2+uKka/1GS99ktvO"
+    "pe9RcHgI+b9m8fhnHU4vGtLSEsWc/kSnEQ0s+8GUWxx3jTepzsPEQ5pa+Gd8SDvKY/vLcc"
+    "iDoo+PQt6wGk6cN4m3NEw2W0U3QvyxNMyave40I3u/nYiQrnEriZCubxjaIqQbu5RBI6R/"
+    "qeS0KPeVaZQKawk547QEu4HjqiF7GWQvs4dpNg8b5zeqYoBnPZ5/TVDAVrqDU/paDOZmBR"
+    "ouy0qi/o9cHRfQLkTXwOPx/HQmJBPee+IqfDfqZDtNnA0B0GPn3JlJojT2+Hh5WMQIcVm9"
+    "5/Cq+MTVsefqRDcSOGS7mUq2G50cR43jl+Hwi+geRn9G896EBrvgpHW0L5d2Z3KPNOTdmQ"
+    "evbLXfIZf7mc2obeIgWVRLUiPaMaMRBdOFdEb9OPXPSmdUGmQf9F5Z+hc68TRGcyXYPI/R"
+    "cc0a34onttJpG3FzmZ9SAqM0rkIiyxXxFmo57hjUMbAMd9Twa0obB9MNX2FAjZuIGscNIu"
+    "NH4LbFH1YFgYKhp2CsQu/g7BGVzMFqpmsgYFqPaXDwikT37+DNZ3KB5dZEXCVoxERcx1dm"
+    "m4krcrfYS/xWZ6pqqm4ir7qYU0lH4TPWX/OaSBu0t0b1MY05Qn0zX8js5Ia7vZ9e8e0iAY"
+    "hokACmLAGApH05SXtN0q2EEe9VDHBuzjlPW4CdhMpi/1vyw9ZQkAKpfVg6pN+B+lVjPgRQ"
+    "v0q9tbI3tgPqV9k26pIdnnDjreHT1XTENlCglkOIx1i8lndZTSsrSZDAMEQi9CowGkYiVE"
+    "2yD4KvIxZB8iCfprpYssaneWILnS7LjTXeVCqvBA3jGBE/TXDE8/ideaveNCfgTNifTIKj"
+    "ufA1aChGyBNa/8iMP6SHpSwmo9bgpjU4I23qbCttT0VpLPOFcpFhFxVslbCWZlB2amIBGb"
+    "vwM/t8p4OILSBt8GgNLWMXrO3ZdBA5e0wdD0k2WK+xS3bIb2de6KPp4Mg6eZJ3Nr/BaBNb"
+    "37x6+/7u3Xff3zTl7GJYXii5P2BEJaaunEsEHHgVxNMv8t1wG/pOEhnp3A0YTCGnp5CCMo"
+    "99i/z5/4LxZwODbukBTFs0bY8mG1O7rmLAqE8bdcpX1o/AslrerKOgjMgZpVxcN9kbpxap"
+    "oyy08yEq0GEvyVKsss95xGa1/kSofaTf6kwut+rJ5VaYXHaI8oyHHQ45ItI+vvufzH3ymJ"
+    "4MSZwYTykyrH2cDxKIzn4WdUmEnU75uORo+6jvf3rxCI6NL7XUQMDyaZZJECWUyx88I+Uj"
+    "MSziKkfbx/swO5Yd5hcp3AP3dsfcQWywR5eCYasOIYcQcgjBZxByCKM+nZDDyUTGzV5yFK"
+    "K2TDIXaER4Fbn4h4/vmmryeOPorv6CECrlIyQRCPXiEurwg8fMsXJsqB17kAIXKXCxw4jt"
+    "6/GxfKA0CqENoJNdos5upYc81TtELIwZsSDwb7hAy/AWLtPzXZbF3Vh0iOLQJ66z2hs8UA"
+    "0UKJsSZZOgLsw2YUCtSO0WIxo7VDpBKYmtg4BW2SWLaE/Yzw/pwZRcGRQoFilOkwDFeLfn"
+    "HOQViAyi02TwKwxMe2EQmBZ+PbDf70ScL4VgprRqKRbMWjTrL5hstjJ3Tpsxl6ArNOHbm+"
+    "faJrztwu4W2NVjd7UjprNwhrhCXk0m3j3r2IncULbItTj8qiCYaiU7CD8MPWfjJ24oi5pU"
+    "MivggFyRXJD/QP6bxFDMVAjSkf+K2qdZSeAOVUaaWJjIIA/FeC6SvFS4eRqKJhD4hSwUY+"
+    "uU6nm4B4rzO+e2FWZv8ixdg3SSfhwngD7M+VpyfjRnzSnVbrjDlLjbpUSnz9+5adPoUdlm"
+    "yAIOIKCPKaA/YhoZXsqoQCysCjBIzDR/qAwYzptbyO4gV114KLl006WOQ69Axs+DO/Pw87"
+    "PC+c5dzL79P1ifJ9Y="
+)
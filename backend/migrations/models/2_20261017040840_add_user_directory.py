@@ -0,0 +1,197 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "user_directory" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "email" VARCHAR(255) NOT NULL UNIQUE,
+    "user_table" VARCHAR(20) NOT NULL,
+    "user_id" INT NOT NULL,
+    "role" VARCHAR(20) NOT NULL,
+    "display_name" VARCHAR(255) NOT NULL,
+    "phones" JSON NOT NULL,
+    "password_hash" VARCHAR(255) NOT NULL,
+    "active" INT NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    CONSTRAINT "uid_user_direct_user_ta_e5b1af" UNIQUE ("user_table", "user_id")
+) /* Email index over patients and practitioners used by every auth lookup. */;
+        INSERT OR IGNORE INTO "user_directory" ("email", "user_table", "user_id", "role", "display_name", "phones", "password_hash", "active", "updated_at")
+        SELECT "email", 'patient', "id", 'patient',
+            COALESCE(json_extract("name", '$[0].text'), json_extract("name", '$.text'), ''),
+            (SELECT json_group_array(json_extract(t.value, '$.value')) FROM json_each("telecom") AS t WHERE json_extract(t.value, '$.value') <> ''),
+            "password_hash", "active", CURRENT_TIMESTAMP
+        FROM "patients";
+        INSERT OR IGNORE INTO "user_directory" ("email", "user_table", "user_id", "role", "display_name", "phones", "password_hash", "active", "updated_at")
+        SELECT p."email", 'practitioner', p."id",
+            CASE
+                WHEN substr(COALESCE((SELECT json_extract(i.value, '$.value') FROM json_each(p."identifier") AS i WHERE json_extract(i.value, '$.system') = 'license' LIMIT 1), ''), 1, 1) = 'F'
+                    OR EXISTS (SELECT 1 FROM json_each(p."specialty") AS s WHERE s.value = 'Pharmacy') THEN 'pharmacist'
+                WHEN substr(COALESCE((SELECT json_extract(i.value, '$.value') FROM json_each(p."identifier") AS i WHERE json_extract(i.value, '$.system') = 'license' LIMIT 1), ''), 1, 1) = 'L'
+                    OR EXISTS (SELECT 1 FROM json_each(p."specialty") AS s WHERE s.value = 'Laboratory') THEN 'laborist'
+                ELSE 'practitioner'
+            END,
+            COALESCE(json_extract(p."name", '$[0].text'), json_extract(p."name", '$.text'), ''),
+            (SELECT json_group_array(json_extract(t.value, '$.value')) FROM json_each(p."telecom") AS t WHERE json_extract(t.value, '$.value') <> ''),
+            p."password_hash", p."active", CURRENT_TIMESTAMP
+        FROM "practitioners" AS p;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "user_directory";"""
+
+
+MODELS_STATE = (
+    "eJztXWuT2zaW/SssfcpW9Tq2Jz0ztTs1Ve1HNp74kbI7s1PjpFgQCUlYUyQDkm0rM/7vC/"
+    "AhPgBQBEVSJHS/OGkJB5IOLvG45+Lef632gYu96NFdGAbEj/fYj1f/Zf1r5aM9Zv8je/vG"
+    "WqEwLN/kL8Ro7aXtUdkwfQOto5gih3e6QV6E2UsujhxKwpgEPnvVTzyPvxg4rCHxt+VLiU"
+    "9+S7AdB1sc7zBlb3z8lb1MfBd/wRH/8yOHxQG1ics/y0UxTr8MYd+dNf24ClFM2Depvv8r"
+    "7yP8ZG8I9tzaT80apa/b8SFMX3vlx9+nDTl8bTuBl+z9snF4iHeBf2xNMna22MeUfRbvPq"
+    "YJ/838J+UUFTRkP69skv2uCsbFG5R4cYWjtV2+trLtt+/u7Q8v7217pcGqE/h8RAgfH/7r"
+    "t/wr/OfTJ9/96bs//+GP3/2ZNUm/5vGVP33NProkJgOm9Ly9X339mlGLshbpwJSkFmNSp/"
+    "UFe1XOa9G+wSx/mQ/ro+L9KscFo20kFy+ULJfmOAHNLRy+uLt/mZJYkpYasEDa8x2ictKK"
+    "9g3S2BdYIFWrPfpie9jfxjv2520Lc3+/e//8h7v339z+B/+4gE0z2Rz0Nn/jKX+nzqybMC"
+    "b4F+r+pFchp5/3oQj+w+NZP/Alo1GM4iTSsdYSMZ29riJnh93Ew8XXGdlsnz7uYLdPHysN"
+    "l79V55liFMns9h5/URhuiTBiXmgh9P7lP+55z/so+s2rEvnNm7t/pBzvD/k7r9+9/Z+ieY"
+    "X456/fPWsQ7gcxlti1mu8joBfd+aJ/rWxvAs8LPttJKDL+LAg8jHw56TVcg/g1A45l6MdX"
+    "puX+2bt3r2vcP3vVJPfnN89evv/mSToQrBGJsXzidtj8wDixUSzfn/FNhZzzOrJtp1ZsTB"
+    "Y21fCp033ne4f8uWx7GF69efnh/u7NT7VR4Xs6/s7T2tNQvPrNHxvz/rET639f3f9g8T+t"
+    "f757+zKlN4jiLU0/sWx3/88V/04oiQPbZ+aP3Mq5oXi1YK026kno9hz1OhJGfS6jXnBUGf"
+    "b821e2vdVjctd9bxUz3cZ39mfdktW6d6EjrXUQ8Jrzyr0ym09SF0LOmMjx9wHFZOv/iA8p"
+    "1a/Yl0K+IzsJ516sn8qeFkbx18KMilfL6Z6iz0dnVsO6GAPsd+NsB/D87sPzuxcvV5KJYQ"
+    "hquZOP8J+FF3y4OMlvbVKU08steY2cT58Rde2aSfN3gqdB45VjW/Gt/dN98xXko21KD/8d"
+    "/Fvn/D/3iE8c5L0N0q8jOHBr79+0eXCdvKV9PM+c9OGuit6tFGMh37WCdYTpQ+o5STupjk"
+    "GX9l28v3Vr533Z4OMda91T+3hT4lN+BG7VXqAayAgHRcNx2cUDdKv2AN0KHqDSvjV37jWg"
+    "gRv35W7UxfNZlKz/D7OV9EEyymrXUx0F/id9/1PQh/YAWD+PdRRFOIr20t29mvY6CnjX5z"
+    "30kJaUULQHrvvpCPxgEWtaeRNnxB5pckOnJKAkPujsTKuYCRVKGiQx8fFqkt3p8PpkRLY+"
+    "lpyuWtWbEgTSjYZ0k9HW6yzQgA5wGljQ9L60wwD7DyNR96GqoOCp0niqUt74rtLWj7WQYW"
+    "GzpL9egyitXsCXKU+CKH2No95FlGbv7XRF6RoGxFPJKrbHbqreUOwE1NVjV4rtxfLMljFQ"
+    "/ufLKyj/F1H+68/6ABS/yTp8f+xvWVNEV56lc+RpurOFawhLvo5Ai9pCP6dAixcEbf0gIt"
+    "k01oiyKN+8aQuxcLNmXaMr8snLqsFq8RTSFvoRFPnNDAifmDR8gjiu/eQxI87VCqBowEzw"
+    "NtR91E+6+KifqH3UTwQftVs8nnb6igbZItIIOaYhCtx2uW3HWqllgVvxxt2ROd0IIRFpIO"
+    "fDhwmxT8NxizagCGWooc68fTuzaUXv8i3FUeA9tMorqvt2DeA1sxjhB6wrvFYx5i1nI0iu"
+    "y7h6i44hUkskWQyH7qoJiUgTjBoUodkMxUK1AVCErnHUuyhChfvCtdcHzcuKIhIc7KAOgT"
+    "q0dF5BHQJ1aEE891SHqssXaESdL+OKi/6clKLv0Z54hx9IFAf0sJKoRfUGN22K0SZtau8q"
+    "bTvLRhnWyk3TqvQh1ZDUzTUFJZCRJpWRKPay29M7IkmipPYJNXHgZO/gZGcf5xJ5IkE10z"
+    "WQgTSPoh+xudUONnaqT2jMGk0YnFMkAe+MIxSz74nY8OlRW4UBtZLkaiiJUgNUkNsySQhI"
+    "E7zGE0wUoIZMoIZAUkzQPmYxFAv1goP2cY2j3kX7AKcxOI1n5l/r4jS+jGvt1R5t2S98j6"
+    "OMGMG1Vm9w0+ZaI1lTm6ZtO4Zkv8AxIh52rRxtVdA1r1pbwz4B2ol7gBx3F/CuZczrhrDW"
+    "UQa6fJ487hak3RalLRwy1gEjjeKtpnutAQO2u7HNUwxRFMV2EmmnmhCwkHBCJwN/wZ7utC"
+    "IATThcT2DqMXZ22a8VyFZ7MGogE4ie2ouxYb+TfR8tt1EVY8REPjXpZB+ynWYkXULVtNdR"
+    "QHwP4nnkx55nAypTWXdlXwKF+aaP6XOFygkS2TFffRCqo6bzpSyl0FtGUEI9iU3/7cO7t2"
+    "20FqimS5I4sfVvyyPRaOyu/rJJfIdzZ60T4sXEjx7xz/vrWApMC6ecpXZrbxr2Td3NyDto"
+    "WnvFJSAMy4lUgDWkgd7i5XqHRVGA4jCgcc+kjwIYBnvWg71BDvE0L09WMUZs3KaILXKcbL"
+    "dr+8l+jSXpWdR8y7Am7NYmOIbDJRS4hLJYXilySeAFW7aH1ONWBAK/stzWDvL1iK0gYCIA"
+    "ARxuTS2O5563pviDPwDJH/JuzOS2MjueZrSyRg0xQVzHNTRxYZ9TqMxrtFaHyZRv3rSFyL"
+    "AR6hkew5BWjKP4dHyMrKV+gAzvAeJjLhAfkxKvm1WvBgKnRTenhRPsQzaj+vp0i0jgvBvn"
+    "2ZxkPyBPFjvQdreyjjOQ71E8RDlv7BdL9iEn6S5g5rnjhr/ISvEGU8y2cTZF/lbTuAWoeY"
+    "yPYt5o7Qd0zw48Gw9ttZzOTaB5hA9/Zy2fFfTvBwrACa8JboiPvLE06rEZL3fhAtvtQmUN"
+    "CCLlrEVKUKSvaLBDTDds5eH3ZBjdOpOoiDRwEzzKoYN7XbLgY4fIHJ1qzkWkgfuEMSiH6+"
+    "1TBmpmZqqrozZQIPlBls+LkAwBFqBXz0yJAr161np1sXINQPRrtL7HnaLmF0pxY5WfmaKa"
+    "ci/XU4thaVdT+U/rpqWqme2ijrLPCmgpTJeurIRu+VzIAFAEbjb6qe494BrIwGP1SJeAQa"
+    "mGjHwVPkOc3jVeqrM9n8kFllsTN5QgyNigkbEhcnbYTbwexeFE5JnV4eY2n7QMgKw83JGO"
+    "wrnfeYoQkCa43hoyfxeVXy3yyyKG+N65n1QjogfQamZGv0lSDeG/LHG0sw80cSY8VtMnfz"
+    "jGrtZpV1+Qr0DOuh2/HOZHuQYPys2Udg6JidUr+TJT1EJi4mscdcmGQkhM3HAhdldpqygQ"
+    "EEFAnOyGNmY/K4p7VBGVIIFhkGgvKdFWTXIIgq/kSqb4IHeSZ9Mla3qaZ7bQaWi01TVeV6"
+    "OtlL/ML4HayvPzs7yH7398n5erU5Nfu9RqBvONbbgXIJextWGcnclVHrDxc9qlQXyNrP+n"
+    "Zp9HucjDAKotbk5EA2QPURZMMn5QAOj6U+r6Lg4RjffS7ZFa5KijJtRCU8tFx/qwy1T4ox"
+    "3ZaNF9BEzItIsmonh4xdnBNCYbtm4oNAa1s1tEQkbYwV3h+EuIKUkv5h4wopIBUs7qMihk"
+    "QhaiAELsEOSR3/UfAAkUnoDBn4DPAf1kF4ECOsMjAOcxOPxjjRkcvMc8+Mg58G17zHe5Gg"
+    "MkBYNu2n801iTQUU3z5qCZgmYK6hloptc46vPWTM3zrgjCk86tny7e/Xc+vg/YPxNJKBcd"
+    "kPFc+2e5VHM39IvASVKnl8Sn2mxy0+ZULS7ouXnrjmkr88+wjjAL+a51dLPXEleeaNuntm"
+    "tx96Gy3sMtrGm9tflgat/EEoAG3hEaPvkcm0Zl5/OWa1gFwEB6R7mCVf1mAs/qY14DBse9"
+    "PlUvPax9zbAGAhvvZuNso7Ll2fJSPVyXcSkYmO/GfGqubBez07bxAmQg07edJM3bFknzVp"
+    "Q0U9J0NyU1kJFMD70hSRmLyO8SmpV76xoGwkVl6ajIXt94ayADjXeUyIeQBg/ExVR74yEA"
+    "TdjyTbG/Ls59uvfBBeCZ18FnRr3ebXB2DuGOGX6nm/2vzkFFRJpguFOfVfY4RtwnIjKvVm"
+    "KrGBBg+wuwMdpqRZAU7ecRmWBU2MhC8tVw+eEBj0X66MGDIIMbJoh2kcEhIy1cKF0sr8cL"
+    "N7r3SUUg8AvXSTW2PpDxdyY898z4W5kAhjDn67i8K86ac8r+mxv8TzRwsJtQvFLHqpRtbr"
+    "oEq4RFc81olRJn5cVWcLYUycJVVI3141WOPUG91QtEqjhhzFhz9ep/VjAmuMmaDvVO/vQW"
+    "d7rEm55beA93egNpoIIxikO9ZE5XMBKRBnI+imq0DtyDHRGZgKGmuwYycTYZR56rLpkC2+"
+    "3+LxFtoA9sIT4vySUA0enFxiq95mnviZ9I01Mqt0EyKLi8RNcM8nHE9qsRQdrrhQRq3jQ2"
+    "fIhMmg5affdfLdUKQBPYnlqpDZKY8agX4VhCTGB8bPvmi4AdhHbfNNoqvAncT23tlWOUbn"
+    "pnCRRGoEcUe+B5bNOThDZPqUcolvhyWguNyDuAoiMaRUdAMVcvBqCYg2J+xvEBFPOReC2k"
+    "BW3JXIIEhkEzB818eTz31MyrM8AQ9nwdorlk3pxYNa845aKIKFOWv0H+4T7g/040gHPNt5"
+    "H+PLsROdD8sZRncGZMCtTWgwXY0Kdj9AkfUmOo9JIbw3EY8yZi0EHeMN7RINnuFG2qPUdK"
+    "I2Ov28Iwfe0SVqHOqSxMmqcDKnQyKjO7JL6VI60MacU7FFt87AKP8FNSZCHPs/L149iY+P"
+    "zJOybaroddDNWrfnwG79oONnaE6QNxIEBj4gCNfNXTVSUaMAMlbEgjsryoDEgjcikHbHMW"
+    "F9hv9wBK4Aa6ARfi9usWNLCoggHLjsfZIId4JJacUlqSalQwBvI8yvLh7Aje2GkAACIyw2"
+    "6JGhChsIz0SD7sET89E0XJfo+oxOJbhkCChTHQH4OYq3Fpzgdmy1r7KBEJ/J+jZfeN7VD3"
+    "AOPRY2tLIocts9se0R0SKIyA/ghAwoMpEh4E/oa4bPLmdV/iA/uoB+zpcK7sYMIh8Lkv0l"
+    "vsEEAEzRVG0EDpBdNGXeJAEUovFE+sbuCJgIOwE0lgj4ei2C4eD12K5WCIS4O4NIiauvSZ"
+    "Y/CoqXI+HYLe6wjiEdagLkXra3Pq9FzPbCbuSrV8Lepfwv7oJFX4MnSKsj/P+3obLDj1a3"
+    "sNe5egrR9E5zL1IuuGRIbSRPZoyzqx2faYffiZZL3KOnuf9mUoYey7D0PWa7Q2mqhaZaz+"
+    "NEmqchlIViPY8ly2anmhDKQLeR6mW3IuW/me+i7t7WAoV1m4p0KJ6sHWm2N/hhL2QGIuRb"
+    "Mt7ZmE/Z139KHoxxCmJsh893Oanm+lDtHOG9x0CdHOcv11C9FWs6MZHM3e+5juFNhOvXwh"
+    "cpCf/gFx0lPGSUOdtKmisI6lznrXSAPGoT4a1EdbDNPjxMxCibQRBB+4YHGpGKhjtuk+YQ"
+    "I1KMQJzCVOoEt0SHX/330ma6BAuwbteipei/Npd1IrCDBUKOsCwRYXp3isYAuoMzJinRHZ"
+    "rmEAll+j9T1ecIXMDiEWtb3SaXL5ejUAsR/ybsxktbKoz64sDvHxSqUL8PduTkoCrNUUYk"
+    "D6BVOvv8MMZBtklxqzV8H9P6X7X9cXDS5oPRd0yghxtH3+TRzw3Y3vNUW+q812HWWCG28C"
+    "qtlalGzYGpHQbJvalewmDky7YxKgIGJrv83TkunQ3YAZyPYoOgv7uKx/DaqrGOC5G8/VDW"
+    "DnG7kVDPDcjWdQuC6mcPkktkMqzx6GHbJHnsLPWQM25a0M+SjvYYFG3zIOL14+f/Xm7jWz"
+    "45unjfoMxYB8J84kCaXcaRfFgfNJ46go4KbzJj8eaz4Z2FW/Jz7ZJ3ttagXcdNQ+WQq3+E"
+    "tI6KGlIqGc2gasTfw2bG64u3/ZPPSh2NnZfrJf651EmjjYS3QsWIqobu3jCsSEPcQkxUrL"
+    "r9a3+pOyjwkLQBXe0sXWfyrTH2kwX4KAaii1BaFgkCjomka94KiZKEgIT+lytb8IxoCret"
+    "rXZsvOz6WM1v1AC3uMLnJfrwiTkijylQgqtSCf2/34ejwo7lMq7lkqSfaO5Kj6tw/v3qrY"
+    "raKaKx1xYuvflkc6hTP1ejhXf9kkfppv11onxIuJHz3in/fX1fQbTs5Su5e26ZBtrF68g6"
+    "aXFnb5k+3y5eq82vYVuvwEVn8ZD9co9h1jDzuBRDlW816BwIQz+IDgPSJaeYiPgGHclJdd"
+    "ZCeJvHL13MElwkQXZScPZYuDUnACExrvtGWLOupM1WJmjOuJFuykzGYHyblMPSFXIGdNyM"
+    "vhbZSZd49olsRGkX5fPQAiEsah/ziwvcU+8Ss+mK7DIABhezL44IQoij7zUpg7FGkFwQlA"
+    "A1XVwTYsvRyiKAwD9r0GSB94V/a0wDHp5AS9YGLYRfJ1gcywi+Rpg/bEO9g7NudLo1d1yP"
+    "o+7euHsisTCbtoLt1FMnaRZLqLZYpfdT2fp45XghfJUpH08WK5hxfJ2gWTDy+Sr8LKKHbY"
+    "KWAY0t6nfZnOWCUZ69mMlUlgTWTsUhmuF0nWReNmFskYBM5o0cVTYpxJU8ecIYuk5zIZ0x"
+    "dDlVYIVsXoAocwWk+ev9/5+D5g/3SwwbTH7qfweXrv5QTrh60Vi6I6eq2ybJ4MYrNrK/bJ"
+    "aLZV/hHWEWYh37WQ+4BphC2KUVn6u8qMDk4zaf3NsfgyZKiZNF4uG0osEYjUGkQVA/JDt3"
+    "iJgrOMqR5kH4EGMn7bLWd6S8r0Jt3FXCQyrb6MX8UYQfLUV/EjzBYCEmslm6hijCB97Grv"
+    "7NNwrB0YVEddc2AQNzfWVPeuZxU2YTTy8ZXFhiOrwoDa8vwown9GnBAqseZLnBQU6rt6rT"
+    "sCTIjFnHqdg3u0akNf5o1KuEd7jaNecNS8R6vW2/Qy6UuxUKsAimpMxWuxadWuASECwWyh"
+    "BMQFS0DUp9IBKNYNfZiZKXflWboEnaa78vwPYc56FTcWSrU4Z86pgoEYXaCWnuohCKfVp0"
+    "YIxGn96XmWEzJVj0IUxVajh5rodKoxKE3zWR1vWpSmcti0E8hLoCb6isdLa65DdokwkONx"
+    "isby3H/Yd7SEjxoImO7GNA0Sme6hZvkIMJDh4VVTtjBSfW2pjrrqVLnYd/VTDVcw1yzMsS"
+    "+pvKysfsDrKAOf8lF2BSDKTSDKIZcdR7AvK0zQEu5TBZkgzo3NckRcbOPNBjuyG1dqBbSJ"
+    "M4HrqYVQkJ1Bdp7FUCxUgATZ+RpHHWTnmcijRU3eHvSWKCAW9PzJeM2uO657KPoyKHAMov"
+    "6QCiiI+rMW9feVQvVDEJ13ZTDH5Sp/mt3aBDvEdKEXNLHYOUOyLs0qbqI6DLKQicYwtURL"
+    "VFpC1QmzYhug6oTOpCDjGKpO4OlJh6oTy7ZvqDoxswGBqhNQdWLKEKtOEVZQdWKcGQSqTs"
+    "xo5v0tQR7bSutXOxCAsCwOPjhRiHnyL1lmEPXA1EAwKIMPSkC3yCe/az8wTRzMWlAGZN47"
+    "SEHeUbsSoQxIv4zBCfvhFLtQBqRj0mDkYhtqgXQsbeHHmIYU81imvMzFeYxdRXkLtkCQrc"
+    "8om7x6wzzX9Ha20stYUXwJuhZpXVkyfUYXVLvQSn2O6Sage8Yb1L3QLDSWhzBD3Yvuj6h7"
+    "OcaWuAYc57QN8QZ6LM2uE3LMeHGpgiFLtLJKwAuUDtEvnxiF2I/S9fNSRUQWbHRQckXz7D"
+    "Rd7ZUlWlV5aIIaNSeI4tsmxlNarAbq1AxXp4b9zoCSKFbGkOsXqnmdd2ncXleMfK3PeOmT"
+    "3HYufYP8w33A/9WLxz/rcHrRkJaWKOb0J9qNaGDZD6bc4rhrvEl1HiYe0NTCP+FD2lEe21"
+    "+OQx4UfXwU8obVcOK8SbyjQbLdKboR4o+lYdbsdbsZ2fv1RIR0jVtJhHR9w9AWId3YpYwa"
+    "If2xktOi3FemUSqsJeSM6yTYjRxXDdnLIHuZOUyzeVg7v1EVAzx34/m3BPlspTvYpa9FY2"
+    "5WoOGyrCTq/8jVcQHtQ3QNPB3PjxdCMuG9J47Cd6NOttPEmRAAPXXOnYUkSmOPj5uHRUwQ"
+    "lzV4Dq+KT1wde65OdCOBQ7abuWS76ZLjqHH80hx+ET3A6C9o3pvRYBectI725dLuzO6Rhr"
+    "w7y+CVrfZ75HA/sx61TRwki2pJakR7ZjSiYLqQzmgYp/5Z6YxKgxyC3itL/0JnnsZoqQTr"
+    "5zE6rlnTW/HMVrrORtxc5ueUwCiNq5DIckW8hVqOOwZ1jCzDHTX8mtLGwXTLVxhQ42aixn"
+    "GDyPgRuG3xh1VBoGB0UzDWgXuwQ0Qlc7Ca6RoImO7GNDh4RaKHd/DmM7nAcmsirhI0YSKu"
+    "4yuLzcQVOTvsJl6rM1U1VTeRV13MqaSj8Bl3X/OaSBO0t0b1sQ5zhPpmvpDZyQn2oZde8e"
+    "0jAYhokADmLAGApH05SXtD0q2EFu9VDHCuzzlPW4DthMpi/1vyw9ZQkAKpfVh6pN+B+lVT"
+    "PgRQv0q9tTI3tgPqV5k26pIdnnDjreHT7eiIbaBALYcQj6l4Le+y6lZWkiCBYYhEGFRg1I"
+    "xEqJrkEARfRyyC5EE+TXWxZE1P88wWuq4sN9Z4Xam8EjSMY0S8NMERz+N35q163ZyAC2F/"
+    "NgmOlsLXqKEYAU9o/QMz/oAeVrKYjFqDm9bgjLSpvau0PRWlscoXSivDWhVslbCWZlB2am"
+    "YBGfvgE/t8u4eILSBN8GiNLWMXrIVsOojsEFPbRZIN1gvskD3y2pkX+mg6OLJOHuWdLW8w"
+    "2sTWl89fvbl7/c0fbppydjEs3ym5P2BEJaaunEsEHHgVxNMv8pxgF3h2Emnp3A0YTCGnp5"
+    "CCMpd9i/z5/4zxJw2DbukBTFs0bZcmW127rmLAqE8bdcpX1o/AslrerKOgjMgZpVwcJwm1"
+    "U4vUUQba+RgV6LCbZClW2ec8YL1afyLUPNJvu0wut+rJ5VaYXPaI8oyHPQ45ItI8voefzD"
+    "3ykJ4MSZxoTykyrHmcjxKIzn4WdUiE7V75uORo86gffnpxCY61L7XUQMDyaZaJHyWUyx88"
+    "I+UD0SziKkebx/s4O5Y95hcpnAP3dsfcQayxR5eCYasOIYcQcgjBZxByCKM+n5DD2UTGLV"
+    "5yFKK2dDIXdIjwKnLxjx/fNdfk8drRXcMFIfwcYfqCUOyoghDqDW7aghCSiMuXtbYngxBe"
+    "7hHxrHRErOABUyv/+ZGFfNeqJam3WP+utT5YmLU7WLzIrOUFwackfLRqjMBA3f7i/+L/iM"
+    "OYdWRFB9+xPhP2Zm6A31YDtKzPlLCNGe+G14phv5Vj+BBh3/22Tsyj8PDfv/jxDls08LBF"
+    "IvZ9ML+ymDBLtqKAffqWgd2A9ce2e9YOPWArDthPoBFr7rLP5nW26LfHkugW31qmJEhCMj"
+    "5m45KN0k0+Ssy4foVYjQvGamBuoFounQIwTJqBy5I7/jG3bvNdSa6jDEyaMUIuh0g3U18F"
+    "AZHxsrsHgZ7RFu3BXLto0yQKPXTIyu9okNzETZjsZbXcWThkHOlFAZQIuOA8uLcxRFH0OW"
+    "BHhh2KdjrWLwBNnGvGeAD4CeFBMtG0ZjoqQRNmOir2f4tNdARuPrWhm+XmO8shNZzrpFJ5"
+    "U+I3qdflVDtNHrKYlGPDztc2UmDqbYisPUZRQvGeezgEX0gXQJfEnHXHVKWHvEoeOBCmdC"
+    "AI/GtOejK8gVPfcqc6UciKDlEceMSx16HGA9VAQVC4JCicoD7MNmFArUjtDiMa21Q6QSmJ"
+    "rYOAVll+iigk7OcH9KBLrgwKFIsUp/mTY7wPOQd58WaNi30y+BXe6ftO405f8OXAfr8dcb"
+    "4UscZKq5ZiwaxFs/6MyXYnOyK3GXMJukITvr152tmEd33Y3QG73dhd74nuLJwhrpBXnYk3"
+    "ZB3bkRPIFrmWWKkqCKZayQ7CCwLX3nqJE8gunCqZFXBArkguRE5D5PQshmKhzvUukdP7LK"
+    "uTzcPTqNujQGsTCxMZpPCczkXCDa9XBs8mEPiFBJ4aq/LgCTzrc+kAFOfp+t4f+1vWFNyV"
+    "Z+ka1CVf6nECGMKcryVdanPWnFPZyztMibNbSXT6/J2bNo0elW3GrH0JAvqUAvoDppFmPo"
+    "sKBALgOgbAhRJFtSWFXChTUk1gd5QsIfwWvnTTpQ6wrUCmj7C9jEdksFjaiwaeff1/C6C0"
+    "yw=="
+)
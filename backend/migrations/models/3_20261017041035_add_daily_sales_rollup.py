@@ -0,0 +1,187 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "daily_sales_rollup" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "day" DATE NOT NULL,
+    "quantity" INT NOT NULL,
+    "amount" VARCHAR(40) NOT NULL,
+    "prescriptions" INT NOT NULL,
+    "medicine_id" INT NOT NULL REFERENCES "medicines" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_daily_sales_day_8d4da3" UNIQUE ("day", "medicine_id")
+) /* Per-day, per-medicine dispensing totals behind the sales report. */;
+        INSERT OR IGNORE INTO "daily_sales_rollup" ("day", "medicine_id", "quantity", "amount", "prescriptions")
+        SELECT substr(p."dispensed_date", 1, 10), p."medicine_id", SUM(p."quantity_dispensed"),
+            ROUND(SUM(CAST(m."unit_price" AS REAL) * p."quantity_dispensed"), 2), COUNT(*)
+        FROM "prescriptions" AS p
+        JOIN "medicines" AS m ON m."id" = p."medicine_id"
+        WHERE p."status" = 'dispensed' AND p."dispensed_date" IS NOT NULL
+        GROUP BY substr(p."dispensed_date", 1, 10), p."medicine_id";"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "daily_sales_rollup";"""
+
+
+MODELS_STATE = (
+    "eJztXWuT27iV/SssfZqt6jh2x52ksqlU9dieHSd+TNk92VQ8UyyIhCSsKZIDku1REv/3Bf"
+    "gQHwAogiIpErpf/JBwIOngEo97D+7992ofuNiLntyHYUD8eI/9ePUn698rH+0x+4fs7Rtr"
+    "hcKwfJO/EKO1l7ZHZcP0DbSOYooc3ukGeRFmL7k4cigJYxL47FU/8Tz+YuCwhsTfli8lPv"
+    "klwXYcbHG8w5S98eln9jLxXfwrjvh/P3FYHFCbuPyzXBTj9MsQ9t1Z00+rEMWEfZPq+z/z"
+    "PsLP9oZgz6391KxR+rodH8L0tdd+/F3akMPXthN4yd4vG4eHeBf4x9YkY2eLfUzZZ/HuY5"
+    "rw38x/Uk5RQUP288om2e+qYFy8QYkXVzha2+VrK9t+9/7B/vjqwbZXGqw6gc9HhPDx4b9+"
+    "y7/Cb26fPf/D8z/+7vfP/8iapF/z+MofvmYfXRKTAVN63j2svn7NqEVZi3RgSlKLManT+p"
+    "K9Kue1aN9glr/Mh/VJ8X6V44LRNpKLF0qWS3OcgOYWDl/eP7xKSSxJSw1YIO3FDlE5aUX7"
+    "BmnsCyyQqtUe/Wp72N/GO/bfuxbm/n7/4cX39x++ufsv/nEBm2ayOehd/sYtf6fOrJswJv"
+    "gX6v6kVyGnn/ehCP7d01k/8CWjUYziJNKx1hIxnb2uImeH3cTDxdcZ2Wxvn3aw29unSsPl"
+    "b9V5phhFMrt9wL8qDLdEGDEvtBD68OofD7znfRT94lWJ/Obt/T9SjveH/J0379/9T9G8Qv"
+    "yLN++/bRDuBzGW2LWa7yOgF935on+tbG8Czwu+2EkoMv5tEHgY+XLSa7gG8WsGHMvQj69M"
+    "y/2379+/qXH/7esmuT++/fbVh2+epQPBGpEYyyduh80PjBMbxfL9Gd9UyDmvI9t2asXGZG"
+    "FTDZ863fe+d8ify7aH4fXbVx8f7t/+UBsVvqfj79zWnobi1W9+35j3j51Y//v64XuL/9f6"
+    "5/t3r1J6gyje0vQTy3YP/1zx74SSOLB9Zv7IrZwbilcL1mqjnoRuz1GvI2HU5zLqBUeVYc"
+    "+/fWXbWz0md933VjHTbXxnf9YtWa17FzrSWgcBrzmv3Cuz+Sx1IeSMiRx/F1BMtv7f8CGl"
+    "+jX7Ush3ZCfh3Iv1Q9nTwij+WphR8Wo53VP05ejMalgXY4D9bpztAF7cf3xx//LVSjIxDE"
+    "Etd/IR/rPwgg8XJ/mtTYpyerklr5Hz+Quirl0zaf5OcBs0Xjm2Fd/a3+6bryAfbVN6+O/g"
+    "3zrn/4VHfOIg712Qfh3BgVt7/6bNg+vkLe3jeeakD3dV9G6lGAv5rhWsI0wfU89J2kl1DL"
+    "q07+L9rVs778sGH+9Y657ax5sSn/IjcKv2AtVARjgoGo7LLh6gO7UH6E7wAJX2rblzrwEN"
+    "3Lgvd6Muns+iZP1/mK2kj5JRVrue6ijwP+n7n4I+tAfA+nmsoyjCUbSX7u7VtNdRwLs+76"
+    "GHtEIJRXvgul8cgR8sYk0rb+KM2CNNbuiUBJTEB52daRUzYYSSBklMfLyaZHc6fHwyIlsf"
+    "S05XrdGbEgShG43QTUZbr7NAAzrAaWBB0/vSDgPsL0ai7kNVQcFTpfFUpbzxXaWtr7WQYW"
+    "GzpL9eQ1BavYAvMzwJQelrHPUuQWn23k43KF3DQPBUsortsZtGbyh2AurqsSvF9mJ5ZssY"
+    "RP7nyytE/i8S+a8/6wNQ/Dbr8MOxv2VNEV15ls6Rp+nOFq4hLPk6hBa1hX5OQouXiHiHj8"
+    "jD0YfA85JwJRFbCG1u2gQXLm9tR7y5Tcv2J0UXP2D6GxcdbqyQ/SM1S+JjyyVRiP2IjYEV"
+    "BzFDWmu8Y4NtxTtspR9iURwGNH6yagzY2R3+5P/k/5htyC3i5+/vMRtf5EfcagP+IoqLLr"
+    "nywwpp+aturChIYVmHVsD2vT/5OxSxT7YiB2V9Zhyxv75E/GNIHFn8My32KVuc/iqJduQT"
+    "ozn16Ba/i5vWzw1FCchGpr0aKHHLt90MlHnkr+ti4C8J8mNpOENpjVXIdHvOpdxeQ/sgkW"
+    "0wX2KH7JGncvYVoKYxZqgnOXpp5LbZ4qsXr9/ev/nm2e3NbcORWnj9ngshoerULrlJpT4o"
+    "NXFgt9JTfr6KdSe2gYIj6OkjaEHZUAekvKuFkax1OCoNbFb7doK2fhCRaCXbsB/fbN+pZ8"
+    "26qqJzp4NVg9V33LIW+srn/EY1yJ4n3b8Sx7WfPWXEuVrC5wbMhChhXVvyrIu25JlaW/JM"
+    "2Ei4xeNpp69okC0ijZBRNcQ8d12yZLBWajnPnZgp48icrrJfRBrI+fDyfvZpOG7R9CgkyD"
+    "XUmYfjmU0remdjdmgIvMdWWZScQgF4zSxG+BHrCiarGPOWsxGkkstImYOOVxuWSLJ4jbGr"
+    "lktEmmDUoOSazVAsVNMDSq5rHPUuSq7CfeHa64NmkhERCV5JUHWBqmvpvIKqC1RdC+K5p6"
+    "qrunwNYc/Xoe2SLPpzihR9h/bEO3xPojigh5UkWlRvcNMWMdqkTe1dpW3nsFGGtXLTtCp9"
+    "SGNI6uaaASUII00aRqLYy7Ie7Ygk+anaJ9TEgZO9g5OdfZxL5AnA1UzXQAbSPEr8iM2tdr"
+    "Cx0/iExqzRhME5RSJaYxyhmH1PxIZPj9oqDKiVJEVGSZQaoILclklCQJrgNZ5gooBoyATR"
+    "EEhmD7GPWQzFQr3gEPu4xlHvEvsApzE4jWfmX+viNL6Ma+31Hm3ZL/yAo4wYwbVWb3DT5l"
+    "ojWVObpm07SrJf4hgRj99PzNBWBV3zqrU17CPQTtwD5Ka+gHctY15XwlpHGejyefa0m0i7"
+    "TaUtHDLWASON4q2me60BA7a7sc1Tg1IUxXYSaaeIE7CQKE6nclbBnu60IgBNOFxPYOoxdn"
+    "bZrxXIVnswaiATiJ7ai7Fhv5N9Hy23URVjxEQ+Nelkz28/R9IlVE17HQXE9yCeKz/2PItn"
+    "WYKmK/sSKMw3fUyfR6gceUIG9UGojoJUAc3dSkZQQj2JTf/14/t3bbQWqKZLkjix9R/LI9"
+    "Fo7K7+vEn8LGXQOiFeTPzoCf+8v4wVgWnhlLPUbu1Nw76puxl5B01rr7gEhGE5kcK7hjTQ"
+    "W7xc77AYFMgyWfVM1i6AYbBnPdgb5BBP8/JkFWPExm0KbZHjZLtd20/2ayxJq6jmW4Y1Yb"
+    "c2wTEcLqHAJZTF8kqRSwIv2LI9pB63IhD4ldWkcZCvR2wFARMBBMDh1tTieO55a4o/+AOQ"
+    "/DHvxkxuK7PjaUYra9QQE8R1XEMTF/Y5SWXeoLVaJlO+edMmkWEj1FMew5BWjKP4tD5G1l"
+    "JfIMN7AH3MBfQxKfG6WfVqIHBadHNaOME+ZDOqr0+3iATOu3GezUn2I/Jk2oG2u5V1nIF8"
+    "j+Ihynljv1iyDzlJdwEzzx03/EVWijeYYraNs9OyF3psC1DzGB/FvNHaD+ieHXg2HtpqOZ"
+    "2bQPMIH/7OWj4r6N8PFIATXhPcED8r/LBExstduMB2e6CyBoQg5ayDlBCRvqLBDjHdsJWH"
+    "35NhdOtMoiLSwE3wKIcO7nXJxMcOkTk61ZyLSAP3CWNQDtfbpxRqZmaqG0dtoCDkB1k+L0"
+    "IyCCwgXj2zSBTEq2cdry5WrgGIfoPWD7iTan6hFDdW+ZlFVFPu5fHUYljao6n8p3WLpaqZ"
+    "7RIdZZ8V0DIwXbqyErrlcyEDQBG42cRPde8B10AGHqtHugQMkWrIyFfhM8TpXeOlOtvzmV"
+    "xguTVxQwmCjA0aGRsiZ4fdxOtRHE5EXnUB+pKOwrnfeYoQkCa43hph/i5RfnWQX6YY4nvn"
+    "fqEaET1ArGZm9JsUqiH8lyWOdvaBJs6Ex2r65A9H7WqddvUF+QrkrNvxy2F+lGvwELmZ0s"
+    "4hMbF6JV9milpITHyNoy7ZUAiJiRsuxO5R2ioKAogQQJzshjZmPyuKe1QRlSCBYQjRXjJE"
+    "WzXJIQi+kiuZ4oPcKTybLlnT0zyzhU4jRltd43VjtJXyl/klUFt5fv427+G7v33Iy9Wpya"
+    "9dajWD+cY23AuQy9jaMM7O5CoXbPyYdmkQXyPH/1Ozz1UuchlAtcXNCTVA9hBlYpLxRQEQ"
+    "158yru/iENF4L90eqYMcddSEsdDUctGxPuwyI/zRjmy06D4CJmTaRRNRPHzE2cE0Jhu2bi"
+    "hiDGpnt4iEjLCDu8LxryGmJL2Ye8CISgZIOavLoJAJWVABhNghyCP/0n8AJFB4AgZ/Ar4E"
+    "9LNdCAV0hkcAzmNw+McaMzh4j7n4yDnwbXvMd7kaAyQFQ9y0/2isSaATNc2bQ8wUYqYQPY"
+    "OY6TWO+rxjpuZ5V4TAk86tny7e/fc+fgjYHxOFUC46IOO59s9yqeZu6JeBk6ROL4lPtdnk"
+    "ps2pWlzQc/PWHdNW5p9hHWEW8l3r6GavJa480bZPbdfi7kNlvYdbWNN6a/PB1L6JJQANvC"
+    "M0fPI5No3Kzuct17AKgIH0jnIFq/rNBJ7Vx7wGDI57fapeelj7mmENBDbezcbZRmXLs+Wl"
+    "8XBdxqVgYL4b86m5sl3MTtvGC5CBTN91CmnetYQ078SQZkqa7qakBjKS6aE3JCljEfmXhG"
+    "bl3rqGAbmoLB0V2esbbw1koPGOonwIafBIXEy1Nx4C0IQt3xT76+Lcp3sfXACeeR18ZtTr"
+    "3QZn5xDumOF3utk/dQ4qItIEw536rLLHMeI+EZF5dSS2ioEAbP8AbIy2WgqSov08lAlGyU"
+    "YWkq+Ghx8e8Vikjy4ehDC4YQHRLmFwyEgLF0oXy+vxwo3ufVIRCPzCdVKNrQ9k/J0Jzz0z"
+    "/lYmgCHM+Tou74qz5pyy/+YG/wMNHOwmFK/UWpWyzU0XsUpYNNdUq5Q4Ky+2grOlSCZXUT"
+    "XW16sce4J6qxdQqjhhzFhz9ep/VjAmuMmaDvVO/vQWd7rEm55beA93egNpYARjFId6yZxu"
+    "wEhEGsj5KFGjdeAe7IjIAhhqumsgE2eTccJz1SVTYLvd/yWiDfSBLcTnJbkEIDq92Fil1z"
+    "ztPfETaXpK5TZIBgWXl+iaQT6O2H41Ikh7vZBAzZvGhpfIpOmg1Xf/1aFaAWgC21NHaoMk"
+    "ZjzqKRxLiAmMj23ffBGwg9Dum0ZbhTeB+6mtvXKM0k3vLIHCCPRQsQeexzY9SWjzlHqEYo"
+    "kvp7XQiLwDKDqiUXQEIubqxQAi5hAxP+P4ABHzkXgtQgvaIXMJEhiGmDnEzJfHc8+YeXUG"
+    "GMKeryNoLpk3J46aV5xyUUSUKcvfIv/wEPA/JxrAuebbSH+e3VAONH8s5RmcGZMCtXWxAB"
+    "v6dIw+40NqDJVecmM4DmPeRBQd5A3jHQ2S7U7RptpzpDQy9rotDNPXLrIKdU5lYdI8LajQ"
+    "yajM7JL4Vo60MqQV71Bs8bELPMJPSZGFPM/K149jY+LzJ++YaLsuuxiqV319Bu/aDjZ2hO"
+    "kjcUCgMbFAI1/1dKMSDZiBIWxII7I8VQakEbmUA7Y5iwvst3sAJXAD3YALcft1Ew0sqmDA"
+    "svU4G+QQj8SSU0pLUo0KxkCeR1k+nB3BGzsVACAiM+wW1YAIhWWkR/Jhj/jpmShK9ntEJR"
+    "bfMgQSLIyB/hjEPBqX5nxgtqy1jxKRwP85sey+2g51DzAePba2JHLYMrvtoe6QQGEE9EcA"
+    "Eh5MkfAg8DfEZZM3r/sSH9hHPWJPh3NlBxMOgc99kd5ihwAUNFeooIHSC6aNusSBIpReKJ"
+    "5YXeGJgAPZiUTY46EotovHQ5diORh0aaBLA9XUpc8cg6umyvl0CHqvQ8QjrEFditbX5tTp"
+    "uZ7ZTNyVavla1L+E/dFJqvBl6BRlf5H39S5YcOrX9hr2LkFbP4jOZepl1g2JDKWJ7NGWdW"
+    "Kz7TH78DPJep119iHty1DC2Hcfhqw3aG00UbXKWP1pklTlMpCshtjyXLZqeaEMpAt5HqZb"
+    "ci5b+Z76Pu3tYChXmdxTEYnqwdbbY3+GEvZIYh6KZlvaMwn7O+/oY9GPIUxNkPnuxzQ930"
+    "ot0c4b3HSRaGe5/rpJtNXsaIqj2Xuf0p0C26mXL0QO8tP/gE56Sp001EmbSoV1LHXWu0Ya"
+    "MA710aA+2mKYHkczCyXSRgj4wAWLS2mgjtmm+8gEalDQCcxFJ9BFHVLd/3efyRooiF1D7H"
+    "oqXovzaXdSKwgwVCjrAmKLi1M8ltgC6oyMWGdEtmsYgOU3aP2AF1whs4PEorZXOk0uX68G"
+    "IPZj3o2ZrFYW9dmVxSE+XqniAvy9m5MhAdZqimBA+gVTr7/DDGQbZJcas1fB/T+l+1/XFw"
+    "0uaD0XdMoIcbR9/k0c8N2N7zVFvqvNdh1lghtvAqrZWpRs2BqR0Gyb2pXsJg5Mu2MSoCBi"
+    "a7/N05Lp0N2AGcj2KHEW9nFZ/xpUVzHAczeeqxvAzjdyKxjguRvPEOG6WITLJ7EdUnn2MO"
+    "yQPfIUfs4asBneypBP8h4WaPQt4/Dy1YvXb+/fMDu+uW3UZygG5Lk4kySUcqddFAfOZ42j"
+    "ooCbzpv8dKz5ZGBX/Z74ZJ/stakVcNNR+2wp3OJfQ0IPLRUJ5dQ2YG3Bb8PmhvuHV81DH4"
+    "qdne0n+7XeSaSJg71Ex4KliOrWPq5ATNhDTFKstPxqfas/KfuYsABU4S1dbP2nMv2RBvMl"
+    "CKiGUlsgBYNEQdc06gVHzURBgjyly9V+FxHvYEfIO/u2Ou/oI+/nQ+B5SbhAe+h2XTZXr8"
+    "DdRu17xmXn51JG644zU+xsTA1DoSuTSBgqkjO1giG3+/EFDCBRmFKikOXeZO9IzvZ//fj+"
+    "nYrdKqq5NSBObP3H8kgn/Vevh3P1503ipwmKrXVCvJj40RP+eX9ZTb9D5yy1u7WbHuzGcs"
+    "87aLq14Vg02bFILmdQ275CyDCB1V/GJTiKfcfYw04gCbWrea9AYMIZfEDwnu3fdXyOR8Aw"
+    "ft3LLrKTSNVcPf95iTDRp9vJpdvi0RW85oTGO+04Tx11ZphnZozrRXmQ67LZQXIuU0/IFc"
+    "hZE/JyeBtl5t0jmmX9UdQrUA+AiIRx6D8ObG+xT/yKD6brMAhA2J4MPjghiqIvvHboDkVa"
+    "qkEBaGAYerANSy8PMgrDgH2vAfIt3pc9LXBMOjlBL5hJd5F8XSCV7iJ52qA9j+Ps2Jwvlf"
+    "vqkPVd2tf3ZVcmEnbR5MOLZOwi2YcXyxS/G3w+Tx3vUC+SpSJL5sWSNS+StQtma14kX4WV"
+    "UeywU8AwpH1I+zKdsUr22rMZK7PmmsjYpVKCL5Ksi+pmFskYCGe06OI5RM6kqWOSlUXSc5"
+    "kU84uhSkuCVTG6wCGM1pPn7/c+fgjYHx1sMO2x+yl8nt57OcH6srViUVSr1yrL5kkRm11b"
+    "sU+q2Vb5R1hHmIV810LuI6YRtihGZa30KjM6OM0s/zfHatWQ0mdSvVw2lFgSIFLHIKoYCD"
+    "9000sUnGVM9SD7CDSQ8btuSeZbcsw36S7mIpFpdfaCKsYIkqfOXRBhthCQWCs7RxVjBOmN"
+    "uaSLZd+qLftWsGz2aTjWFgbVUdcsDOLmxprqXo6twiZUIx9fWawcWSUDakuMpJD/jDghVL"
+    "TmS5wUFNF39Vp3BJigxZx6nYOLx2pDX+YVVLh4fI2jXnDUvHisjrfplR6QYqG4A1QhmYrX"
+    "YtOqXTRDBILZQs2MC9bMqE+lA1CsK32YmSl35Vm6BJ2mu/L8D2HOeiVKFkq1OGfOqeSDqC"
+    "5Qh57qEoTT0aeGBOJ0/OlFlkQzjR6FKIqtRg+1oNOpxhBpms/qeNMSaSqHTTvjvgRqoq94"
+    "vDzwOmSXCAM5HqfKLk+WiH1HK/BRAwHT3ZimQSKLe6hZPgIMZHj4qClbGKl+bKmOuurcwt"
+    "h39XMzVzDXHJhjX1J5WVn9gNdRBj7lo+wKICg3QVAOuew4gn1ZJYcWuU8VZEJwbmyWI+Ji"
+    "G2822JHduFJHQJs4E7ieOhAKYWcIO89iKBYagISw8zWOOoSdZxIeLYoY96C3RAGxEM+fjN"
+    "fsuuO6R0RfBgWOIag/ZAQUgvqzDuoXC9dQROddGcxxucqfZrc2wQ4xXeiJJhY7Z0jWpVnp"
+    "JqrDIJNMNIapRS1RaQlVJ8zSNkDVCZ1JQcYxVJ3A05MOVSeWbd9QdWJmAwJVJ6DqxJQSq0"
+    "4KK6g6Mc4MAlUnZjTz/pIgj22l9asdCEBYFgcfnCjEPPmXLDOIemBqIBiUwQcloFvkk39p"
+    "PzBNHMxaUAZk3jtIIbyjdiVCGZB+GYMT9sMpdqEMSMekwcjFNtQC6Vjawo8xDSnmWqa8zM"
+    "V5jF1FeQu2QJCtzyibvHrDPNf0drbSy1hRfAm6FmldWTJ9RhdUu9BKfY7pJqB7xhvUvdAs"
+    "NJZLmKHuRfdH1L0cY0tcA45z2oZ4Az2WZtcJOWa8uFTBkCVaWUXwAqVD9MsnRiH2o3T9vF"
+    "QRkQUbHZRc0Tw7TVd7ZYlWVR6aoEbNCaL4tonxlBargTo1w9WpYb8zoCSKlRpy/UI1b/Iu"
+    "jdvrisrX+oyXPslt59K3yD88BPxPPT3+WYfTi0paWlTM6U+0G2pg2Q+m3OK4a7xJdS4TD2"
+    "hq4Z/xIe0o1/aX45CLoo+PQt6wKifOm8Q7GiTbnaIbQX8slVmz1+2msvfrCYV0jVuJQrq+"
+    "YWhTSDd2KaMqpD9VclqU+8pUpcJaQs64TgG7kXXVkL0MspeZwzSbh7XzG1UxwHM3nn9JkM"
+    "9WuoNd+lo05mYFGi7LSlT/R66OC2gfomvg6Xh+uhCSCe89cRS+G3WynSbOBAH01Dl3FpIo"
+    "jT0+bi6LmECXNXgOr4pPXK09Vye6kcAh281cst10yXHUOH5pDr+IHmD0FzTvzWiwC05aR/"
+    "tyaXdm90hD3p1l8MpW+z1yuJ9Zj9omDpJFtSQ1oj0zGlEwXUhnNIxT/6x0RqVBDkHvlaV/"
+    "oTNPY7RUgvXzGB3XrOmteGYrXWcjbi7zc0pglOoqJGG5Qm+hDscdRR0jh+GOMfxapI2D6Z"
+    "avMBCNm0k0jhtExo/AbYs/rAqCCEa3CMY6cA92iKhkDlYzXQMB092YBgevSPTwDt58JhdY"
+    "bk3EVYImTMR1fGWxmbgiZ4fdxGt1pqqm6ibyqos5lXQUPuPua14TaULsrVF9rMMcob6ZL2"
+    "R2coJ96KVXfPuEAEQ0hADmHAKAkPblQtobkm4ltHivYoBzfc552gJsJ1Sm/W/JD1tDQQqk"
+    "9mHpkX4H6ldN+RBA/Sr11spcbQfUrzJt1CU7POHGW8On29ER20BBtBwkHlPxWt5l1a2sJE"
+    "ECw6BEGDTAqKlEqJrkEARfhxZB8iCfprpYsqaneWYLXVeWG2u8bqi8IhrGMSJemuCI5/E7"
+    "81a9bk7AhbA/mwRHS+FrVClGwBNaf8+MP6CHlUyTUWtw0yrOSJvau0rbUyqNVb5QWhnWqm"
+    "CrhLU0g7JTMxNk7IPP7PPtHkFsAWmCR2vsMHbBWsimg8gOMbVdJNlgvcQO2SOvnXmhj6aD"
+    "I+vkSd7Z8gajLdj66sXrt/dvvvndTTOcXQzLcyX3B4yoxNSVc4mAA6+CePpFnhPsAs9OIq"
+    "04dwMGU8jpKaSgzGXfIn/+v2D8WcOgW3oA0xZN26XJVteuqxgw6tNGnfKV9SOwrA5v1lFQ"
+    "RuSMUi6Ok4TaqUXqKAPtfIwKdNhNshSr7HMesV6tPxFqHul3XSaXO/XkcidMLntEecbDHo"
+    "ccEWke38NP5h55TE+GJE60pxQZ1jzORxGis59FHRJhu1c+LjnaPOqHn15cgmPtSy01ELB8"
+    "mmXiRwnl4Q+ekfKRaBZxlaPN432cHcse84sUzoF7u2PuINbYo0vBsFUHySFIDkF8BpJDGP"
+    "X5SA5no4xbfMhRUG3pZC7ooPAqcvGPr++aa/J4bXXXcCKEHyNMXxKKHZUIod7gpk2EkEQ8"
+    "fFlre1KE8GqPiGelI2IFj5ha+c+PLOS7Vi1JvcX6d631wcKs3cHiRWYtLwg+J+GTVWMEBu"
+    "r2J/8n/284jFlHVnTwHesLYW/mBvjbqkDL+kIJ25jxbnitGPZbOYYPEfbd39aJeRIe/vsn"
+    "P95hiwYetkjEvg/mVxYTZslWFLBP3zKwG7D+2HbP2qFHbMUB+wk0Ys1d9tm8zhb97bEkus"
+    "W3likJEknGp2xcslG6yUeJGdfPoNW4oFYDcwPVcukUgGHSDFyW3PGPuXWb70pyHWVg0owR"
+    "cjlEupn6KghQxsvuHgR6Rlu0B3PtEpsmUeihQ1Z+R4PkJm7CZC+r5c7CIeNITwVQIuCC8+"
+    "DexhBF0ZeAHRl2KNrpWL8ANHGuGeMB4CeER8lE05rpqARNmOmo2P8tNtERuPnUhm6Wm+8s"
+    "h9RwrpNK5U2J36Rel1PtNHnMNCnHhp2vbaTA1NsQWXuMooTiPfdwCL6QLoAuiTnrjqlKD3"
+    "mVPHAgTOlAEPjXnPRkeAOnvuVOdWIgKzpEceARx16HGg9UAwWicIkonKA+zDZhQK1I7Q4j"
+    "GttUOkEpia2DgFZZfoooJOznB/SgS64MChSLFKf5k2O8DzkHefFmjYt9MvgV3ul7rnGnL/"
+    "j1wH6/HXG+FFpjpVVLsWDWoll/wWS7kx2R24y5BF2hCd/d3HY24V0fdnfAbjd213uiOwtn"
+    "iCvkVWfiDVnHduQEskWuRStVBcFUK9lBeEHg2lsvcQLZhVMlswIOyBXJBeU0KKdnMRQLda"
+    "53UU7vs6xONpenUbdHgdYmFiYySOE5nYuEG16vDJ5NIPALCTw1VuXBE3jW59IBKM7T9X04"
+    "9resKbgrz9I1qEu+1OMEMIQ5X0u61OasOaeyl/eYEme3ksTp83du2mL0qGwzZu1LCKBPGU"
+    "B/xDTSzGdRgYAArqMALpREVFtSyIWySKoJ7I6SJYTfwpduutQC2wpkeoXtZTwig2lpLyo8"
+    "+/r/iQXpDA=="
+)
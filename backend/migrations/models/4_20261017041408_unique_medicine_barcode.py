@@ -0,0 +1,173 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        UPDATE "medicines" SET "barcode" = NULL WHERE TRIM("barcode") = '';
+        CREATE UNIQUE INDEX IF NOT EXISTS "uid_medicines_barcode_1f739e" ON "medicines" ("barcode");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "uid_medicines_barcode_1f739e";"""
+
+
+MODELS_STATE = (
+    "eJztXWuT27iV/SssfZqt6jh2x52ksqlU9dieHSd+TNk92VQ8UyyIhCSsKZIDku1REv/3Bf"
+    "gQHwAogiIpErpf/JBwIOngEo97D+7992ofuNiLntyHYUD8eI/9ePUn698rH+0x+4fs7Rtr"
+    "hcKwfJO/EKO1l7ZHZcP0DbSOYooc3ukGeRFmL7k4cigJYxL47FU/8Tz+YuCwhsTfli8lPv"
+    "klwXYcbHG8w5S98eln9jLxXfwrjvh/P3FYHFCbuPyzXBTj9MsQ9t1Z00+rEMWEfZPq+z/z"
+    "PsLP9oZgz6391KxR+rodH8L0tdd+/F3akMPXthN4yd4vG4eHeBf4x9YkY2eLfUzZZ/HuY5"
+    "rw38x/Uk5RQUP288om2e+qYFy8QYkXVzha2+VrK9t+9/7B/vjqwbZXGqw6gc9HhPDx4b9+"
+    "y7/Cb26fPf/D8z/+7vfP/8iapF/z+MofvmYfXRKTAVN63j2svn7NqEVZi3RgSlKLManT+p"
+    "K9Kue1aN9glr/Mh/VJ8X6V44LRNpKLF0qWS3OcgOYWDl/eP7xKSSxJSw1YIO3FDlE5aUX7"
+    "BmnsCyyQqtUe/Wp72N/GO/bfuxbm/n7/4cX39x++ufsv/nEBm2ayOehd/sYtf6fOrJswJv"
+    "gX6v6kVyGnn/ehCP7d01k/8CWjUYziJNKx1hIxnb2uImeH3cTDxdcZ2Wxvn3aw29unSsPl"
+    "b9V5phhFMrt9wL8qDLdEGDEvtBD68OofD7znfRT94lWJ/Obt/T9SjveH/J0379/9T9G8Qv"
+    "yLN++/bRDuBzGW2LWa7yOgF935on+tbG8Czwu+2EkoMv5tEHgY+XLSa7gG8WsGHMvQj69M"
+    "y/2379+/qXH/7esmuT++/fbVh2+epQPBGpEYyyduh80PjBMbxfL9Gd9UyDmvI9t2asXGZG"
+    "FTDZ863fe+d8ify7aH4fXbVx8f7t/+UBsVvqfj79zWnobi1W9+35j3j51Y//v64XuL/9f6"
+    "5/t3r1J6gyje0vQTy3YP/1zx74SSOLB9Zv7IrZwbilcL1mqjnoRuz1GvI2HU5zLqBUeVYc"
+    "+/fWXbWz0md933VjHTbXxnf9YtWa17FzrSWgcBrzmv3Cuz+Sx1IeSMiRx/F1BMtv7f8CGl"
+    "+jX7Ush3ZCfh3Iv1Q9nTwij+WphR8Wo53VP05ejMalgXY4D9bpztAF7cf3xx//LVSjIxDE"
+    "Etd/IR/rPwgg8XJ/mtTYpyerklr5Hz+Quirl0zaf5OcBs0Xjm2Fd/a3+6bryAfbVN6+O/g"
+    "3zrn/4VHfOIg712Qfh3BgVt7/6bNg+vkLe3jeeakD3dV9G6lGAv5rhWsI0wfU89J2kl1DL"
+    "q07+L9rVs778sGH+9Y657ax5sSn/IjcKv2AtVARjgoGo7LLh6gO7UH6E7wAJX2rblzrwEN"
+    "3Lgvd6Muns+iZP1/mK2kj5JRVrue6ijwP+n7n4I+tAfA+nmsoyjCUbSX7u7VtNdRwLs+76"
+    "GHtEIJRXvgul8cgR8sYk0rb+KM2CNNbuiUBJTEB52daRUzYYSSBklMfLyaZHc6fHwyIlsf"
+    "S05XrdGbEgShG43QTUZbr7NAAzrAaWBB0/vSDgPsL0ai7kNVQcFTpfFUpbzxXaWtr7WQYW"
+    "GzpL9eQ1BavYAvMzwJQelrHPUuQWn23k43KF3DQPBUsortsZtGbyh2AurqsSvF9mJ5ZssY"
+    "RP7nyytE/i8S+a8/6wNQ/Dbr8MOxv2VNEV15ls6Rp+nOFq4hLPk6hBa1hX5OQouXiHiHj8"
+    "jD0YfA85JwJRFbCG1u2gQXLm9tR7y5Tcv2J0UXP2D6GxcdbqyQ/SM1S+JjyyVRiP2IjYEV"
+    "BzFDWmu8Y4NtxTtspR9iURwGNH6yagzY2R3+5P/k/5htyC3i5+/vMRtf5EfcagP+IoqLLr"
+    "nywwpp+aturChIYVmHVsD2vT/5OxSxT7YiB2V9Zhyxv75E/GNIHFn8My32KVuc/iqJduQT"
+    "ozn16Ba/i5vWzw1FCchGpr0aKHHLt90MlHnkr+ti4C8J8mNpOENpjVXIdHvOpdxeQ/sgkW"
+    "0wX2KH7JGncvYVoKYxZqgnOXpp5LbZ4qsXr9/ev/nm2e3NbcORWnj9ngshoerULrlJpT4o"
+    "NXFgt9JTfr6KdSe2gYIj6OkjaEHZUAekvKuFkax1OCoNbFb7doK2fhCRaCXbsB/fbN+pZ8"
+    "26qqJzp4NVg9V33LIW+srn/EY1yJ4n3b8Sx7WfPWXEuVrC5wbMhChhXVvyrIu25JlaW/JM"
+    "2Ei4xeNpp69okC0ijZBRNcQ8d12yZLBWajnPnZgp48icrrJfRBrI+fDyfvZpOG7R9CgkyD"
+    "XUmYfjmU0remdjdmgIvMdWWZScQgF4zSxG+BHrCiarGPOWsxGkkstImYOOVxuWSLJ4jbGr"
+    "lktEmmDUoOSazVAsVNMDSq5rHPUuSq7CfeHa64NmkhERCV5JUHWBqmvpvIKqC1RdC+K5p6"
+    "qrunwNYc/Xoe2SLPpzihR9h/bEO3xPojigh5UkWlRvcNMWMdqkTe1dpW3nsFGGtXLTtCp9"
+    "SGNI6uaaASUII00aRqLYy7Ie7Ygk+anaJ9TEgZO9g5OdfZxL5AnA1UzXQAbSPEr8iM2tdr"
+    "Cx0/iExqzRhME5RSJaYxyhmH1PxIZPj9oqDKiVJEVGSZQaoILclklCQJrgNZ5gooBoyATR"
+    "EEhmD7GPWQzFQr3gEPu4xlHvEvsApzE4jWfmX+viNL6Ma+31Hm3ZL/yAo4wYwbVWb3DT5l"
+    "ojWVObpm07SrJf4hgRj99PzNBWBV3zqrU17CPQTtwD5Ka+gHctY15XwlpHGejyefa0m0i7"
+    "TaUtHDLWASON4q2me60BA7a7sc1Tg1IUxXYSaaeIE7CQKE6nclbBnu60IgBNOFxPYOoxdn"
+    "bZrxXIVnswaiATiJ7ai7Fhv5N9Hy23URVjxEQ+Nelkz28/R9IlVE17HQXE9yCeKz/2PItn"
+    "WYKmK/sSKMw3fUyfR6gceUIG9UGojoJUAc3dSkZQQj2JTf/14/t3bbQWqKZLkjix9R/LI9"
+    "Fo7K7+vEn8LGXQOiFeTPzoCf+8v4wVgWnhlLPUbu1Nw76puxl5B01rr7gEhGE5kcK7hjTQ"
+    "W7xc77AYFMgyWfVM1i6AYbBnPdgb5BBP8/JkFWPExm0KbZHjZLtd20/2ayxJq6jmW4Y1Yb"
+    "c2wTEcLqHAJZTF8kqRSwIv2LI9pB63IhD4ldWkcZCvR2wFARMBBMDh1tTieO55a4o/+AOQ"
+    "/DHvxkxuK7PjaUYra9QQE8R1XEMTF/Y5SWXeoLVaJlO+edMmkWEj1FMew5BWjKP4tD5G1l"
+    "JfIMN7AH3MBfQxKfG6WfVqIHBadHNaOME+ZDOqr0+3iATOu3GezUn2I/Jk2oG2u5V1nIF8"
+    "j+Ihynljv1iyDzlJdwEzzx03/EVWijeYYraNs9OyF3psC1DzGB/FvNHaD+ieHXg2HtpqOZ"
+    "2bQPMIH/7OWj4r6N8PFIATXhPcED8r/LBExstduMB2e6CyBoQg5ayDlBCRvqLBDjHdsJWH"
+    "35NhdOtMoiLSwE3wKIcO7nXJxMcOkTk61ZyLSAP3CWNQDtfbpxRqZmaqG0dtoCDkB1k+L0"
+    "IyCCwgXj2zSBTEq2cdry5WrgGIfoPWD7iTan6hFDdW+ZlFVFPu5fHUYljao6n8p3WLpaqZ"
+    "7RIdZZ8V0DIwXbqyErrlcyEDQBG42cRPde8B10AGHqtHugQMkWrIyFfhM8TpXeOlOtvzmV"
+    "xguTVxQwmCjA0aGRsiZ4fdxOtRHE5EXnUB+pKOwrnfeYoQkCa43hph/i5RfnWQX6YY4nvn"
+    "fqEaET1ArGZm9JsUqiH8lyWOdvaBJs6Ex2r65A9H7WqddvUF+QrkrNvxy2F+lGvwELmZ0s"
+    "4hMbF6JV9milpITHyNoy7ZUAiJiRsuxO5R2ioKAogQQJzshjZmPyuKe1QRlSCBYQjRXjJE"
+    "WzXJIQi+kiuZ4oPcKTybLlnT0zyzhU4jRltd43VjtJXyl/klUFt5fv427+G7v33Iy9Wpya"
+    "9dajWD+cY23AuQy9jaMM7O5CoXbPyYdmkQXyPH/1Ozz1UuchlAtcXNCTVA9hBlYpLxRQEQ"
+    "158yru/iENF4L90eqYMcddSEsdDUctGxPuwyI/zRjmy06D4CJmTaRRNRPHzE2cE0Jhu2bi"
+    "hiDGpnt4iEjLCDu8LxryGmJL2Ye8CISgZIOavLoJAJWVABhNghyCP/0n8AJFB4AgZ/Ar4E"
+    "9LNdCAV0hkcAzmNw+McaMzh4j7n4yDnwbXvMd7kaAyQFQ9y0/2isSaATNc2bQ8wUYqYQPY"
+    "OY6TWO+rxjpuZ5V4TAk86tny7e/fc+fgjYHxOFUC46IOO59s9yqeZu6JeBk6ROL4lPtdnk"
+    "ps2pWlzQc/PWHdNW5p9hHWEW8l3r6GavJa480bZPbdfi7kNlvYdbWNN6a/PB1L6JJQANvC"
+    "M0fPI5No3Kzuct17AKgIH0jnIFq/rNBJ7Vx7wGDI57fapeelj7mmENBDbezcbZRmXLs+Wl"
+    "8XBdxqVgYL4b86m5sl3MTtvGC5CBTN91CmnetYQ078SQZkqa7qakBjKS6aE3JCljEfmXhG"
+    "bl3rqGAbmoLB0V2esbbw1koPGOonwIafBIXEy1Nx4C0IQt3xT76+Lcp3sfXACeeR18ZtTr"
+    "3QZn5xDumOF3utk/dQ4qItIEw536rLLHMeI+EZF5dSS2ioEAbP8AbIy2WgqSov08lAlGyU"
+    "YWkq+Ghx8e8Vikjy4ehDC4YQHRLmFwyEgLF0oXy+vxwo3ufVIRCPzCdVKNrQ9k/J0Jzz0z"
+    "/lYmgCHM+Tou74qz5pyy/+YG/wMNHOwmFK/UWpWyzU0XsUpYNNdUq5Q4Ky+2grOlSCZXUT"
+    "XW16sce4J6qxdQqjhhzFhz9ep/VjAmuMmaDvVO/vQWd7rEm55beA93egNpYARjFId6yZxu"
+    "wEhEGsj5KFGjdeAe7IjIAhhqumsgE2eTccJz1SVTYLvd/yWiDfSBLcTnJbkEIDq92Fil1z"
+    "ztPfETaXpK5TZIBgWXl+iaQT6O2H41Ikh7vZBAzZvGhpfIpOmg1Xf/1aFaAWgC21NHaoMk"
+    "ZjzqKRxLiAmMj23ffBGwg9Dum0ZbhTeB+6mtvXKM0k3vLIHCCPRQsQeexzY9SWjzlHqEYo"
+    "kvp7XQiLwDKDqiUXQEIubqxQAi5hAxP+P4ABHzkXgtQgvaIXMJEhiGmDnEzJfHc8+YeXUG"
+    "GMKeryNoLpk3J46aV5xyUUSUKcvfIv/wEPA/JxrAuebbSH+e3VAONH8s5RmcGZMCtXWxAB"
+    "v6dIw+40NqDJVecmM4DmPeRBQd5A3jHQ2S7U7RptpzpDQy9rotDNPXLrIKdU5lYdI8LajQ"
+    "yajM7JL4Vo60MqQV71Bs8bELPMJPSZGFPM/K149jY+LzJ++YaLsuuxiqV319Bu/aDjZ2hO"
+    "kjcUCgMbFAI1/1dKMSDZiBIWxII7I8VQakEbmUA7Y5iwvst3sAJXAD3YALcft1Ew0sqmDA"
+    "svU4G+QQj8SSU0pLUo0KxkCeR1k+nB3BGzsVACAiM+wW1YAIhWWkR/Jhj/jpmShK9ntEJR"
+    "bfMgQSLIyB/hjEPBqX5nxgtqy1jxKRwP85sey+2g51DzAePba2JHLYMrvtoe6QQGEE9EcA"
+    "Eh5MkfAg8DfEZZM3r/sSH9hHPWJPh3NlBxMOgc99kd5ihwAUNFeooIHSC6aNusSBIpReKJ"
+    "5YXeGJgAPZiUTY46EotovHQ5diORh0aaBLA9XUpc8cg6umyvl0CHqvQ8QjrEFditbX5tTp"
+    "uZ7ZTNyVavla1L+E/dFJqvBl6BRlf5H39S5YcOrX9hr2LkFbP4jOZepl1g2JDKWJ7NGWdW"
+    "Kz7TH78DPJep119iHty1DC2Hcfhqw3aG00UbXKWP1pklTlMpCshtjyXLZqeaEMpAt5HqZb"
+    "ci5b+Z76Pu3tYChXmdxTEYnqwdbbY3+GEvZIYh6KZlvaMwn7O+/oY9GPIUxNkPnuxzQ930"
+    "ot0c4b3HSRaGe5/rpJtNXsaIqj2Xuf0p0C26mXL0QO8tP/gE56Sp001EmbSoV1LHXWu0Ya"
+    "MA710aA+2mKYHkczCyXSRgj4wAWLS2mgjtmm+8gEalDQCcxFJ9BFHVLd/3efyRooiF1D7H"
+    "oqXovzaXdSKwgwVCjrAmKLi1M8ltgC6oyMWGdEtmsYgOU3aP2AF1whs4PEorZXOk0uX68G"
+    "IPZj3o2ZrFYW9dmVxSE+XqniAvy9m5MhAdZqimBA+gVTr7/DDGQbZJcas1fB/T+l+1/XFw"
+    "0uaD0XdMoIcbR9/k0c8N2N7zVFvqvNdh1lghtvAqrZWpRs2BqR0Gyb2pXsJg5Mu2MSoCBi"
+    "a7/N05Lp0N2AGcj2KHEW9nFZ/xpUVzHAczeeqxvAzjdyKxjguRvPEOG6WITLJ7EdUnn2MO"
+    "yQPfIUfs4asBneypBP8h4WaPQt4/Dy1YvXb+/fMDu+uW3UZygG5Lk4kySUcqddFAfOZ42j"
+    "ooCbzpv8dKz5ZGBX/Z74ZJ/stakVcNNR+2wp3OJfQ0IPLRUJ5dQ2YG3Bb8PmhvuHV81DH4"
+    "qdne0n+7XeSaSJg71Ex4KliOrWPq5ABtlDXNYpN0Wp0vKr9a39pOxjwvJPxbAstvpTmfxI"
+    "g/kSBFRDoS0QgkGaoGsa9YKjZpogQZzS5WK/i4h3sCPknX1XnXf0kffzIfC8JFygPXS7LJ"
+    "trV+Bmo/Yt47LzcymjdbeZKXY2poKhUJVJBAwVwZlav5Db/fjyBRAoTClQyDJvsnckJ/u/"
+    "fnz/TsVuFdXcGhAntv5jeaST+qvXw7n68ybx0/TE1johXkz86An/vL+spt+hc5bandpN/3"
+    "VjuecdNJ3acCya7FgkFzOobV8hY5jA6i/jEBzFvmPsYSeQBNrVvFcgMOEMPiB4z/bvOh7H"
+    "I2AYr+6MHI5jCdVcPe95iTAhKtz06XZy6bZ4dAWfOaHxTjvKU0edGeSZGeN6MR7kumx2kJ"
+    "zL1BNyBXLWhLwc3kaZefeIZjl/FNUK1AMgImEc+o8D21vsE7/ig+k6DAIQtieDD06IougL"
+    "rxy6Q5GWZlAAGhiEHmzD0suDjMIwYN9rgGyL92VPCxyTTk7QC+bRXSRfF0iku0ieNmjP4z"
+    "g7NudLxb46ZH2X9vV92ZWJhF009fAiGbtI7uHFMsVvBp/PU8cb1ItkqciRebFUzYtk7YK5"
+    "mhfJV2FlFDvsFDAMaR/SvkxnrJK79mzGypy5JjJ2qYTgiyTrorqZRTIGwhktungGkTNp6p"
+    "hiZZH0XCbB/GKo0pJgVYwucAij9eT5+72PHwL2RwcbTHvsfgqfp/deTrC+bK1YFNXqtcqy"
+    "eVLEZtdW7JNqtlX+EdYRZiHftZD7iGmELYpRWSm9yowOTjPH/82xVjUk9JlUL5cNJZYEiN"
+    "QxiCoGwg/d9BIFZxlTPcg+Ag1k/K5bivmWDPNNuou5SGRanbugijGC5KkzF0SYLQQk1srN"
+    "UcUYQXpjLuli2bdqy74VLJt9Go61hUF11DULg7i5saa6l2OrsAnVyMdXFitHVsmA2tIiKe"
+    "Q/I04IFa35EicFRfRdvdYdASZoMade5+DisdrQl3kFFS4eX+OoFxw1Lx6r4216hQekWCjt"
+    "ADVIpuK12LRql8wQgWC2UDHjghUz6lPpABTrSh9mZspdeZYuQafprjz/Q5izXoGShVItzp"
+    "lzKvggqgvUoae6BOF09KkhgTgdf3qRpdBMo0chimKr0UMt6HSqMUSa5rM63rREmsph0863"
+    "L4Ga6CseLwu8DtklwkCOx6mxy5MlYt/RCnzUQMB0N6ZpkMjiHmqWjwADGR4+asoWRqofW6"
+    "qjrjqzMPZd/czMFcw1B+bYl1ReVlY/4HWUgU/5KLsCCMpNEJRDLjuOYF9Wx6FF7lMFmRCc"
+    "G5vliLjYxpsNdmQ3rtQR0CbOBK6nDoRC2BnCzrMYioUGICHsfI2jDmHnmYRHixLGPegtUU"
+    "AsxPMn4zW77rjuEdGXQYFjCOoPGQGFoP6sg/rFwjUU0XlXBnNcrvKn2a1NsENMF3qiicXO"
+    "GZJ1aVa6ieowyCQTjWFqUUtUWkLVCbO0DVB1QmdSkHEMVSfw9KRD1Yll2zdUnZjZgEDVCa"
+    "g6MaXEqpPCCqpOjDODQNWJGc28vyTIY1tp/WoHAhCWxcEHJwoxT/4lywyiHpgaCAZl8EEJ"
+    "6Bb55F/aD0wTB7MWlAGZ9w5SCO+oXYlQBqRfxuCE/XCKXSgD0jFpMHKxDbVAOpa28GNMQ4"
+    "q5likvc3EeY1dR3oItEGTrM8omr94wzzW9na30MlYUX4KuRVpXlkyf0QXVLrRSn2O6Ceie"
+    "8QZ1LzQLjeUSZqh70f0RdS/H2BLXgOOctiHeQI+l2XVCjhkvLlUwZIlWVhG8QOkQ/fKJUY"
+    "j9KF0/L1VEZMFGByVXNM9O09VeWaJVlYcmqFFzgii+bWI8pcVqoE7NcHVq2O8MKIlipYZc"
+    "v1DNm7xL4/a6ovK1PuOlT3LbufQt8g8PAf9TT49/1uH0opKWFhVz+hPthhpY9oMptzjuGm"
+    "9SncvEA5pa+Gd8SDvKtf3lOOSi6OOjkDesyonzJvGOBsl2p+hG0B9LZdbsdbup7P16QiFd"
+    "41aikK5vGNoU0o1dyqgK6U+VnBblvjJVqbCWkDOuU8BuZF01ZC+D7GXmMM3mYe38RlUM8N"
+    "yN518S5LOV7mCXvhaNuVmBhsuyEtX/kavjAtqH6Bp4Op6fLoRkwntPHIXvRp1sp4kzQQA9"
+    "dc6dhSRKY4+Pm8siJtBlDZ7Dq+ITV2vP1YluJHDIdjOXbDddchw1jl+awy+iBxj9Bc17Mx"
+    "rsgpPW0b5c2p3ZPdKQd2cZvLLVfo8c7mfWo7aJg2RRLUmNaM+MRhRMF9IZDePUPyudUWmQ"
+    "Q9B7Zelf6MzTGC2VYP08Rsc1a3orntlK19mIm8v8nBIYpboKSViu0Fuow3FHUcfIYbhjDL"
+    "8WaeNguuUrDETjZhKN4waR8SNw2+IPq4IggtEtgrEO3IMdIiqZg9VM10DAdDemwcErEj28"
+    "gzefyQWWWxNxlaAJE3EdX1lsJq7I2WE38Vqdqaqpuom86mJOJR2Fz7j7mtdEmhB7a1Qf6z"
+    "BHqG/mC5mdnGAfeukV3z4hABENIYA5hwAgpH25kPaGpFsJLd6rGOBcn3OetgDbCZVp/1vy"
+    "w9ZQkAKpfVh6pN+B+lVTPgRQv0q9tTJX2wH1q0wbdckOT7jx1vDpdnTENlAQLQeJx1S8ln"
+    "dZdSsrSZDAMCgRBg0waioRqiY5BMHXoUWQPMinqS6WrOlpntlC15XlxhqvGyqviIZxjIiX"
+    "JjjiefzOvFWvmxNwIezPJsHRUvgaVYoR8ITW3zPjD+hhJdNk1BrctIoz0qb2rtL2lEpjlS"
+    "+UVoa1KtgqYS3NoOzUzAQZ++Az+3y7RxBbQJrg0Ro7jF2wFrLpILJDTG0XSTZYL7FD9shr"
+    "Z17oo+ngyDp5kne2vMFoC7a+evH67f2bb3530wxnF8PyXMn9ASMqMXXlXCLgwKsgnn6R5w"
+    "S7wLOTSCvO3YDBFHJ6Cikoc9m3yJ//Lxh/1jDolh7AtEXTdmmy1bXrKgaM+rRRp3xl/Qgs"
+    "q8ObdRSUETmjlIvjJKF2apE6ykA7H6MCHXaTLMUq+5xHrFfrT4SaR/pdl8nlTj253AmTyx"
+    "5RnvGwxyFHRJrH9/CTuUce05MhiRPtKUWGNY/zUYTo7GdRh0TY7pWPS442j/rhpxeX4Fj7"
+    "UksNBCyfZpn4UUJ5+INnpHwkmkVc5WjzeB9nx7LH/CKFc+De7pg7iDX26FIwbNVBcgiSQx"
+    "CfgeQQRn0+ksPZKOMWH3IUVFs6mQs6KLyKXPzj67vmmjxeW901nAjhxwjTl4RiRyVCqDe4"
+    "aRMhJBEPX9banhQhvNoj4lnpiFjBI6ZW/vMjC/muVUtSb7H+XWt9sDBrd7B4kVnLC4LPSf"
+    "hk1RiBgbr9yf/J/xsOY9aRFR18x/pC2Ju5Af62KtCyvlDCNma8G14rhv1WjuFDhH33t3Vi"
+    "noSH//7Jj3fYooGHLRKx74P5lcWEWbIVBezTtwzsBqw/tt2zdugRW3HAfgKNWHOXfTavs0"
+    "V/eyyJbvGtZUqCRJLxKRuXbJRu8lFixvUzaDUuqNXA3EC1XDoFYJg0A5cld/xjbt3mu5Jc"
+    "RxmYNGOEXA6Rbqa+CgKU8bK7B4Ge0RbtwVy7xKZJFHrokJXf0SC5iZsw2ctqubNwyDjSUw"
+    "GUCLjgPLi3MURR9CVgR4YdinY61i8ATZxrxngA+AnhUTLRtGY6KkETZjoq9n+LTXQEbj61"
+    "oZvl5jvLITWc66RSeVPiN6nX5VQ7TR4zTcqxYedrGykw9TZE1h6jKKF4zz0cgi+kC6BLYs"
+    "66Y6rSQ14lDxwIUzoQBP41Jz0Z3sCpb7lTnRjIig5RHHjEsdehxgPVQIEoXCIKJ6gPs00Y"
+    "UCtSu8OIxjaVTlBKYusgoFWWnyIKCfv5AT3okiuDAsUixWn+5BjvQ85BXrxZ42KfDH6Fd/"
+    "qea9zpC349sN9vR5wvhdZYadVSLJi1aNZfMNnuZEfkNmMuQVdownc3t51NeNeH3R2w243d"
+    "9Z7ozsIZ4gp51Zl4Q9axHTmBbJFr0UpVQTDVSnYQXhC49tZLnEB24VTJrIADckVyQTkNyu"
+    "lZDMVCnetdlNP7LKuTzeVp1O1RoLWJhYkMUnhO5yLhhtcrg2cTCPxCAk+NVXnwBJ71uXQA"
+    "ivN0fR+O/S1rCu7Ks3QN6pIv9TgBDGHO15IutTlrzqns5T2mxNmtJHH6/J2bthg9KtuMWf"
+    "sSAuhTBtAfMY0081lUICCA6yiACyUR1ZYUcqEskmoCu6NkCeG38KWbLrXAtgKZXmF7GY/I"
+    "YFraiwrPvv4/gc3odg=="
+)
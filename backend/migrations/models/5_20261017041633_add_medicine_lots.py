@@ -0,0 +1,188 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "medicine_lots" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "batch_number" VARCHAR(100) NOT NULL,
+    "expiry_date" DATE NOT NULL,
+    "quantity" INT NOT NULL,
+    "received_at" TIMESTAMP NOT NULL,
+    "medicine_id" INT NOT NULL REFERENCES "medicines" ("id") ON DELETE CASCADE
+) /* Stock received under one batch number; a medicine's current_stock is the sum of its lots */;
+CREATE INDEX IF NOT EXISTS "idx_medicine_lo_medicin_9163c9" ON "medicine_lots" ("medicine_id", "expiry_date");
+CREATE INDEX IF NOT EXISTS "idx_medicine_lo_expiry__d9898e" ON "medicine_lots" ("expiry_date");
+        INSERT INTO "medicine_lots" ("medicine_id", "batch_number", "expiry_date", "quantity", "received_at")
+        SELECT "id", "batch_number", "expiry_date", "current_stock", "created_at"
+        FROM "medicines"
+        WHERE "current_stock" > 0;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "medicine_lots";"""
+
+
+MODELS_STATE = (
+    "eJztXWmz27iV/SssfZmeqjeO/eKXpCapVL223dNOvHTZrzOpuLtYEAlJGFMEm8tzK4n/+w"
+    "BcxAUARVAkRUL3ixcJB5IOLrHce3Dvv1Z76mIvenIfBJT48R778eq/rX+tfLTH7B+yt2+s"
+    "FQqC8k3+QozWXtoelQ3TN9A6ikPk8E43yIswe8nFkROSICbUZ6/6iefxF6nDGhJ/W76U+O"
+    "SXBNsx3eJ4h0P2xqef2cvEd/GvOOL//cRhMQ1t4vLPclGM0y9D2HdnTT+tAhQT9k2q7//M"
+    "+wg+2xuCPbf2U7NG6et2fAjS11778XdpQw5f2w71kr1fNg4O8Y76x9YkY2eLfRyyz+Ldx2"
+    "HCfzP/STlFBQ3ZzyubZL+rgnHxBiVeXOFobZevrWz73fsH++OrB9teabDqUJ+PCOHjw3/9"
+    "ln+F/7p99vz3z//w2989/wNrkn7N4yu//5p9dElMBkzpefew+vo1oxZlLdKBKUktxqRO60"
+    "v2qpzXon2DWf4yH9YnxftVjgtG20guXihZLs1xAppbOHx5//AqJbEkLTVggbQXOxTKSSva"
+    "N0hjX2CBVK326Ffbw/423rH/3rUw97f7Dy++v//wzd1/8o+jbJrJ5qB3+Ru3/J06s27CmO"
+    "BfqPuTXoWcft6HIvi3T2f9wJeMRjGKk0jHWkvEdPa6ipwddhMPF19nZLO9fdrBbm+fKg2X"
+    "v1XnOcQoktntA/5VYbglwoh5oYXQh1d/f+A976PoF69K5Ddv7/+ecrw/5O+8ef/uf4rmFe"
+    "JfvHn/bYNwn8ZYYtdqvo+AXnTni/61sr2hnke/2EkgMv4tpR5Gvpz0Gq5B/JoBxzL04yvT"
+    "cv/t+/dvatx/+7pJ7o9vv3314Ztn6UCwRiTG8onbYfMD48RGsXx/xjcVcs7ryLadWrExWd"
+    "hUw6dO973vHfLnsu1heP321ceH+7c/1EaF7+n4O7e1p6F49ZvfNeb9YyfW/75++N7i/7X+"
+    "8f7dq5ReGsXbMP3Est3DP1b8O6EkprbPzB+5lXND8WrBWm3Uk8DtOep1JIz6XEa94Kgy7P"
+    "m3r2x7q8fkrvveKma6je/sz7olq3XvQkda6yDgNeeVe2U2n6UuhJwxkePvaIjJ1v8rPqRU"
+    "v2ZfCvmO7CSce7F+KHtaGMVfCzMqXi2n+xB9OTqzGtbFGGC/G2c7gBf3H1/cv3y1kkwMQ1"
+    "DLnXyE/yy84MPFSX5rk6KcXm7Ja+R8/oJC166ZNH+H3tLGK8e24lv7233zFeSjbUoP/x38"
+    "W+f8v/CITxzkvaPp1xEcuLX3b9o8uE7e0j6eZ076cFdF71aKsZDvWnQd4fAx9ZyknVTHoE"
+    "v7Lt7furXzvmzw8Y617ql9vCnxKT8Ct2ovUA1khIOi4bjs4gG6U3uA7gQPUGnfmjv3GtDA"
+    "jftyN+ri+SxK1v+H2Ur6KBllteupjgL/k77/ifahnQLr57GOoghH0V66u1fTXkcB7/q8Bx"
+    "7SCiUU7YHrfnEEfrCINa28iTNijzS5oYeEhiQ+6OxMq5gJI5QhTWLi49Uku9Ph45MR2fpY"
+    "crpqjd6UIAjdaIRuMtp6nQUa0AFOAwua3pd2GGB/MRJ1H6oKCp4qjacq5Y3vKm19rYUMC5"
+    "sl/fUagtLqBXyZ4UkISl/jqHcJSrP3drpB6RoGgqeSVWyP3TR6E2KHhq4eu1JsL5ZntoxB"
+    "5H++vELk/yKR//qzPgDFb7MOPxz7W9YU0ZVn6Rx5mu5s4RrCkq9DaFFb6OcktHiJiHf4iD"
+    "wcfaCelwQridhCaHPTJrhweWs74s3tsGx/UnTxAw7/y0WHGytg/0jNkvjYckkUYD9iY2DF"
+    "NGZIa413bLCteIet9EOsEAc0jJ+sGgN2doc/+T/5P2Ybcov4+ft7zMYX+RG3WspfRHHRJV"
+    "d+WEFY/qobK6IpLOvQomzf+5O/QxH7ZCtyUNZnxhH760vEP4bEkcU/02KfssXpr5JoRz4x"
+    "mlOPbvG7uGn93FCUgGxk2quBErd8281AmUf+ui4G/pIgP5aGM5TWWIVMt+dcyu01tKeJbI"
+    "P5EjtkjzyVs68ANY0xQz3J0Usjt80WX714/fb+zTfPbm9uG47Uwuv3XAgJVad2yU0q9UGp"
+    "iQO7lZ7y81WsO7ENFBxBTx9BC8qGOiDlXS2MZK3DUWlgs9q3E7T1aUSilWzDfnyzfaeeNe"
+    "uqis6dDlYNVt9xy1roK5/zG9Uge550/0oc1372lBHnagmfGzATooR1bcmzLtqSZ2ptyTNh"
+    "I+EWj6edvqJBtog0QkbVEPPcdcmSwVqp5Tx3YqaMI3O6yn4RaSDnw8v72afhuEXTo5Ag11"
+    "BnHo5nNq3onY3ZoYF6j62yKDmFAvCaWYzwI9YVTFYx5i1nI0gll5EyBx2vNiyRZPEaY1ct"
+    "l4g0wahByTWboViopgeUXNc46l2UXIX7wrXXB80kIyISvJKg6gJV19J5BVUXqLoWxHNPVV"
+    "d1+RrCnq9D2yVZ9OcUKfoO7Yl3+J5EMQ0PK0m0qN7gpi1itEmb2rtK285howxr5aZpVfqQ"
+    "xpDUzTUDShBGmjSMFGIvy3q0I5Lkp2qfUBMHTvYOTnb2cS6RJwBXM10DGUjzKPEjNrfadG"
+    "On8QmNWaMJg3OKRLTGOEIx+56IDZ8etVUYUCtJioySKDVABbktk4SANMFrPMFEAdGQCaIh"
+    "kMweYh+zGIqFesEh9nGNo94l9gFOY3Aaz8y/1sVpfBnX2us92rJf+AFHGTGCa63e4KbNtU"
+    "aypnaYtu0oyX6JY0Q8fj8xQ1sVdM2r1tawj0A7cQ+Qm/oC3rWMeV0Jax1loMvn2dNuIu02"
+    "lbZwyFhTRlqIt5rutQYM2O7GNk8NGqIotpNIO0WcgIVEcTqVswr2dKcVAWjC4XoCU4+xs8"
+    "t+rUC22oNRA5lA9NRejA37nez7aLmNqhgjJvKpSSd7fvs5ki6hatrrKCC+B/Fc+bHnWTzL"
+    "EjRd2ZdAYb7pY/o8QuXIEzKoD0J1FKQKaO5WMoKS0JPY9F8+vn/XRmuBarokiRNb/7Y8Eo"
+    "3G7upPm8TPUgatE+LFxI+e8M/781gRmBZOOUvt1t407Ju6m5F30LT2iktAGJYTKbxrSAO9"
+    "xcv1DotBgSyTVc9k7QIYBnvWg71BDvE0L09WMUZs3KbQFjlOttu1/WS/xpK0imq+ZVgTdm"
+    "sTHMPhEgpcQlksryFyCfXolu0h9bgVgcCvrCaNg3w9YisImAggAA63phbHc89bU/zBH4Dk"
+    "j3k3ZnJbmR1PM1pZo4aYIK7jGpq4sM9JKvMGrdUymfLNmzaJDBuhnvIYhrRiHMWn9TGylv"
+    "oCGd4D6GMuoI9JidfNqlcDgdOim9PCofuAzai+Pt0iEjjvxnk2J9mPyJNpB9ruVtZxBvI9"
+    "ioco5439Ysk+5CTdBcw8d9zwF1lDvMEhZts4Oy17oce2ADWP8VHMG619Gu7ZgWfjoa2W07"
+    "kJNI/w4e+s5bOC/v1AATjhNcEN8bPCD0tkvNyFC2y3ByprQAhSzjpICRHpKxrsAIcbtvLw"
+    "ezKMbp1JVEQauAke5dDBvS6Z+NghMkenmnMRaeA+YQzK4Xr7lELNzEx146gNFIT8IMvnRU"
+    "gGgQXEq2cWiYJ49azj1cXKNQDRb9D6AXdSzS+U4sYqP7OIasq9PJ5aDEt7NJX/tG6xVDWz"
+    "XaKj7LNoWAamS1dWEm75XMgAUARuNvFT3XvANZCBx+qRLgFDpBoy8lX4DHB613ipzvZ8Jh"
+    "dYbk3cUIIgY4NGxobI2WE38XoUhxORV12AvqSjcO53niIEpAmut0aYv0uUXx3klymG+N65"
+    "X6hGRA8Qq5kZ/SaFagj/ZYmjnX2giTPhsZo++cNRu1qnXX1BvgI563b8cpgf5Ro8RG6mtH"
+    "NITKxeyZeZohYSE1/jqEs2FEJi4oYLsXuUtoqCACIEECe7oY3Zz4riHlVEJUhgGEK0lwzR"
+    "Vk1yCIKv5Eqm+CB3Cs+mS9b0NM9sodOI0VbXeN0YbaX8ZX4J1Faen7/Ne/jurx/ycnVq8m"
+    "uXWs1gvrEN9yhyGVsbxtmZXOWCjR/TLg3ia+T4f2r2ucpFLgOotrg5oQbIHqJMTDK+KADi"
+    "+lPG9V0coDDeS7dH6iBHHTVhLDS1XHSsD7vMCH+0Ixstuo+ACZl20UQUDx9xdnAYkw1bNx"
+    "QxBrWzW0RCRtjBXeH41wCHJL2Ye8AolAyQclaXQSETsqACCLBDkEf+qf8ASKDwBAz+BHyh"
+    "4We7EAroDI8AnMfg8I81ZnDwHnPxkXPg2/aY73I1BkgKhrhp/9FYE6oTNc2bQ8wUYqYQPY"
+    "OY6TWO+rxjpuZ5V4TAk86tny7e/fc+fqDsj4lCKBcdkPFc+2e5VHM39EvqJKnTS+JTbTa5"
+    "aXOqFhf03Lx1x7SV+WdYR5iFfNc6utlriStPtO1T27W4+1BZ7+EW1rTe2nwwtW9iCUAD7w"
+    "gNn3yOTaOy83nLNawCYCC9o1zBqn4zgWf1Ma8Bg+Nen6qXHta+ZlgDgY13s3G2UdnybHlp"
+    "PFyXcSkYmO/GfGqubBez07bxAmQg03edQpp3LSHNOzGkmZKmuympgYxkeugNScpYRP4poV"
+    "m5t65hQC4qS0dF9vrGWwMZaLyjKB+CkD4SF4faGw8BaMKWb4r9dXHu070PLgDPvA4+M+r1"
+    "boOzcwh3zPA73eyfOgcVEWmC4U59VtnjGHGfiMi8OhJbxUAAtn8ANkZbLQVJ0X4eygSjZC"
+    "MLyVfDww+PeCzSRxcPQhjcsIBolzA4ZKSFC6WL5fV44Ub3PqkIBH7hOqnG1gcy/s6E554Z"
+    "fysTwBDmfB2Xd8VZc07Zf3OD/yGkDnaTEK/UWpWyzU0XsUpQNNdUq5Q4Ky+2grOlSCZXUT"
+    "XW16sce4J6qxdQqjhBzFhz9ep/VjAmuMmaDvVO/vQWd7rEm55beA93egNpYARjFId6yZxu"
+    "wEhEGsj5KFGjNXUPdkRkAQw13TWQibPJOOG56pIpsN3u/xLRBvrAFuLzklwCEJ1ebKzSa5"
+    "72nviJND2lchskg4LLS3TNIB9HbL8aEaS9Xkig5k1jw0tk0nTQ6rv/6lCtADSB7akjtTSJ"
+    "GY96CscSYgLjY9s3XwRsGth902ir8CZwP7W1V45RuumdJVAYgR4qdup5bNOTBDZPqUdCLP"
+    "HltBYakXcARUc0io5AxFy9GEDEHCLmZxwfIGI+Eq9FaEE7ZC5BAsMQM4eY+fJ47hkzr84A"
+    "Q9jzdQTNJfPmxFHzilMuiogyZflb5B8eKP9zogGca76N9OfZDeVA88eGPIMzY1Kgti4WYE"
+    "OfjtFnfEiNodJLbgzHYcybiKKDvGG8C2my3SnaVHuOlEbGXreFYfraRVahzqksTJqnBRU6"
+    "GZWZXRLfypFWhrTiHYotPnbUI/yUFFnI86x8/Tg2Jj5/8o6Jtuuyi6F61ddn8K5turEjHD"
+    "4SBwQaEws08lVPNyrRgBkYwoY0IstTZUAakUs5YJuzuMB+uwdQAjfQDbgQt1830cCiCgYs"
+    "W4+zQQ7xSCw5pbQk1ahgDOR5lOXD2RG8sVMBACIyw25RDYhQWEZ6JB/2iJ+eiaJkv0ehxO"
+    "JbhkCChTHQH4OYR+PSnA/MlrX2USIS+D8nlt1X26HuAcajx9aWRA5bZrc91B0SKIyA/ghA"
+    "woMpEh5Qf0NcNnnzui/xgX3UI/Z0OFd2MOEQ+NwX6S12CEBBc4UKGii9YNqoSxwoQumF4o"
+    "nVFZ4IOJCdSIQ9Hopiu3g8dCmWg0GXBro0UE1d+swxuGqqnE+HoPc6RDzCGtSlaH1tTp2e"
+    "65nNxF2plq9F/UvYH52kCl+GTlH2F3lf7+iCU7+217B3Cdr6NDqXqZdZNyQylCayR1vWic"
+    "22x+zDzyTrddbZh7QvQwlj330Yst6gtdFE1Spj9adJUpXLQLIaYstz2arlhTKQLuR5ONyS"
+    "c9nK99T3aW8HQ7nK5J6KSFQPtt4e+zOUsEcS81A029KeSdjfeEcfi34MYWqCzHc/pun5Vm"
+    "qJdt7gpotEO8v1102irWZHUxzN3vuU7hTYTr18IXKQn/4HdNJT6qShTtpUKqxjqbPeNdKA"
+    "caiPBvXRFsP0OJpZKJE2QsAHLlhcSgN1zDbdRyZQg4JOYC46gS7qkOr+v/tM1kBB7Bpi11"
+    "PxWpxPu5NaQYChQlkXEFtcnOKxxBZQZ2TEOiOyXcMALL9B6we84AqZHSQWtb3SaXL5ejUA"
+    "sR/zbsxktbKoz64sDvHxShUX4O/dnAwJsFZTBAPSL5h6/R1mIFuaXWrMXgX3/5Tuf11fNL"
+    "ig9VzQKSPE0fb5N3HAdze+1yHyXW226ygT3HgTUM3WomTD1ogkzLapXclu4sC0OyYBohFb"
+    "+22elkyH7gbMQLZHibOwj8v616C6igGeu/Fc3QB2vpFbwQDP3XiGCNfFIlw+ie0glGcPww"
+    "7ZI0/h56wBm+GtDPkk72GBRt8yDi9fvXj99v4Ns+Ob20Z9hmJAnoszSRKG3GkXxdT5rHFU"
+    "FHDTeZOfjjWfDOyq3xOf7JO9NrUCbjpqny2FW/xrQMJDS0VCObUNWFvw27C54f7hVfPQh2"
+    "JnZ/vJfq13EmniYC/RsWApCnVrH1cgg+whLuuUm6JUafnV+tZ+UvYxYfmnYlgWW/2pTH6k"
+    "wXwJAqqh0BYIwSBN0DWNesFRM02QIE7pcrHfRcQ72BHyzr6rzjv6yPv5QD0vCRZoD92uYN"
+    "NBLhUTH7+hJml8pCJJuP6pfRW77PxcysK6b9EUO5tC5sEfzRalR/7knhZ72MVscbpAz0fu"
+    "w+E1dDDb2rpWwlgPLepjKz1FW9kp+o8Wsoq+/yOyaq41i0RWvMNWlOwturFIHFnFp9dq9o"
+    "z5QV3EKUduMg1J1dGSSlZqL4BaZUq1Cjh6pvVCgG/ybN/kLwnyY2mNC+VsUIVALKLpJSgW"
+    "hh4HxgYUToxzOTF2LshdLstdI1B1FFwUOX1RZF+RC58pBa8qjxdGclc9eMPA5qQJL+7pSA"
+    "4KlSs86kNCfkgeXxAOm+gpN9FZLQP2jmQL/ZeP79+p2K2imksncWLr35ZHOt2n6fWor/60"
+    "Sfy04Iu1TogXEz96wj/vz6vpt3mcpdqqKciEmoqgxnLIO2jKhCDQNFmgSS4PV9u+Qhg+gd"
+    "Vf5hgzin3HbFl0qES6rOa9AoEJZ/ABwXtEtArhHAHDuE9mJOEY6+qPq+emKhEm6Gyb/qlO"
+    "7qkW75SgQiJhvNP2TdVRZ7qmZsa4nmeKHb3Z7CAJ4qgn5ArkrAl5ObyNMvPuUZhlUVXUf1"
+    "MPgIiEceg/DmxvsU/8SsC26zAIQNieDD44AYqiLzR07R2KtG5hCUADoz2DbVh6aXJQEFD2"
+    "vQbIX39f9rTAMemkmLhgZZJF8nWB0iSL5GmD9lwZt2NzvvT6pA5Z36V9fV92ZSJhFy3msk"
+    "jGLlLNZbFM8VxL5/PUMSfVIlkqqg5crPjNIlm7YPWbRfJVWFmIHXYKGIa0D2lfpjNWqQZy"
+    "NmNlFRITGbtUiaVFknVRkf0iGQOVvRZdPCfjmTR1TFq5SHouU7JrMVRpSbAqRkcdwmg9ef"
+    "5+7+MHyv7oYINpj91P4fP03ssJ1petFYuiWr1WWTZPitjs2op9+rZL/hHWEWYh37WQ+4jD"
+    "CFshRs5xbq5dXtHAaVZNu+Ge6zTqA5dOJtXLZUOJJQEidQyiioHwQze9RMFZxlQPso9AAx"
+    "m/61a0q6VmV5PuYi4SmVZng6tijCC57X7EGLngIswWAultoJaskhWMEaQ35pIuln2rtuxb"
+    "wbLZp+FYWxhUR12zMIibG2uqm26oCptQjXx8ZbFyZJUMqC3RrEL+M+KEUNGaL3FSUETf1W"
+    "vdEWCCFnPqdQ5SOakN3dwrmpDKybRRLzhqpnJSx9t6XM9tYqFYHlR1nIrXYtOqXYRQBILZ"
+    "Qg3CC9YgrE+lA1CsK32YmSlrXeBvLkGn6a48/0OYs17Jx4VSLc6ZM0yXUFEXqENPdQnC6e"
+    "hTQwJxOv70IktolkaPAhTFVqOHWtDpVGOINM1ndbxpiTSVw6ZdwUwCNdFXPF5dLR2yS4SB"
+    "HI+SSG7D089j39EKfNRAwHQ3pkOayOIeapaPAAMZHj5qyhbGUD+2VEdddT5E7Lv6+SQrmG"
+    "sOzLEvqbysrH7A6ygDn/JRdgUQlJsgKIdcdhzBvqwyXovcpwoyITg3NssRcbGNNxvsyG5c"
+    "qSOgTZwJXE8dCIWwM4SdZzEUCw1AQtj5Gkcdws4zCY9eLum24cRCPH8kXrPrjuseEX0ZFD"
+    "iGoP6QEVAI6s86qH+Z0gdL5vhU5QPl3DzEdKEnmljsnCFZl2alm6gOg0wy0RimFrVEpSVU"
+    "nTBL2wBVJ3QmBRnHUHUCT086VJ1Ytn1D1YmZDQhUnYCqE1NKrDoprKDqxDgzCFSdmNHM+0"
+    "uCPLaV1q92IABhWRx8cKIA8+Rfsswg6oGpgWBQBh8UGm6RT/6p/cA0cTBrQRmQee8ghfCO"
+    "2pUIZUD6ZQxO2A8PsQtlQDomDUYutqEWSMfSFn6MwyDEXMuUl7k4j7GrKG/BFgiy9Rllk1"
+    "dvmOea3s5Wehkrii9B1yKtK0umz+iCahdaqc9xuKHhnvEGdS80C43lEmaoe9H9EXUvx9gS"
+    "14DjnLYh3kCPpdl1Qo4ZLy5VMGSJVlYRvEDpEP3yiVGA/ShdPy9VRGTBRgclVzTPTtPVXl"
+    "miVZWHJqhRc4Iovm1iPKXFaqBOzXB1atjvpCGJYqWGXL9QzZu8S+P2uqLytT7jpU9y27n0"
+    "LfIPD5T/qafHP+twelFJS4uKOf2JdkMNLPvBIbc47hpvUp3LxGmYWvhnfEg7yrX95Tjkou"
+    "jjo5A3rMqJ8ybxLqTJdqfoRtAfS2XW7HW7qez9ekIhXeNWopCubxjaFNKNXcqoCulPlZwW"
+    "5b4yVamwlpAzrlPAbmRdNWQvg+xl5jDN5mHt/EZVDPDcjedfEuSzle5gl74WjblZgYbLsh"
+    "LV/5Gr4wLah+gaeDqeny6EZMJ7TxyF70adbKeJM0EAPXXOnYUkSmOPj5vLIibQZQ2ew6vi"
+    "E1drz9WJbiRwyHYzl2w3XXIcNY5fmsMvogcY/QXNezMa7IKT1tG+XNqd2T3SkHdnGbyy1X"
+    "6PHO5n1qO2iYNkUS1JjcKeGY1CMF1IZzSMU/+sdEalQQ5B75WlfwlnnsZoqQTr5zE6rlnT"
+    "W/HMVrrORtxc5ueUwCjVVUjCcoXeQh2OO4o6Rg7DHWP4tUgbB4dbvsJANG4m0ThuEBk/Ar"
+    "ct/rAqCCIY3SIYa+oe7ACFkjlYzXQNBEx3YxocvCLRwzt485lcYLk1EVcJmjAR1/GVxWbi"
+    "ipwddhOv1ZmqmqqbyKsu5lTSUfiMu695TaQJsbdG9bEOc4T6Zr6Q2cmh+8BLr/j2CQGIaA"
+    "gBzDkEACHty4W0NyTdSmjxXsUA5/qc87QF2E5Cmfa/JT9sDQUpkNqHpUf6HahfNeVDAPWr"
+    "1Fsrc7UdUL/KtFGX7PCEG28Nn25HR2wDBdFykHhMxWt5l1W3spIECQyDEmHQAKOmEqFqkk"
+    "MQfB1aBMmDfJrqYsmanuaZLXRdWW6s8bqh8opoGMeIeGmCI57H78xb9bo5ARfC/mwSHC2F"
+    "r1GlGJQntP6eGT8NDyuZJqPW4KZVnJE2tXeVtqdUGqt8obQyrFXBVglraQZlp2YmyNjTz+"
+    "zz7R5BbAFpgkdr7DB2wVrApoPIDnBou0iywXqJHbJHXjvzQh9NB0fWyZO8s+UNRluw9dWL"
+    "12/v33zz25tmOLsYludK7g8YhRJTV84lAg68CuLpF3kO3VHPTiKtOHcDBlPI6SmkoMxl3y"
+    "J//r9g/FnDoFt6ANMWTdsNk62uXVcxYNSnjTrlK+tHYFkd3qyjoIzIGaVcHCcJtFOL1FEG"
+    "2vkYFeiwm2QpVtnnPGK9Wn8i1DzS77pMLnfqyeVOmFz2KOQZD3scckSkeXwPP5l75DE9GZ"
+    "I40Z5SZFjzOB9FiM5+VuiQCNu98nHJ0eZRP/z04hIca19qqYGA5dMsEz9KQh7+4BkpH4lm"
+    "EVc52jzex9mx7DG/SOEcuLc75g5ijT26FAxbdZAcguQQxGcgOYRRn4/kcDbKuMWHHAXVlk"
+    "7mgg4KryIX//j6rrkmj9dWdw0nQvgxwuFLEmJHJUKoN7hpEyEkEQ9f1tqeFCG82iPiWemI"
+    "WPQRh1b+8yML+a5VS1Jvsf5da32wMGt3sHiRWcuj9HMSPFk1RmCgbn/yf/L/ioOYdWRFB9"
+    "+xvhD2Zm6Av6kKtKwvIWEbM94NrxXDfivH8CHCvvubOjFPgsMff/LjHbZC6mGLROz7YH5l"
+    "MWGWbEWUffqWgV3K+mPbPWuHHrEVU/YTwog1d9ln8zpb4W+OJdEtvrVMSZBIMj5l45KN0k"
+    "0+Ssy4fgatxgW1GpgbqJZLpwAMk2bgsuSOf8yt23xXkusoA5NmjJDLIdLN1FdBgDJedveA"
+    "6hlt0R7MtUtsmkSBhw5Z+R0Nkpu4CZO9rJY7CweMIz0VQImAC86DexsDFEVfKDsy7FC007"
+    "F+AWjiXDPGA8BPCI+SiaY101EJmjDTUbH/W2yiI3DzqQ3dLDffWQ6p4VwnlcqbEr9JvS6n"
+    "2mnymGlSjg07X9tIgam3IbL2GEVJiPfcwyH4QroAuiTmrDumKj3kVfLAgTClA0HgX3PSk+"
+    "ENnPqWO9WJgazoEMXUI469DjQeqAYKROESUThBfZhtwoBakdodRmFsh9IJSklsHQS0yvJT"
+    "RAFhP5+GB11yZVCgWKQ4zZ8c433AOciLN2tc7JPBr/BO33ONO3301wP7/XbE+VJojZVWLc"
+    "WCWYtm/QWT7U52RG4z5hJ0hSZ8d3Pb2YR3fdjdAbvd2F3vie4snCGukFediTdgHduRQ2WL"
+    "XItWqgqCqVayg/Aode2tlzhUduFUyayAA3JFckE5DcrpWQzFQp3rXZTT+yyrk83laaHbo0"
+    "BrEwsTGaTwnM5Fwg2vVwbPJhD4hQSeGqvy4Ak863PpABTn6fo+HPtb1hTclWfpGtQlX+px"
+    "AhjCnK8lXWpz1pxT2ct7HBJnt5LE6fN3btpi9KhsM2btSwigTxlAf8RhpJnPogIBAVxHAV"
+    "wgiai2pJALZJFUE9gdJUsIv4Uv3XSpBbYVyPQK28t4RAbT0l5UePb1/wGsmjtM"
+)
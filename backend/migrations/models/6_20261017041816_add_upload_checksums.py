@@ -0,0 +1,178 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "medical_documents" ADD "sha256" VARCHAR(64);
+        ALTER TABLE "medical_uploads" ADD "sha256" VARCHAR(64);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "medical_documents" DROP COLUMN "sha256";
+        ALTER TABLE "medical_uploads" DROP COLUMN "sha256";"""
+
+
+MODELS_STATE = (
+    "eJztXWuT27iV/SssfdnZqo5jd9yTVJJKVY/t2XHix5Tdk01lZooFkZCENUVyQLI9SuL/vg"
+    "Af4gMARVAkRUL3ix8SDiQdXOJx78G9/17tAxd70ZP7MAyIH++xH6/+aP175aM9Zv+QvX1j"
+    "rVAYlm/yF2K09tL2qGyYvoHWUUyRwzvdIC/C7CUXRw4lYUwCn73qJ57HXwwc1pD42/KlxC"
+    "e/JNiOgy2Od5iyN378mb1MfBf/iiP+3x85LA6oTVz+WS6KcfplCPvurOmPqxDFhH2T6vs/"
+    "8z7CT/aGYM+t/dSsUfq6HR/C9LXXfvxt2pDD17YTeMneLxuHh3gX+MfWJGNni31M2Wfx7m"
+    "Oa8N/Mf1JOUUFD9vPKJtnvqmBcvEGJF1c4Wtvlayvbfvf+wf746sG2VxqsOoHPR4Tw8eG/"
+    "fsu/wm9unz3//fM//O7r539gTdKveXzl91+yjy6JyYApPe8eVl++ZNSirEU6MCWpxZjUaX"
+    "3JXpXzWrRvMMtf5sP6pHi/ynHBaBvJxQsly6U5TkBzC4cv7x9epSSWpKUGLJD2YoeonLSi"
+    "fYM09gUWSNVqj361Pexv4x37710Lc3+///Diu/sPX939N/+4gE0z2Rz0Ln/jlr9TZ9ZNGB"
+    "P8C3V/0quQ08/7UAT/7umsH/iS0ShGcRLpWGuJmM5eV5Gzw27i4eLrjGy2t0872O3tU6Xh"
+    "8rfqPFOMIpndPuBfFYZbIoyYF1oIfXj1jwfe8z6KfvGqRH719v4fKcf7Q/7Om/fv/qdoXi"
+    "H+xZv33zQI94MYS+xazfcR0IvufNG/VrY3gecFn+0kFBn/Jgg8jHw56TVcg/g1A45l6MdX"
+    "puX+m/fv39S4/+Z1k9wf3n7z6sNXz9KBYI1IjOUTt8PmB8aJjWL5/oxvKuSc15FtO7ViY7"
+    "KwqYZPne573zvkz2Xbw/D67auPD/dvv6+NCt/T8Xdua09D8epXXzfm/WMn1v++fvjO4v+1"
+    "/vn+3auU3iCKtzT9xLLdwz9X/DuhJA5sn5k/civnhuLVgrXaqCeh23PU60gY9bmMesFRZd"
+    "jzb1/Z9laPyV33vVXMdBvf2Z91S1br3oWOtNZBwGvOK/fKbD5JXQg5YyLH3wYUk63/N3xI"
+    "qX7NvhTyHdlJOPdifV/2tDCKvxRmVLxaTvcUfT46sxrWxRhgvxtnO4AX9x9f3L98tZJMDE"
+    "NQy518hP8svODDxUl+a5OinF5uyWvkfPqMqGvXTJq/E9wGjVeObcW39rf75ivIR9uUHv47"
+    "+LfO+X/hEZ84yHsXpF9HcODW3r9p8+A6eUv7eJ456cNdFb1bKcZCvmsF6wjTx9RzknZSHY"
+    "Mu7bt4f+vWzvuywcc71rqn9vGmxKf8CNyqvUA1kBEOiobjsosH6E7tAboTPEClfWvu3GtA"
+    "Azfuy92oi+ezKFn/H2Yr6aNklNWupzoK/E/6/qegD+0BsH4e6yiKcBTtpbt7Ne11FPCuz3"
+    "voIa1QQtEeuO4XR+AHi1jTyps4I/ZIkxs6JQEl8UFnZ1rFTBihpEESEx+vJtmdDh+fjMjW"
+    "x5LTVWv0pgRB6EYjdJPR1uss0IAOcBpY0PS+tMMA+4uRqPtQVVDwVGk8VSlvfFdp62stZF"
+    "jYLOmv1xCUVi/gywxPQlD6Gke9S1CavbfTDUrXMBA8laxie+ym0RuKnYC6euxKsb1Yntky"
+    "BpH/+fIKkf+LRP7rz/oAFL/NOvxw7G9ZU0RXnqVz5Gm6s4VrCEu+DqFFbaGfk9DiJSLe4S"
+    "PycPQh8LwkXEnEFkKbmzbBhctb2xFvbtOy/UnRxfeY/sZFhxsrZP9IzZL42HJJFGI/YmNg"
+    "xUHMkNYa79hgW/EOW+mHWBSHAY2frBoDdnaHP/k/+T9kG3KL+Pn7e8zGF/kRt9qAv4jiok"
+    "uu/LBCWv6qGysKUljWoRWwfe9P/g5F7JOtyEFZnxlH7K/PEf8YEkcW/0yLfcoWp79Koh35"
+    "kdGcenSL38VN6+eGogRkI9NeDZS45dtuBso88td1MfCXBPmxNJyhtMYqZLo951Jur6F9kM"
+    "g2mC+xQ/bIUzn7ClDTGDPUkxy9NHLbbPHVi9dv79989ez25rbhSC28fs+FkFB1apfcpFIf"
+    "lJo4sFvpKT9fxboT20DBEfT0EbSgbKgDUt7VwkjWOhyVBjarfTtBWz+ISLSSbdiPb7bv1L"
+    "NmXVXRudPBqsHqO25ZC33lc36jGmTPk+5fiePaz54y4lwt4XMDZkKUsK4tedZFW/JMrS15"
+    "Jmwk3OLxtNNXNMgWkUbIqBpinrsuWTJYK7Wc507MlHFkTlfZLyIN5Hx4eT/7NBy3aHoUEu"
+    "Qa6szD8cymFb2zMTs0BN5jqyxKTqEAvGYWI/yIdQWTVYx5y9kIUsllpMxBx6sNSyRZvMbY"
+    "VcslIk0walByzWYoFqrpASXXNY56FyVX4b5w7fVBM8mIiASvJKi6QNW1dF5B1QWqrgXx3F"
+    "PVVV2+hrDn69B2SRb9OUWKvkV74h2+I1Ec0MNKEi2qN7hpixht0qb2rtK2c9gow1q5aVqV"
+    "PqQxJHVzzYAShJEmDSNR7GVZj3ZEkvxU7RNq4sDJ3sHJzj7OJfIE4GqmayADaR4lfsTmVj"
+    "vY2Gl8QmPWaMLgnCIRrTGOUMy+J2LDp0dtFQbUSpIioyRKDVBBbsskISBN8BpPMFFANGSC"
+    "aAgks4fYxyyGYqFecIh9XOOod4l9gNMYnMYz8691cRpfxrX2eo+27Bd+wFFGjOBaqze4aX"
+    "OtkaypTdO2HSXZL3GMiMfvJ2Zoq4KuedXaGvYRaCfuAXJTX8C7ljGvK2Gtowx0+Tx72k2k"
+    "3abSFg4Z64CRRvFW073WgAHb3djmqUEpimI7ibRTxAlYSBSnUzmrYE93WhGAJhyuJzD1GD"
+    "u77NcKZKs9GDWQCURP7cXYsN/Jvo+W26iKMWIin5p0sue3nyPpEqqmvY4C4nsQz5Ufe57F"
+    "syxB05V9CRTmmz6mzyNUjjwhg/ogVEdBqoDmbiUjKKGexKb/+vH9uzZaC1TTJUmc2PqP5Z"
+    "FoNHZXf94kfpYyaJ0QLyZ+9IR/3l/GisC0cMpZarf2pmHf1N2MvIOmtVdcAsKwnEjhXUMa"
+    "6C1erndYDApkmax6JmsXwDDYsx7sDXKIp3l5sooxYuM2hbbIcbLdru0n+zWWpFVU8y3Dmr"
+    "Bbm+AYDpdQ4BLKYnmlyCWBF2zZHlKPWxEI/Mpq0jjI1yO2goCJAALgcGtqcTz3vDXFH/wB"
+    "SP6Yd2Mmt5XZ8TSjlTVqiAniOq6hiQv7nKQyb9BaLZMp37xpk8iwEeopj2FIK8ZRfFofI2"
+    "upL5DhPYA+5gL6mJR43ax6NRA4Lbo5LZxgH7IZ1denW0QC5904z+Yk+xF5Mu1A293KOs5A"
+    "vkfxEOW8sV8s2YecpLuAmeeOG/4iK8UbTDHbxtlp2Qs9tgWoeYyPYt5o7Qd0zw48Gw9ttZ"
+    "zOTaB5hA9/Zy2fFfTvBwrACa8JboifFX5YIuPlLlxguz1QWQNCkHLWQUqISF/RYIeYbtjK"
+    "w+/JMLp1JlERaeAmeJRDB/e6ZOJjh8gcnWrORaSB+4QxKIfr7VMKNTMz1Y2jNlAQ8oMsnx"
+    "chGQQWEK+eWSQK4tWzjlcXK9cARL9B6wfcSTW/UIobq/zMIqop9/J4ajEs7dFU/tO6xVLV"
+    "zHaJjrLPCmgZmC5dWQnd8rmQAaAI3Gzip7r3gGsgA4/VI10Chkg1ZOSr8Bni9K7xUp3t+U"
+    "wusNyauKEEQcYGjYwNkbPDbuL1KA4nIq+6AH1JR+Hc7zxFCEgTXG+NMH+XKL86yC9TDPG9"
+    "c79QjYgeIFYzM/pNCtUQ/ssSRzv7QBNnwmM1ffKHo3a1Trv6gnwFctbt+OUwP8o1eIjcTG"
+    "nnkJhYvZIvM0UtJCa+xlGXbCiExMQNF2L3KG0VBQFECCBOdkMbs58VxT2qiEqQwDCEaC8Z"
+    "oq2a5BAEX8mVTPFB7hSeTZes6Wme2UKnEaOtrvG6MdpK+cv8EqitPD9/k/fw7d8+5OXq1O"
+    "TXLrWawXxjG+4FyGVsbRhnZ3KVCzZ+SLs0iK+R4/+p2ecqF7kMoNri5oQaIHuIMjHJ+KIA"
+    "iOtPGdd3cYhovJduj9RBjjpqwlhoarnoWB92mRH+aEc2WnQfARMy7aKJKB4+4uxgGpMNWz"
+    "cUMQa1s1tEQkbYwV3h+NcQU5JezD1gRCUDpJzVZVDIhCyoAELsEOSRf+k/ABIoPAGDPwGf"
+    "A/rJLoQCOsMjAOcxOPxjjRkcvMdcfOQc+LY95rtcjQGSgiFu2n801iTQiZrmzSFmCjFTiJ"
+    "5BzPQaR33eMVPzvCtC4Enn1k8X7/57Hz8E7I+JQigXHZDxXPtnuVRzN/TLwElSp5fEp9ps"
+    "ctPmVC0u6Ll5645pK/PPsI4wC/mudXSz1xJXnmjbp7Zrcfehst7DLaxpvbX5YGrfxBKABt"
+    "4RGj75HJtGZefzlmtYBcBAeke5glX9ZgLP6mNeAwbHvT5VLz2sfc2wBgIb72bjbKOy5dny"
+    "0ni4LuNSMDDfjfnUXNkuZqdt4wXIQKbvOoU071pCmndiSDMlTXdTUgMZyfTQG5KUsYj8S0"
+    "Kzcm9dw4BcVBYv26Hbu691LLdEmLD1qFvt1887WO3Xz5VWy99qpPsie/3JoQYycHIYRVkS"
+    "0uCRuJhqb+wEoHl2Pc75pThX6963F4BnXrefGfV6t+3ZOY87vvidefZPnYOgiDTBcKc+C+"
+    "5xjLjPSWReHemuYiDA3T/AHaOtlkKnaD8P5YdRspyF5APi4Z1HPBbpo4szQWZgWMC5i8wA"
+    "Mv7Chd3F8nq80KR7X1cEAr9wXVdj6wMZlWfCc8+MypUJYAhzvo7L0eKsOafsyrnBf08DB7"
+    "sJxSu1Fqhsc9NFDBQWzTXVQCXOyovZ4GwpksmBVI319UDHnqCe7QWUQE4YM9ZcvfqqFYwJ"
+    "brKmQ72TP73FnS7xpucW3sOd3kAaGMEYxaFeMqcbMBKRBnI+StRoHbgHOyKyAIaa7hrIxN"
+    "lknPBcdckU2G73f4loA31gC/F5SS5ZiE4vNlbpNVp7T/xEmv5TuQ2SQcHlJbpmkI8jtl+N"
+    "CNJeLyRQ86ax4SVIabptdW4FdahWAJrA9tSR2iCJGY96CtISYgLjY9s3XwTsILT7pilX4U"
+    "3gfmprrxyjdNNnS6AwAj1uCQSexzY9SWjzlIWEYokvp7WQi7wDKOqiUdQFIubqxQAi5hAx"
+    "P+P4ABHzkXgtQgvaIXMJEhiGmDnEzJfHc8+YeXUGGMKeryNoLpk3J46aV5xyUUSUKeHfIv"
+    "/wEPA/JxrAueYzSX+e3VAONH8s5RmyGZMCtXWxABv6dIw+4UNqDJVecmM4DmPeRBQd5A3j"
+    "HQ2S7U7RptpzpDQy9rotDNOXLrIKdc5qYdI8LajQyVjN7JL4Vo60MqQV71Bs8bELPMJPSZ"
+    "GFPM/K149jY+LzJ++YyLwuuxiqV319Bu/aDjZ2hOkjcUCgMbFAI1/1dKMSDZiBIWxI07I8"
+    "VQakabmUA7Y5iwvst3sAJXAD3YALcft1Ew0sqiDDsvU4G+QQj8SSU0pL0pIKxkCeR1k+nB"
+    "3BGzsVACAiM+wW1YAIhWWkR3Jnj/jpmShK9ntEJRbfMgQSLIyB/hjEPBqX5nxgtqy1jxKR"
+    "wP85sey+2g51DzAePba2JHLYMrvtoe6QQGEE9EcAEh5MkfAg8DfEZZM3r6sTH9hHPWJPh3"
+    "NlBxMOgc99kd5ihwAUNFeooIHSFqaNusSBIpS2KJ5YXeGJgAPZiUTY46EotovHQ5diORh0"
+    "aaBLA9XUpc8cg6umyvl0CHqvQ8QjrEGnaW7MqdNzPbOZuCvV8rVIVzIlcbAqfBk6Re9f5H"
+    "29Cxac+lWseV/3/aCtH0TnMvUy64ZEhtJE9mjLOrHZ9ph9+Jlkvc46+5D2ZShh7LsPQ9Yb"
+    "tDaaqFrlsf40SaqeGUhWQ2x5Llu1vFAG0oU8D9MtOZetfE99n/Z2MJSrTO6piET1YOvtsT"
+    "9DCXskMQ9Fsy3tmYT9nXf0sejHEKYmyHz3Q5qeb6WWaOcNbrpItLNcf90k2mp2NMXR7L0f"
+    "050C26mXL0QO8tP/gE56Sp001KGbSoV1LCXXuwYdMA7156D+3GKYHkczCyXoRgj4QAm6cU"
+    "vQwQWWS2nMjtm8+8gwalDQYcxFh9FFfVM9X3VfKRoo0AaANmCyJTg//3cntYIAQ4WyOSBm"
+    "uTjFY4lZoI7LiHVcZLuGAVh+g9YPeMEVSDtIWGp7pdPk8vVqAGI/5t2YyWplUZ9d2SHi45"
+    "Uq7sLfuzkZcmGtpgi2pF8wjao4zEC2QXZpNHsVwitThld0ff3g4tdz8aeMEEc7ptLEAd/d"
+    "+F5T5LvabNdRJrjxJqCarUXJhq0RCc22qV3JbuLAtDsmWQoitvbbPO2bDt0NmIFsjxLHYh"
+    "+X9a9BdRUDPHfjuboB7HzjuYIBnrvxDBGui0W4fBLbIZVnZ8MO2SNP4eesAZvhrQz5JO9h"
+    "gUbfMg4vX714/fb+DbPjm9tG/YtiQJ6LM0lCKXfaRXHgfNI4Kgq46bzJT8eaTwZ21e+JT/"
+    "bJXptaATcdtc+Wwi3+NST00FLxUU5tA9YW/DZsbrh/eNU89KHY2dl+sl/rnUSaONhLdCwI"
+    "i6hubekKZJA9xGWdclOUgi2/Wt/aWso+JiyvVQzLYqtrlcmlNJgvQUA1FDIDIRikYbqmUS"
+    "84aqZhEsQpXRInuIh4BztC3tm5AHhHH3k/HwLPS8IF2kO3K+7BIJe2iY/fBCZpfKQiSbhe"
+    "q33Vvez8XMpo3bdoip1NIfPgj2aL0iN/ck+LPexitjhdAOkj9+HwGkWYbW1dK2GsUyvwsZ"
+    "Weoq3sFP0nC1lF3/8VWTXXmkUiK95hK0r2VrCxSBxZxafXaiKN+UFdxClHbjINSdXRkkpW"
+    "ai+AWmVKtQo4eqb1QoBv8mzf5C8J8mNpDRHlbFCFQCyi6SUoFoYeB8YGFE6Mczkxdi54Xi"
+    "7LXSNQdRRcFDl9UWRfkQufKQWvKo8XRnJXPXjDwOakCS/u6UgOCpUrPOpDQn5IHl8QDpvo"
+    "KTfRWa0I9o5kC/3Xj+/fqditoppLJ3Fi6z+WRzrdp+n1qK/+vEn8tKCOtU6IFxM/esI/7y"
+    "+r6bd5nKXaqinIhJqKoMZyyDtoyoQg0DRZoEkuD1fbvkIYPoHVX+YYM4p9x2xZdAKJdFnN"
+    "ewUCE87gA4L3iGgVGjoChnGfzEjCMdbVH1fPTVUiTNDZNv1TndxTLd4pQYVEaLzT9k3VUW"
+    "e6pmbGuJ5nih292ewgCeKoJ+QK5KwJeTm8jTLz7hHNstQq6uupB0BEwjj0Hwe2t9gnfiVg"
+    "23UYBCBsTwYfnBBF0eeAuvYORVq3sASggdGewTYsvTQ5KAwD9r0GqA9wX/a0wDHppJi4YO"
+    "WXRfJ1gdIvi+Rpg/ZcGbdjc770+qQOWd+mfX1XdmUiYRctlrNIxi5SLWexTPFcS+fz1DEn"
+    "1SJZKqo6XKy40CJZu2B1oUXyVVgZxQ47BQxD2oe0L9MZq1RbOZuxssqLiYxdqoTVIsm6qM"
+    "h+kYyByl6LLp6T8UyaOiatXCQ9lymJthiqtCRYFaMLHMJoPXn+fu/jh4D90cEG0x67n8Ln"
+    "6b2XE6wvWysWRbV6rbJsnhSx2bUV+/Rtl/wjrCPMQr5rIfcR0whbFCPnODfXLq9o4DSr0t"
+    "1wz3Ua9YFLJ5Pq5bKhxJIAkToGUcVA+KGbXqLgLGOqB9lHoIGM33UritZSE61JdzEXiUyr"
+    "s8FVMUaQ3HY/YoxccBFmC4H0NlBLVskKxgjSG3NJF8u+VVv2rWDZ7NNwrC0MqqOuWRjEzY"
+    "011U03VIVNqEY+vrJYObJKBtSWaFYh/xlxQqhozZc4KSii7+q17ggwQYs59ToHqZzUhm7u"
+    "FU1I5WTaqBccNVM5qeNtPa7nNrFQLA+qOk7Fa7Fp1S5CKALBbKEG4QVrENan0gEo1pU+zM"
+    "yUtS7wN5eg03RXnv8hzFmv5ONCqRbnzBmmS6ioC9Shp7oE4XT0qSGBOB1/epElNEujRyGK"
+    "YqvRQy3odKoxRJrmszretESaymHTrmAmgZroKx6vrpYO2SXCQI5HSSS34ennse9oBT5qIG"
+    "C6G9M0SGRxDzXLR4CBDA8fNWULI9WPLdVRV50PEfuufj7JCuaaA3PsSyovK6sf8DrKwKd8"
+    "lF0BBOUmCMohlx1HsC+rjNci96mCTAjOjc1yRFxs480GO7IbV+oIaBNnAtdTB0Ih7Axh51"
+    "kMxUIDkBB2vsZRh7DzTMKjl0u6bTixEM8fidfsuuO6R0RfBgWOIag/ZAQUgvqzDupfpvTB"
+    "kjk+VflAOTcPMV3oiSYWO2dI1qVZ6SaqwyCTTDSGqUUtUWkJVSfM0jZA1QmdSUHGMVSdwN"
+    "OTDlUnlm3fUHViZgMCVSeg6sSUEqtOCiuoOjHODAJVJ2Y08/6SII9tpfWrHQhAWBYHH5wo"
+    "xDz5lywziHpgaiAYlMEHJaBb5JN/aT8wTRzMWlAGZN47SCG8o3YlQhmQfhmDE/bDKXahDE"
+    "jHpMHIxTbUAulY2sKPMQ0p5lqmvMzFeYxdRXkLtkCQrc8om7x6wzzX9Ha20stYUXwJuhZp"
+    "XVkyfUYXVLvQSn2O6Sage8Yb1L3QLDSWS5ih7kX3R9S9HGNLXAOOc9qGeAM9lmbXCTlmvL"
+    "hUwZAlWllF8AKlQ/TLJ0Yh9qN0/bxUEZEFGx2UXNE8O01Xe2WJVlUemqBGzQmi+LaJ8ZQW"
+    "q4E6NcPVqWG/M6AkipUacv1CNW/yLo3b64rK1/qMlz7JbefSt8g/PAT8Tz09/lmH04tKWl"
+    "pUzOlPtBtqYNkPptziuGu8SXUuEw9oauGf8CHtKNf2l+OQi6KPj0LesConzpvEOxok252i"
+    "G0F/LJVZs9ftprL3ywmFdI1biUK6vmFoU0g3dimjKqR/rOS0KPeVqUqFtYSccZ0CdiPrqi"
+    "F7GWQvM4dpNg9r5zeqYoDnbjz/kiCfrXQHu/S1aMzNCjRclpWo/o9cHRfQPkTXwNPx/HQh"
+    "JBPee+IofDfqZDtNnAkC6Klz7iwkURp7fNxcFjGBLmvwHF4Vn7hae65OdCOBQ7abuWS76Z"
+    "LjqHH80hx+ET3A6C9o3pvRYBectI725dLuzO6Rhrw7y+CVrfZ75HA/sx61TRwki2pJakR7"
+    "ZjSiYLqQzmgYp/5Z6YxKgxyC3itL/0JnnsZoqQTr5zE6rlnTW/HMVrrORtxc5ueUwCjVVU"
+    "jCcoXeQh2OO4o6Rg7DHWP4tUgbB9MtX2EgGjeTaBw3iIwfgdsWf1gVBBGMbhGMdeAe7BBR"
+    "yRysZroGAqa7MQ0OXpHo4R28+UwusNyaiKsETZiI6/jKYjNxRc4Ou4nX6kxVTdVN5FUXcy"
+    "rpKHzG3de8JtKE2Fuj+liHOUJ9M1/I7OQE+9BLr/j2CQGIaAgBzDkEACHty4W0NyTdSmjx"
+    "XsUA5/qc87QF2E6oTPvfkh+2hoIUSO3D0iP9DtSvmvIhgPpV6q2VudoOqF9l2qhLdnjCjb"
+    "eGT7ejI7aBgmg5SDym4rW8y6pbWUmCBIZBiTBogFFTiVA1ySEIvg4tguRBPk11sWRNT/PM"
+    "FrquLDfWeN1QeUU0jGNEvDTBEc/jd+atet2cgAthfzYJjpbC16hSjIAntP6OGX9ADyuZJq"
+    "PW4KZVnJE2tXeVtqdUGqt8obQyrFXBVglraQZlp2YmyNgHn9jn2z2C2ALSBI/W2GHsgrWQ"
+    "TQeRHWJqu0iywXqJHbJHXjvzQh9NB0fWyZO8s+UNRluw9dWL12/v33z1u5tmOLsYludK7g"
+    "8YUYmpK+cSAQdeBfH0izwn2AWenURace4GDKaQ01NIQZnLvkX+/H/G+JOGQbf0AKYtmrZL"
+    "k62uXVcxYNSnjTrlK+tHYFkd3qyjoIzIGaVcHCcJtVOL1FEG2vkYFeiwm2QpVtnnPGK9Wn"
+    "8i1DzS77pMLnfqyeVOmFz2iPKMhz0OOSLSPL6Hn8w98pieDEmcaE8pMqx5nI8iRGc/izok"
+    "wnavfFxytHnUDz+9uATH2pdaaiBg+TTLxI8SysMfPCPlI9Es4ipHm8f7ODuWPeYXKZwD93"
+    "bH3EGssUeXgmGrDpJDkByC+AwkhzDq85EczkYZt/iQo6Da0slc0EHhVeTiH1/fNdfk8drq"
+    "ruFECD9EmL4kFDsqEUK9wU2bCCGJePiy1vakCOHVHhHPSkfECh4xtfKfH1nId61aknqL9e"
+    "9a64OFWbuDxYvMWl4QfErCJ6vGCAzU7U/+T/7fcBizjqzo4DvWZ8LezA3wt1WBlvWZErYx"
+    "493wWjHst3IMHyLsu7+tE/MkPPzpJz/eYYsGHrZIxL4P5lcWE2bJVhSwT98ysBuw/th2z9"
+    "qhR2zFAfsJNGLNXfbZvM4W/e2xJLrFt5YpCRJJxo/ZuGSjdJOPEjOun0GrcUGtBuYGquXS"
+    "KQDDpBm4LLnjH3PrNt+V5DrKwKQZI+RyiHQz9VUQoIyX3T0I9Iy2aA/m2iU2TaLQQ4es/I"
+    "4GyU3chMleVsudhUPGkZ4KoETABefBvY0hiqLPATsy7FC007F+AWjiXDPGA8BPCI+SiaY1"
+    "01EJmjDTUbH/W2yiI3DzqQ3dLDffWQ6p4VwnlcqbEr9JvS6n2mnymGlSjg07X9tIgam3Ib"
+    "L2GEUJxXvu4RB8IV0AXRJz1h1TlR7yKnngQJjSgSDwrznpyfAGTn3LnerEQFZ0iOLAI469"
+    "DjUeqAYKROESUThBfZhtwoBakdodRjS2qXSCUhJbBwGtsvwUUUjYzw/oQZdcGRQoFilO8y"
+    "fHeB9yDvLizRoX+2TwK7zT91zjTl/w64H9fjvifCm0xkqrlmLBrEWz/ozJdic7IrcZcwm6"
+    "QhO+u7ntbMK7PuzugN1u7K73RHcWzhBXyKvOxBuyju3ICWSLXItWqgqCqVayg/CCwLW3Xu"
+    "IEsgunSmYFHJArkgvKaVBOz2IoFupc76Kc3mdZnWwuT6NujwKtTSxMZJDCczoXCTe8Xhk8"
+    "m0DgFxJ4aqzKgyfwrM+lA1Ccp+v7cOxvWVNwV56la1CXfKnHCWAIc76WdKnNWXNOZS/vMS"
+    "XObiWJ0+fv3LTF6FHZZszalxBAnzKA/ohppJnPogIBAVxHAVwoiai2pJALZZFUE9gdJUsI"
+    "v4Uv3XSpBbYVyPQK28t4RAbT0l5UePbl/wFHIRhZ"
+)
@@ -0,0 +1,187 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "blobs" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "sha256" VARCHAR(64) NOT NULL UNIQUE,
+    "size" BIGINT NOT NULL,
+    "ref_count" INT NOT NULL,
+    "created_at" TIMESTAMP NOT NULL
+) /* Content-addressed file shared by every upload\/document with the same SHA-256. */;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "blobs";"""
+
+
+MODELS_STATE = (
+    "eJztXWmz2zaW/SssfZlM1Ytjv/g56emurnpe0nHHS8p+6elqO8WCSEjCmCIZgnyO0u3/Pg"
+    "AXcQFAERJJkdD94kXCgaSDSyz3Htz778U2cLFHH9yGYUD8eIv9ePE/1r8XPtpi9g/Z21fW"
+    "AoVh+SZ/IUZLL22PyobpG2hJ4wg5vNMV8ihmL7mYOhEJYxL47FU/8Tz+YuCwhsRfly8lPv"
+    "ktwXYcrHG8wRF748Ov7GXiu/h3TPl/P3BYHEQ2cflnuSjG6Zch7Luzph8WIYoJ+ybV93/l"
+    "fYSf7BXBnlv7qVmj9HU73oXpay/9+Ie0IYcvbSfwkq1fNg538Sbw961Jxs4a+zhin8W7j6"
+    "OE/2b+k3KKChqyn1c2yX5XBePiFUq8uMLR0i5fW9j2m7d39vsXd7a90GDVCXw+IoSPD//1"
+    "a/4Vvr5+9Pi7x99/++Tx96xJ+jX3r3z3JfvokpgMmNLz5m7x5UtGLcpapANTklqMSZ3W5+"
+    "xVOa9F+waz/GU+rA+K96scF4y2kVy8ULJcmuMINLdw+Pz27kVKYklaasACac82KJKTVrRv"
+    "kMa+wAypWmzR77aH/XW8Yf+9aWHuH7fvnv14++6rm//mHxewaSabg97kb1zzd+rMugljgn"
+    "+h7k96FXL4ee+L4G8fTvqBLxmlMYoTqmOtJWI8e11QZ4PdxMPF1xnYbK8fdrDb64dKw+Vv"
+    "1XmOMKIyu73DvysMt0QYMS+0EHr34p93vOctpb95VSK/en37z5Tj7S5/59XbN38rmleIf/"
+    "bq7dMG4X4QY4ldq/neA46iO1/0L5XtVeB5wWc7CUXGnwaBh5EvJ72GaxC/ZMChDH3/yrjc"
+    "P3379lWN+6cvm+T+8vrpi3dfPUoHgjUiMZZP3A6bHxgnNorl+zO+qZBzXke27dSKjcnMph"
+    "o+dbpvfW+XP5dtD8PL1y/e392+/rk2KnxPx9+5rj0NxatfPWnM+/tOrP99efejxf9r/evt"
+    "mxcpvQGN11H6iWW7u38t+HdCSRzYPjN/5FbODcWrBWu1UU9C98hRryNh1Kcy6gVHlWHPv3"
+    "1l21s9Jnfd91Yx4218J3/WLVmtexc60loHAa85r9wrs/okdSHkjIkc/xBEmKz9n/Aupfol"
+    "+1LId2Qn4dyL9XPZ08wo/lKYUfFqOd1H6PPemdWwLsYA+9042wE8u33/7Pb5i4VkYuiDWu"
+    "7kI/xn4RkfLg7yW5sU5fRyS14i59NnFLl2zaT5O8F10Hhl31Z8a3u9bb6CfLRO6eG/g3/r"
+    "nP+nXrBcSBy36etXbR7bJWvRzVW7eBb4MbOur9nCw9Ymil1rRTxsUXbUZ/9e7ix8j6OdlY"
+    "RegNxvGFcJ9wNbn0m8seINa8i+m/X+x9uvr2+ePFg0Bqbf3j/6H/0Ir9iIJqwNoWkLP9ku"
+    "cWQFK+s1domDvF/Svizku8Urz4tuo+AztVJfNvt6FmJ9xH/+6FOMLT5g2He/4cTZlJkDfh"
+    "Du0p9z2GMNzucxnc/MdJgtaPmm9oh+fCbnpbfmknryuINL6sljpUuKv9Vw/ZE/JG7qp2St"
+    "NNwCYdK250/X199++931w2+ffH/z+Lvvbr5/uDdj8a02e3768m/cpGv0i5vO/aSmMV/UMO"
+    "NxPxcXNnhC1FTP80ys8oQIp4zzbNaeecTnm403Qbp3FDZttfdbN29O3tLeO5877OJyjJVi"
+    "0s0P2wHi6D4Nc1FxX3a4fZdQff1owvuyISA//p4oJT7lR2NbVAMZEU1qRJm7hOtu1OG6Gy"
+    "FcV9q35pJSAxq4osxkBZF4VUVnOk2W/4edmNxLRlkdJ6yjIFioHywMjqE9ANZPYx1Riind"
+    "Sl2xatrrKOBdn/fQQ1q6j6I9cH2c6IN7gWNNK2/ijNgjjW7oEQkiEu90dqZVzIhysihIYu"
+    "LjxSi70/7FZJSsfSw5XbVKbUoQ6Gw0dDYZbUedBRrQHk4DM5re53YYYH8xEnUfqgoKniqN"
+    "pyrlje8qbX1hrAwLmyX99Rr85uoF3Cy/OSgITR71LgpC9t5GV0FYw5gU8u0t8rjNRCdsHX"
+    "KCyNVjV4o9iuWJLWMg05wuryDTPItMs/6s90BxrnZ7t+9vXlNEV56lc+RhurOFqw9LvgxV"
+    "bG2hn5Iq9jki3u498jB9F3heEi4kYguhzVWb4MLlrW3Km9tR2f6g6OJnHH3tot2VFbJ/pG"
+    "ZJfGy5hIbYp1xhGgcxQ1pLvGGDnetZ2YdYEQ6DKBbVsqd2yAWyv2Qbcov4pYCW/Q6fcqsN"
+    "+IsoLrrkyg8rjMpfdWXRIIVlHVoB2/d+9DeIsk+2qIOyPjOOMjUt+xgSU4t/psU+ZY1Vot"
+    "kPjObUo1v8Lm5av4KU9qx5HCRu+bY0DjKP/GVlcfgtQX4sDWcorbEKAZ2m6POT616fY4ds"
+    "kady9imEr26GepCj50Zumy2+ePby9e2rrx5dX103HKmF1++xEBKqTu2Sa+/qg1ITB3YrPe"
+    "Xnq1h3YhsoOIIePoIWlPV1QMq7mhnJWoej0sAmtW8naO0HlNCFbMO+f7N9p54166qKzp0O"
+    "Vg1W33HLWugrn/P0NyB7HnX/ShzXfvSQEedqCZ8bMBOihHVtyaMu2pJHam3JI2Ej4RaPp5"
+    "2+okG2iDRCRtUQ89x0SWnGWqnlPDdiWrM9c7rKfhFpIOf9y/vZp+G4RdOjkCDXUCcejic2"
+    "reidjdmhIfDuW2VRqquMDeAls0j5jXhNwWQVY95yNoBUch75DdH+asMcSRavMXbVcolIE4"
+    "walFyTGYqZanpAyXWJo95FyVW4L1x7udPMCCciwSsJqi5Qdc2dV1B1gaprRjwfqeqqLl99"
+    "2PNlaLski/6UIkU/oC3xdj8Snodvt5BEi+oNrtoiRqu0qb2ptO0cNsqwVm6aVqUPaQxJ3V"
+    "wzoARhpFHDSBH2sqxHGyLJVK/2CTVx4GTv4GRnH+cSebUWNdM1kIE0DxI/YnOrHazsND6h"
+    "MWs0YXBOkYjWGEcoZt8TseHTo7YKA2oleRtRQlMDVJDbMkkISBO8xiNMFBANGSEaApWHIP"
+    "YxiaGYqRccYh+XOOpdYh/gNAan8cT8a12cxudxrb3cojX7he8wzYgRXGv1BldtrjWSNbWj"
+    "tG1HSfZzHCPi8fuJGdqqoGtetbaGxwi0E3cHuanP4F3LmNeVsNZRBrp8Hj3sJtJuU2kLh4"
+    "xlwEiL8FrTvdaAAdvd2OapQSNEYzuh2iniBCwkitMpc1qwpzutCEATDtcjmHqMnU32awWy"
+    "1R6MGsgEosf2YqzY72TfR8ttVMUYMZGPTTrZ8tvPVLqEqmmvo4D4I4jnyo8tz+JZlqDpyr"
+    "4ECvPNMabPI1S6hcgaKEgV0NytZAQlkSex6b+/f/umjdYC1XRJEie2/mN5hA7G7uIvq8TP"
+    "UgYtE+LFxKcP+Of9dagITAunnKV2a28a9lXdzcg7aFp7xSUgDMuBFN41pIHe4vl6h8WgQJ"
+    "bJ6shk7QIYBnvSg71CDvE0L09WMUZs3MbQFjlOttu1s/LLOnzLsCbs1kY4hsMlFLiEMlte"
+    "I+SSwAvWbA+px60IBH5lNWkc5OsRW0HARAABcLg1NTuej7w1xR/8Hkh+n3djJreV2fEwo5"
+    "U1qo8J4jKuoYkL+5SkMq/QUi2TKd+8apPIsBE6Uh7DkFaMaXxYHyNrqS+Q4T2APuYM+piU"
+    "eN2sejUQOC26OS2cYBuyGdXXp1tEAufdOM/mJPseeTLtQNvdyjrOQL4H8RDlvLFfLNmHHK"
+    "S7gJnnjuv/ImuEVzjCbBtnp2Uv9NgWoOYxPoh5o6UfRFt24Fl5aK3ldG4CzSO8/ztr+ayg"
+    "fz9QAI54TXBF/KzwwxwZL3fhAtvtgcoaEIKUkw5SQkT6ggY7xNGKrTz8ngyjW2cSFZEGbo"
+    "IHOXRwr0smPnaIzNGp5lxEGrhPGIJyuN4+plAzM1PdOGoDBSE/yPJ5FpJBYAHx6olFoiBe"
+    "Pel4dbFy9UD0K7S8w51U8zOluLHKTyyimnIvj6cWw9IeTeU/rVssVc1sl+go+6wgKgPTpS"
+    "sridZ8LmQAKAI3mfip7j3gGsjAY/VAl4AhUg0Z+Sp8hji9azxXZ3s+kwsstyZuKEGQsUEj"
+    "YwN1NthNvCOKw4nIiy5AX9JROPc7TxEC0gTXWyPM3yXKrw7yyxRDfO98XKhGRPcQq5kY/S"
+    "aFagj/ZYmjnX2giTPhsRo/+cNeu1qnXX1BvgI56Xb8fJgf5Bo8RG7GtHNITKxeyeeZohYS"
+    "E1/iqEs2FEJi4oYLsXuUtoqCACIEEEe7oY3Zz6LxEVVEJUhgGEK05wzRVk2yD4Iv5Eqm+C"
+    "B3Cs+mS9b4NE9sodOI0VbXeN0YbaX8ZX4J1Faen5/mPfzw07u8XJ2a/NqlVjOYb2zDvQC5"
+    "jK0V4+xErnLBxi9plwbxNXD8PzX7XOUilwFUW1wdUANkD1EmJhleFABx/THj+i4OURRvpd"
+    "sjdZCjjhoxFppaLtrXh51nhJ9uyEqL7j1gRKZdNBLF/UecHRzFZMXWDUWMQe3sFpGQEbZ3"
+    "Vzj+PcQRSS/m7jCKJAOknNVlUMiELKgAQuwQ5JE/9B8ACRSegN6fgM9B9MkuhAI6wyMApz"
+    "E4/GONGRy8xVx85Oz4tj3mu1yNAZKCIW56/GgsSaATNc2bQ8wUYqYQPYOY6SWO+rRjpuZ5"
+    "V4TAk86tny7e/bc+vgvYHyOFUM46IMO59k9yqeZu6OeBk6ROL4lPtdnkqs2pWlzQc/PWHd"
+    "NW5p9h7WEW8l1r72avJa480PaY2q7F3YfKeg+3sMb11uaDqX0TSwAaeEeo/+RzbBqVnc9b"
+    "rmEVAAPpHeQKVvWbCTyrj3kNGBz3jql66WHta4Y1ENh4NxtnG5U1z5aXxsN1GZeCgfluzK"
+    "fmynYxG20bL0AGMn3TKaR50xLSvBFDmilpupuSGshIpvvekKSMUfKHhGbl3rqGAbmoLF62"
+    "Qdc3T3Qst0SYsPWoW+2Txx2s9sljpdXytxrpvshWf3KogQycHAZRloRRcE9cHGlv7ASgeX"
+    "Y9zPmlOFfr3rcXgCdet58Y9Xq37dk5jzu++J159k+dg6CINMFwxz4LbnGMuM9JZF4d6a5i"
+    "IMB9fIA7RmsthU7RfhrKD6NkOTPJB8TDO/d4KNIHF2eCzMCwgHMXmQFk/IULu7PldX+hSf"
+    "e+rggEfuG6rsbWBzIqT4TnIzMqVyaAPsz5Mi5Hi7PmlLIr5wb/cxQ42E0ivFBrgco2V13E"
+    "QGHRXFMNVOKsvJgNzpYimRxI1VhfD7TvCerZnkEJ5IQxY83Vq69awZjgJms61Dv501vc6R"
+    "Jvem7hR7jTG0gDIxiDONRL5nQDRiLSQM4HiRotA3dnUyILYKjproFMnE2GCc9Vl0yB7Xb/"
+    "l4g20Ac2E5+X5JKF6PRiY5Veo7W3xE+k6T+V2yAZFFxeomsG+Ziy/SolSHu9kEDNm8b6ly"
+    "Cl6bbVuRXUoVoBaALbY0dqgyRmPOopSEuICYwPbd98EbCD0D42TbkKbwL3Y1t75Rilmz5b"
+    "AoUROOKWQOB5bNOThDZPWUgiLPHltBZykXcARV00irpAxFy9GEDEHCLmJxwfIGI+EK9FaE"
+    "E7ZC5BAsMQM4eY+fx4PjJmXp0B+rDnywiaS+bNkaPmFaccpUSZEv418nd3Af9zpAGcaj6T"
+    "9OfZDeVA88dGPEM2Y1Kgti4WYEOfjtEnvEuNodJLbgz7YcybiKKDvGG8iYJkvVG0qfZMlU"
+    "bGXreFYfrSRVahzlktTJqHBRU6GauZXRLfypFWhrTiDYotPnaBR/gpiVrI86x8/dg3Jj5/"
+    "8vaJzOuyi7561ddn8K7tYGVTHN0TBwQaIws08lVPNyrRgBkYwoY0LfNTZUCalnM5YJuzuM"
+    "B+uwdQAjfQDTgTt1830cCsCjLMW4+zQg7xSCw5pbQkLalgDOR5kOXD2RC8slMBACIyw25R"
+    "DYhQWEaOSO7sET89E9Fku0WRxOJbhkCChTHQH4OYR+PSnA/MlrX2USIS+D8lln2stkPdA4"
+    "zHEVtbQh22zK6PUHdIoDAC+iMACQ/GSHgQ+Cvissmb19WJd+yj7rGnw7mygxGHwOe+SG+2"
+    "QwAKmgtU0EBpC9NGXeJAEUpbFE+srvBEwIHsRCLs8RCN7eLx0KVYDgZdGujSQDV17jNH76"
+    "qpcj7tg97LEPEIa9Bhmhtz6vhcT2wm7kq1fC3SlUxJHKwKX4ZO0ftneV9vghmnfhVr3td9"
+    "P2jtB/RUpp5n3RBqKE1ki9asE5ttj9mHn0jWy6yzd2lfhhLGvns/ZL1CS6OJqlUeO54mSd"
+    "UzA8lqiC1PZauWF8pAupDn4WhNTmUr31Pfpr3tDOUqk3sqIlFHsPV635+hhN2TmIei2Zb2"
+    "RML+wTt6X/RjCFMjZL77JU3Pt1BLtPMGV10k2lmuv24SbTU7muJo9t6HdKfAdurlC9RBfv"
+    "of0EmPqZOGOnRjqbD2peSOrkEHjEP9Oag/Nxumh9HMQgm6AQI+UIJu2BJ0cIHlXBqzfTbv"
+    "Y2QYNSjoMKaiw+iivqmer7qvFA0UaANAGzDaEpyf/7uTWkGAoULZHBCznJ3iocQsUMdlwD"
+    "ousl1DDyy/Qss7POMKpB0kLLW90mFy+XrVA7Hv827MZLWyqE+u7BDx8UIVd+HvXR0MubBW"
+    "YwRb0i+YRlUcZiDrILs0mr0K4ZUxwyu6vn5w8eu5+FNGiKMdU2nigO9ufC8j5LvabNdRJr"
+    "jxRqCarUXJiq0RSZRtU7uS3cSBaXdMshRQtvbbPO2bDt0NmIFsDxLHYh+X9a9BdRUDPHfj"
+    "uboB7HzjuYIBnrvxDBGus0W4fBLbYSTPzoYdskWews9ZAzbDWxnyQd7DDI2+ZRyev3j28v"
+    "XtK2bHV9eN+hfFgDwWZ5IkirjTjsaB80njqCjgxvMmPxxqPunZVb8lPtkmW21qBdx41D6a"
+    "C7f495BEu5aKj3JqG7C24Ldhc8Pt3YvmoQ/Fzsb2k+1S7yTSxMFeomNBWBTp1pauQHrZQ5"
+    "zXKTdGKdjyqx1bW0vZx4jltYphmW11rTK5lAbzJQiohkJmIASDNEyXNOoFR800TII4pUvi"
+    "BBcRb2dT5J2cC4B39J738y7wvCScoT10u+Ie9HJpm/j4VWCSxkcqkoTrtdpX3cvOT6Usqv"
+    "sWTbGzMWQe/NFsUXrkT+5hsYddzBaHCyC95z4cXqMIs62tayWM9cgKfGylp2grO0X/2UJW"
+    "0fd/UavmWrMIteINtmiytYKVRWJqFZ9eq4k05Ad1Eafsuck0JFVHSypZqb0AapUx1Srg6B"
+    "nXCwG+yZN9k78lyI+lNUSUs0EVArGIppegWBiOODA2oHBinMqJsXPB83JZ7hqBqqPgosjh"
+    "iyLbilz4RCl4VXk8M5K76sEbBjYlTXhxT0dyUKhc4VEfEvJD8vCCcNhEj7mJzmpFsHckW+"
+    "i/v3/7RsVuFdVcOokTW/+xPNLpPs1Rj/riL6vETwvqWMuEeDHx6QP+eX9djL/N4yzVVk1B"
+    "JtRUBDWWQ95BUyYEgabRAk1yebja9hXC8BGs/jzHmEHsO2bLohNIpMtq3isQmHB6HxC8RU"
+    "Sr0NAe0I/7ZEISjqGu/rh6bqoSYYLOtumf6uSeavFOCSokEsUbbd9UHXWia2pijOt5ptjR"
+    "m80OkiCOekKuQE6akOfD2yAz7xZFWZZaRX099QCISBiH48eB7S22iV8J2HYdBgEI25PeBy"
+    "dElH4OItfeIKp1C0sAGhjt6W3DcpQmB4VhwL5XD/UBbsueZjgmnRQTZ6z8Mku+zlD6ZZY8"
+    "rdCWK+M2bM6XXp/UIeuHtK8fy65MJOysxXJmydhZquXMlimea+l0njrmpJolS0VVh7MVF5"
+    "ola2esLjRLvgori7DDTgH9kPYu7ct0xirVVk5mrKzyYiJj5yphNUuyziqynyVjoLLXoovn"
+    "ZDyRpo5JK2dJz3lKos2GKi0JVsXoAocwWg+ev9/6+C5gf3SwwbTH7qfwaXrv5QTry9aKRV"
+    "GtXqssmwdFbHZtxT582yX/CGsPs5DvWsi9xxHFVoSRs5+ba5dXNHCaVemuuOc6jfrApZNR"
+    "9XLZUGJJgEgdg6hiIPzQTS9RcJYxdQTZe6CBjN90K4rWUhOtSXcxF4lMq7PBVTFGkNx2P2"
+    "KIXHAUs4VAehuoJatkBWME6Y25pItlX6st+1qwbPZpONYWBtVRlywM4ubGmuqmG6rCRlQj"
+    "71+ZrRxZJQNqSzSrkP8MOCFUtOZznBQU0Xf1WrcHmKDFHHudg1ROakM394ompHIybdQLjp"
+    "qpnNTxtiOu5zaxUCwPqjqOxWuxadUuQigCwWyhBuEZaxDWp9IeKNaVPkzMlLUu8DeXoMN0"
+    "V57/PsxZr+TjTKkW58wJpkuoqAvUoae6BOFw9KkhgTgcf3qWJTRLo0chorHV6KEWdDrUGC"
+    "JN01kdr1oiTeWwaVcwk0BN9BUPV1dLh+wSYSDHgySSW/H089h3tAIfNRAw3Y3pKEhkcQ81"
+    "y3uAgQz3HzVlC2OkH1uqoy46HyL2Xf18khXMJQfm2JdUXlZWP+B1lIFP+SC7AgjKjRCUQy"
+    "47jmBfVhmvRe5TBZkQnBuaZUpcbOPVCjuyG1fqCGgTZwLXYwdCIewMYedJDMVMA5AQdr7E"
+    "UYew80TCo+dLum04sRDPH4jX7Lrj8oiIvgwKHENQv88IKAT1Jx3UP0/pgzlzfKjygXJu7m"
+    "O60BNNzHbOkKxLk9JNVIdBJploDFOLWqLSEqpOmKVtgKoTOpOCjGOoOoHHJx2qTszbvqHq"
+    "xMQGBKpOQNWJMSVWnRRWUHVimBkEqk5MaOb9LUEe20rrVzsQgLAs9j44NMQ8+ZcsM4h6YG"
+    "ogGJTeByWI1sgnf2g/ME0czFpQBmTaO0ghvKN2JUIZkOMyBifsh0fYhTIgHZMGIxfbUAuk"
+    "Y2kLP8ZRGGGuZcrLXJzG2EWUt2ALBFn7jLLRqzdMc01vZyu9jEXjc9A1S+vKkukzuqDahV"
+    "bqcxytgmjLeIO6F5qFxnIJM9S96P6IuudjbI5rwH5OWxGvp8fS7Doh+4wX5yoYMkcrqwhe"
+    "oHSIfvlEGmKfpuvnuYqIzNjooOSK5tlpvNorc7Sq8tAENWoOEMW3TYyntFgN1Knpr04N+5"
+    "1BRGis1JDrF6p5lXdp3F5XVL7WZ7z0SW47l75G/u4u4H/q6fFPOpyeVdLSomJOf6LdUAPL"
+    "fnDELY67xptU5zLxIEot/BPepR3l2v5yHHJR9P5RyBtW5cR5k3gTBcl6o+hG0B9LZdbsdb"
+    "up7P1yQCFd41aikK5vGNoU0o1dyqAK6Q+VnBblvjJVqbCWkDOuU8BuYF01ZC+D7GXmMM3m"
+    "Ye38RlUM8NyN598S5LOVbmeXvhaNuVmBhsuyEtX/nqv9AnoM0TXweDw/nAnJhPeeOArfjT"
+    "rZThNnggB67Jw7M0mUxh4fN5dFjKDL6j2HV8UnrtaeqxPdSOCQ7WYq2W665DhqHL80h19E"
+    "9zD6M5r3JjTYBSeto32+tDuTe6Qh7848eGWr/RY53M+sR20TB8miWpIaRUdmNIrAdCGdUT"
+    "9O/ZPSGZUG2Qe9F5b+JZp4GqO5Eqyfx2i/Zo1vxRNb6TobcXOZn1ICo1RXIQnLFXoLdThu"
+    "L+oYOAy3j+HXIm0cHK35CgPRuIlE47hBZPwI3Lb4w6ogiGB0i2AsA3dnhyiSzMFqpmsgYL"
+    "ob0+DgFYnu38Gbz+QCy62JuErQiIm49q/MNhMXdTbYTbxWZ6pqqm4iL7qYU0lH4TPuvuY1"
+    "kSbE3hrVxzrMEeqb+UJmJyfYhl56xfeYEICIhhDAlEMAENI+X0h7RdKthBbvVQxwrs85T1"
+    "uA7SSSaf9b8sPWUJACqX1Yjki/A/WrxnwIoH6VemtlrrYD6leZNuqSHZ5w463h0+3oiG2g"
+    "IFoOEo+xeC3vsupWVpIggWFQIvQaYNRUIlRNsg+CL0OLIHmQD1NdLFnj0zyxha4ry401Xj"
+    "dUXhEN4xgRL01wxPP4nXirXjcn4EzYn0yCo7nwNagUI+AJrX9kxh9Eu4VMk1FrcNUqzkib"
+    "2ptK20MqjUW+UFoZ1qpgq4S1NIOyUxMTZGyDT+zz7SOC2ALSBI/W0GHsgrWQTQfUDnFku0"
+    "iywXqOHbJFXjvzQh9NB0fWyYO8s/kNRluw9cWzl69vX3317VUznF0My2Ml9zuMIompK+cS"
+    "AQdeBfH0izwn2ASenVCtOHcDBlPI4SmkoMxl3yJ//j9j/EnDoFt6ANMWTduNkrWuXVcxYN"
+    "SHjTrlK+tHYFkd3qyjoIzICaVcHCcJtVOL1FEG2vkQFeiwm2QpVtnn3GO9Wn8i1DzSb7pM"
+    "LjfqyeVGmFy2KOIZD4845IhI8/jufzL3yH16MiRxoj2lyLDmcT6IEJ39rMghFNtH5eOSo8"
+    "2jvv/pxSU41r7UUgMBy4dZJj5NIh7+4Bkp74lmEVc52jzeh9mxbDG/SOHsuLc75g5ijT26"
+    "FAxbdZAcguQQxGcgOYRRn47kcDLKuNmHHAXVlk7mgg4KryIX//D6rqkmj9dWd/UnQviF4u"
+    "g5ibCjEiHUG1y1iRASysOXtbYHRQgvtoh4VjoiVnCPIyv/+dRCvmvVktRbrH/XWu4szNrt"
+    "LF5k1vKC4FMSPlg0RqCnbj/6H/2fcBizjiy68x3rM2Fv5gb4TVWgZX2OCNuY8W54rRj2Wz"
+    "mGDxH23W/qxDwId3/+6McbbEWBhy1C2ffB/MpiwizZogH79DUDuwHrj233rA26x1YcsJ8Q"
+    "UdbcZZ/N62xF3+xLolt8a5mSIJFkfMjGJRulq3yUmHH9ClqNM2o1MDdQLZdOAegnzcB5yR"
+    "3+mFu3+a4k11EGJs0YIJcD1c3UV0GAMl529yDQM9qiPZhrl9g0oaGHdln5HQ2Sm7gRk70s"
+    "5jsLh4wjPRVAiYALzr17G0NE6eeAHRk2iG50rF8AmjjXDPEA8BPCvWSiac10VIJGzHRU7P"
+    "9mm+gI3HxqQzfLzXeSQ6o/10ml8qbEb1Kvy6l2mtxnmpR9w87XNlJg6m2g1hYjmkR4yz0c"
+    "gi+kC6BLYs66Y6rSQ14lDxwIYzoQBP41Jz0Z3sCpb75TnRjIojsaBx5x7GWo8UA1UCAKl4"
+    "jCCTqG2SYMqBWp3WAUxXYknaCUxNZBQKssPwUNCfv5QbTTJVcGBYpFitP8yTHehpyDvHiz"
+    "xsU+GfwC7/Q91rjTF/y+Y7/fppwvhdZYadVSLJi1aNafMVlvZEfkNmMuQRdowjdX151NeH"
+    "MMuxtgtxu7yy3RnYUzxAXyqjPxhqxjmzqBbJFr0UpVQTDVSnYQXhC49tpLnEB24VTJrIAD"
+    "ckVyQTkNyulJDMVMnetdlNPbLKuTzeVpkXtEgdYmFiYySOE5nouEG95RGTybQOAXEnhqrM"
+    "q9J/Csz6U9UJyn63u3729eU3BXnqVrUJd8qfsJoA9zvpR0qc1Zc0plL29xRJzNQhKnz9+5"
+    "aovRo7LNkLUvIYA+ZgD9HkdUM59FBQICuI4CuFASUW1JIRfKIqkmsDtIlhB+C1+66VILbC"
+    "uQ8RW25/GI9KalPavw7Mv/A2NoLys="
+)
@@ -0,0 +1,215 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "upload_sessions" (
+    "id" CHAR(36) NOT NULL PRIMARY KEY,
+    "file_name" VARCHAR(255) NOT NULL,
+    "file_type" VARCHAR(100) NOT NULL,
+    "description" TEXT,
+    "total_size" BIGINT NOT NULL,
+    "chunk_size" INT NOT NULL,
+    "sha256" VARCHAR(64),
+    "created_at" TIMESTAMP NOT NULL,
+    "updated_at" TIMESTAMP NOT NULL,
+    "lab_test_id" INT REFERENCES "lab_tests" ("id") ON DELETE CASCADE,
+    "patient_id" INT NOT NULL REFERENCES "patients" ("id") ON DELETE CASCADE,
+    "scan_id" INT REFERENCES "scans" ("id") ON DELETE CASCADE,
+    "uploaded_by_id" INT NOT NULL REFERENCES "practitioners" ("id") ON DELETE CASCADE
+) /* Resumable upload in progress; finalized into a MedicalUpload once every chunk arrived */;
+CREATE INDEX IF NOT EXISTS "idx_upload_sess_updated_5ae184" ON "upload_sessions" ("updated_at");
+        CREATE TABLE IF NOT EXISTS "upload_chunks" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "number" INT NOT NULL,
+    "size" INT NOT NULL,
+    "session_id" CHAR(36) NOT NULL REFERENCES "upload_sessions" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_upload_chun_session_57889c" UNIQUE ("session_id", "number")
+);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "upload_chunks";
+        DROP TABLE IF EXISTS "upload_sessions";"""
+
+
+MODELS_STATE = (
+    "eJztXWuT2zaW/SssfdlsVcex2912ZjM1Ve1HJp7xI2W3Z6fGSbHQJCRhTZEMQbajzPi/L8"
+    "CH+ABAERJJkdD94oeEA0kHl3jce3DvvxebwMUefXAThgHx4w3248X/WP9e+GiD2T9kb19Y"
+    "CxSG5Zv8hRjdeWl7VDZM30B3NI6QwztdIo9i9pKLqRORMCaBz171E8/jLwYOa0j8VflS4p"
+    "PfEmzHwQrHaxyxNz79yl4mvot/x5T/9xOHxUFkE5d/lotinH4Zwr47a/ppEaKYsG9Sff9X"
+    "3kf42V4S7Lm1n5o1Sl+3422YvvbKj39MG3L4ne0EXrLxy8bhNl4H/q41ydhZYR9H7LN493"
+    "GU8N/Mf1JOUUFD9vPKJtnvqmBcvESJF1c4urPL1xa2/fbdrf3h5a1tLzRYdQKfjwjh48N/"
+    "/Yp/hW8vH109vfr+8ZOr71mT9GvuXnn6NfvokpgMmNLz9nbx9WtGLcpapANTklqMSZ3WF+"
+    "xVOa9F+waz/GU+rA+K96scF4y2kVy8ULJcmuMINLdw+OLm9mVKYklaasACac/XKJKTVrRv"
+    "kMa+wAypWmzQ77aH/VW8Zv+9bmHuHzfvn/908/6b6//mHxewaSabg97mb1zyd+rMugljgn"
+    "+h7k96FbL/ee+L4McPJ/3Al4zSGMUJ1bHWEjGevS6os8Zu4uHi6wxstpcPO9jt5UOl4fK3"
+    "6jxHGFGZ3d7i3xWGWyKMmBdaCL19+c9b3vOG0t+8KpHfvLn5Z8rxZpu/8/rd278WzSvEP3"
+    "/97lmDcD+IscSu1XzvAAfRnS/658r2MvC84IudhCLjz4LAw8iXk17DNYi/Y8ChDH33yrjc"
+    "P3v37nWN+2evmuR+fPPs5ftvHqUDwRqRGMsnbofND4wTG8Xy/RnfVMg5ryPbdmrFxmRmUw"
+    "2fOt13vrfNn8u2h+HVm5cfbm/e/FwbFb6n4+9c1p6G4tVvnjTm/V0n1v++uv3J4v+1/vXu"
+    "7cuU3oDGqyj9xLLd7b8W/DuhJA5sn5k/civnhuLVgrXaqCehe+Co15Ew6lMZ9YKjyrDn37"
+    "6y7a0ek7vue6uY8Ta+kz/rlqzWvQsdaa2DgNecV+6VWX6WuhByxkSOfwwiTFb+3/E2pfoV"
+    "+1LId2Qn4dyL9XPZ08wo/lqYUfFqOd1H6MvOmdWwLsYA+9042wE8v/nw/ObFy4VkYuiDWu"
+    "7kI/xn4RkfLvbyW5sU5fRyS75DzucvKHLtmknzd4LLoPHKrq341uZy03wF+WiV0sN/B//W"
+    "Of/PvOBuIXHcpq9ftHls71iLbq7axfPAj5l1fcsWHrY2UexaS+Jhi7KjPvv33dbC9zjaWk"
+    "noBcj9jnGVcD+w9YXEaytes4bsu1kffrr59vL6yYNFY2D67f0X/xc/wks2oglrQ2jawk82"
+    "dziygqX1BrvEQd7HtC8L+W7xyoui2yj4Qq3Ul82+noVYH/EPv/gUY4sPGPbd7zhxNmXmgB"
+    "+E2/Tn7PdYg/N5TOczMx1mC1q+qR2iH5/JaemtuaSeXHVwST25Urqk+FsN1x/5Q+KmfkZW"
+    "SsMtECZte/50efn48dPLh4+ffH999fTp9fcPd2YsvtVmz89e/ZWbdI1+cdO5m9Q05osaZj"
+    "zu5+LCBk+Imup5nolVnhDhlHGazdpzj/h8s/E2SPeOwqat9n7r5s3JW9o753OHXVyOsVJM"
+    "uvlhO0Ac3adhLiruy/a37xKqrx9NeF82BOTH3xOlxKf8aGyLaiAjokmNKHOXcN21Olx3LY"
+    "TrSvvWXFJqQANXlJmsIBKvquhMp8nd/2EnJveSUVbHCesoCBbqBwuDQ2gPgPXjWEeUYko3"
+    "UlesmvY6CnjX5z30kJbuo2gPXB8m+uBe4FjTyps4I/ZIoxt6RIKIxFudnWkVM6KcLAqSmP"
+    "h4McrutH8xGSUrH0tOV61SmxIEOhsNnU1G20FngQa0h9PAjKb3uR0G2F+MRN2HqoKCp0rj"
+    "qUp547tKW18YK8PCZkl/vQa/uXoBN8tvDgpCk0e9i4KQvbfWVRDWMCaFfHuLPG4y0Qlbh5"
+    "wgcvXYlWIPYnliyxjINKfLK8g0TyLTrD/rPVCcq93e7/qb1xTRlWfpHLmf7mzh6sOSz0MV"
+    "W1vop6SKfYGIt/2APEzfB56XhAuJ2EJoc9EmuHB5a5vy5nZUtt8ruvgZR9+6aHthhewfqV"
+    "kSH1suoSH2KVeYxkHMkNYdXrPBzvWs7EOsCIdBFItq2WM75ALZj9mG3CJ+KaBlv8On3GoD"
+    "/iKKiy658sMKo/JXXVg0SGFZh1bA9r2/+GtE2Sdb1EFZnxlHmZqWfQyJqcU/02KfssIq0e"
+    "wnRnPq0S1+FzetX0FKe9I8DhK3fFsaB5lH/ryyOPyWID+WhjOU1liFgE5T9PnJda8vsEM2"
+    "yFM5+xTCVzdDPcjRcyO3zRZfPn/15ub1N48uLy4bjtTC63clhISqU7vk2rv6oNTEgd1KT/"
+    "n5Ktad2AYKjqD7j6AFZX0dkPKuZkay1uGoNLBJ7dsJWvkBJXQh27Dv3mzfqWfNuqqic6eD"
+    "VYPVd9yyFvrK5zz9DcieR92/Ese1Hz1kxLlawucGzIQoYV1b8qiLtuSRWlvySNhIuMXjaa"
+    "evaJAtIo2QUTXEPNddUpqxVmo5z7WY1mzHnK6yX0QayHn/8n72aThu0fQoJMg11JGH44lN"
+    "K3pnY3ZoCLz7VlmU6ipjA3jOLFJ+I15TMFnFmLecDSCVnEd+Q7S72jBHksVrjF21XCLSBK"
+    "MGJddkhmKmmh5Qcp3jqHdRchXuC9e+22pmhBOR4JUEVReouubOK6i6QNU1I54PVHVVl68+"
+    "7Pk8tF2SRX9KkaIf0YZ4258Iz8O3XUiiRfUGF20Ro2Xa1F5X2nYOG2VYKzdNq9KHNIakbq"
+    "4ZUIIw0qhhpAh7WdajNZFkqlf7hJo4cLJ3cLKzj3OJvFqLmukayECaB4kfsbnVDpZ2Gp/Q"
+    "mDWaMDinSERrjCMUs++J2PDpUVuFAbWSvI0ooakBKshtmSQEpAle4xEmCoiGjBANgcpDEP"
+    "uYxFDM1AsOsY9zHPUusQ9wGoPTeGL+tS5O49O41l5t0Ir9wveYZsQIrrV6g4s21xrJmtpR"
+    "2rajJPsFjhHx+P3EDG1V0DWvWlvDQwTaibuF3NQn8K5lzOtKWOsoA10+jx52E2m3qbSFQ8"
+    "ZdwEiL8ErTvdaAAdvd2OapQSNEYzuh2iniBCwkitMpc1qwpzutCEATDtcjmHqMnXX2awWy"
+    "1R6MGsgEosf2YizZ72TfR8ttVMUYMZGPTTrZ8NvPVLqEqmmvo4D4A4jnyo8Nz+JZlqDpyr"
+    "4ECvPNIabPI1S6hcgaKEgV0NytZAQlkSex6b99ePe2jdYC1XRJEie2/mN5hA7G7uLPy8TP"
+    "UgbdJcSLiU8f8M/7y1ARmBZOOUvt1t407Iu6m5F30LT2iktAGJY9KbxrSAO9xfP1DotBgS"
+    "yT1YHJ2gUwDPakB3uJHOJpXp6sYozYuI2hLXKcbLdrZ+WXdfiWYU3YrY1wDIdLKHAJZba8"
+    "RsglgRes2B5Sj1sRCPzKatI4yNcjtoKAiQAC4HBranY8H3hrij/4PZD8Ie/GTG4rs+N+Ri"
+    "trVB8TxHlcQxMX9ilJZV6jO7VMpnzzok0iw0boQHkMQ1oxpvF+fYyspb5AhvcA+pgT6GNS"
+    "4nWz6tVA4LTo5rRwgk3IZlRfn24RCZx34zybk+x75Mm0A213K+s4A/kexEOU88Z+sWQfsp"
+    "fuAmaeO67/i6wRXuIIs22cnZa90GNbgJrH+CDmje78INqwA8/SQystp3MTaB7h/d9Zy2cF"
+    "/fuBAnDEa4JL4meFH+bIeLkLF9huD1TWgBCknHSQEiLSZzTYIY6WbOXh92QY3TqTqIg0cB"
+    "M8yKGDe10y8bFDZI5ONeci0sB9whCUw/X2MYWamZnqxlEbKAj5QZbPk5AMAguIV08sEgXx"
+    "6knHq4uVqweiX6O7W9xJNT9Tihur/MQiqin38nhqMSzt0VT+07rFUtXMdomOss8KojIwXb"
+    "qykmjF50IGgCJwk4mf6t4DroEMPFYPdAkYItWQka/CZ4jTu8ZzdbbnM7nAcmvihhIEGRs0"
+    "MjZQZ43dxDugOJyIPOsC9CUdhXO/8xQhIE1wvTXC/F2i/Oogv0wxxPfOh4VqRHQPsZqJ0W"
+    "9SqIbwX5Y42tkHmjgTHqvxkz/stKt12tUX5CuQo27Hz4f5Qa7BQ+RmTDuHxMTqlXyeKWoh"
+    "MfE5jrpkQyEkJm64ELtHaasoCCBCAHG0G9qY/SwaH1BFVIIEhiFEe8oQbdUk+yD4TK5kig"
+    "9yp/BsumSNT/PEFjqNGG11jdeN0VbKX+aXQG3l+flZ3sOPf3+fl6tTk1+71GoG841tuBcg"
+    "l7G1ZJwdyVUu2PiYdmk0XzbN0jUdSVjG1IcySaohhA0smEjniVwWJNdNVFtc7JFPZLNOpr"
+    "4ZXkUBQogxhRAuDlEUb6T7SXVUqI4aMXicWi7aFdSdpySCrslSi+4dYESmXTQSxf2H6B0c"
+    "xWTJFlpFUEYdHRCRkEK399gB/j3EEUlvMm8xiiQDpJzVZVBIHS3IJkLsEOSRP/QfAAkUno"
+    "Den4AvQfTZLpQVOsMjAKcxOPxjjRkcvMFcreVs+bY95rtcjQGSgiHQfPho3JFA5F8dZs6b"
+    "Q5AZgswQboQg8zmO+rSDzOZ5V4RInc41qS7hkHc+vg3YHyPFnE46IMPFQo5yqeZ++xeBk6"
+    "ROL4lPtdnkos2pWtxodPPWHfN85p9h7WAW8l1rF5eoZfrc0/aQYrjFZZHKeg/X1sb11uaD"
+    "qX11TQAaeKmq/2x9bBqVnc9b7q0VAAPpHeTOWvWbCTyrj3kNGBz3DikT6mHte5k1ENh4Nx"
+    "tnG5UVTy+YCgh0GZeCgfluzKfmynYxa20bL0AGMn3dKaR53RLSvBZDmilpupuSGshIpvve"
+    "kKSMUfKHhGbl3rqGAX2tLF62RpfXT3Qst0SYsPWoW+2Tqw5W++RKabX8rUZ+NLLRnxxqIA"
+    "Mnh0GUJWEU3BMXR9obOwFonl0Pc34pztW6CQoE4JH5CSZGvV56AnbO444vnmSA/VPnICgi"
+    "TTDcsc+CGxwj7nMSmVdHuqsYCHAfHuCO0UpLoVO0n4bywyhZzkwSKPHwzj0eivTBxZkgMz"
+    "As4NxFZgApkuGG82x53d0A073gLAKBX7jfrLH1gRTUE+H5wBTUlQmgD3M+j9vk4qw5pXTU"
+    "ucH/HAUOdpMIL9RaoLLNRRcxUFg011QDlTgrr/6Ds6VIJgdSNdbXA+16ggLAJ1ACOWHMWH"
+    "P1CtJWMCa4yZoO9U7+9BZ3usSbnlv4Ae70BtLACMYgDvWSOd2AkYg0kPNBokZ3gbu1KZEF"
+    "MNR010AmzibDhOeqS6bAdrv/S0Qb6AObic9LcslCdHqxsUqv0dob4ifSfKnKbZAMCi4v0T"
+    "WDfEzZfpUSpL1eSKDmTWP9S5DS/OTq3ArqUK0ANIHtsSO1QRIzHvUUpCXEBMaHtm++CNhB"
+    "aB+a112FN4H7sa29cozSzTcugcIIHHBLIPA8tulJQpvneCQRlvhyWivfyDuAKjgaVXAgYq"
+    "5eDCBiDhHzI44PEDEfiNcitKAdMpcggWGImUPMfH48Hxgzr84AfdjzeQTNJfPmyFHzilOO"
+    "UqLMof8G+dvbgP850gBONZ9J+vPshnKg+WMjniGbMSlQWxcLsKFPx+gz3qbGUOklN4bdMO"
+    "ZNRNFB3jBeR0GyWivaVHumSiNjr9vCMH3tIqtQ56wWJs39ggqdjNXMLolv5UgrQ1rxGsUW"
+    "H7vAI/yURC3keVa+fuwaE58/ebtE5nXZRV+96uszeNd2sLQpju6JAwKNkQUa+aqnG5VowA"
+    "wMYUOalvmpMiBNy6kcsM1ZXGC/3QMogRvoBpyJ26+baGBWBRnmrcdZIod4JJacUlqSllQw"
+    "BvI8yPLhrAle2qkAABGZYbeoBkQoLCMHJHf2iJ+eiWiy2aBIYvEtQyDBwhjoj0HMo3Fpzg"
+    "dmy1r7KBEJ/B8Tyz5U26HuAcbjgK0toQ5bZlcHqDskUBgB/RGAhAdjJDwI/CVx2eTN6+rE"
+    "W/ZR99jT4VzZwYhD4HNfpDfbIQAFzRkqaKC0hWmjLnGgCKUtiidWV3gi4EB2IhH2eIjGdv"
+    "F46FIsB4MuDXRpoJo69Zmjd9VUOZ/2Qe95iHiENWg/zY05dXyuJzYTd6VavhbpSqYkDlaF"
+    "L0On6P3zvK+3wYxTv4o17+u+H7TyA3osUy+ybgg1lCayQSvWic22x+zDjyTrVdbZ+7QvQw"
+    "lj370fsl6jO6OJqlUeO5wmSdUzA8lqiC2PZauWF8pAupDn4WhFjmUr31PfpL1tDeUqk3sq"
+    "IlEHsPVm15+hhN2TmIei2Zb2SML+wTv6UPRjCFMjZL77mKbnW6gl2nmDiy4S7SzXXzeJtp"
+    "odTXE0e+9TulNgO/XyBeogP/0P6KTH1ElDHbqxVFi7UnIH16ADxqH+HNSfmw3Tw2hmoQTd"
+    "AAEfKEE3bAk6uMByKo3ZLpv3ITKMGhR0GFPRYXRR31TPV91XigYKtAGgDRhtCc7P/91JrS"
+    "DAUKFsDohZTk7xUGIWqOMyYB0X2a6hB5Zfo7tbPOMKpB0kLLW90n5y+XrVA7Ef8m7MZLWy"
+    "qE+u7BDx8UIVd+HvXewNubBWYwRb0i+YRlUcZiCrILs0mr0K4ZUxwyu6vn5w8eu5+FNGiK"
+    "MdU2nigO9ufN9FyHe12a6jTHDjjUA1W4uSJVsjkijbpnYlu4kD0+6YZCmgbO23edo3Hbob"
+    "MAPZHiSOxT4u61+D6ioGeO7Gc3UD2PnGcwUDPHfjGSJcJ4tw+SS2w0ienQ07ZIM8hZ+zBm"
+    "yGtzLkg7yHGRp9yzi8ePn81Zub18yOLy4b9S+KAbkSZ5IkirjTjsaB81njqCjgxvMmPxxq"
+    "PunZVb8hPtkkG21qBdx41D6aC7f495BE25aKj3JqG7C24Ldhc8PN7cvmoQ/Fztr2k82d3k"
+    "mkiYO9RMeCsCjSrS1dgfSyhzitU26MUrDlVzu0tpayjxHLaxXDMtvqWmVyKQ3mSxBQDYXM"
+    "QAgGaZjOadQLjpppmARxSpfECS4i3tamyDs6FwDv6APv533geUk4Q3vodsU96OXSNvHx68"
+    "AkjY9UJAnXa7WvupedH0tZVPctmmJnY8g8+KPZovTIn9z9Yg+7mC32F0D6wH04vEYRZltb"
+    "10oY65EV+NhKT9FWdor+wUJW0fd/UavmWrMIteI1tmiysYKlRWJqFZ9eq4k05Ad1EafsuM"
+    "k0JFVHSypZqb0AapUx1Srg6BnXCwG+yaN9k78lyI+lNUSUs0EVArGIppegWBgOODA2oHBi"
+    "nMqJsXPB83JZ7hqBqqPgosj+iyKbilz4SCl4VXk8M5K76sEbBjYlTXhxT0dyUKhc4VEfEv"
+    "JD8vCCcNhEj7mJzmpFsHckW+i/fXj3VsVuFdVcOokTW/+xPNLpPs1Bj/riz8vETwvqWHcJ"
+    "8WLi0wf88/6yGH+bx1mqrZqCTKipCGosh7yDpkwIAk2jBZrk8nC17SuE4SNY/WmOMYPYd8"
+    "yWRSeQSJfVvFcgMOH0PiB4g4hWoaEdoB/3yYQkHENd/XH13FQlwgSdbdM/1ck91eKdElRI"
+    "JIrX2r6pOupI19TEGNfzTLGjN5sdJEEc9YRcgRw1Ic+Ht0Fm3g2Ksiy1ivp66gEQkTAOh4"
+    "8D21tsEr8SsO06DAIQtie9D06IKP0SRK69RlTrFpYANDDa09uG5SBNDgrDgH2vHuoD3JQ9"
+    "zXBMOikmTlj5ZZZ8naD0yyx5WqINV8at2ZwvvT6pQ9aPaV8/lV2ZSNhJi+XMkrGTVMuZLV"
+    "M819LxPHXMSTVLloqqDicrLjRL1k5YXWiWfBVWFmGHnQL6Ie192pfpjFWqrRzNWFnlxUTG"
+    "TlXCapZknVRkP0vGQGWvRRfPyXgkTR2TVs6Snmxat9mRmh5vT9m8/iHry1TGTlNEbjZUaY"
+    "nWKo9p4BBG616PxTsf3wbsjw5Pbdpjd7/FNOMdcoL1hX7FNkKt96tsNPbK/uzaHmf//aD8"
+    "I6wdzEK+ayH3HkcUWxFGzm41q1330cBp1vG74L7+NE4G13RGVRhmQ4klITV11KaKgYBNN4"
+    "VJwVnG1AFk74AGMn7drYxcSxW5Jt3FXCQyrc6fV8UYQXLbjZIhsudRzBYC6f2pljycFYwR"
+    "pDfmki6Wfam27EvBstmn4VhbSlVHnbOUipsba6qboKkKG1G/vXtltgJulXCqLTWvQjA14I"
+    "RQUefPcVJQ6BXUa90OYIJ6dex1DpJfqQ3d3EutkPzKtFEvOGomv1JHKA+40NzEQnlBqIM5"
+    "Fq/FplW7bKMIBLOFqo0nrNpYn0p7oFhXLDIxU9ZKedBcgvbTXXn++zBnvSKZM6VanDMnmG"
+    "CiosdQh57qoo390aeGaGR//Ol5lgIujR6FiMZWo4da0GlfY4g0TWd1vGiJNJXDpl3zTQI1"
+    "0Vc8XCUyHbJLhIEcD5J6b8kT9mPf0Qp81EDAdDemoyCRxT3ULO8ABjLcf9SULYyRfmypjj"
+    "rrDJLYd/UzcFYw5xyYY19Seb1b/YDXUQY+5YPsCiAoN0JQDrnsOIJ9WS3BFrlPFWRCcG5o"
+    "lilxsY2XS+zI7qipI6BNnAlcjx0IhbAzhJ0nMRQzDUBC2PkcRx3CzhMJj54uTbnhxEI8fy"
+    "BeswuidwdE9GVQ4BiC+n1GQCGoP+mg/mmKRcyZ4321IpRzcx/ThZ5oYrZzhmRdmpRuojoM"
+    "MslEY5ha1BKVllCnwyxtA9Tp0JkUZBxDnQ48PulQp2Pe9g11OiY2IFCnA+p0jCmx6qSwgj"
+    "odw8wgUKdjQjPvbwny2FZavz6EAIRlsffBoSHmyb9kmUHUA1MDwaD0PihBtEI++UP7gWni"
+    "YNaCwinT3kEK4R21KxEKpxyWYzlhPzzCLhRO6ZhmGbnYhuopHYuB+DGOwghzLVNeGOQ4xs"
+    "6iIAhbIMjKZ5SNXu9immt6O1vpZSwan4KuWVpXlqea0QX1QbSSxeNoGUQbxhtUCtEszZZL"
+    "mKFSSPdH1D0dY3NcA3Zz2pJ4PT2WZldW2WW8OFWJlTlaWUXwAsVW9AtO0hD7NF0/T1V2Zc"
+    "ZGB0VqNM9O41WrmaNVlYcmqOoDVX16Ni2+0WSWlZb3gco+/VX2Yb8ziAiNlap7/dI+r/Mu"
+    "jTsdiFrh+hqRzn1tJ/k3yN/eBvxPvRsMRx3nTyoCatF9pz/RbuinZT844hbHgwlNqnNhfR"
+    "ClFv4Zb9OO8tsQ5TjkMvLdo5A3rAqw8ybxOgqS1VrRjaDYlgrT2et2Uwv9dY+mvMatRFNe"
+    "32K1acob+7pBNeWfKllAyp14quthLSHLXqcQ58BKdMj3BvnezGGazcPaGaGqGOC5G8+/Jc"
+    "hnK93WLr1TGnOzAg3XiyX3JHZc7RbQQ4iugcfj+eFMSCa898RReLvU6YmaOBMk42NnKZpJ"
+    "ajn2+Li5kGQEJVvvWc8qUQS1Wl+dGkgCh/xAU8kP1CUrVOP4pTn8IrqH0Z/RvDehwS44aR"
+    "3t0yUqmtwjDZmK5sErW+03yOF+Zj1qmzhIr9WSBio6MAdUBKYLCaD6ceoflQCqNMg+6D2z"
+    "hDnRxBM/zZVg/cxPuzVrfCue2ErX2Yiby/yUUj6lShRJWK5QqKjDcTsZzMBhuF0MvxZp4+"
+    "BoxVcYiMZNJBrHDSLjR+C2xR9WBUEEo1sE4y5wt3aIIskcrGa6BgKmuzENDl6R6P4dvPlM"
+    "LrDcmrqsBI2Yumz3ymxzl1Fnjd3Ea3WmqqbqJvKsy1+VdBQ+4+5rXhNpQuytUa+twxyhzm"
+    "Ug5MJygk3opZeiDwkBiGgIAUw5BAAh7dOFtJck3Upo8V7FAOf6nPNED9hOIpn2vyWjbg0F"
+    "SaPah+WAhEVQ8WvMhwAqfqm3VuZqO6Dil2mjLtnhCTfeGj7djo7YBgqi5SDxGIvX8vavbi"
+    "0qCRIYBiVCrwFGTSVC1ST7IPg8tAiSB3k/1cWSNT7NE1vourLcWON1Q+UV0TCOEfHSlFA8"
+    "8+GRt+p1syjOhP3JpISaL18nSnQxF8IG1a4EPGf6T2y2CKLtQiZiqTW4aFWzpE3tdaXtPl"
+    "nLIt9ZWBnWqmCrhLU0g8pmE1OwbILP7PPtA6L+AtIEF+DQcf+CtZBNB9QOcWS7SLIjfYEd"
+    "skFeO/NCH02PUNbJg7yz+Q1GW3T65fNXb25ef/P4ohn/L4blSsn9FqNIYurKuUTAgRtGdB"
+    "cgzwnWgWcnVEsY0IDBFLJ/Cikoc9m3yJ//Lxh/1jDolh7AtEXTdqNkpWvXVQwY9X6jTvnK"
+    "+hFYVseD6yioVHNEtSDHSULtXCx1lIF2PkSRQ+wmWRZf9jn3WK+cpAg1j/TrLpPLtXpyuR"
+    "Ymlw2KeIrIAw45ItI8vvufzD1yn54MSZxoTykyrHmcD6LcZz8rcgjF9kEJzORo86jvf3px"
+    "CY61bwHVQMDyfpaJT5OIx4t4Cs97olknWI42j/dhdiwbzG+eOFvu7Y65g1hjjy4Fw1YdNJ"
+    "qg0QS1Hmg0YdSno9GcjJRw9iFHQeamk+qhgySuKF4wvCBuqtn2teVw/YkQMuHG83Xif15I"
+    "JAjVty/aBAi5msThLQdIq/FpketUclr8ZMMzEf0KeoMT6g3yQehObAkADbHsbjv5Q+J2UI"
+    "ey8+bApYzL2nRRZ/Tjx1cvFJTWUA1ik4S4Dzh2hvS2cJceqh5nO7XqHiz9pa0id1rK/Y4U"
+    "B5taJ6u5ttfta0qJtOojoNwJVIZo716gqizdr0bk2uQN78HK4BbxrTAKuDXSH6wl8ZHH5j"
+    "v+chxYyKopdK2AWZeF73G0tdIdiIWiiNzj7AGvihkH+5QuqcAqx0m93F7qCav/iWr/jqVy"
+    "cTr9JP7H1SluTe+Zudq2LlwjntWsEshuKQtTBRmYgmoQf3NKmm5ApQYykOlhCvDUK5F19S"
+    "g3YOBX1vcrx0GqK5Bu35+RlXIHX8eZtI//0+Xl48dPLx8+fvL99dXTp9ffP9xt6MW32nb2"
+    "z179lW/ua0Mg7vbT5VgxAEr26yCT2O/vFLVGl9dPdGbuEmHCRFKftZ9cdZi0n1wp52z+Fg"
+    "SkzA5NQEDqHEe9S0CKUW7H+ICkIVUUSPohachoiz/Pba1FagUBhioSuruhrpuERQSCwUIO"
+    "lrGDzgpT7oPf80jBIj7GnTKwpOt/Dyy/Rne3eMaizC7JV6p7pf3k0rxKyJHEFsVGzGS1sq"
+    "gfns6m1IU0vGPaOUZ2WhRDJolBU4x8pDh6QSLsqFKM1BtctEb1KE9OUGu7N6j3coOIZ6WM"
+    "W8E9jqx8naEW8l0rrEz71GL9u9bdNg+wsZPU2vKC4HMSPhCieP10+4v/C3vIw5jHAOnWd6"
+    "wvhL2Zr/XfVdck60tE2MTCu6FsZmC/lWP4EGHf/a5OzINw+8MvfrzGVhR42CKUfR/MM7gn"
+    "zFQtGrBPXzGwG7D+/CC21ugeW3HAfkJEWXOXfTZhoxt9R0PME67EW4sLxx8ogoyfsnHJRu"
+    "kiHyX2tIIy6pTKKMwNVMdtugP0E+w6LbnDBxXrNt+V5DrKwLDiAKVtqG7h0goCDqmyVKyB"
+    "ntEW7cFcu2SeIDT00FZb2dHEjVj7ajHfWThkHOnl+CgRUO+hFrbo4y5hiCj9ErAjwxrRtY"
+    "71C0AT55ohHgB+QriXaT7aCr+VoBELvxX7v9nWfYOYqdrQzYqZHnXdrD/XyT94rpgP7LSf"
+    "sdfwm1TevWhzmtxnGWd2DTsnZU2BqbeBWhuMaBLhDfdwCL6QLoAu4uR6BKDSQ1Z0DooRj+"
+    "pAEPjXnPRkeAOnvvlOdaIqiG5pHHjEse9CnZB7HQVhd0nKR4IOYbYJA2pFatcYRbEdSSco"
+    "JbF1ENAqK9dDQ8J+fhBtdcmVQYFikeK0nHyMNyHngK2UkgW2LW23DH6GGbuvNDJ2B79v2e"
+    "+3KedLkUlQadVSLJi1aNZfMFmtZUfkNmMuQWdowtcXl51NeH0Iu2tgtxu7dxuiOwtniDPk"
+    "VWfiDVnHNnUC2SLXoo+ugmCqlewgvCBw7ZWXOIEsnbySWQEH5IrkQl7EMe+vwjU0tWHP07"
+    "ne5RraJktuYXN5WuTqqTykWJjI4HLSeC4SbngHFTRuAoFfuEujsSr3fpemPpf2QHGetej9"
+    "rr95TcFdeZauQV3KR+8mgD7M+TyuLomz5pSSl93giDjrhSROn79z0RajR2WbXnOWggL/hA"
+    "H0exzJcxOqZXAVCAjgOgrgQklEtaVAZCiLpJrA7iAJvXiNDemmSy2wrUDGV9iexiPSm5b2"
+    "pMKzr/8PmhtZsQ=="
+)
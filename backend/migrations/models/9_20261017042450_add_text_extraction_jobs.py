@@ -0,0 +1,205 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "text_extraction_jobs" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL,
+    "force" INT NOT NULL,
+    "attempts" INT NOT NULL,
+    "available_at" TIMESTAMP NOT NULL,
+    "last_error" TEXT,
+    "created_at" TIMESTAMP NOT NULL,
+    "document_id" INT NOT NULL UNIQUE REFERENCES "medical_documents" ("id") ON DELETE CASCADE
+) /* Queued text extraction for a MedicalDocument; see backend\/text_extraction.py */;
+CREATE INDEX IF NOT EXISTS "idx_text_extrac_availab_7c7e26" ON "text_extraction_jobs" ("available_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "text_extraction_jobs";"""
+
+
+MODELS_STATE = (
+    "eJztXWmT2za2/SssfXl5VR3HbnfbmZepqWovmTjjJc/dnjc1TooFkZCEMUUoXNpWZvzfH8"
+    "BFXABQhERSJHS/eJFwIOngEsu9B/f+e7amLvbCBzebDSV+tMZ+NPsf698zH60x+4fs7Qtr"
+    "hjab4k3+QoTmXtIeFQ2TN9A8jALk8E4XyAsxe8nFoROQTUSoz171Y8/jL1KHNST+sngp9s"
+    "nvMbYjusTRCgfsjY+/sZeJ7+IvOOT//chhEQ1s4vLPclGEky9D2HdnTT/ONigi7JuU3/+N"
+    "97H5ZC8I9tzKT00bJa/b0XaTvPbKj35MGnL43HaoF6/9ovFmG62ov2tNUnaW2McB+yzefR"
+    "TE/Dfzn5RRlNOQ/ryiSfq7ShgXL1DsRSWO5nbx2sy23767s29f3tn2TINVh/p8RAgfH/7r"
+    "l/wrfHv56Orp1fePn1x9z5okX3P3ytOv6UcXxKTAhJ63d7OvX1NqUdoiGZiC1HxMqrS+YK"
+    "/Kec3b15jlL/NhfZC/X+Y4Z7SJ5PyFguXCHAeguYHDFzd3LxMSC9ISAxZIe75CgZy0vH2N"
+    "NPYFJkjVbI2+2B72l9GK/fe6gbm/37x//tPN+2+u/5t/HGXTTDoHvc3euOTvVJl1Y8YE/0"
+    "Ltn/QyZP/z3hXBjx+O+oEvGA0jFMWhjrUWiOHsdRY6K+zGHs6/Ts9me/mwhd1ePlQaLn+r"
+    "ynOAUSiz2zv8RWG4BcKIeaGB0LuX/7jjPa/D8HevTOQ3b27+kXC83mbvvH739q958xLxz1"
+    "+/e1Yj3KcRlti1mu8d4CC6s0X/XNleUM+jn+14IzL+jFIPI19OegVXI37OgH0Z+u6VYbl/"
+    "9u7d6wr3z17Vyf3w5tnL9988SgaCNSIRlk/cDpsfGCc2iuT7M76pkHNeRTbt1PKNycSmGj"
+    "51uu98b5s9l00Pw6s3L2/vbt78UhkVvqfj71xWnob81W+e1Ob9XSfW/726+8ni/7X++e7t"
+    "y4ReGkbLIPnEot3dP2f8O6E4orbPzB+5pXND/mrOWmXU44174KhXkTDqYxn1nKPSsGffvr"
+    "TtLR+T2+57y5jhNr6jP+sWrFa9Cy1prYKA14xX7pVZfJK6EDLGRI5/pAEmS/9veJtQ/Yp9"
+    "KeQ7spNw5sX6pehpYhR/zc0of7WY7gP0eefMqlkXY4D9bpzuAJ7f3D6/efFyJpkYuqCWO/"
+    "kI/1l4woeLvfxWJkU5vdyS58j59BkFrl0xaf4OvaS1V3ZtxbfWl+v6K8hHy4Qe/jv4t874"
+    "f+bR+UziuE1ev2jy2M5Zi3au2tlz6kfMur5lCw9bm0LsWgviYStkR3327/nWwvc42Frxxq"
+    "PI/Y5xFXM/sPWZRCsrWrGG7LtZtz/dfHt5/eTBrDYw3fb+q/+rH+AFG9GYtSFh0sKP13Mc"
+    "WHRhvcEucZD3IenLQr6bv/Ii7zagn0Mr8WWzr2ch1kf0w69+iLHFBwz77necODtk5oAfbL"
+    "bJz9nvsQbn85DOZ2Y6zBa0fFM7RDc+k9PSW3FJPblq4ZJ6cqV0SfG3aq4/8ofETf2MLJWG"
+    "myNM2vb86fLy8eOnlw8fP/n++urp0+vvH+7MWHyryZ6fvforN+kK/eKmczepacwXFcxw3E"
+    "/FhQ2eEDXV0zwTqzwhwinjNJu15x7x+WbjLU32jsKmrfJ+4+bNyVraO+dzi11chrESTLL5"
+    "YTtAHNwnYa5Q3Jftb98mVF89mvC+bAjID78nSohP+NHYFlVARkSTalHmNuG6a3W47loI1x"
+    "X2rbmkVIAGrigTWUEkXlXRmR7G839hJyL3klFWxwmrKAgW6gcL6SG0U2D9ONZRGOIwXEtd"
+    "sWraqyjgXZ/3jYe0dB95e+D6MNEH9wJHmlZexxmxRxrc0ANCAxJtdXamZcyAcrKAxhHx8W"
+    "yQ3Wn3YrKQLH0sOV01Sm0KEOhsNHQ2KW0HnQVq0A5OAxOa3qd2GGB/MRJ1H6oSCp4qjacq"
+    "4Y3vKm19YawMC5sl/fUa/ObqBdwsvzkoCE0e9TYKQvbeSldBWMGYFPLtLPK4TkUnbB1yaO"
+    "DqsSvFHsTyyJYxkGmOl1eQaZ5Epll91jugOFO7vd/1N60poi3P0jlyP93pwtWFJZ+HKray"
+    "0I9JFfsCEW97izwcvqeeF29mErGF0OaiSXDh8tZ2yJvbQdF+r+jiFxx866LthbVh/0jMkv"
+    "jYckm4wX7IFaYRjRjSmuMVG+xMz8o+xArwhgaRqJY9tkMukP2Qbsgt4hcCWvY7/JBbLeUv"
+    "oijvkis/rE1Q/KoLK6QJLO3Qomzf+6u/QiH7ZCt0UNpnylGqpmUfQ6LQ4p9psU9ZYpVo9i"
+    "OjOfHo5r+Lm9ZvIKU9aR4HiVu+KY2DzCN/Xlkcfo+RH0nDGUprLENApyn6/OS61xfYIWvk"
+    "qZx9CuGrm6IeZOipkdtkiy+fv3pz8/qbR5cXlzVHau71uxJCQuWpXXLtXX1QquPAbqWn/G"
+    "wVa09sDQVH0P1H0Jyyrg5IWVcTI1nrcFQY2Kj27QQtfRqScCbbsO/ebN6pp83aqqIzp4NV"
+    "gVV33LIW+srnLP0NyJ4H3b8Sx7UfPWTEuVrC5xrMhChhVVvyqI225JFaW/JI2Ei4+eNpJ6"
+    "9okC0ijZBR1cQ8121SmrFWajnPtZjWbMecrrJfRBrIeffyfvZpOGrQ9CgkyBXUkYfjkU0r"
+    "emdjdmig3n2jLEp1lbEGPGcWQ34jXlMwWcaYt5z1IJWcRn5DtLvaMEWSxWuMbbVcItIEow"
+    "Yl12iGYqKaHlByneOot1Fy5e4L155vNTPCiUjwSoKqC1RdU+cVVF2g6poQzwequsrLVxf2"
+    "fB7aLsmiP6ZI0Y9oTbztT4Tn4dvOJNGiaoOLpojRImlqr0ptW4eNUqyVmaZV6kMaQ1I31w"
+    "woQRhp0DBSgL0069GKSDLVq31CdRw42Vs42dnHuURerUXNdAVkIM29xI/Y3GrThZ3EJzRm"
+    "jToMzikS0RrjCEXseyI2fHrUlmFArSRvI4rDxAAV5DZMEgLSBK/xABMFREMGiIZA5SGIfY"
+    "xiKCbqBYfYxzmOepvYBziNwWk8Mv9aG6fxaVxrr9ZoyX7hexymxAiutWqDiybXGkmb2kHS"
+    "tqUk+wWOEPH4/cQUbZXQFa9aU8NDBNqxu4Xc1CfwrqXM60pYqygDXT6PHrYTaTeptIVDxp"
+    "wy0gK81HSv1WDAdju2eWrQAIWRHYfaKeIELCSK0ylzmrOnO60IQBMO1wOYeoSdVfprBbLV"
+    "HowKyASih/ZiLNjvZN9Hy21UxhgxkQ9NOlnz28+hdAlV015FAfEHEM+VH2uexbMoQdOWfQ"
+    "kU5ptDTJ9HqHQLkdVQkCqgvltJCYoDT2LTP9++e9tEa46quySJE1n/sTwS9sbu7M+L2E9T"
+    "Bs1j4kXEDx/wz/tLXxGYBk45S83WXjfsi6qbkXdQt/aSS0AYlj0pvCtIA73F0/UOi0GBNJ"
+    "PVgcnaBTAM9qgHe4Ec4mlenixjjNi4DaEtcpx0t2un5Zd1+JZhTditDXAMh0socAllsrwG"
+    "yCXUo0u2h9TjVgQCv7KaNA7y9YgtIWAigAA43JqaHM8H3priD34HJN9m3ZjJbWl23M9oaY"
+    "3qYoI4j2to4sI+JqnMazRXy2SKNy+aJDJshA6UxzCkFeEw2q+PkbXUF8jwHkAfcwJ9TEK8"
+    "bla9CgicFu2cFg5db9iM6uvTLSKB83acp3OSfY88mXag6W5lFWcg3714iDLe2C+W7EP20p"
+    "3DzHPHdX+RNcALHGC2jbOTshd6bAtQ8xjvxbzR3KfBmh14Fh5aajmd60DzCO/+zlo2K+jf"
+    "DxSAA14TXBA/LfwwRcaLXbjAdnOgsgKEIOWog5QQkT6jwd7gYMFWHn5PhtGtM4mKSAM3wb"
+    "0cOrjXJRUfO0Tm6FRzLiIN3Cf0QTlcbx9SqJmaqW4ctYaCkB9k+TwJySCwgHj1yCJREK8e"
+    "dbw6X7k6IPo1mt/hVqr5iVJcW+VHFlFNuJfHU/NhaY6m8p/WLpaqZrZNdJR9Fg2KwHThyo"
+    "qDJZ8LGQCKwI0mfqp7D7gCMvBY3dMlYIhUQ0a+Ep8bnNw1nqqzPZvJBZYbEzcUIMjYoJGx"
+    "IXRW2I29A4rDicizLkBf0JE791tPEQLSBNdbLczfJsqvDvLLFEN873xYqEZEdxCrGRn9Jo"
+    "VqCP9lsaOdfaCOM+GxGj75w067WqVdfUG+BDnqdvx0mO/lGjxEboa0c0hMrF7Jp5miFhIT"
+    "n+OoSzYUQmLimguxfZS2jIIAIgQQB7uhjdnPCqMDqohKkMAwhGhPGaItm2QXBJ/JlUzxQW"
+    "4Vnk2WrOFpHtlCpxGjLa/xujHaUvnL7BKorTw/P8t6+PFv77NydWryK5dazWC+tg33KHIZ"
+    "WwvG2ZFcZYKND0mXRvNlh2m6piMJS5m6LZKkGkJYz4KJZJ7IZEFy3US5xcUe+UQ666Tqm/"
+    "5VFCCEGFII4eINCqK1dD+pjgpVUQMGjxPLRbuCutOURIQrstCiewcYkGkXDURx9yF6BwcR"
+    "WbCFVhGUUUcHRCSk0O08doC/bHBAkpvMW4wCyQApZ3UZFFJHC7KJDXYI8sgf+g+ABApPQO"
+    "dPwGcafLJzZYXO8AjAcQwO/1hjBgevMVdrOVu+bY/4LldjgKRgCDQfPhpzQkX+1WHmrDkE"
+    "mSHIDOFGCDKf46iPO8hsnndFiNTpXJNqEw555+M7yv4YKOZ00gHpLxZylEs189u/oE6cOL"
+    "0kPtV6k4smp2p+o9HNWrfM85l9hrWDWch3rV1copLpc0/bQ4rh5pdFSus9XFsb1lubDab2"
+    "1TUBaOClqu6z9bFpVHY+b7i3lgMMpLeXO2vlbybwrD7m1WBw3DukTKiHte9lVkBg4+1snG"
+    "1Uljy9YCIg0GVcCgbm2zGfmCvbxay0bTwHGcj0dauQ5nVDSPNaDGkmpOluSiogI5nuekOS"
+    "MBaSPyQ0K/fWFQzoa2XxshW6vH6iY7kFwoStR9Vqn1y1sNonV0qr5W/V8qORtf7kUAEZOD"
+    "n0oizZBPSeuDjQ3tgJQPPsup/zS36u1k1QIACPzE8wMur10hOwcx53fPEkA+yfOgdBEWmC"
+    "4Q59FlzjCHGfk8i8OtJdxkCA+/AAd4SWWgqdvP04lB9GyXImkkCJh3fucV+k9y7OBJmBYQ"
+    "HnNjIDSJEMN5wny+vuBpjuBWcRCPzC/WaNrQ+koB4JzwemoC5NAF2Y83ncJhdnzV7TUZdT"
+    "1X6J7MyjwH6b/S8qKb2T317NVVn777By78XLXa8/p52a8Zh8PUxH9UtAHezGAZ6phVRFm4"
+    "s2SqpN3lxTSlXgrKx0Ek7XcZmWStVYX0y16wmqJ59ARuVsIsaaq1fNt4QxwcdYj0a0CkY0"
+    "xCIkoYjMwg+IRdSQBoZ/eolGFMzpRttEpIGc9xJym1N3a4dEFv1R010BmTib9BPbLC+ZAt"
+    "vNzkMRbaADcSIOQ8kNFdFjyMYq2Vfba+LH0mSzym2QDAr+QtGvhXwcsv1qSJD2eiGBmjeN"
+    "da/fSpK7qxNTqOPcAtAEtocOc9M4YjzqyW8LiAmM923ffBGw6cY+NCm+Cm8C90Nbe+kYpZ"
+    "usXQKFETjgigX1PLbpiTc2T5BJAizx5TSWDZJ3ACWENEoIgdxAvRiA3ADkBkccH0Bu0BOv"
+    "eWhBW28gQQLDIDjoMjgLgoNRCw7KM0AX9nweigPJvDlwBeySUy4MibIAwRvkb+8o/3OgAR"
+    "xrMpjk59k15UD9xwZcmsGYFKitigXY0Cdj9AlvE2Mo9ZIZw24Ysyai6CBrGK0CGi9Xijbl"
+    "nkOlkbHXbWGYvraRVagTfguT5n5BhU66b2aXxLcypJUirWiFIouPHfUIPyWFFvI8K1s/do"
+    "2Jz5+8nYKmKrvoqld9fQbv2qYLO8TBPXFAoDGwQCNb9XSjEjWYgSFsyHEzPVUG5Lg5lQO2"
+    "PosL7Dd7ACVwA92AE3H7tRMNTKqaxbT1OAvkEI9EklNKQ8aXEsZAnntZPpwVwQs7EQAgIj"
+    "PsBtWACIVl5IDM2B7xkzNRGK/XKJBYfMMQSLAwBvpjEPFoXJIwg9my1j5KRAL/x8SyD9V2"
+    "qHuA8Thga0tChy2zywPUHRIojID+CEC2iCGyRVB/QVw2efOiRNGWfdQ99nQ4V3Yw4BD43B"
+    "fpTXYIQEFzhgoaqAti2qhLHChCXZD8idUVngg4kJ1IhD0eCiM7fzx0KZaDQZcGujRQTZ36"
+    "zNG5aqqYT7ug9zxEPMIatJ/m2pw6PNcjm4nbUi1fi3QlUxIHq8KXkedc+fFv+7OtPM/6ek"
+    "snnDdXTLRS9f2gpU/DY5l6kXZDQkNpImu0ZJ3YbHvMPvxIsl6lnb1P+jKUMPbduyHrNZob"
+    "TVSlbNvhNElKxhlIVk1seSxblbxQBtKFPA8HS3IsW9me+ibpbWsoV6ncUxGJOoCtN7v+DC"
+    "XsnkQ8FM22tEcS9nfe0W3ejyFMHanhbyPR/pDkNpypJdpZg4s2Eu00UWI7ibaaHU1xNHvv"
+    "Y7JTYDv14oXQQX7yH9BJD6mThiJ+Q6mwdnX4Di7gB4xD8T4o3jcZpvvRzEL9vh4CPlC/r9"
+    "/6fXCB5VQas10q9ENkGBUo6DDGosNoo74pn6/arxQ1FGgDQBsw2BKcnf/bk1pCgKFCzSEQ"
+    "s5yc4r7ELFAEp8ciOLJdQwcsv0bzOzzh8q0tJCyVvdJ+cvl61QGxt1k3ZrJaWtQHTqC0P/"
+    "hCfDxTxV34exd7Qy6s1RDBluQLJlEVhxnIkqaXRtNXIbwyZHhF19cPLn49F3/CCHG0Yyp1"
+    "HPDdju95gHxXm+0qygQ33gBUs7UoXrA1Ig7SbWpbsus4MO2WSZZoyNZ+m6d906G7BjOQ7V"
+    "7iWOzj0v41qC5jgOd2PJc3gK1vPJcwwHM7niHCdbIIl08iexPIs7Nhh6yRp/BzVoD18FaK"
+    "fJD1MEGjbxiHFy+fv3pz85rZ8cVlrf5FPiBX4kwSBwF32oURdT5pHBUF3HDe5Id9zScdu+"
+    "rXxCfreK1NrYAbjtpHU+EWf9mQYNtQ8VFObQ3WFPw2bG64uXtZP/ShyFnZfrye651E6jjY"
+    "S7QsCIsC3drSJUgne4jTOuWGKAVbfLVDa2sp+xiwvFY+LJOtrlUkl9JgvgAB1VDIDIRgkI"
+    "bpnEY956iehkkQp7RJnOAi4m3tEHlH5wLgHd3yft5Tz4s3E7SHdlfcaSeXtomPX1OTND5S"
+    "kSRcr9W+6l50fixlQdW3aIqdDSHz4I9mg9Ije3L3iz3sfLbYXwDplvtweI0izLa2rhUz1g"
+    "OL+thKTtFWeor+wUJW3vd/hVbFtWaR0IpW2ArjtUUXFolCK//0Sk2kPj+ojThlx02qISk7"
+    "WhLJSuUFUKsMqVYBR8+wXgjwTR7tm/w9Rn4krSGinA3KEIhF1L0E+cJwwIGxBoUT41hOjK"
+    "0LnhfLctsIVBUFF0X2XxRZl+TCR0rBy8rjiZHcVg9eM7AxacLzezqSg0LpCo/6kJAdkvsX"
+    "hMMmeshNdForgr0j2UL/fPvurYrdMqq+dBInsv5jeaTVfZqDHvXZnxexnxTUseYx8SLihw"
+    "/45/1lNvw2j7NUWTUFmVBdEVRbDnkHdZkQBJoGCzTJ5eFq21cIwwew+tMcY3qx74gtiw6V"
+    "SJfVvJcgMOF0PiB4jYhWoaEdoBv3yYgkHH1d/XH13FQFwgSdbd0/1co91eCdElRIJIhW2r"
+    "6pKupI19TIGNfzTLGjN5sdJEEc9YRcghw1IU+Ht15m3jUK0iy1ivp66gEQkTAOh48D21us"
+    "Y78UsG07DAIQtiedD84GheFnGrj2CoVat7AEoIHRns42LAdpctBmQ9n36qA+wE3R0wTHpJ"
+    "Vi4oSVXybJ1wlKv0ySpwVac2Xcis350uuTOmT9mPT1U9GViYSdtFjOJBk7SbWcyTLFcy0d"
+    "z1PLnFSTZCmv6nCy4kKTZO2E1YUmyVduZQF22CmgG9LeJ32Zzlip2srRjBVVXkxk7FQlrC"
+    "ZJ1klF9pNkDFT2WnTxnIxH0tQyaeUk6UmndZsdqcPj7Smd12/Tvkxl7DRF5CZDlZZorfSY"
+    "UocwWvd6LN75+I6yP1o8tUmP7f0W44x3yAnWF/rl2wi13q+00dgr+7Mre5z994Oyj7B2MA"
+    "v5roXcexyE2AowcnarWeW6jwZOs47fBff1J3EyuKYzqMIwHUosCampozZlDARs2ilMcs5S"
+    "pg4gewc0kPHrdmXkGqrI1enO5yKRaXX+vDLGCJKbbpT0kT0vxGwhkN6fasjDWcIYQXptLm"
+    "lj2Zdqy74ULJt9Go60pVRV1DlLqbi5saa6CZrKsAH127tXJivgVgmnmlLzKgRTPU4IJXX+"
+    "FCcFhV5BvdbtACaoV4de5yD5ldrQzb3UCsmvTBv1nKN68it1hPKAC811LJQXhDqYQ/Gab1"
+    "q1yzaKQDBbqNp4wqqN1am0A4p1xSIjM2WtlAf1JWg/3aXnvwtz1iuSOVGqxTlzhAkmSnoM"
+    "deipKtrYH32qiUb2x5+epyngkujRBoWRVeuhEnTa1xgiTeNZHS8aIk3FsGnXfJNATfQV91"
+    "eJTIfsAmEgx72k3lvwhP3Yd7QCHxUQMN2O6YDGsriHmuUdwECGu4+asoUx0I8tVVFnnUES"
+    "+65+Bs4S5pwDc+xLKq93qx/wKsrAp7yXXQEE5QYIyiGXHUewL6sl2CD3KYNMCM71zXJIXG"
+    "zjxQI7sjtq6ghoHWcC10MHQiHsDGHnUQzFRAOQEHY+x1GHsPNIwqOnS1NuOLEQz++J1/SC"
+    "6PyAiL4MChxDUL/LCCgE9Ucd1D9NsYgpc7yvVoRybu5iutATTUx2zpCsS6PSTZSHQSaZqA"
+    "1Tg1qi1BLqdJilbYA6HTqTgoxjqNOBhycd6nRM276hTsfIBgTqdECdjiElVq0UVlCno58Z"
+    "BOp0jGjm/T1GHttK69eHEICwLHY+OOEG8+Rfsswg6oGpgGBQOh8UGiyRT/7QfmDqOJi1oH"
+    "DKuHeQQnhH7UqEwimH5ViO2Q8PsAuFU1qmWUYutqF6SstiIH6Eg02AuZYpKwxyHGNnURCE"
+    "LRBk6TPKBq93Mc41vZmt5DJWGJ2CrklaV5qnmtEF9UG0ksXjYEGDNeMNKoVolmbLJMxQKa"
+    "T9I+qejrEprgG7OW1BvI4eS7Mrq+wyXpyqxMoUrawkeIFiK/oFJ8MN9sNk/TxV2ZUJGx0U"
+    "qdE8Ow1XrWaKVlUcmqCqD1T16di0+EaTWVZS3gcq+3RX2Yf9ThqQMFKq7vVL+7zOujTudC"
+    "BqhatrRDL3NZ3k3yB/e0f5n3o3GI46zp9UBNSg+05+ol3TT8t+cMAtjgcT6lRnwnoaJBb+"
+    "CW+TjrLbEMU4ZDLy3aOQNSwLsLMm0Sqg8XKl6EZQbEuF6ex1u66F/rpHU17hVqIpr26xmj"
+    "TltX1dr5ryj6UsIMVOPNH1sJaQZa9ViLNnJTrke4N8b+YwzeZh7YxQZQzw3I7n32Pks5Vu"
+    "axfeKY25WYGG68WSexI7rnYL6CFEV8DD8fxwIiQT3nvsKLxd6vREdZwJkvGhsxRNJLUce3"
+    "zcTEgygJKt86xnpSiCWq2vTg0kgUN+oLHkB2qTFap2/NIcfhHdwehPaN4b0WDnnDSO9ukS"
+    "FY3ukYZMRdPgla32a+RwP7MetXUcpNdqSAMVHJgDKgDThQRQ3Tj1j0oAVRhkF/SeWcKcYO"
+    "SJn6ZKsH7mp92aNbwVj2yla23E9WV+TCmfEiWKJCyXK1TU4bidDKbnMNwuhl+JtHFwsOQr"
+    "DETjRhKN4waR8iNw2+APK4MggtEugjGn7tbeoEAyB6uZroCA6XZMg4NXJLp7B282kwssN6"
+    "YuK0ADpi7bvTLZ3GWhs8Ju7DU6U1VTdR151uWvCjpyn3H7Na+ONCH2VqvX1mKOUOcyEHJh"
+    "OXS98ZJL0YeEAEQ0hADGHAKAkPbpQtoLkmwltHgvY4Bzfc55ogdsx4FM+9+QUbeCgqRRzc"
+    "NyQMIiqPg15EMAFb/UWytztR1Q8cu0UZfs8IQbbzWfbktHbA0F0XKQeAzFa3H7V7cWlQQJ"
+    "DIMSodMAo6YSoWySXRB8HloEyYO8n+p8yRqe5pEtdG1Zrq3xuqHykmgYR4h4SUoonvnwyF"
+    "v1ulkUJ8L+aFJCTZevEyW6mAphvWpXKM+Z/hObLWiwnclELJUGF41qlqSpvSq13SdrmWU7"
+    "CyvFWiVsmbCGZlDZbGQKljX9xD7fPiDqLyBNcAH2HffPWduw6SC0NziwXSTZkb7ADlkjr5"
+    "l5oY+6Ryjt5EHW2fQGoyk6/fL5qzc3r795fFGP/+fDcqXkfotRIDF15Vwi4MANI7oLkOfQ"
+    "FfXsONQSBtRgMIXsn0Jyylz2LbLn/zPGnzQMuqEHMG3RtN0gXuradRkDRr3fqBO+0n4Elt"
+    "Xx4CoKKtUcUS3IceKNdi6WKspAO++jyCF24zSLL/uce6xXTlKEmkf6dZvJ5Vo9uVwLk8sa"
+    "BTxF5AGHHBFpHt/dT+YeuU9OhiSKtacUGdY8zntR7rOfFTgkxPZBCczkaPOo7356cQmOtG"
+    "8BVUDA8n6WiR/GAY8X8RSe90SzTrAcbR7v/exY1pjfPHG23NsdcQexxh5dCoatOmg0QaMJ"
+    "aj3QaMKoj0ejORop4eRDjoLMTSfVQwtJXF68oH9B3Fiz7WvL4boTIfCdxssviVKA/Z6f6X"
+    "wmESKIjS6axAgRa27jXXv7X3TeLtPG7H9jHGPX4h1YRQfWggYWsmp1J3+wQowtzgL23e9q"
+    "n/lgIwoZuu68TfYPdI9IYo58DYGEHoPKIdjAOpJjfOOt/B0GLuVrXMpHUYTXG5lIUR22LE"
+    "EgKbZAaHna0Ny01rEGblunu00VTyceCtnaEgRU4gJTuwGqKPAFgC8AToWtcnFn+zu9Y2EN"
+    "BefCLs+FbqmO/FEHww7q0k/igFizxr5PiKm0//kq9j/NJGfD8tsXTafC7L6Bw1v2kHjx4y"
+    "y7yZDR4sdrnqv2N1Ckn/AIlg1Ce2ILANwylWU/I39ITrRqsXPWHLiUcVmZLqqMfvjw6oWC"
+    "0gqqRmwcE/cBx06Q3gbukq3243TXVt6PJb+08Rp0WFwIO/L6qKmVlOuLe9W+xpRquToCyp"
+    "1AaYj27gXKdw/3O4f57dU178FK4RbxrU1AuTWGP1gL4iOPzXf85YgWHt30W1mUWZeF73Gw"
+    "tZIdiIWCgNxjV/AS9/YpbdzFpYCjnrNYPWF1P1Ht37GUUmsln8T/uDpFXq09M1fT1oXfIk"
+    "6rGgtkNxQOLYMMTFLciyIpIU1XclcBGch0PyVaq7Wq2zobazDwNup7GyOaKM+l2/dnZKnc"
+    "wVdxJu3j/3R5+fjx08uHj598f3319On19w93G3rxraad/bNXf+Wb+8oQiLv9ZDlWDICS/S"
+    "rIJPa7O0Wt0OX1E52Zu0CYMJFUZ+0nVy0m7SdXyjmbvwVhCghTgGTRtFFvI1lklNsRPiCt"
+    "ZBkFl74hreRgiz+vfqRFagkBhioSusthppumUwSCwUKWzi4d07pZOksW2QW/55GkU3yMW+"
+    "XoTNb/Dlh+jeZ3eMLX9tqk5yzvlfaTG2Z1JI8kNi9HaSarpUX98ISnhS6k5h3TzkK506IY"
+    "Mkn0moTyQ4iDFyTAjioJZbXBRWNUL+Tp6ypt9wb1Xq4R8ayEcYve48DK1pnQQr5rbUrTfm"
+    "ix/l1rvs0CbOwktbI8Sj/FmwdCFK+bbn/1f2UP+SbiMcBw6zvWZ8LezNb678prkvU5IGxi"
+    "4d2EbGZgv5Vj8vsjVWIebLY//OpHK2wF1MMWCdn3wbzGV8xM1Qop+/QlA7uU9efTyFqhe2"
+    "xFlP2EIGTNXfbZhI1u8F24wTwlZ7S1+NXiB4og48d0XNJRushGiT2toIw6pTIKcwPVcZvu"
+    "AN0Eu05Lbv9BxarNtyW5ijIwrNhD8dNwV92+7Vm1QMAhVVasg+oZbd4ezLVNbkISbjy01V"
+    "Z21HEDVkeeTXcW3jCO9LJAFgioCFgJW3SRbWaDwvAzZUeGFQpXOtYvAE2ca/p4APgJ4V73"
+    "EnIBGvAWcr7/m+wlZIiZqg3drJjpURfPunOd/J1nE71lp/2UvZrfpPTuRZPT5D7NSbpr2L"
+    "psRwJMvA2htcYojAPMb4WFgi+kDaCNOLkaASj1kJYlh+wWgzoQBP41Jz0Z3sCpb7pTnagK"
+    "CrdhRD3i2PONTsi9ioKwu6QoAEGHMFuHAbUitSuMgsgOpBOUktgqCGiVFXQNN4T9fBpsdc"
+    "mVQYFikeI5dbc2T1LEOWArpWSBbSrsJIOfYU2nK42aTvTLlv1+O+R8KXLNK61aigWzFs36"
+    "MybLleyI3GTMBegMTfj64rK1Ca8OYXcF7LZjd74murNwijhDXnUm3g3r2A4dKlvkGvTRZR"
+    "BMtZIdhEepay+92KGygmNKZgUckCuSC5nzh7y/CtfQ1IY9Ted6m2to6zS5hc3laYGrp/KQ"
+    "YmEig8tJw7lIuOEdcJdGBAK/cJdGY1Xu/C5NdS7tgOIsa9H7XX/TmoLb8ixdg/bTXZoAuj"
+    "Dn87i6JM6aY0pedoMD4qxmkjh99s5FU4weFW06zVkKCvwTBtDvcSDPTaiWwZUgIIBrKYDb"
+    "SCKqaoaz5gay20tCL16FUbrpUgtsS5DhFban8Yh0pqU9qfDs6/8DFIFU2Q=="
+)
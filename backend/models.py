@@ -1,8 +1,8 @@
 from tortoise import fields, models
 from tortoise.contrib.pydantic import pydantic_model_creator
 from datetime import date
-from typing import Optional
-from pydantic import BaseModel
+from typing import List, Optional
+from pydantic import BaseModel, Field
 from decimal import Decimal
 
 class Patient(models.Model):
@@ -42,6 +42,42 @@ class Practitioner(models.Model):
     class Meta:
         table = "practitioners"
 
+class UserDirectory(models.Model):
+    """Email index over patients and practitioners used by every auth lookup.
+
+    Kept in sync with Patient/Practitioner writes by signals in backend/user_directory.py;
+    the role is precomputed so login does not have to parse identifier/specialty JSON.
+    """
+    id = fields.IntField(pk=True)
+    email = fields.CharField(max_length=255, unique=True)
+    user_table = fields.CharField(max_length=20)  # patient, practitioner
+    user_id = fields.IntField()
+    role = fields.CharField(max_length=20)  # patient, practitioner, pharmacist, laborist
+    display_name = fields.CharField(max_length=255, default="")
+    phones = fields.JSONField(default=list)  # Contact point values from telecom
+    password_hash = fields.CharField(max_length=255)
+    active = fields.BooleanField(default=True)
+    updated_at = fields.DatetimeField(auto_now=True)
+    
+    class Meta:
+        table = "user_directory"
+        unique_together = (("user_table", "user_id"),)
+
+class PatientSearch(models.Model):
+    """Normalized copies of a patient's name, identifiers, phones and email for indexed search.
+
+    One row per patient (same id), kept in sync by signals in backend/patient_search.py.
+    """
+    id = fields.IntField(pk=True, generated=False)  # The patient's id
+    display_name = fields.CharField(max_length=255, default="")
+    name_folded = fields.CharField(max_length=500, default="")  # Lowercase, accent-free name tokens
+    identifiers = fields.TextField(default="")  # Identifier values, lowercase letters and digits only
+    phones = fields.TextField(default="")  # Phone numbers, digits only
+    email = fields.CharField(max_length=255, default="")  # The patient's email, lowercase
+    
+    class Meta:
+        table = "patient_search"
+
 class Medicine(models.Model):
     id = fields.IntField(pk=True)
     name = fields.CharField(max_length=255)
@@ -57,7 +93,7 @@ class Medicine(models.Model):
     minimum_stock = fields.IntField(default=10)
     expiry_date = fields.DateField()
     batch_number = fields.CharField(max_length=100)
-    barcode = fields.CharField(max_length=100, null=True)
+    barcode = fields.CharField(max_length=100, null=True, unique=True)
     prescription_required = fields.BooleanField(default=True)
     active = fields.BooleanField(default=True)
     created_at = fields.DatetimeField(auto_now_add=True)
@@ -65,6 +101,26 @@ class Medicine(models.Model):
     
     class Meta:
         table = "medicines"
+        indexes = (
+            ("name",),
+            ("category", "name"),
+        )
+
+class MedicineLot(models.Model):
+    """Stock received under one batch number; a medicine's current_stock is the sum of its lots"""
+    id = fields.IntField(pk=True)
+    medicine = fields.ForeignKeyField('models.Medicine', related_name='lots')
+    batch_number = fields.CharField(max_length=100)
+    expiry_date = fields.DateField()
+    quantity = fields.IntField(default=0)  # Units left in this lot
+    received_at = fields.DatetimeField(auto_now_add=True)
+    
+    class Meta:
+        table = "medicine_lots"
+        indexes = (
+            ("medicine_id", "expiry_date"),  # FEFO allocation and per-medicine expiry checks
+            ("expiry_date",),  # Expiring-soon range queries
+        )
 
 class Prescription(models.Model):
     id = fields.IntField(pk=True)
@@ -84,6 +140,28 @@ class Prescription(models.Model):
     
     class Meta:
         table = "prescriptions"
+        # Single-column indexes keep rowid order, so filtered keyset pages need no sort
+        indexes = (
+            ("status",),
+            ("patient_id",),
+        )
+
+class DailySalesRollup(models.Model):
+    """Per-day, per-medicine dispensing totals behind the sales report.
+
+    Updated in the same transaction that dispenses a prescription, so the report only
+    has to scan the rollup rows in its date range.
+    """
+    id = fields.IntField(pk=True)
+    day = fields.DateField()
+    medicine = fields.ForeignKeyField('models.Medicine', related_name='daily_sales')
+    quantity = fields.IntField(default=0)
+    amount = fields.DecimalField(max_digits=12, decimal_places=2, default=0)
+    prescriptions = fields.IntField(default=0)  # Number of prescriptions dispensed
+
+    class Meta:
+        table = "daily_sales_rollup"
+        unique_together = (("day", "medicine_id"),)
 
 class Appointment(models.Model):
     id = fields.IntField(pk=True)
@@ -101,6 +179,10 @@ class Appointment(models.Model):
 
     class Meta:
         table = "appointments"
+        indexes = (
+            ("doctor_id", "date", "time"),
+            ("patient_id", "date"),
+        )
 
 # Laborist-specific models
 class LabTest(models.Model):
@@ -123,6 +205,10 @@ class LabTest(models.Model):
     
     class Meta:
         table = "lab_tests"
+        indexes = (
+            ("laborist_id",),
+            ("patient_id",),
+        )
 
 class Scan(models.Model):
     id = fields.IntField(pk=True)
@@ -145,6 +231,25 @@ class Scan(models.Model):
     
     class Meta:
         table = "scans"
+        indexes = (
+            ("laborist_id",),
+            ("patient_id",),
+        )
+
+class Blob(models.Model):
+    """Content-addressed file shared by every upload/document with the same SHA-256.
+
+    ref_count is the number of MedicalUpload and MedicalDocument rows pointing at it;
+    see backend/blob_store.py.
+    """
+    id = fields.IntField(pk=True)
+    sha256 = fields.CharField(max_length=64, unique=True)
+    size = fields.BigIntField()  # bytes
+    ref_count = fields.IntField(default=0)
+    created_at = fields.DatetimeField(auto_now_add=True)
+    
+    class Meta:
+        table = "blobs"
 
 class MedicalUpload(models.Model):
     id = fields.IntField(pk=True)
@@ -157,11 +262,47 @@ class MedicalUpload(models.Model):
     file_path = fields.CharField(max_length=500)
     file_type = fields.CharField(max_length=100)  # pdf, image, document, etc.
     file_size = fields.IntField()  # Size in bytes
+    sha256 = fields.CharField(max_length=64, null=True)  # Content hash, hex
     description = fields.TextField(null=True)
     uploaded_at = fields.DatetimeField(auto_now_add=True)
     
     class Meta:
         table = "medical_uploads"
+        indexes = (
+            ("patient_id",),
+            ("lab_test_id",),
+            ("scan_id",),
+        )
+
+class UploadSession(models.Model):
+    """Resumable upload in progress; finalized into a MedicalUpload once every chunk arrived"""
+    id = fields.UUIDField(pk=True)
+    patient = fields.ForeignKeyField('models.Patient', related_name='upload_sessions')
+    uploaded_by = fields.ForeignKeyField('models.Practitioner', related_name='upload_sessions')
+    lab_test = fields.ForeignKeyField('models.LabTest', related_name='upload_sessions', null=True)
+    scan = fields.ForeignKeyField('models.Scan', related_name='upload_sessions', null=True)
+    file_name = fields.CharField(max_length=255)
+    file_type = fields.CharField(max_length=100)
+    description = fields.TextField(null=True)
+    total_size = fields.BigIntField()  # bytes
+    chunk_size = fields.IntField()  # bytes; every chunk but the last has this size
+    sha256 = fields.CharField(max_length=64, null=True)  # Expected content hash, if the client sent one
+    created_at = fields.DatetimeField(auto_now_add=True)
+    updated_at = fields.DatetimeField(auto_now=True)  # Last chunk received; used to expire abandoned sessions
+    
+    class Meta:
+        table = "upload_sessions"
+        indexes = (("updated_at",),)
+
+class UploadChunk(models.Model):
+    id = fields.IntField(pk=True)
+    session = fields.ForeignKeyField('models.UploadSession', related_name='chunks')
+    number = fields.IntField()
+    size = fields.IntField()
+    
+    class Meta:
+        table = "upload_chunks"
+        unique_together = (("session_id", "number"),)
 
 class LaboristRecord(models.Model):
     id = fields.IntField(pk=True)
@@ -206,6 +347,7 @@ class MedicalRecord(models.Model):
     
     class Meta:
         table = "medical_records"
+        indexes = (("patient_id", "date_of_service"),)
 
 class PatientAllergy(models.Model):
     """Patient allergies and adverse reactions"""
@@ -226,6 +368,7 @@ class PatientAllergy(models.Model):
     
     class Meta:
         table = "patient_allergies"
+        indexes = (("patient_id", "status"),)
 
 class PatientMedication(models.Model):
     """Current and past medications"""
@@ -250,6 +393,7 @@ class PatientMedication(models.Model):
     
     class Meta:
         table = "patient_medications"
+        indexes = (("patient_id", "status"),)
 
 class VitalSigns(models.Model):
     """Patient vital signs measurements"""
@@ -274,6 +418,7 @@ class VitalSigns(models.Model):
     
     class Meta:
         table = "vital_signs"
+        indexes = (("patient_id", "measurement_date"),)
 
 class Diagnosis(models.Model):
     """Patient diagnoses"""
@@ -294,6 +439,7 @@ class Diagnosis(models.Model):
     
     class Meta:
         table = "diagnoses"
+        indexes = (("patient_id", "status"),)
 
 class MedicalProcedure(models.Model):
     """Medical procedures performed"""
@@ -318,6 +464,7 @@ class MedicalProcedure(models.Model):
     
     class Meta:
         table = "medical_procedures"
+        indexes = (("patient_id", "procedure_date"),)
 
 class ClinicalNote(models.Model):
     """Clinical notes and observations"""
@@ -342,6 +489,7 @@ class ClinicalNote(models.Model):
     
     class Meta:
         table = "clinical_notes"
+        indexes = (("patient_id", "note_date"),)
 
 class FamilyHistory(models.Model):
     """Patient family medical history"""
@@ -359,6 +507,7 @@ class FamilyHistory(models.Model):
     
     class Meta:
         table = "family_history"
+        indexes = (("patient_id",),)
 
 class SocialHistory(models.Model):
     """Patient social history"""
@@ -400,6 +549,7 @@ class MedicalDocument(models.Model):
     file_path = fields.CharField(max_length=500)
     file_type = fields.CharField(max_length=50)  # pdf, jpg, png, docx, etc.
     file_size = fields.IntField()  # bytes
+    sha256 = fields.CharField(max_length=64, null=True)  # Content hash, hex
     mime_type = fields.CharField(max_length=100)
     provider_name = fields.CharField(max_length=255, null=True)
     document_date = fields.DateField(null=True)  # Date of the document content
@@ -411,6 +561,21 @@ class MedicalDocument(models.Model):
     
     class Meta:
         table = "medical_documents"
+        indexes = (("patient_id", "status", "created_at"),)
+
+class TextExtractionJob(models.Model):
+    """Queued text extraction for a MedicalDocument; see backend/text_extraction.py"""
+    id = fields.IntField(pk=True)
+    document = fields.OneToOneField('models.MedicalDocument', related_name='text_extraction_job')
+    force = fields.BooleanField(default=False)  # Replace extracted_text even if already set
+    attempts = fields.IntField(default=0)
+    available_at = fields.DatetimeField()  # Not picked up before this (retry backoff, or a worker's lease)
+    last_error = fields.TextField(null=True)
+    created_at = fields.DatetimeField(auto_now_add=True)
+    
+    class Meta:
+        table = "text_extraction_jobs"
+        indexes = (("available_at",),)
 
 class LabResult(models.Model):
     """Detailed lab test results"""
@@ -433,6 +598,7 @@ class LabResult(models.Model):
     
     class Meta:
         table = "lab_results"
+        indexes = (("patient_id", "test_date"),)
 
 class ImagingResult(models.Model):
     """Detailed imaging results"""
@@ -458,6 +624,7 @@ class ImagingResult(models.Model):
     
     class Meta:
         table = "imaging_results"
+        indexes = (("patient_id", "study_date"),)
 
 # Create Pydantic models for API serialization
 Patient_Pydantic = pydantic_model_creator(Patient, name="Patient")
@@ -469,6 +636,8 @@ PractitionerIn_Pydantic = pydantic_model_creator(Practitioner, name="Practitione
 Medicine_Pydantic = pydantic_model_creator(Medicine, name="Medicine")
 MedicineIn_Pydantic = pydantic_model_creator(Medicine, name="MedicineIn", exclude_readonly=True)
 
+MedicineLot_Pydantic = pydantic_model_creator(MedicineLot, name="MedicineLot")
+
 Prescription_Pydantic = pydantic_model_creator(Prescription, name="Prescription")
 PrescriptionIn_Pydantic = pydantic_model_creator(Prescription, name="PrescriptionIn", exclude_readonly=True)
 
@@ -556,6 +725,11 @@ class MedicineCreate(BaseModel):
     prescription_required: bool = True
     active: bool = True
 
+class MedicineLotCreate(BaseModel):
+    batch_number: str
+    expiry_date: date
+    quantity: int
+
 class MedicineUpdate(BaseModel):
     name: Optional[str] = None
     generic_name: Optional[str] = None
@@ -585,9 +759,17 @@ class PrescriptionCreate(BaseModel):
     instructions: Optional[str] = None
 
 class PrescriptionDispense(BaseModel):
-    quantity_dispensed: int
+    quantity_dispensed: int = Field(gt=0)
     pharmacist_id: int
 
+class PrescriptionDispenseItem(BaseModel):
+    prescription_id: int
+    quantity_dispensed: int = Field(gt=0)
+
+class PrescriptionDispenseBatch(BaseModel):
+    pharmacist_id: int
+    items: List[PrescriptionDispenseItem]
+
 # Laborist-specific Pydantic models for operations
 class LabTestCreate(BaseModel):
     patient_id: int
@@ -630,6 +812,17 @@ class ScanUpdate(BaseModel):
     image_urls: Optional[list] = None
     notes: Optional[str] = None
 
+class UploadSessionCreate(BaseModel):
+    patient_id: int
+    lab_test_id: Optional[int] = None
+    scan_id: Optional[int] = None
+    file_name: str
+    file_type: str
+    total_size: int
+    chunk_size: int = 8 * 1024 * 1024
+    sha256: Optional[str] = None
+    description: Optional[str] = None
+
 class LaboristRecordCreate(BaseModel):
     department: str = 'Laboratory'
     shift: str = 'day'
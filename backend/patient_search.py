@@ -0,0 +1,210 @@
+import re
+import unicodedata
+from typing import List
+from tortoise import connections
+from tortoise.signals import post_save, post_delete
+from backend.models import Patient, PatientSearch
+from backend.user_directory import display_name
+
+# Patient search columns
+#
+# Patient names, identifiers and phone numbers live inside FHIR JSON columns, which
+# cannot be indexed. Every Patient write upserts a patient_search row holding normalized
+# copies of them (lowercase accent-free name tokens, identifier values, phone digits)
+# and of the lowercase email. backend/search.py indexes those with FTS5: a prefix index
+# over the name tokens and trigram indexes over identifiers and phones and over the
+# email, which find any part of a number or address.
+# Patients stored before this existed are added by sync_missing_patients() on startup.
+
+SYNC_BATCH_SIZE = 1000
+SELECTIVE_NUMBER_LENGTH = 6  # Digits typed with a name search the number index from this length
+SEARCH_CANDIDATES = 500  # Index matches ranked per query
+PHONE_QUERY = re.compile(r"^[\d\s()+\-./]+$")
+PHONE_SYSTEMS = {"phone", "sms", None}
+
+def fold(text: str) -> str:
+    """Lowercase, strip accents and reduce text to space-separated letter/digit tokens"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(re.findall(r"[^\W_]+", stripped.casefold()))
+
+def name_tokens(patient: Patient) -> List[str]:
+    """Folded tokens of every text, given and family name in the FHIR HumanName(s)"""
+    names = patient.name if isinstance(patient.name, list) else [patient.name]
+    tokens = []
+    for name in names:
+        if not isinstance(name, dict):
+            continue
+        given = name.get("given") or []
+        if isinstance(given, str):
+            given = [given]
+        for part in [name.get("text") or "", *given, name.get("family") or ""]:
+            for token in fold(str(part)).split():
+                if token not in tokens:
+                    tokens.append(token)
+    return tokens
+
+def search_fields(patient: Patient) -> dict:
+    identifiers = [
+        fold(str(identifier["value"])).replace(" ", "")
+        for identifier in patient.identifier or []
+        if isinstance(identifier, dict) and identifier.get("value")
+    ]
+    phones = [
+        re.sub(r"\D", "", str(contact["value"]))
+        for contact in patient.telecom or []
+        if isinstance(contact, dict) and contact.get("value") and contact.get("system") in PHONE_SYSTEMS
+    ]
+    return {
+        "display_name": display_name(patient)[:255],
+        "name_folded": " ".join(name_tokens(patient))[:500],
+        "identifiers": " ".join(value for value in identifiers if value),
+        "phones": " ".join(value for value in phones if value),
+        "email": (patient.email or "").lower()[:255],
+    }
+
+async def sync_patient(patient: Patient, using_db=None):
+    """Upsert the search row for a patient (UPDATE-then-INSERT, see user_directory.sync_user)"""
+    fields = search_fields(patient)
+    if not await PatientSearch.filter(id=patient.id).using_db(using_db).update(**fields):
+        await PatientSearch.create(id=patient.id, **fields, using_db=using_db)
+
+@post_save(Patient)
+async def _sync_saved_patient(sender, instance, created, using_db, update_fields):
+    await sync_patient(instance, using_db)
+
+@post_delete(Patient)
+async def _remove_deleted_patient(sender, instance, using_db):
+    await PatientSearch.filter(id=instance.id).using_db(using_db).delete()
+
+async def sync_missing_patients() -> int:
+    """Create search rows for patients that have none; returns how many were added"""
+    connection = connections.get("default")
+    added = 0
+    last_id = 0
+    while True:
+        rows = await connection.execute_query_dict(
+            """
+            SELECT p.id FROM patients AS p
+            LEFT JOIN patient_search AS s ON s.id = p.id
+            WHERE s.id IS NULL AND p.id > ?
+            ORDER BY p.id
+            LIMIT ?
+            """,
+            [last_id, SYNC_BATCH_SIZE]
+        )
+        if not rows:
+            break
+        last_id = rows[-1]["id"]
+        patients = await Patient.filter(id__in=[row["id"] for row in rows]).only("id", "name", "identifier", "telecom", "email")
+        await PatientSearch.bulk_create(
+            [PatientSearch(id=patient.id, **search_fields(patient)) for patient in patients],
+            ignore_conflicts=True
+        )
+        added += len(patients)
+    if added:
+        print(f"Added {added} patients to the search index")
+    return added
+
+async def search_patient_ids(text: str, limit: int) -> List[int]:
+    """Ids of patients whose name, identifier, phone or email matches text, best matches first.
+
+    Words match the start of any name token (prefix index). Words with digits match any
+    part of an identifier or phone number (trigram index); digit-only input may contain
+    spaces and phone punctuation. Up to SEARCH_CANDIDATES index matches are ranked (a
+    leading name match first, then by name), and any part of an email address (three
+    characters or more) fills the remaining places. Input containing "@" only searches emails.
+    """
+    text = text.strip()
+    if "@" in text:
+        return await search_email_ids(text, limit, [])
+
+    if PHONE_QUERY.match(text) and re.sub(r"\D", "", text):
+        tokens = [re.sub(r"\D", "", text)]
+    else:
+        tokens = fold(text).split()
+    name_terms = [token for token in tokens if not any(char.isdigit() for char in token)]
+    number_terms = [token for token in tokens if token not in name_terms]
+    if any(len(token) < 3 for token in number_terms) or not tokens:
+        ids = []  # Trigrams need at least three characters
+    else:
+        ids = await search_name_and_number_ids(tokens, name_terms, number_terms, limit)
+    if len(ids) < limit:
+        ids += await search_email_ids(text, limit - len(ids), ids)
+    return ids
+
+async def search_name_and_number_ids(tokens: List[str], name_terms: List[str], number_terms: List[str], limit: int) -> List[int]:
+    # The more selective index drives the query and the other words filter its matches:
+    # a long number is rarer than any name prefix, a short fragment is not
+    conditions, params = [], []
+    if number_terms and (not name_terms or max(len(token) for token in number_terms) >= SELECTIVE_NUMBER_LENGTH):
+        index_table = "patient_numbers_fts"
+        match = " AND ".join(f'"{token}"' for token in number_terms)
+        for token in name_terms:
+            conditions.append("(' ' || s.name_folded) LIKE ?")
+            params.append(f"% {token}%")
+    else:
+        index_table = "patient_names_fts"
+        match = " AND ".join(f'"{token}"*' for token in name_terms)
+        for token in number_terms:
+            conditions.append("(s.identifiers LIKE ? OR s.phones LIKE ?)")
+            params += [f"%{token}%", f"%{token}%"]
+
+    # Patients whose first name token starts with the first word come first. On the
+    # name index they are also fetched by an initial-token query (^) of their own, so
+    # the cap on the other matches cannot push them out.
+    # Folded tokens are letters and digits only, so they need no LIKE escaping.
+    candidates = [candidate_ids_sql(index_table, conditions)]
+    candidate_params = [match, *params, SEARCH_CANDIDATES]
+    if tokens[0] in name_terms:
+        leading_match, order_params = "s.name_folded LIKE ? DESC, ", [f"{tokens[0]}%"]
+        if index_table == "patient_names_fts":
+            candidates.insert(0, candidate_ids_sql(index_table, conditions))
+            candidate_params = ["^" + match, *params, SEARCH_CANDIDATES, *candidate_params]
+    else:
+        leading_match, order_params = "", []
+
+    rows = await connections.get("default").execute_query_dict(
+        f"""
+        SELECT s.id
+        FROM patient_search AS s
+        WHERE s.id IN ({' UNION '.join(candidates)})
+        ORDER BY {leading_match}s.display_name, s.id
+        LIMIT ?
+        """,
+        candidate_params + order_params + [limit]
+    )
+    return [row["id"] for row in rows]
+
+async def search_email_ids(text: str, limit: int, exclude: List[int]) -> List[int]:
+    """Ids of patients whose email contains text (trigram index), ordered by name"""
+    term = text.lower()
+    if len(term) < 3 or limit <= 0:
+        return []  # Trigrams need at least three characters
+    conditions, params = [], []
+    if exclude:
+        conditions.append(f"s.id NOT IN ({', '.join('?' for _ in exclude)})")
+        params += exclude
+    rows = await connections.get("default").execute_query_dict(
+        f"""
+        SELECT s.id
+        FROM patient_search AS s
+        WHERE s.id IN ({candidate_ids_sql("patient_email_fts", conditions)})
+        ORDER BY s.display_name, s.id
+        LIMIT ?
+        """,
+        ['email : "' + term.replace('"', '""') + '"', *params, SEARCH_CANDIDATES, limit]
+    )
+    return [row["id"] for row in rows]
+
+def candidate_ids_sql(index_table: str, conditions: List[str]) -> str:
+    """SELECT of at most SEARCH_CANDIDATES patient ids matching index_table and conditions.
+
+    Takes the MATCH expression, the condition parameters and the cap as parameters.
+    Only the candidates are sorted, so a common prefix does not sort its whole match set.
+    """
+    where = " AND ".join([f"{index_table} MATCH ?", *conditions])
+    return (
+        f"SELECT id FROM (SELECT s.id FROM {index_table} "
+        f"JOIN patient_search AS s ON s.id = {index_table}.rowid WHERE {where} LIMIT ?)"
+    )
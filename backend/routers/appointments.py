@@ -3,6 +3,7 @@ from typing import List, Optional
 from datetime import date
 from ..models import Appointment, Appointment_Pydantic, AppointmentIn_Pydantic, Patient, Practitioner, Practitioner_Pydantic, Patient_Pydantic
 from ..auth import get_current_user
+from ..serializers import serialize_appointments
 
 router = APIRouter()
 
@@ -117,17 +118,8 @@ async def get_appointments(
     if date:
         query = query.filter(date=date)
     
-    appointments = await query.prefetch_related('patient', 'doctor')
-    results = []
-    for appointment in appointments:
-        result = await Appointment_Pydantic.from_tortoise_orm(appointment)
-        doctor_details = await Practitioner_Pydantic.from_tortoise_orm(await appointment.doctor)
-        patient_details = await Patient_Pydantic.from_tortoise_orm(await appointment.patient)
-        result_dict = result.dict()
-        result_dict["doctorDetails"] = doctor_details.dict()
-        result_dict["patientDetails"] = patient_details.dict()
-        results.append(result_dict)
-    return results
+    appointments = await query
+    return await serialize_appointments(appointments)
 
 @router.get("/appointments/{appointment_id}", response_model=dict)
 async def get_appointment(appointment_id: int, current_user: dict = Depends(get_current_user)):
@@ -1,32 +1,51 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, Query, Request, Response
 from typing import List, Optional
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+from tortoise import timezone
+from tortoise.exceptions import IntegrityError
+import asyncio
 import os
-import uuid
-import shutil
 from ..models import (
     LabTest, Scan, MedicalUpload, LaboristRecord, Appointment, Patient, Practitioner,
+    UploadSession, UploadChunk,
     LabTest_Pydantic, Scan_Pydantic, MedicalUpload_Pydantic, LaboristRecord_Pydantic,
-    LabTestCreate, LabTestUpdate, ScanCreate, ScanUpdate, LaboristRecordCreate,
-    Appointment_Pydantic, Patient_Pydantic, Practitioner_Pydantic
+    LabTestCreate, LabTestUpdate, ScanCreate, ScanUpdate, LaboristRecordCreate, UploadSessionCreate,
+    Patient_Pydantic, Practitioner_Pydantic
 )
 from ..auth import get_current_user
+from ..serializers import bulk_serialize, serialize_appointments
+from ..pagination import paginate, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from ..blob_store import adopt_file, blob_path, release_blob, store_upload
+from ..uploads import file_response, hash_file, remove_file, write_stream_at
+from ..thumbnails import get_thumbnail, schedule_thumbnails
+from ..patient_search import search_patient_ids
 
 router = APIRouter()
 
-# Ensure uploads directory exists
-UPLOAD_DIR = "uploads/medical"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+# Resumable uploads: chunks are written in place into a .part file per session, which is
+# moved into the blob store when the session is completed. Sessions without a new chunk
+# for UPLOAD_SESSION_TTL are deleted together with their .part file.
+UPLOAD_SESSION_DIR = os.getenv("UPLOAD_SESSION_DIR", "uploads/sessions")
+MAX_RESUMABLE_UPLOAD_BYTES = int(os.getenv("MAX_RESUMABLE_UPLOAD_BYTES", str(4 * 1024 * 1024 * 1024)))
+MIN_CHUNK_SIZE = 256 * 1024
+MAX_CHUNK_SIZE = 64 * 1024 * 1024
+UPLOAD_SESSION_TTL = timedelta(hours=24)
+UPLOAD_SESSION_GC_INTERVAL = 3600
+_session_gc_task: Optional[asyncio.Task] = None
 
 # Lab Tests Endpoints
 @router.get("/lab-tests/", response_model=List[dict])
 async def get_lab_tests(
+    request: Request,
+    response: Response,
     current_user: dict = Depends(get_current_user),
     patient_id: int = None,
     status: str = None,
-    urgent_only: bool = False
+    urgent_only: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
 ):
-    """Get lab tests for laborist view"""
+    """Get lab tests for laborist view, one page at a time"""
     if current_user["role"] not in ["laborist", "practitioner"]:
         raise HTTPException(status_code=403, detail="Access denied")
     
@@ -43,25 +62,12 @@ async def get_lab_tests(
     if urgent_only:
         query = query.filter(urgent=True)
     
-    lab_tests = await query.prefetch_related('patient', 'laborist', 'requested_by')
-    results = []
-    
-    for lab_test in lab_tests:
-        result = await LabTest_Pydantic.from_tortoise_orm(lab_test)
-        patient_details = await Patient_Pydantic.from_tortoise_orm(await lab_test.patient)
-        requested_by_details = await Practitioner_Pydantic.from_tortoise_orm(await lab_test.requested_by)
-        
-        result_dict = result.dict()
-        result_dict["patientDetails"] = patient_details.dict()
-        result_dict["requestedByDetails"] = requested_by_details.dict()
-        
-        if lab_test.laborist:
-            laborist_details = await Practitioner_Pydantic.from_tortoise_orm(await lab_test.laborist)
-            result_dict["laboristDetails"] = laborist_details.dict()
-        
-        results.append(result_dict)
-    
-    return results
+    lab_tests = await paginate(query, request, response, cursor, limit)
+    return await bulk_serialize(lab_tests, LabTest_Pydantic, {
+        "patientDetails": ("patient", Patient, Patient_Pydantic),
+        "requestedByDetails": ("requested_by", Practitioner, Practitioner_Pydantic),
+        "laboristDetails": ("laborist", Practitioner, Practitioner_Pydantic),
+    })
 
 @router.put("/lab-tests/{test_id}")
 async def update_lab_test(
@@ -95,12 +101,16 @@ async def update_lab_test(
 # Scans Endpoints
 @router.get("/scans/", response_model=List[dict])
 async def get_scans(
+    request: Request,
+    response: Response,
     current_user: dict = Depends(get_current_user),
     patient_id: int = None,
     status: str = None,
-    urgent_only: bool = False
+    urgent_only: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
 ):
-    """Get scans for laborist view"""
+    """Get scans for laborist view, one page at a time"""
     if current_user["role"] not in ["laborist", "practitioner"]:
         raise HTTPException(status_code=403, detail="Access denied")
     
@@ -117,25 +127,12 @@ async def get_scans(
     if urgent_only:
         query = query.filter(urgent=True)
     
-    scans = await query.prefetch_related('patient', 'laborist', 'requested_by')
-    results = []
-    
-    for scan in scans:
-        result = await Scan_Pydantic.from_tortoise_orm(scan)
-        patient_details = await Patient_Pydantic.from_tortoise_orm(await scan.patient)
-        requested_by_details = await Practitioner_Pydantic.from_tortoise_orm(await scan.requested_by)
-        
-        result_dict = result.dict()
-        result_dict["patientDetails"] = patient_details.dict()
-        result_dict["requestedByDetails"] = requested_by_details.dict()
-        
-        if scan.laborist:
-            laborist_details = await Practitioner_Pydantic.from_tortoise_orm(await scan.laborist)
-            result_dict["laboristDetails"] = laborist_details.dict()
-        
-        results.append(result_dict)
-    
-    return results
+    scans = await paginate(query, request, response, cursor, limit)
+    return await bulk_serialize(scans, Scan_Pydantic, {
+        "patientDetails": ("patient", Patient, Patient_Pydantic),
+        "requestedByDetails": ("requested_by", Practitioner, Practitioner_Pydantic),
+        "laboristDetails": ("laborist", Practitioner, Practitioner_Pydantic),
+    })
 
 @router.put("/scans/{scan_id}")
 async def update_scan(
@@ -196,42 +193,292 @@ async def upload_medical_file(
         if not scan:
             raise HTTPException(status_code=404, detail="Scan not found")
     
-    # Generate unique filename
+    # Save file (identical content already stored is only referenced)
     file_extension = os.path.splitext(file.filename)[1]
-    unique_filename = f"{uuid.uuid4()}{file_extension}"
-    file_path = os.path.join(UPLOAD_DIR, unique_filename)
-    
-    # Save file
     try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-    except Exception as e:
+        blob = await store_upload(file)
+    except OSError as e:
         raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
     
     # Create database record
-    medical_upload = await MedicalUpload.create(
-        patient_id=patient_id,
+    try:
+        medical_upload = await MedicalUpload.create(
+            patient_id=patient_id,
+            uploaded_by_id=current_user["id"],
+            lab_test_id=lab_test_id,
+            scan_id=scan_id,
+            file_name=f"{blob.sha256}{file_extension}",
+            original_name=file.filename,
+            file_path=blob_path(blob.sha256),
+            file_type=file.content_type,
+            file_size=blob.size,
+            sha256=blob.sha256,
+            description=description
+        )
+    except Exception:
+        await release_blob(blob.sha256)
+        raise
+    schedule_thumbnails(medical_upload.file_path, medical_upload.file_type)
+    
+    result = await MedicalUpload_Pydantic.from_tortoise_orm(medical_upload)
+    return result.dict()
+
+# Resumable Upload Endpoints
+def session_part_path(session_id) -> str:
+    return os.path.join(UPLOAD_SESSION_DIR, f"{session_id}.part")
+
+def session_chunk_count(session: UploadSession) -> int:
+    return -(-session.total_size // session.chunk_size)
+
+async def get_own_session(session_id: str, current_user: dict) -> UploadSession:
+    session = await UploadSession.get_or_none(id=session_id)
+    if not session or session.uploaded_by_id != current_user["id"] or current_user["role"] == "patient":
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    return session
+
+async def delete_upload_session(session: UploadSession):
+    await session.delete()
+    await asyncio.to_thread(remove_file, session_part_path(session.id))
+
+async def expire_upload_sessions() -> int:
+    """Delete sessions that received nothing for UPLOAD_SESSION_TTL; returns how many"""
+    expired = await UploadSession.filter(updated_at__lt=timezone.now() - UPLOAD_SESSION_TTL)
+    for session in expired:
+        await delete_upload_session(session)
+    return len(expired)
+
+async def _collect_upload_sessions():
+    while await UploadSession.exists():
+        try:
+            expired = await expire_upload_sessions()
+            if expired:
+                print(f"Removed {expired} abandoned upload sessions")
+        except Exception as e:
+            print(f"Error removing abandoned upload sessions: {str(e)}")
+        await asyncio.sleep(UPLOAD_SESSION_GC_INTERVAL)
+
+def start_upload_session_gc():
+    """Run the abandoned-session collector while any upload session exists.
+
+    Called on app startup, so sessions left by a previous run are collected, and again
+    whenever a session is created after the collector stopped for lack of sessions.
+    """
+    global _session_gc_task
+    if _session_gc_task is None or _session_gc_task.done():
+        _session_gc_task = asyncio.create_task(_collect_upload_sessions())
+
+async def stop_upload_session_gc():
+    global _session_gc_task
+    if _session_gc_task is not None:
+        _session_gc_task.cancel()
+        try:
+            await _session_gc_task
+        except asyncio.CancelledError:
+            pass
+        _session_gc_task = None
+
+def session_progress(session: UploadSession, received: List[int]) -> dict:
+    total_chunks = session_chunk_count(session)
+    received_set = set(received)
+    return {
+        "session_id": str(session.id),
+        "total_size": session.total_size,
+        "chunk_size": session.chunk_size,
+        "total_chunks": total_chunks,
+        "received_chunks": sorted(received_set),
+        "missing_chunks": [number for number in range(total_chunks) if number not in received_set],
+    }
+
+@router.post("/uploads/sessions/")
+async def create_upload_session(
+    session_data: UploadSessionCreate,
+    current_user: dict = Depends(get_current_user)
+):
+    """Start a resumable upload; chunks are then PUT to /uploads/sessions/{id}/chunks/{n}"""
+    if current_user["role"] not in ["laborist", "practitioner"]:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    if not 0 < session_data.total_size <= MAX_RESUMABLE_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Uploads must be between 1 byte and {MAX_RESUMABLE_UPLOAD_BYTES // (1024 * 1024)} MB"
+        )
+    if not MIN_CHUNK_SIZE <= session_data.chunk_size <= MAX_CHUNK_SIZE:
+        raise HTTPException(status_code=400, detail=f"Chunk size must be between {MIN_CHUNK_SIZE} and {MAX_CHUNK_SIZE} bytes")
+    
+    # Verify patient exists
+    patient = await Patient.get_or_none(id=session_data.patient_id)
+    if not patient:
+        raise HTTPException(status_code=404, detail="Patient not found")
+    
+    # Verify lab test or scan exists if provided
+    if session_data.lab_test_id and not await LabTest.exists(id=session_data.lab_test_id):
+        raise HTTPException(status_code=404, detail="Lab test not found")
+    if session_data.scan_id and not await Scan.exists(id=session_data.scan_id):
+        raise HTTPException(status_code=404, detail="Scan not found")
+    
+    session = await UploadSession.create(
+        patient_id=session_data.patient_id,
         uploaded_by_id=current_user["id"],
-        lab_test_id=lab_test_id,
-        scan_id=scan_id,
-        file_name=file.filename,
-        file_path=file_path,
-        file_type=file.content_type,
-        file_size=file.size,
-        description=description
+        lab_test_id=session_data.lab_test_id,
+        scan_id=session_data.scan_id,
+        file_name=session_data.file_name,
+        file_type=session_data.file_type,
+        description=session_data.description,
+        total_size=session_data.total_size,
+        chunk_size=session_data.chunk_size,
+        sha256=session_data.sha256.lower() if session_data.sha256 else None
     )
+    await asyncio.to_thread(os.makedirs, UPLOAD_SESSION_DIR, exist_ok=True)
+    await asyncio.to_thread(lambda: open(session_part_path(session.id), "wb").close())
+    start_upload_session_gc()
+    return session_progress(session, [])
+
+@router.put("/uploads/sessions/{session_id}/chunks/{number}")
+async def upload_session_chunk(
+    session_id: str,
+    number: int,
+    request: Request,
+    current_user: dict = Depends(get_current_user)
+):
+    """Write one chunk (the raw request body) at offset number * chunk_size; re-sending a chunk is allowed"""
+    session = await get_own_session(session_id, current_user)
+    
+    if not 0 <= number < session_chunk_count(session):
+        raise HTTPException(status_code=400, detail="Chunk number out of range")
+    offset = number * session.chunk_size
+    expected = min(session.chunk_size, session.total_size - offset)
+    
+    written = await write_stream_at(session_part_path(session.id), offset, request.stream(), expected)
+    if written != expected:
+        raise HTTPException(status_code=400, detail=f"Chunk {number} must be {expected} bytes, got {written}")
+    
+    try:
+        await UploadChunk.create(session_id=session.id, number=number, size=written)
+    except IntegrityError:
+        pass  # Chunk re-sent; it has just been overwritten in place
+    await UploadSession.filter(id=session.id).update(updated_at=timezone.now())
+    return {"session_id": str(session.id), "number": number, "size": written}
+
+@router.get("/uploads/sessions/{session_id}")
+async def get_upload_session(session_id: str, current_user: dict = Depends(get_current_user)):
+    """Get the progress of a resumable upload (which chunks still have to be sent)"""
+    session = await get_own_session(session_id, current_user)
+    received = await UploadChunk.filter(session_id=session.id).values_list("number", flat=True)
+    return session_progress(session, received)
+
+@router.post("/uploads/sessions/{session_id}/complete")
+async def complete_upload_session(session_id: str, current_user: dict = Depends(get_current_user)):
+    """Assemble a finished resumable upload into a MedicalUpload"""
+    session = await get_own_session(session_id, current_user)
+    
+    received = await UploadChunk.filter(session_id=session.id).count()
+    if received != session_chunk_count(session):
+        raise HTTPException(status_code=400, detail="Upload is not complete")
+    
+    # Claim the session so a concurrent complete or the collector cannot use the file too
+    if not await UploadSession.filter(id=session.id).delete():
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    
+    part_path = session_part_path(session.id)
+    sha256 = await hash_file(part_path)
+    if session.sha256 and sha256 != session.sha256:
+        await asyncio.to_thread(remove_file, part_path)
+        raise HTTPException(status_code=400, detail="Uploaded content does not match the expected SHA-256")
+    
+    blob = await adopt_file(part_path, session.total_size, sha256)
+    file_extension = os.path.splitext(session.file_name)[1]
+    try:
+        medical_upload = await MedicalUpload.create(
+            patient_id=session.patient_id,
+            uploaded_by_id=session.uploaded_by_id,
+            lab_test_id=session.lab_test_id,
+            scan_id=session.scan_id,
+            file_name=f"{blob.sha256}{file_extension}",
+            original_name=session.file_name,
+            file_path=blob_path(blob.sha256),
+            file_type=session.file_type,
+            file_size=blob.size,
+            sha256=blob.sha256,
+            description=session.description
+        )
+    except Exception:
+        await release_blob(blob.sha256)
+        raise
+    schedule_thumbnails(medical_upload.file_path, medical_upload.file_type)
     
     result = await MedicalUpload_Pydantic.from_tortoise_orm(medical_upload)
     return result.dict()
 
+@router.delete("/uploads/sessions/{session_id}")
+async def abort_upload_session(session_id: str, current_user: dict = Depends(get_current_user)):
+    """Abandon a resumable upload and delete what was received"""
+    session = await get_own_session(session_id, current_user)
+    await delete_upload_session(session)
+    return {"message": "Upload session deleted"}
+
+async def get_accessible_upload(upload_id: int, current_user: dict) -> MedicalUpload:
+    if current_user["role"] not in ["laborist", "practitioner", "patient"]:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    medical_upload = await MedicalUpload.get_or_none(id=upload_id)
+    if not medical_upload:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    
+    if current_user["role"] == "patient" and medical_upload.patient_id != current_user["id"]:
+        raise HTTPException(status_code=403, detail="Access denied")
+    return medical_upload
+
+@router.get("/uploads/{upload_id}/download")
+async def download_medical_file(
+    upload_id: int,
+    request: Request,
+    current_user: dict = Depends(get_current_user)
+):
+    """Download an uploaded file (supports Range and If-None-Match)"""
+    medical_upload = await get_accessible_upload(upload_id, current_user)
+    return await file_response(
+        request,
+        medical_upload.file_path,
+        medical_upload.sha256,
+        medical_upload.file_type,
+        medical_upload.original_name
+    )
+
+@router.get("/uploads/{upload_id}/thumbnail")
+async def get_medical_file_thumbnail(
+    upload_id: int,
+    request: Request,
+    size: str = Query("small", pattern="^(small|medium|large)$"),
+    current_user: dict = Depends(get_current_user)
+):
+    """Get a JPEG thumbnail of an uploaded image or PDF (first page)"""
+    medical_upload = await get_accessible_upload(upload_id, current_user)
+    
+    thumbnail = await get_thumbnail(medical_upload.file_path, medical_upload.file_type, size)
+    if not thumbnail:
+        raise HTTPException(status_code=404, detail="No thumbnail available for this file")
+    
+    return await file_response(
+        request,
+        thumbnail,
+        f"{medical_upload.sha256}-{size}" if medical_upload.sha256 else None,
+        "image/jpeg",
+        f"{os.path.splitext(medical_upload.original_name)[0]}-{size}.jpg"
+    )
+
 @router.get("/uploads/", response_model=List[dict])
 async def get_medical_uploads(
+    request: Request,
+    response: Response,
     current_user: dict = Depends(get_current_user),
     patient_id: int = None,
     lab_test_id: int = None,
-    scan_id: int = None
+    scan_id: int = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
 ):
-    """Get medical uploads"""
+    """Get medical uploads, one page at a time"""
     if current_user["role"] not in ["laborist", "practitioner", "patient"]:
         raise HTTPException(status_code=403, detail="Access denied")
     
@@ -244,23 +491,11 @@ async def get_medical_uploads(
     if scan_id:
         query = query.filter(scan_id=scan_id)
     
-    uploads = await query.prefetch_related('patient', 'uploaded_by', 'lab_test', 'scan')
-    results = []
-    
-    for upload in uploads:
-        result = await MedicalUpload_Pydantic.from_tortoise_orm(upload)
-        result_dict = result.dict()
-        
-        # Add related details
-        patient_details = await Patient_Pydantic.from_tortoise_orm(await upload.patient)
-        uploaded_by_details = await Practitioner_Pydantic.from_tortoise_orm(await upload.uploaded_by)
-        
-        result_dict["patientDetails"] = patient_details.dict()
-        result_dict["uploadedByDetails"] = uploaded_by_details.dict()
-        
-        results.append(result_dict)
-    
-    return results
+    uploads = await paginate(query, request, response, cursor, limit)
+    return await bulk_serialize(uploads, MedicalUpload_Pydantic, {
+        "patientDetails": ("patient", Patient, Patient_Pydantic),
+        "uploadedByDetails": ("uploaded_by", Practitioner, Practitioner_Pydantic),
+    })
 
 # Laborist Appointments
 @router.get("/appointments/", response_model=List[dict])
@@ -277,21 +512,8 @@ async def get_laborist_appointments(
     if date:
         query = query.filter(date=date)
     
-    appointments = await query.prefetch_related('patient', 'doctor')
-    results = []
-    
-    for appointment in appointments:
-        result = await Appointment_Pydantic.from_tortoise_orm(appointment)
-        patient_details = await Patient_Pydantic.from_tortoise_orm(await appointment.patient)
-        doctor_details = await Practitioner_Pydantic.from_tortoise_orm(await appointment.doctor)
-        
-        result_dict = result.dict()
-        result_dict["patientDetails"] = patient_details.dict()
-        result_dict["doctorDetails"] = doctor_details.dict()
-        
-        results.append(result_dict)
-    
-    return results
+    appointments = await query
+    return await serialize_appointments(appointments)
 
 # Laborist Record Management
 @router.get("/record/", response_model=dict)
@@ -331,19 +553,20 @@ async def update_laborist_record(
 @router.get("/patients/search/")
 async def search_patients(
     query: str,
+    limit: int = Query(10, ge=1, le=50),
     current_user: dict = Depends(get_current_user)
 ):
-    """Search patients for laborist"""
+    """Search patients for laborist by name, national ID, phone number or email"""
     if current_user["role"] != "laborist":
         raise HTTPException(status_code=403, detail="Access denied")
     
-    patients = await Patient.filter(
-        email__icontains=query
-    ).limit(10)
+    patient_ids = await search_patient_ids(query, limit)
+    patients = {patient.id: patient for patient in await Patient.filter(id__in=patient_ids)}
     
     results = []
-    for patient in patients:
-        result = await Patient_Pydantic.from_tortoise_orm(patient)
-        results.append(result.dict())
+    for patient_id in patient_ids:
+        if patient_id in patients:
+            result = await Patient_Pydantic.from_tortoise_orm(patients[patient_id])
+            results.append(result.dict())
     
     return results 
\ No newline at end of file
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, Query, Request
 from typing import List, Optional
 from datetime import datetime, date
+from tortoise import connections, fields
+import json
 import os
-import uuid
 
 from backend.models import (
     # Models
@@ -25,7 +26,12 @@ from backend.models import (
     ImagingResult_Pydantic, ImagingResultCreate,
     PatientSummary, ComprehensiveMedicalRecord
 )
-from backend.auth import get_current_practitioner
+from backend.auth import get_current_practitioner, get_current_user
+from backend.blob_store import blob_path, release_blob, store_upload
+from backend.uploads import file_response
+from backend.thumbnails import get_thumbnail, schedule_thumbnails
+from backend.text_extraction import extractor_for, text_extraction_queue
+from backend.search import fts_query, rank_expression
 
 router = APIRouter()
 
@@ -400,24 +406,202 @@ async def get_patient_clinical_notes(
     notes = await query.order_by('-note_date').limit(limit)
     return [await ClinicalNote_Pydantic.from_tortoise_orm(note) for note in notes]
 
+# Chart Search
+
+MAX_SEARCH_RESULTS = 100
+SEARCH_SNIPPET_TOKENS = 16
+
+# (result type, FTS index, source table, title, date, extra condition) for each searchable
+# part of a chart; the indexes are defined in backend/search.py
+CHART_SEARCH_SOURCES = [
+    ("clinical_note", "clinical_notes_fts", "clinical_notes", "s.note_type", "s.note_date", None),
+    ("medical_record", "medical_records_fts", "medical_records", "s.title", "s.date_of_service", "s.status != 'deleted'"),
+    ("document", "medical_documents_fts", "medical_documents", "s.title",
+     "COALESCE(s.document_date, s.created_at)", "s.status != 'deleted'"),
+]
+
+async def search_chart(text: str, patient_id: Optional[int], limit: int) -> List[dict]:
+    """Best BM25 matches for text across notes, records and documents (of one patient, or all)"""
+    match = fts_query(text)
+    if not match:
+        return []
+    
+    selects = []
+    params = []
+    for result_type, index_table, source_table, title, service_date, condition in CHART_SEARCH_SOURCES:
+        conditions = [f"{index_table} MATCH ?"]
+        params.append(match)
+        if patient_id is not None:
+            conditions.append("s.patient_id = ?")
+            params.append(patient_id)
+        if condition:
+            conditions.append(condition)
+        selects.append(f"""
+            SELECT '{result_type}' AS type, s.id AS id, s.patient_id AS patient_id,
+                   {title} AS title, {service_date} AS date,
+                   snippet({index_table}, -1, '**', '**', '...', {SEARCH_SNIPPET_TOKENS}) AS snippet,
+                   {rank_expression(index_table)} AS relevance
+            FROM {index_table}
+            JOIN {source_table} AS s ON s.id = {index_table}.rowid
+            WHERE {' AND '.join(conditions)}
+        """)
+    params.append(limit)
+    
+    rows = await connections.get("default").execute_query_dict(
+        " UNION ALL ".join(selects) + " ORDER BY relevance LIMIT ?",
+        params
+    )
+    # bm25() is lower for better matches; expose it as a score where higher is better
+    return [{**row, "relevance": -row["relevance"]} for row in rows]
+
+@router.get("/patients/{patient_id}/search", response_model=List[dict])
+async def search_patient_chart(
+    patient_id: int,
+    q: str = Query(..., min_length=2),
+    limit: int = Query(20, ge=1, le=MAX_SEARCH_RESULTS),
+    current_practitioner: Practitioner = Depends(get_current_practitioner)
+):
+    """Full-text search of a patient's clinical notes, medical records and documents"""
+    patient = await Patient.get_or_none(id=patient_id)
+    if not patient:
+        raise HTTPException(status_code=404, detail="Patient not found")
+    
+    return await search_chart(q, patient_id, limit)
+
+@router.get("/search", response_model=List[dict])
+async def search_all_charts(
+    q: str = Query(..., min_length=2),
+    limit: int = Query(20, ge=1, le=MAX_SEARCH_RESULTS),
+    current_user: dict = Depends(get_current_user)
+):
+    """Hospital-wide full-text search of clinical notes, medical records and documents (practitioners only)"""
+    if current_user["role"] != "practitioner":
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    return await search_chart(q, None, limit)
+
 # Comprehensive Patient Medical Record
 
+# (section, model, pydantic model, extra filters, ordering, limit) for the single-statement
+# comprehensive record. Filters, ordering and limits mirror the per-section queries below.
+COMPREHENSIVE_SECTIONS = [
+    ("medical_records", MedicalRecord, MedicalRecord_Pydantic, {}, "date_of_service DESC", None),
+    ("allergies", PatientAllergy, PatientAllergy_Pydantic, {"status": "active"}, None, None),
+    ("medications", PatientMedication, PatientMedication_Pydantic, {"status": "active"}, None, None),
+    ("vital_signs", VitalSigns, VitalSigns_Pydantic, {}, "measurement_date DESC", 10),
+    ("diagnoses", Diagnosis, Diagnosis_Pydantic, {"status": "active"}, None, None),
+    ("procedures", MedicalProcedure, MedicalProcedure_Pydantic, {}, "procedure_date DESC", None),
+    ("clinical_notes", ClinicalNote, ClinicalNote_Pydantic, {}, "note_date DESC", 20),
+    ("family_history", FamilyHistory, FamilyHistory_Pydantic, {}, None, None),
+    ("social_history", SocialHistory, SocialHistory_Pydantic, {}, None, 1),
+    ("lab_results", LabResult, LabResult_Pydantic, {}, "test_date DESC", 20),
+    ("imaging_results", ImagingResult, ImagingResult_Pydantic, {}, "study_date DESC", 20),
+    ("documents", MedicalDocument, MedicalDocument_Pydantic, {"status": "active"}, "created_at DESC", None),
+]
+
+def _calculate_age(birth_date: Optional[date]) -> Optional[int]:
+    if not birth_date:
+        return None
+    today = date.today()
+    return today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
+
+def _json_object_sql(model, field_names) -> str:
+    """Build a json_object(...) expression for the given model fields, embedding JSON columns as JSON"""
+    fields_map = model._meta.fields_map
+    projection = model._meta.fields_db_projection
+    args = []
+    for name in field_names:
+        column = f'"{projection[name]}"'
+        if isinstance(fields_map[name], fields.JSONField):
+            column = f"json({column})"
+        args.append(f"'{name}', {column}")
+    return f"json_object({', '.join(args)})"
+
+def _section_sql(section: str, model, field_names, filters: dict, order_by: Optional[str], limit: Optional[int], key: str = "patient_id"):
+    """One UNION ALL arm: the section name and its rows aggregated into a JSON array"""
+    where = [f'"{key}" = ?']
+    params = []
+    for column, value in filters.items():
+        where.append(f'"{column}" = ?')
+        params.append(value)
+    inner = f'SELECT {_json_object_sql(model, field_names)} AS obj FROM "{model._meta.db_table}" WHERE {" AND ".join(where)}'
+    if order_by:
+        inner += f" ORDER BY {order_by}"
+    if limit:
+        inner += f" LIMIT {int(limit)}"
+    return f"SELECT '{section}' AS section, json_group_array(json(obj)) AS payload FROM ({inner})", params
+
+async def build_comprehensive_record_in_db(patient_id: int) -> Optional[ComprehensiveMedicalRecord]:
+    """Assemble the comprehensive record with a single SQLite statement.
+
+    Every section is aggregated with json_group_array/json_object and the sections are
+    combined with UNION ALL, so the whole chart is one round trip. Returns None if the
+    patient does not exist.
+    """
+    arms = [_section_sql("patient", Patient, ["id", "name", "email", "gender", "birth_date"], {}, None, 1, key="id")]
+    for section, model, pydantic_model, filters, order_by, limit in COMPREHENSIVE_SECTIONS:
+        arms.append(_section_sql(section, model, list(pydantic_model.model_fields), filters, order_by, limit))
+    
+    sql = " UNION ALL ".join(arm_sql for arm_sql, _ in arms)
+    params = [value for _, arm_params in arms for value in [patient_id, *arm_params]]
+    rows = await connections.get("default").execute_query_dict(sql, params)
+    payload = {row["section"]: json.loads(row["payload"]) for row in rows}
+    
+    if not payload["patient"]:
+        return None
+    patient = payload["patient"][0]
+    birth_date = date.fromisoformat(patient["birth_date"]) if patient["birth_date"] else None
+    
+    sections = {}
+    for section, _, pydantic_model, _, _, _ in COMPREHENSIVE_SECTIONS:
+        sections[section] = [pydantic_model.model_validate(item) for item in payload[section]]
+    social_history = sections.pop("social_history")
+    social_history = social_history[0] if social_history else None
+    
+    medical_records = sections["medical_records"]
+    patient_summary = PatientSummary(
+        id=patient["id"],
+        name=patient["name"],
+        email=patient["email"],
+        gender=patient["gender"],
+        birth_date=birth_date,
+        age=_calculate_age(birth_date),
+        active_allergies=[allergy.allergen for allergy in sections["allergies"]],
+        current_medications=[med.medication_name for med in sections["medications"]],
+        active_diagnoses=[dx.diagnosis_name for dx in sections["diagnoses"]],
+        last_visit=medical_records[0].date_of_service.isoformat() if medical_records else None,
+        emergency_contact=social_history.emergency_contact if social_history else None
+    )
+    
+    return ComprehensiveMedicalRecord(
+        patient_summary=patient_summary,
+        social_history=social_history.dict() if social_history else None,
+        **sections
+    )
+
 @router.get("/patients/{patient_id}/comprehensive", response_model=ComprehensiveMedicalRecord)
 async def get_comprehensive_medical_record(
     patient_id: int,
+    single_query: bool = False,
     current_practitioner: Practitioner = Depends(get_current_practitioner)
 ):
-    """Get comprehensive medical record for a patient"""
+    """Get comprehensive medical record for a patient.
+    
+    With ``single_query=true`` the record is assembled in the database in one round trip.
+    """
     try:
+        if single_query:
+            comprehensive_record = await build_comprehensive_record_in_db(patient_id)
+            if comprehensive_record is None:
+                raise HTTPException(status_code=404, detail="Patient not found")
+            return comprehensive_record
+        
         patient = await Patient.get_or_none(id=patient_id)
         if not patient:
             raise HTTPException(status_code=404, detail="Patient not found")
         
         # Calculate age
-        age = None
-        if patient.birth_date:
-            today = date.today()
-            age = today.year - patient.birth_date.year - ((today.month, today.day) < (patient.birth_date.month, patient.birth_date.day))
+        age = _calculate_age(patient.birth_date)
         
         # Get all related data
         medical_records = await MedicalRecord.filter(patient_id=patient_id).order_by('-date_of_service')
@@ -490,26 +674,16 @@ async def upload_medical_document(
     file: UploadFile = File(...),
     current_practitioner: Practitioner = Depends(get_current_practitioner)
 ):
-    """Upload a medical document with OCR support"""
+    """Upload a medical document; its text is extracted in the background unless sent"""
     try:
         # Verify patient exists
         patient = await Patient.get_or_none(id=patient_id)
         if not patient:
             raise HTTPException(status_code=404, detail="Patient not found")
         
-        # Create upload directory if it doesn't exist
-        upload_dir = "uploads/medical_documents"
-        os.makedirs(upload_dir, exist_ok=True)
-        
-        # Generate unique filename
+        # Save file (identical content already stored is only referenced)
         file_extension = os.path.splitext(file.filename)[1]
-        unique_filename = f"{uuid.uuid4()}{file_extension}"
-        file_path = os.path.join(upload_dir, unique_filename)
-        
-        # Save file
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        blob = await store_upload(file)
         
         # Parse tags if provided
         tags_list = []
@@ -529,29 +703,82 @@ async def upload_medical_document(
                 pass
         
         # Create document record
-        document = await MedicalDocument.create(
-            patient=patient,
-            uploaded_by=current_practitioner,
-            document_type=document_type,
-            title=title,
-            description=description,
-            file_name=unique_filename,
-            original_filename=file.filename,
-            file_path=file_path,
-            file_type=file_extension.lstrip('.'),
-            file_size=len(content),
-            mime_type=file.content_type,
-            provider_name=provider_name,
-            document_date=doc_date,
-            extracted_text=extracted_text,
-            tags=tags_list
-        )
+        try:
+            document = await MedicalDocument.create(
+                patient=patient,
+                uploaded_by=current_practitioner,
+                document_type=document_type,
+                title=title,
+                description=description,
+                file_name=f"{blob.sha256}{file_extension}",
+                original_filename=file.filename,
+                file_path=blob_path(blob.sha256),
+                file_type=file_extension.lstrip('.'),
+                file_size=blob.size,
+                sha256=blob.sha256,
+                mime_type=file.content_type,
+                provider_name=provider_name,
+                document_date=doc_date,
+                extracted_text=extracted_text,
+                tags=tags_list
+            )
+        except Exception:
+            await release_blob(blob.sha256)
+            raise
+        schedule_thumbnails(document.file_path, document.mime_type)
+        if extractor_for(document.mime_type, document.file_type):
+            await text_extraction_queue.enqueue(document.id)
         
         return await MedicalDocument_Pydantic.from_tortoise_orm(document)
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error uploading document: {str(e)}")
 
+@router.get("/documents/{document_id}/download")
+async def download_medical_document(
+    document_id: int,
+    request: Request,
+    current_practitioner: Practitioner = Depends(get_current_practitioner)
+):
+    """Download a medical document (supports Range and If-None-Match)"""
+    document = await MedicalDocument.get_or_none(id=document_id)
+    if not document or document.status == "deleted":
+        raise HTTPException(status_code=404, detail="Document not found")
+    
+    return await file_response(
+        request,
+        document.file_path,
+        document.sha256,
+        document.mime_type,
+        document.original_filename
+    )
+
+@router.get("/documents/{document_id}/thumbnail")
+async def get_medical_document_thumbnail(
+    document_id: int,
+    request: Request,
+    size: str = Query("small", pattern="^(small|medium|large)$"),
+    current_practitioner: Practitioner = Depends(get_current_practitioner)
+):
+    """Get a JPEG thumbnail of an image document or of a PDF's first page"""
+    document = await MedicalDocument.get_or_none(id=document_id)
+    if not document or document.status == "deleted":
+        raise HTTPException(status_code=404, detail="Document not found")
+    
+    thumbnail = await get_thumbnail(document.file_path, document.mime_type, size)
+    if not thumbnail:
+        raise HTTPException(status_code=404, detail="No thumbnail available for this document")
+    
+    return await file_response(
+        request,
+        thumbnail,
+        f"{document.sha256}-{size}" if document.sha256 else None,
+        "image/jpeg",
+        f"{os.path.splitext(document.original_filename)[0]}-{size}.jpg"
+    )
+
 @router.get("/patients/{patient_id}/documents", response_model=List[MedicalDocument_Pydantic])
 async def get_patient_documents(
     patient_id: int,
@@ -1,44 +1,184 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+from tortoise import connections
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import F, Subquery
+from tortoise.functions import Sum
+from tortoise.transactions import in_transaction
 from ..models import (
-    Medicine, Prescription, Patient, Practitioner,
-    Medicine_Pydantic, MedicineCreate, MedicineUpdate,
-    Prescription_Pydantic, PrescriptionCreate, PrescriptionDispense
+    Medicine, MedicineLot, Prescription, Patient, Practitioner,
+    Medicine_Pydantic, MedicineCreate, MedicineUpdate, MedicineLot_Pydantic, MedicineLotCreate,
+    Prescription_Pydantic, PrescriptionCreate, PrescriptionDispense, PrescriptionDispenseBatch
 )
 from ..auth import get_current_user
+from ..pagination import paginate, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from ..search import fts_query, rank_expression
+from ..kv_store import MemoryExpiringStore
+from ..alerts import alert_broker, medicine_alerts, medicine_snapshot
 
 router = APIRouter()
 
+MAX_DISPENSE_BATCH = 200
+
+# Process-local read-through cache for point-of-sale barcode scans (barcode -> medicine
+# dict). Writes to a medicine evict its barcode; the TTL bounds staleness from other workers.
+BARCODE_CACHE_TTL = 60
+barcode_cache = MemoryExpiringStore(max_entries=10000)
+
+async def invalidate_barcodes(*barcodes: Optional[str]):
+    for barcode in barcodes:
+        if barcode:
+            await barcode_cache.delete(barcode)
+
+def normalize_barcode(data: dict):
+    """Store blank barcodes as NULL so they do not collide in the unique index"""
+    if "barcode" in data and not (data["barcode"] or "").strip():
+        data["barcode"] = None
+
+# Lot inventory
+#
+# Stock is held in MedicineLot rows; Medicine.current_stock is kept equal to the sum of a
+# medicine's lots so the existing guarded decrement and reports keep working. Dispensing
+# allocates first-expiry-first-out from unexpired lots in the same transaction.
+
+# SQL condition: medicine m has stock left in an expired lot (param: today)
+EXPIRED_LOT_EXISTS = (
+    "EXISTS (SELECT 1 FROM medicine_lots AS l "
+    "WHERE l.medicine_id = m.id AND l.expiry_date < ? AND l.quantity > 0)"
+)
+
+def expired_lot_medicine_ids():
+    """Subquery of medicine ids that still have stock in an expired lot"""
+    return Subquery(
+        MedicineLot.filter(expiry_date__lt=date.today(), quantity__gt=0).values("medicine_id")
+    )
+
+async def allocate_lots(connection, medicine_id: int, quantity: int, include_expired: bool = False) -> Optional[list]:
+    """Take quantity from the lots of a medicine, earliest expiry first.
+    
+    Returns the allocations, or None if the lots cannot cover quantity (the caller must
+    roll back, since earlier lots may already have been decremented).
+    """
+    lots = MedicineLot.filter(medicine_id=medicine_id, quantity__gt=0)
+    if not include_expired:
+        lots = lots.filter(expiry_date__gte=date.today())
+    
+    allocations = []
+    remaining = quantity
+    for lot in await lots.using_db(connection).order_by("expiry_date", "id"):
+        if remaining == 0:
+            break
+        take = min(lot.quantity, remaining)
+        updated = await MedicineLot.filter(id=lot.id, quantity__gte=take).using_db(connection).update(
+            quantity=F("quantity") - take
+        )
+        if not updated:
+            return None
+        allocations.append({
+            "lot_id": lot.id,
+            "batch_number": lot.batch_number,
+            "expiry_date": lot.expiry_date,
+            "quantity": take
+        })
+        remaining -= take
+    return allocations if remaining == 0 else None
+
+async def receive_into_lot(connection, medicine_id: int, batch_number: str, expiry_date: date, quantity: int) -> MedicineLot:
+    """Add quantity to the lot with this batch number and expiry, creating it if needed"""
+    lot = await MedicineLot.filter(
+        medicine_id=medicine_id, batch_number=batch_number, expiry_date=expiry_date
+    ).using_db(connection).first()
+    if lot:
+        await MedicineLot.filter(id=lot.id).using_db(connection).update(quantity=F("quantity") + quantity)
+        lot.quantity += quantity
+        return lot
+    return await MedicineLot.create(
+        medicine_id=medicine_id,
+        batch_number=batch_number,
+        expiry_date=expiry_date,
+        quantity=quantity,
+        using_db=connection
+    )
+
 # Medicine Management
+async def search_medicines(
+    text: str,
+    category: Optional[str],
+    low_stock: bool,
+    expired: bool,
+    limit: int
+) -> List[Medicine]:
+    """Rank medicines matching text with the medicines_fts index, applying the list filters in SQL"""
+    match = fts_query(text)
+    if not match:
+        return []
+    
+    conditions = ["medicines_fts MATCH ?"]
+    params = [match]
+    if category:
+        conditions.append("m.category = ?")
+        params.append(category)
+    if low_stock:
+        conditions.append("m.current_stock <= m.minimum_stock")
+    if expired:
+        conditions.append(EXPIRED_LOT_EXISTS)
+        params.append(date.today().isoformat())
+    params.append(limit)
+    
+    rows = await connections.get("default").execute_query_dict(
+        f"""
+        SELECT m.id
+        FROM medicines_fts
+        JOIN medicines AS m ON m.id = medicines_fts.rowid
+        WHERE {' AND '.join(conditions)}
+        ORDER BY {rank_expression('medicines_fts')}
+        LIMIT ?
+        """,
+        params
+    )
+    ids = [row["id"] for row in rows]
+    medicines = {m.id: m for m in await Medicine.filter(id__in=ids)}
+    return [medicines[medicine_id] for medicine_id in ids if medicine_id in medicines]
+
 @router.get("/medicines/", response_model=List[dict])
 async def get_medicines(
+    request: Request,
+    response: Response,
     current_user: dict = Depends(get_current_user),
     category: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
     low_stock: bool = Query(False),
-    expired: bool = Query(False)
+    expired: bool = Query(False),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
 ):
-    """Get all medicines with optional filtering"""
-    query = Medicine.all()
-    
-    if category:
-        query = query.filter(category=category)
+    """Get medicines with optional filtering, one page at a time ordered by name.
     
+    With ``search`` the name, generic name, brand name and barcode are matched by word
+    prefix through the full-text index and the best ``limit`` matches are returned by
+    relevance instead (no next page).
+    """
     if search:
-        query = query.filter(name__icontains=search)
-    
-    if low_stock:
-        query = query.filter(current_stock__lte=Medicine.minimum_stock)
-    
-    if expired:
-        query = query.filter(expiry_date__lt=date.today())
-    
-    medicines = await query
+        medicines = await search_medicines(search, category, low_stock, expired, limit)
+    else:
+        query = Medicine.all()
+        
+        if category:
+            query = query.filter(category=category)
+        
+        if low_stock:
+            query = query.filter(current_stock__lte=Medicine.minimum_stock)
+        
+        if expired:
+            query = query.filter(id__in=expired_lot_medicine_ids())
+        
+        medicines = await paginate(query, request, response, cursor, limit, sort_field="name")
     results = []
     
     for medicine in medicines:
-        medicine_data = await Medicine_Pydantic.from_tortoise_orm(medicine)
+        medicine_data = Medicine_Pydantic.model_validate(medicine)
         medicine_dict = medicine_data.dict()
         # Convert Decimal to float for JSON serialization
         medicine_dict["unit_price"] = float(medicine_dict["unit_price"])
@@ -58,6 +198,20 @@ async def get_medicine(medicine_id: int, current_user: dict = Depends(get_curren
     medicine_dict["unit_price"] = float(medicine_dict["unit_price"])
     return medicine_dict
 
+@router.get("/medicines/by-barcode/{code}", response_model=dict)
+async def get_medicine_by_barcode(code: str, current_user: dict = Depends(get_current_user)):
+    """Get a medicine by its barcode (point-of-sale scans)"""
+    medicine_dict = await barcode_cache.get(code)
+    if medicine_dict is None:
+        medicine = await Medicine.get_or_none(barcode=code)
+        if not medicine:
+            raise HTTPException(status_code=404, detail="Medicine not found")
+        
+        medicine_dict = Medicine_Pydantic.model_validate(medicine).dict()
+        medicine_dict["unit_price"] = float(medicine_dict["unit_price"])
+        await barcode_cache.set(code, medicine_dict, BARCODE_CACHE_TTL)
+    return medicine_dict
+
 @router.post("/medicines/", response_model=dict)
 async def create_medicine(
     medicine_data: MedicineCreate,
@@ -67,7 +221,18 @@ async def create_medicine(
     if current_user.get("role") != "pharmacist":
         raise HTTPException(status_code=403, detail="Only pharmacists can add medicines")
     
-    medicine = await Medicine.create(**medicine_data.dict())
+    data = medicine_data.dict()
+    normalize_barcode(data)
+    try:
+        async with in_transaction() as connection:
+            medicine = await Medicine.create(**data, using_db=connection)
+            if medicine.current_stock > 0:
+                await receive_into_lot(
+                    connection, medicine.id, medicine.batch_number, medicine.expiry_date, medicine.current_stock
+                )
+    except IntegrityError:
+        raise HTTPException(status_code=400, detail="Barcode already in use")
+    alert_broker.publish(medicine_alerts(medicine))
     medicine_pydantic = await Medicine_Pydantic.from_tortoise_orm(medicine)
     medicine_dict = medicine_pydantic.dict()
     medicine_dict["unit_price"] = float(medicine_dict["unit_price"])
@@ -89,7 +254,34 @@ async def update_medicine(
     
     update_data = medicine_data.dict(exclude_unset=True)
     if update_data:
-        await medicine.update_from_dict(update_data).save()
+        normalize_barcode(update_data)
+        old_barcode = medicine.barcode
+        before = medicine_snapshot(medicine)
+        # A new current_stock is applied as a delta to the lots (and to the row, so a
+        # concurrent dispense is not overwritten); losses come out of the earliest expiry.
+        stock_change = update_data.pop("current_stock", medicine.current_stock) - medicine.current_stock
+        try:
+            async with in_transaction() as connection:
+                if update_data:
+                    await medicine.update_from_dict(update_data).save(
+                        using_db=connection, update_fields=[*update_data, "updated_at"]
+                    )
+                if stock_change > 0:
+                    await receive_into_lot(
+                        connection, medicine.id, medicine.batch_number, medicine.expiry_date, stock_change
+                    )
+                elif stock_change < 0:
+                    if await allocate_lots(connection, medicine.id, -stock_change, include_expired=True) is None:
+                        raise HTTPException(status_code=400, detail="Insufficient stock")
+                if stock_change:
+                    await Medicine.filter(id=medicine.id).using_db(connection).update(
+                        current_stock=F("current_stock") + stock_change, updated_at=datetime.now()
+                    )
+                    await medicine.refresh_from_db(fields=["current_stock"], using_db=connection)
+        except IntegrityError:
+            raise HTTPException(status_code=400, detail="Barcode already in use")
+        await invalidate_barcodes(old_barcode, medicine.barcode)
+        alert_broker.publish(medicine_alerts(medicine, before))
     
     medicine_pydantic = await Medicine_Pydantic.from_tortoise_orm(medicine)
     medicine_dict = medicine_pydantic.dict()
@@ -111,16 +303,80 @@ async def delete_medicine(
     
     medicine.active = False
     await medicine.save()
+    await invalidate_barcodes(medicine.barcode)
     return {"message": "Medicine deactivated successfully"}
 
+# Lots
+@router.get("/medicines/{medicine_id}/lots", response_model=List[dict])
+async def get_medicine_lots(medicine_id: int, current_user: dict = Depends(get_current_user)):
+    """Get the lots of a medicine that still have stock, in FEFO order"""
+    lots = await MedicineLot.filter(medicine_id=medicine_id, quantity__gt=0).order_by("expiry_date", "id")
+    return [MedicineLot_Pydantic.model_validate(lot).dict() for lot in lots]
+
+@router.post("/medicines/{medicine_id}/lots", response_model=dict)
+async def receive_medicine_lot(
+    medicine_id: int,
+    lot_data: MedicineLotCreate,
+    current_user: dict = Depends(get_current_user)
+):
+    """Receive stock into a lot (pharmacist only)"""
+    if current_user.get("role") != "pharmacist":
+        raise HTTPException(status_code=403, detail="Only pharmacists can receive stock")
+    
+    if lot_data.quantity <= 0:
+        raise HTTPException(status_code=400, detail="Quantity must be positive")
+    
+    medicine = await Medicine.get_or_none(id=medicine_id)
+    if not medicine:
+        raise HTTPException(status_code=404, detail="Medicine not found")
+    
+    async with in_transaction() as connection:
+        lot = await receive_into_lot(
+            connection, medicine.id, lot_data.batch_number, lot_data.expiry_date, lot_data.quantity
+        )
+        await Medicine.filter(id=medicine.id).using_db(connection).update(
+            current_stock=F("current_stock") + lot_data.quantity, updated_at=datetime.now()
+        )
+    
+    await invalidate_barcodes(medicine.barcode)
+    return MedicineLot_Pydantic.model_validate(lot).dict()
+
+@router.get("/lots/expiring", response_model=List[dict])
+async def get_expiring_lots(
+    request: Request,
+    response: Response,
+    current_user: dict = Depends(get_current_user),
+    days: int = Query(30, ge=0),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+):
+    """Get lots with stock that expire within the next ``days`` days, soonest first"""
+    today = date.today()
+    query = MedicineLot.filter(
+        expiry_date__gte=today, expiry_date__lte=today + timedelta(days=days), quantity__gt=0
+    ).select_related("medicine")
+    lots = await paginate(query, request, response, cursor, limit, sort_field="expiry_date")
+    
+    results = []
+    for lot in lots:
+        lot_dict = MedicineLot_Pydantic.model_validate(lot).dict()
+        lot_dict["medicine_id"] = lot.medicine_id
+        lot_dict["medicine_name"] = lot.medicine.name
+        results.append(lot_dict)
+    return results
+
 # Prescription Management
 @router.get("/prescriptions/", response_model=List[dict])
 async def get_prescriptions(
+    request: Request,
+    response: Response,
     current_user: dict = Depends(get_current_user),
     status: Optional[str] = Query(None),
-    patient_id: Optional[int] = Query(None)
+    patient_id: Optional[int] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
 ):
-    """Get prescriptions with patient and medicine details"""
+    """Get prescriptions with patient and medicine details, one page at a time"""
     query = Prescription.all().prefetch_related('patient', 'prescriber', 'medicine', 'pharmacist')
     
     if status:
@@ -129,11 +385,11 @@ async def get_prescriptions(
     if patient_id:
         query = query.filter(patient_id=patient_id)
     
-    prescriptions = await query
+    prescriptions = await paginate(query, request, response, cursor, limit)
     results = []
     
     for prescription in prescriptions:
-        prescription_data = await Prescription_Pydantic.from_tortoise_orm(prescription)
+        prescription_data = Prescription_Pydantic.model_validate(prescription)
         prescription_dict = prescription_data.dict()
         
         # Add related data
@@ -240,6 +496,50 @@ async def create_prescription(
     prescription_pydantic = await Prescription_Pydantic.from_tortoise_orm(prescription)
     return prescription_pydantic.dict()
 
+async def decrement_stock(connection, medicine_id: int, quantity: int) -> Optional[int]:
+    """Take quantity out of stock with a guarded UPDATE.
+    
+    Returns the remaining stock, or None (and changes nothing) if there is not enough.
+    """
+    updated = await Medicine.filter(id=medicine_id, current_stock__gte=quantity).using_db(connection).update(
+        current_stock=F("current_stock") - quantity,
+        updated_at=datetime.now()
+    )
+    if not updated:
+        return None
+    return await Medicine.filter(id=medicine_id).using_db(connection).first().values_list("current_stock", flat=True)
+
+def publish_stock_alerts(medicine: Medicine, remaining_stock: int, quantity: int):
+    """Publish alerts for a medicine whose stock just dropped by quantity to remaining_stock.
+    
+    The stock before is derived from the post-update remaining_stock rather than taken
+    from the row read before the transaction, so when dispenses run concurrently only
+    the one that actually crosses a threshold publishes it.
+    """
+    before = medicine_snapshot(medicine)
+    before["current_stock"] = remaining_stock + quantity
+    medicine.current_stock = remaining_stock
+    alert_broker.publish(medicine_alerts(medicine, before))
+
+# Sales rollups
+async def record_daily_sale(connection, day: date, medicine: Medicine, quantity: int, prescriptions: int = 1):
+    """Add a dispensed quantity to the day's rollup row (call inside the dispensing transaction).
+
+    Amounts are always computed as REAL, matching the backfill in the rollup migration,
+    so totals do not depend on the TEXT affinity of the Decimal column.
+    """
+    await connection.execute_query(
+        """
+        INSERT INTO daily_sales_rollup (day, medicine_id, quantity, amount, prescriptions)
+        VALUES (?, ?, ?, ROUND(CAST(? AS REAL), 2), ?)
+        ON CONFLICT (day, medicine_id) DO UPDATE SET
+            quantity = quantity + excluded.quantity,
+            amount = ROUND(CAST(amount AS REAL) + CAST(excluded.amount AS REAL), 2),
+            prescriptions = prescriptions + excluded.prescriptions
+        """,
+        [day.isoformat(), medicine.id, quantity, str(medicine.unit_price * quantity), prescriptions]
+    )
+
 @router.post("/prescriptions/{prescription_id}/dispense")
 async def dispense_prescription(
     prescription_id: int,
@@ -250,51 +550,229 @@ async def dispense_prescription(
     if current_user.get("role") != "pharmacist":
         raise HTTPException(status_code=403, detail="Only pharmacists can dispense prescriptions")
     
-    prescription = await Prescription.get_or_none(id=prescription_id).prefetch_related('medicine')
+    prescription = await Prescription.get_or_none(id=prescription_id).select_related('medicine')
     if not prescription:
         raise HTTPException(status_code=404, detail="Prescription not found")
     
-    if prescription.status == "dispensed":
-        raise HTTPException(status_code=400, detail="Prescription already dispensed")
+    # Get pharmacist
+    pharmacist = await Practitioner.get_or_none(id=dispense_data.pharmacist_id)
+    if not pharmacist:
+        raise HTTPException(status_code=404, detail="Pharmacist not found")
     
-    # Check if enough stock is available
-    if prescription.medicine.current_stock < dispense_data.quantity_dispensed:
-        raise HTTPException(status_code=400, detail="Insufficient stock")
+    # The status and stock checks are part of the UPDATEs themselves, so two pharmacists
+    # dispensing concurrently can neither dispense twice nor oversell; raising inside the
+    # block rolls back whatever was already written.
+    async with in_transaction() as connection:
+        dispensed_date = datetime.now()
+        updated = await Prescription.filter(id=prescription_id).exclude(status="dispensed").using_db(connection).update(
+            quantity_dispensed=dispense_data.quantity_dispensed,
+            status="dispensed",
+            dispensed_date=dispensed_date,
+            pharmacist_id=pharmacist.id
+        )
+        if not updated:
+            raise HTTPException(status_code=400, detail="Prescription already dispensed")
+        
+        # Update medicine stock
+        remaining_stock = await decrement_stock(connection, prescription.medicine_id, dispense_data.quantity_dispensed)
+        if remaining_stock is None:
+            raise HTTPException(status_code=400, detail="Insufficient stock")
+        allocations = await allocate_lots(connection, prescription.medicine_id, dispense_data.quantity_dispensed)
+        if allocations is None:
+            raise HTTPException(status_code=400, detail="Insufficient unexpired stock")
+        
+        await record_daily_sale(
+            connection,
+            dispensed_date.date(),
+            prescription.medicine,
+            dispense_data.quantity_dispensed
+        )
+    
+    await invalidate_barcodes(prescription.medicine.barcode)
+    publish_stock_alerts(prescription.medicine, remaining_stock, dispense_data.quantity_dispensed)
+    return {"message": "Prescription dispensed successfully", "lots": allocations}
+
+class InsufficientStock(Exception):
+    pass
+
+DISPENSE_GROUP_SAVEPOINT = "dispense_group"
+
+@router.post("/prescriptions/dispense-batch")
+async def dispense_prescription_batch(
+    batch: PrescriptionDispenseBatch,
+    current_user: dict = Depends(get_current_user)
+):
+    """Dispense several prescriptions in one transaction (pharmacist only).
+    
+    Items are grouped per medicine and each group takes its stock with one guarded
+    decrement. A group that cannot be covered is rolled back on its own, so the
+    response lists the outcome of every item in request order.
+    """
+    if current_user.get("role") != "pharmacist":
+        raise HTTPException(status_code=403, detail="Only pharmacists can dispense prescriptions")
+    
+    if not batch.items:
+        raise HTTPException(status_code=400, detail="No prescriptions to dispense")
+    if len(batch.items) > MAX_DISPENSE_BATCH:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_DISPENSE_BATCH} prescriptions can be dispensed at once")
+    
+    prescription_ids = [item.prescription_id for item in batch.items]
+    if len(set(prescription_ids)) != len(prescription_ids):
+        raise HTTPException(status_code=400, detail="Duplicate prescriptions in batch")
     
     # Get pharmacist
-    pharmacist = await Practitioner.get_or_none(id=dispense_data.pharmacist_id)
+    pharmacist = await Practitioner.get_or_none(id=batch.pharmacist_id)
     if not pharmacist:
         raise HTTPException(status_code=404, detail="Pharmacist not found")
     
-    # Update prescription
-    prescription.quantity_dispensed = dispense_data.quantity_dispensed
-    prescription.status = "dispensed"
-    prescription.dispensed_date = datetime.now()
-    prescription.pharmacist = pharmacist
-    await prescription.save()
+    prescriptions = {
+        p.id: p for p in await Prescription.filter(id__in=prescription_ids).select_related('medicine')
+    }
+    
+    results = {}
+    groups = {}  # medicine_id -> items
+    for item in batch.items:
+        prescription = prescriptions.get(item.prescription_id)
+        if not prescription:
+            results[item.prescription_id] = "Prescription not found"
+        elif prescription.status == "dispensed":
+            results[item.prescription_id] = "Prescription already dispensed"
+        else:
+            groups.setdefault(prescription.medicine_id, []).append(item)
+    
+    remaining = {}  # medicine_id -> (stock left after the batch, quantity taken)
+    lots = []  # Lot allocations per dispensed medicine
+    async with in_transaction() as connection:
+        dispensed_date = datetime.now()
+        for medicine_id, items in groups.items():
+            dispensed = []
+            # Explicit savepoint so an uncovered medicine only rolls back its own items;
+            # a nested in_transaction() is not a savepoint on every supported tortoise version
+            await connection.execute_query(f"SAVEPOINT {DISPENSE_GROUP_SAVEPOINT}")
+            try:
+                for item in items:
+                    updated = await Prescription.filter(id=item.prescription_id).exclude(status="dispensed").using_db(connection).update(
+                        quantity_dispensed=item.quantity_dispensed,
+                        status="dispensed",
+                        dispensed_date=dispensed_date,
+                        pharmacist_id=pharmacist.id
+                    )
+                    if updated:
+                        dispensed.append(item)
+                    else:
+                        results[item.prescription_id] = "Prescription already dispensed"
+                
+                quantity = sum(item.quantity_dispensed for item in dispensed)
+                if dispensed:
+                    remaining_stock = await decrement_stock(connection, medicine_id, quantity)
+                    if remaining_stock is None:
+                        raise InsufficientStock()
+                    allocations = await allocate_lots(connection, medicine_id, quantity)
+                    if allocations is None:
+                        raise InsufficientStock()
+                    remaining[medicine_id] = (remaining_stock, quantity)
+                    lots.append({"medicine_id": medicine_id, "allocations": allocations})
+            except InsufficientStock:
+                await connection.execute_query(f"ROLLBACK TO {DISPENSE_GROUP_SAVEPOINT}")
+                for item in dispensed:
+                    results[item.prescription_id] = "Insufficient stock"
+                continue
+            finally:
+                await connection.execute_query(f"RELEASE {DISPENSE_GROUP_SAVEPOINT}")
+            
+            if dispensed:
+                await record_daily_sale(
+                    connection,
+                    dispensed_date.date(),
+                    prescriptions[dispensed[0].prescription_id].medicine,
+                    quantity,
+                    prescriptions=len(dispensed)
+                )
+                for item in dispensed:
+                    results[item.prescription_id] = None
+    
+    medicines = [prescriptions[items[0].prescription_id].medicine for items in groups.values()]
+    await invalidate_barcodes(*(medicine.barcode for medicine in medicines))
+    for medicine in medicines:
+        if medicine.id in remaining:
+            publish_stock_alerts(medicine, *remaining[medicine.id])
+    
+    items = [
+        {
+            "prescription_id": prescription_id,
+            "status": "dispensed" if results[prescription_id] is None else "failed",
+            "detail": results[prescription_id]
+        }
+        for prescription_id in prescription_ids
+    ]
+    dispensed_count = sum(1 for item in items if item["status"] == "dispensed")
+    return {
+        "dispensed": dispensed_count,
+        "failed": len(items) - dispensed_count,
+        "results": items,
+        "lots": lots
+    }
+
+@router.get("/alerts/stream")
+async def stream_alerts(request: Request, current_user: dict = Depends(get_current_user)):
+    """Stream low-stock and expiry alerts as Server-Sent Events (pharmacist only).
     
-    # Update medicine stock
-    prescription.medicine.current_stock -= dispense_data.quantity_dispensed
-    await prescription.medicine.save()
+    Alerts are raised when a create, update or dispense moves a medicine to or below its
+    minimum stock, or into its expiry warning window / past its expiry date.
+    """
+    if current_user.get("role") != "pharmacist":
+        raise HTTPException(status_code=403, detail="Only pharmacists can subscribe to stock alerts")
     
-    return {"message": "Prescription dispensed successfully"}
+    return StreamingResponse(
+        alert_broker.stream(request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 # Inventory Reports
+INVENTORY_TOTALS_SQL = f"""
+    SELECT
+        COUNT(*) AS total_medicines,
+        COALESCE(SUM(CASE WHEN m.current_stock <= m.minimum_stock THEN 1 ELSE 0 END), 0) AS low_stock_count,
+        COALESCE(SUM(CASE WHEN {EXPIRED_LOT_EXISTS} THEN 1 ELSE 0 END), 0) AS expired_count,
+        COALESCE(SUM(CAST(m.unit_price AS REAL) * m.current_stock), 0) AS total_value
+    FROM medicines AS m
+    WHERE m.active = 1
+"""
+
 @router.get("/reports/inventory/")
-async def get_inventory_report(current_user: dict = Depends(get_current_user)):
-    """Get inventory report with stock levels"""
-    medicines = await Medicine.filter(active=True)
+async def get_inventory_report(
+    request: Request,
+    response: Response,
+    current_user: dict = Depends(get_current_user),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+):
+    """Get inventory report with stock levels.
     
-    total_medicines = len(medicines)
-    low_stock_count = len([m for m in medicines if m.current_stock <= m.minimum_stock])
-    expired_count = len([m for m in medicines if m.expiry_date < date.today()])
-    total_value = sum([float(m.unit_price) * m.current_stock for m in medicines])
+    Totals are aggregated in SQL over all active medicines; ``medicines`` holds one
+    page of per-medicine rows ordered by name (follow the ``Link`` header for more).
+    A medicine counts as expired while any of its expired lots still has stock.
+    """
+    today = date.today()
+    totals = (await connections.get("default").execute_query_dict(INVENTORY_TOTALS_SQL, [today.isoformat()]))[0]
+    
+    query = Medicine.filter(active=True).only(
+        "id", "name", "current_stock", "minimum_stock", "expiry_date", "unit_price"
+    )
+    medicines = await paginate(query, request, response, cursor, limit, sort_field="name")
+    expired_stock = dict(
+        await MedicineLot.filter(medicine_id__in=[m.id for m in medicines], expiry_date__lt=today, quantity__gt=0)
+        .annotate(expired=Sum("quantity"))
+        .group_by("medicine_id")
+        .values_list("medicine_id", "expired")
+    )
     
     return {
-        "total_medicines": total_medicines,
-        "low_stock_count": low_stock_count,
-        "expired_count": expired_count,
-        "total_value": total_value,
+        "total_medicines": totals["total_medicines"],
+        "low_stock_count": totals["low_stock_count"],
+        "expired_count": totals["expired_count"],
+        "total_value": float(totals["total_value"]),
         "medicines": [
             {
                 "id": m.id,
@@ -304,48 +782,64 @@ async def get_inventory_report(current_user: dict = Depends(get_current_user)):
                 "expiry_date": m.expiry_date,
                 "unit_price": float(m.unit_price),
                 "total_value": float(m.unit_price) * m.current_stock,
-                "status": "expired" if m.expiry_date < date.today() else 
+                "expired_stock": expired_stock.get(m.id, 0),
+                "status": "expired" if m.id in expired_stock else 
                          "low_stock" if m.current_stock <= m.minimum_stock else "normal"
             }
             for m in medicines
         ]
     }
 
+SALES_GROUPS = {
+    "medicine": "m.name",
+    "category": "m.category",
+    "manufacturer": "m.manufacturer",
+}
+
 @router.get("/reports/sales/")
 async def get_sales_report(
     current_user: dict = Depends(get_current_user),
     start_date: Optional[date] = Query(None),
-    end_date: Optional[date] = Query(None)
+    end_date: Optional[date] = Query(None),
+    group_by: str = Query("medicine", pattern="^(medicine|category|manufacturer)$")
 ):
-    """Get sales report for dispensed prescriptions"""
-    query = Prescription.filter(status="dispensed").prefetch_related('medicine')
+    """Get sales report for dispensed prescriptions.
     
+    Reads the daily sales rollups for the date range (both ends inclusive) and groups
+    them by medicine name, category or manufacturer.
+    """
+    conditions = []
+    params = []
     if start_date:
-        query = query.filter(dispensed_date__gte=start_date)
+        conditions.append("r.day >= ?")
+        params.append(start_date.isoformat())
     if end_date:
-        query = query.filter(dispensed_date__lte=end_date)
-    
-    prescriptions = await query
-    
-    total_sales = 0
-    medicine_sales = {}
+        conditions.append("r.day <= ?")
+        params.append(end_date.isoformat())
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    
+    rows = await connections.get("default").execute_query_dict(
+        f"""
+        SELECT {SALES_GROUPS[group_by]} AS group_key,
+            SUM(r.quantity) AS quantity,
+            SUM(CAST(r.amount AS REAL)) AS amount,
+            SUM(r.prescriptions) AS prescriptions
+        FROM daily_sales_rollup AS r
+        JOIN medicines AS m ON m.id = r.medicine_id
+        {where}
+        GROUP BY group_key
+        ORDER BY group_key
+        """,
+        params
+    )
     
-    for prescription in prescriptions:
-        if prescription.medicine:
-            sale_amount = float(prescription.medicine.unit_price) * prescription.quantity_dispensed
-            total_sales += sale_amount
-            
-            medicine_name = prescription.medicine.name
-            if medicine_name not in medicine_sales:
-                medicine_sales[medicine_name] = {
-                    "quantity": 0,
-                    "amount": 0
-                }
-            medicine_sales[medicine_name]["quantity"] += prescription.quantity_dispensed
-            medicine_sales[medicine_name]["amount"] += sale_amount
+    sales = {
+        row["group_key"]: {"quantity": row["quantity"], "amount": round(row["amount"], 2)}
+        for row in rows
+    }
     
     return {
-        "total_sales": total_sales,
-        "total_prescriptions": len(prescriptions),
-        "medicine_sales": medicine_sales
-    } 
\ No newline at end of file
+        "total_sales": round(sum(row["amount"] for row in rows), 2),
+        "total_prescriptions": sum(row["prescriptions"] for row in rows),
+        f"{group_by}_sales": sales
+    }
@@ -0,0 +1,100 @@
+import re
+from typing import List
+from tortoise import connections
+
+# Full-text search indexes
+#
+# SQLite FTS5 tables that mirror searchable text columns. They are external-content
+# tables (the text lives only in the source table) kept in sync by triggers, so every
+# write path stays consistent without touching the routers. ensure_search_indexes()
+# runs on startup: it creates missing indexes and builds them from existing rows.
+
+# (index table, source table, indexed columns, bm25 column weights, extra FTS5 options)
+SEARCH_INDEXES = [
+    (
+        "medicines_fts", "medicines",
+        ("name", "generic_name", "brand_name", "barcode"),
+        (10.0, 5.0, 5.0, 2.0),
+        "prefix='2 3 4'",
+    ),
+    (
+        "clinical_notes_fts", "clinical_notes",
+        ("subjective", "objective", "assessment", "plan", "note_content"),
+        (1.0, 1.0, 2.0, 1.5, 1.0),
+        "prefix='3'",
+    ),
+    (
+        "medical_records_fts", "medical_records",
+        ("title", "chief_complaint", "clinical_summary", "treatment_plan", "discharge_notes"),
+        (3.0, 2.0, 1.5, 1.0, 1.0),
+        "prefix='3'",
+    ),
+    (
+        "medical_documents_fts", "medical_documents",
+        ("title", "description", "extracted_text"),
+        (3.0, 2.0, 1.0),
+        "prefix='3'",
+    ),
+    (
+        "patient_names_fts", "patient_search",
+        ("name_folded",),
+        (1.0,),
+        "prefix='1 2 3'",
+    ),
+    (
+        # Trigrams match any part of a national ID or phone number, not just its start
+        "patient_numbers_fts", "patient_search",
+        ("identifiers", "phones"),
+        (1.0, 1.0),
+        "tokenize='trigram'",
+    ),
+    (
+        "patient_email_fts", "patient_search",
+        ("email",),
+        (1.0,),
+        "tokenize='trigram'",
+    ),
+]
+
+def _index_sql(index_table: str, source_table: str, columns, options: str) -> List[str]:
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    delete_old = (
+        f"INSERT INTO {index_table} ({index_table}, rowid, {column_list}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    insert_new = f"INSERT INTO {index_table} (rowid, {column_list}) VALUES (new.id, {new_values});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {index_table} USING fts5("
+        f"{column_list}, content='{source_table}', content_rowid='id', {options})",
+        f"CREATE TRIGGER IF NOT EXISTS {index_table}_ai AFTER INSERT ON {source_table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {index_table}_ad AFTER DELETE ON {source_table} BEGIN {delete_old} END",
+        # Only the indexed columns fire this trigger, so stock updates do not touch the index
+        f"CREATE TRIGGER IF NOT EXISTS {index_table}_au AFTER UPDATE OF {column_list} ON {source_table} "
+        f"BEGIN {delete_old} {insert_new} END",
+    ]
+
+async def ensure_search_indexes():
+    """Create missing FTS5 indexes and their triggers, then build them from existing rows"""
+    connection = connections.get("default")
+    for index_table, source_table, columns, _, options in SEARCH_INDEXES:
+        existing = await connection.execute_query_dict(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", [index_table]
+        )
+        for statement in _index_sql(index_table, source_table, columns, options):
+            await connection.execute_script(statement)
+        if not existing:
+            await connection.execute_script(f"INSERT INTO {index_table} ({index_table}) VALUES ('rebuild')")
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 query where every word is matched as a prefix"""
+    terms = re.findall(r"\w+", text)
+    return " ".join(f'"{term}"*' for term in terms)
+
+def rank_expression(index_table: str) -> str:
+    """bm25() call with the column weights configured for index_table"""
+    for table, _, _, weights, _ in SEARCH_INDEXES:
+        if table == index_table:
+            return f"bm25({index_table}, {', '.join(str(weight) for weight in weights)})"
+    raise ValueError(f"Unknown search index: {index_table}")
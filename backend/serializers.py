@@ -0,0 +1,52 @@
+from typing import Dict, List, Tuple, Type
+from tortoise import models
+from backend.models import (
+    Patient, Practitioner,
+    Appointment_Pydantic, Patient_Pydantic, Practitioner_Pydantic
+)
+
+# Bulk serialization helpers
+#
+# The routers used to call ``from_tortoise_orm`` for every row and then await and
+# re-serialize each related object, so a list of N rows cost N pydantic builds per
+# relation plus an await per row. These helpers load every related table with a
+# single ``id__in`` query and serialize each distinct related object once, so a
+# listing costs one query for the rows plus one per relation whatever its size.
+
+async def bulk_serialize(
+    rows: List[models.Model],
+    pydantic_model,
+    related: Dict[str, Tuple[str, Type[models.Model], object]]
+) -> List[dict]:
+    """Serialize rows and their related objects with a fixed number of queries.
+
+    ``related`` maps the output key (e.g. ``"doctorDetails"``) to a tuple of
+    (foreign key attribute, related model, related pydantic model). Rows whose
+    foreign key is null simply omit the key, matching the per-row code paths.
+    """
+    details_by_key = {}
+    for output_key, (fk_name, model, related_pydantic) in related.items():
+        ids = {getattr(row, f"{fk_name}_id") for row in rows}
+        ids.discard(None)
+        details = {}
+        if ids:
+            for obj in await model.filter(id__in=ids):
+                details[obj.id] = related_pydantic.model_validate(obj).dict()
+        details_by_key[output_key] = (fk_name, details)
+
+    results = []
+    for row in rows:
+        result_dict = pydantic_model.model_validate(row).dict()
+        for output_key, (fk_name, details) in details_by_key.items():
+            related_id = getattr(row, f"{fk_name}_id")
+            if related_id in details:
+                result_dict[output_key] = dict(details[related_id])
+        results.append(result_dict)
+    return results
+
+async def serialize_appointments(appointments: List[models.Model]) -> List[dict]:
+    """Serialize appointments with ``doctorDetails`` and ``patientDetails`` in three queries"""
+    return await bulk_serialize(appointments, Appointment_Pydantic, {
+        "doctorDetails": ("doctor", Practitioner, Practitioner_Pydantic),
+        "patientDetails": ("patient", Patient, Patient_Pydantic),
+    })
@@ -0,0 +1,292 @@
+import argparse
+import asyncio
+import os
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
+from typing import List, Optional, Set, Tuple
+from tortoise import Tortoise, timezone
+from tortoise.expressions import F
+from backend.config import TORTOISE_ORM
+from backend.models import MedicalDocument, TextExtractionJob
+
+# Document text extraction
+#
+# Uploading a document only inserts a TextExtractionJob row; the text is extracted
+# later so upload latency does not depend on document size. The jobs table is the
+# queue, so queued work survives restarts. A dispatcher claims at most `workers` jobs
+# at a time (a claim leases the job by pushing its available_at forward, so several
+# server processes can share the table) and runs the extraction in a process pool.
+# Everything else waits in the table, which is the back-pressure: a burst of uploads
+# grows the table, not memory or CPU contention. Failed jobs are retried with backoff.
+#
+# Documents stored before this existed (or after changing extractors) are queued with
+#     python -m backend.text_extraction reindex [--force]
+
+EXTRACTION_WORKERS = int(os.getenv("TEXT_EXTRACTION_WORKERS", "2"))
+EXTRACTION_LEASE = timedelta(minutes=10)  # A claimed job not finished by then is picked up again
+EXTRACTION_POLL_SECONDS = 30
+MAX_EXTRACTION_ATTEMPTS = 3
+RETRY_BACKOFF = timedelta(minutes=1)
+MAX_EXTRACTED_CHARS = 2_000_000
+REINDEX_BATCH_SIZE = 500
+
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+TEXT_EXTENSIONS = {"txt", "text", "csv", "md", "json", "xml", "hl7"}
+WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+CORE_PROPERTIES = {
+    "{http://purl.org/dc/elements/1.1/}title": "title",
+    "{http://purl.org/dc/elements/1.1/}creator": "author",
+    "{http://purl.org/dc/elements/1.1/}subject": "subject",
+    "{http://purl.org/dc/terms/}created": "created",
+}
+
+def extractor_for(mime_type: Optional[str], file_type: Optional[str]) -> Optional[str]:
+    """Which extractor handles a document ("pdf", "docx" or "text"); None if none does"""
+    mime_type = (mime_type or "").lower()
+    file_type = (file_type or "").lower()
+    if mime_type == "application/pdf" or file_type == "pdf":
+        return "pdf"
+    if mime_type == DOCX_TYPE or file_type == "docx":
+        return "docx"
+    if mime_type.startswith("text/") or file_type in TEXT_EXTENSIONS:
+        return "text"
+    return None
+
+# The functions below run in a pool process
+
+def _extract_pdf(path: str) -> Tuple[str, dict]:
+    import fitz  # PyMuPDF
+
+    with fitz.open(path) as pdf:
+        pages = []
+        length = 0
+        for page in pdf:
+            if length >= MAX_EXTRACTED_CHARS:
+                break
+            text = page.get_text()
+            pages.append(text)
+            length += len(text)
+        info = {
+            "page_count": pdf.page_count,
+            "title": pdf.metadata.get("title"),
+            "author": pdf.metadata.get("author"),
+            "subject": pdf.metadata.get("subject"),
+            "created": pdf.metadata.get("creationDate"),
+        }
+    return "\n".join(pages), info
+
+def _extract_docx(path: str) -> Tuple[str, dict]:
+    with zipfile.ZipFile(path) as archive:
+        body = ET.fromstring(archive.read("word/document.xml"))
+        try:
+            core = ET.fromstring(archive.read("docProps/core.xml"))
+        except KeyError:
+            core = None
+
+    paragraphs = []
+    for paragraph in body.iter(f"{WORD_NS}p"):
+        parts = []
+        for node in paragraph.iter():
+            if node.tag == f"{WORD_NS}t":
+                parts.append(node.text or "")
+            elif node.tag == f"{WORD_NS}tab":
+                parts.append("\t")
+            elif node.tag in (f"{WORD_NS}br", f"{WORD_NS}cr"):
+                parts.append("\n")
+        paragraphs.append("".join(parts))
+
+    info = {}
+    if core is not None:
+        for node in core:
+            if node.tag in CORE_PROPERTIES and node.text:
+                info[CORE_PROPERTIES[node.tag]] = node.text
+    return "\n".join(paragraphs), info
+
+def _extract_plain(path: str) -> Tuple[str, dict]:
+    with open(path, "rb") as f:
+        data = f.read(MAX_EXTRACTED_CHARS * 4)
+    for encoding in ("utf-8-sig", "cp1252"):
+        try:
+            return data.decode(encoding), {"encoding": encoding}
+        except UnicodeDecodeError:
+            continue
+    return data.decode("latin-1"), {"encoding": "latin-1"}
+
+EXTRACTORS = {"pdf": _extract_pdf, "docx": _extract_docx, "text": _extract_plain}
+
+def extract_text(extractor: str, path: str) -> Tuple[str, dict]:
+    """Extract (text, metadata) from a file with the named extractor"""
+    text, info = EXTRACTORS[extractor](path)
+    text = text.replace("\x00", "").strip()
+    info = {key: value for key, value in info.items() if value not in (None, "")}
+    info.update(extractor=extractor, char_count=len(text), truncated=len(text) > MAX_EXTRACTED_CHARS)
+    return text[:MAX_EXTRACTED_CHARS], info
+
+class TextExtractionQueue:
+    def __init__(self, workers: int = EXTRACTION_WORKERS, poll_seconds: float = EXTRACTION_POLL_SECONDS):
+        self.workers = workers
+        self.poll_seconds = poll_seconds
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._running: Set[asyncio.Task] = set()
+
+    async def enqueue(self, document_id: int, force: bool = False):
+        """Queue a document for extraction; only a row insert, the work happens later"""
+        job, created = await TextExtractionJob.get_or_create(
+            document_id=document_id,
+            defaults={"force": force, "available_at": timezone.now()}
+        )
+        if not created and force and not job.force:
+            await TextExtractionJob.filter(id=job.id).update(force=True)
+        self.start()
+        self._wake.set()
+
+    def start(self):
+        """Start the dispatcher (also picks up jobs left queued by a previous run)"""
+        if self._wake is None:
+            self._wake = asyncio.Event()
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def stop(self):
+        """Stop extracting; unfinished jobs stay queued and are retried after their lease"""
+        tasks = [task for task in [self._dispatcher, *self._running] if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._dispatcher = None
+        self._running.clear()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _dispatch(self):
+        while True:
+            self._wake.clear()
+            free = self.workers - len(self._running)
+            try:
+                jobs = await self._claim(free) if free > 0 else []
+            except Exception as e:
+                print(f"Error claiming text extraction jobs: {str(e)}")
+                jobs = []
+            for job in jobs:
+                task = asyncio.create_task(self._run(job))
+                self._running.add(task)
+                task.add_done_callback(self._job_done)
+            # Woken by a new job or a finished one; the timeout picks up retries that came due
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def _job_done(self, task: asyncio.Task):
+        self._running.discard(task)
+        self._wake.set()
+
+    async def _claim(self, limit: int) -> List[TextExtractionJob]:
+        now = timezone.now()
+        candidates = await TextExtractionJob.filter(available_at__lte=now).order_by("id").limit(limit)
+        claimed = []
+        for job in candidates:
+            # Only succeeds if no other process claimed the job since it was read
+            updated = await TextExtractionJob.filter(id=job.id, available_at=job.available_at).update(
+                available_at=now + EXTRACTION_LEASE, attempts=F("attempts") + 1
+            )
+            if updated:
+                job.attempts += 1
+                claimed.append(job)
+        return claimed
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    async def _run(self, job: TextExtractionJob):
+        try:
+            document = await MedicalDocument.get_or_none(id=job.document_id)
+            extractor = document and extractor_for(document.mime_type, document.file_type)
+            if not extractor or document.status == "deleted":
+                await job.delete()
+                return
+
+            loop = asyncio.get_running_loop()
+            try:
+                text, info = await loop.run_in_executor(self._get_pool(), extract_text, extractor, document.file_path)
+            except BrokenProcessPool:
+                self._pool = None  # A worker died (e.g. out of memory); start a fresh pool
+                raise
+
+            metadata = dict(document.metadata or {})
+            metadata["text_extraction"] = {"status": "done", **info}
+            updates = {"metadata": metadata}
+            if job.force or not document.extracted_text:
+                updates["extracted_text"] = text
+            await MedicalDocument.filter(id=document.id).update(**updates)
+            await job.delete()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await self._failed(job, e)
+
+    async def _failed(self, job: TextExtractionJob, error: Exception):
+        if job.attempts < MAX_EXTRACTION_ATTEMPTS:
+            await TextExtractionJob.filter(id=job.id).update(
+                available_at=timezone.now() + RETRY_BACKOFF * (2 ** (job.attempts - 1)),
+                last_error=str(error)
+            )
+            return
+
+        print(f"Giving up on text extraction for document {job.document_id}: {str(error)}")
+        document = await MedicalDocument.get_or_none(id=job.document_id)
+        if document:
+            metadata = dict(document.metadata or {})
+            metadata["text_extraction"] = {"status": "failed", "error": str(error)}
+            await MedicalDocument.filter(id=document.id).update(metadata=metadata)
+        await job.delete()
+
+text_extraction_queue = TextExtractionQueue()
+
+async def reindex_documents(force: bool = False) -> int:
+    """Queue extraction for stored documents without text (all of them with force); returns how many"""
+    queued = 0
+    last_id = 0
+    while True:
+        query = MedicalDocument.filter(id__gt=last_id).exclude(status="deleted")
+        if not force:
+            query = query.filter(extracted_text__isnull=True)
+        batch = await query.order_by("id").limit(REINDEX_BATCH_SIZE).values_list("id", "mime_type", "file_type")
+        if not batch:
+            return queued
+        last_id = batch[-1][0]
+
+        now = timezone.now()
+        document_ids = [document_id for document_id, mime_type, file_type in batch if extractor_for(mime_type, file_type)]
+        if force:
+            await TextExtractionJob.filter(document_id__in=document_ids).update(force=True)
+        await TextExtractionJob.bulk_create(
+            [TextExtractionJob(document_id=document_id, force=force, available_at=now) for document_id in document_ids],
+            ignore_conflicts=True
+        )
+        queued += len(document_ids)
+
+async def _reindex_command(force: bool):
+    # Same database as the server; a running server picks the jobs up within EXTRACTION_POLL_SECONDS
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        queued = await reindex_documents(force)
+        print(f"Queued {queued} documents for text extraction")
+    finally:
+        await Tortoise.close_connections()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Document text extraction")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    reindex = subcommands.add_parser("reindex", help="Queue stored documents for text extraction")
+    reindex.add_argument("--force", action="store_true", help="Re-extract documents that already have text")
+    args = parser.parse_args()
+    asyncio.run(_reindex_command(args.force))
@@ -0,0 +1,157 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, Set, Tuple
+
+# Thumbnail pipeline
+#
+# List screens show thumbnails instead of downloading originals. After an upload is
+# stored, schedule_thumbnails() renders every size in THUMBNAIL_SIZES in a process
+# pool (decoding and resizing are CPU-bound and would stall the event loop even in
+# threads) and caches them as JPEGs next to the source file: <file>.<size>.jpg. PDFs
+# get a raster of their first page. Files uploaded before this existed are rendered
+# on their first thumbnail request. Renders of the same file share one pool job.
+
+THUMBNAIL_SIZES = {"small": 128, "medium": 384, "large": 1024}  # Longest side, pixels
+THUMBNAIL_WORKERS = int(os.getenv("THUMBNAIL_WORKERS", "2"))
+THUMBNAIL_QUALITY = 80
+# Larger images are refused before decoding, so a decompression bomb cannot exhaust a
+# worker's memory (Pillow's own check only raises at twice its default limit)
+THUMBNAIL_MAX_PIXELS = int(os.getenv("THUMBNAIL_MAX_PIXELS", str(50 * 1000 * 1000)))
+PDF_TYPES = {"application/pdf", "pdf"}
+
+_pool: Optional[ProcessPoolExecutor] = None
+_in_flight: Dict[str, asyncio.Future] = {}
+_tasks: Set[asyncio.Task] = set()  # Keeps scheduled renders referenced until done
+
+def thumbnail_path(source_path: str, size: str) -> str:
+    return f"{source_path}.{size}.jpg"
+
+def can_thumbnail(media_type: Optional[str]) -> bool:
+    """Whether files of this MIME type (or bare extension) get thumbnails"""
+    if not media_type:
+        return False
+    media_type = media_type.lower()
+    return media_type.startswith("image/") or media_type in PDF_TYPES
+
+def _open_source(source_path: str, media_type: str, longest_side: int):
+    from PIL import Image
+
+    if media_type.lower() in PDF_TYPES:
+        import fitz  # PyMuPDF
+
+        with fitz.open(source_path) as pdf:
+            page = pdf[0]
+            scale = longest_side / max(page.rect.width, page.rect.height)
+            pixmap = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False)
+            return Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+
+    Image.MAX_IMAGE_PIXELS = THUMBNAIL_MAX_PIXELS
+    image = Image.open(source_path)
+    if image.width * image.height > THUMBNAIL_MAX_PIXELS:
+        raise Image.DecompressionBombError(
+            f"{image.width}x{image.height} image exceeds the {THUMBNAIL_MAX_PIXELS} pixel limit"
+        )
+    # Let the JPEG decoder scale down while decoding instead of decoding full size
+    image.draft("RGB", (longest_side, longest_side))
+    image.load()
+    return image
+
+def _render_thumbnails(source_path: str, media_type: str, sizes: Tuple[Tuple[str, int], ...]):
+    """Render the given sizes of source_path; runs in a pool process"""
+    from PIL import ImageOps
+
+    # Largest first, so each smaller size is resized from the previous one
+    sizes = sorted(sizes, key=lambda item: item[1], reverse=True)
+    image = _open_source(source_path, media_type, sizes[0][1])
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+
+    for name, longest_side in sizes:
+        image.thumbnail((longest_side, longest_side))
+        destination = thumbnail_path(source_path, name)
+        temporary = f"{destination}.{os.getpid()}.tmp"
+        image.save(temporary, "JPEG", quality=THUMBNAIL_QUALITY, optimize=True)
+        os.replace(temporary, destination)
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=THUMBNAIL_WORKERS)
+    return _pool
+
+def _discard_pool(pool: ProcessPoolExecutor):
+    """Drop a broken pool (a worker died, e.g. out of memory); the next render starts a fresh one"""
+    global _pool
+    if _pool is pool:
+        _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+def _missing_sizes(source_path: str) -> Tuple[Tuple[str, int], ...]:
+    return tuple(
+        (name, longest_side) for name, longest_side in THUMBNAIL_SIZES.items()
+        if not os.path.exists(thumbnail_path(source_path, name))
+    )
+
+async def generate_thumbnails(source_path: str, media_type: str) -> bool:
+    """Render the missing thumbnails of a file; False if it could not be rendered"""
+    future = _in_flight.get(source_path)
+    if future is None:
+        sizes = await asyncio.to_thread(_missing_sizes, source_path)
+        if not sizes:
+            return True
+        future = _in_flight.get(source_path)
+        if future is None:
+            pool = _get_pool()
+            try:
+                future = asyncio.get_running_loop().run_in_executor(
+                    pool, _render_thumbnails, source_path, media_type, sizes
+                )
+            except BrokenProcessPool:
+                # A worker died while the pool was idle; submit to a fresh pool instead
+                _discard_pool(pool)
+                pool = _get_pool()
+                future = asyncio.get_running_loop().run_in_executor(
+                    pool, _render_thumbnails, source_path, media_type, sizes
+                )
+            future.add_done_callback(lambda done: _discard_broken_pool(pool, done))
+            _in_flight[source_path] = future
+            future.add_done_callback(lambda _: _in_flight.pop(source_path, None))
+    try:
+        await asyncio.shield(future)
+        return True
+    except Exception as e:
+        print(f"Error generating thumbnails for {source_path}: {str(e)}")
+        return False
+
+def _discard_broken_pool(pool: ProcessPoolExecutor, future: asyncio.Future):
+    if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+        _discard_pool(pool)
+
+def schedule_thumbnails(source_path: str, media_type: Optional[str]):
+    """Start rendering thumbnails for a newly stored file without waiting for them"""
+    if can_thumbnail(media_type):
+        task = asyncio.create_task(generate_thumbnails(source_path, media_type))
+        _tasks.add(task)
+        task.add_done_callback(_tasks.discard)
+
+async def get_thumbnail(source_path: str, media_type: Optional[str], size: str) -> Optional[str]:
+    """Path of a cached thumbnail, rendering it first if needed; None if there can be none"""
+    if not can_thumbnail(media_type) or size not in THUMBNAIL_SIZES:
+        return None
+    path = thumbnail_path(source_path, size)
+    if await asyncio.to_thread(os.path.exists, path):
+        return path
+    if not await asyncio.to_thread(os.path.isfile, source_path):
+        return None
+    if not await generate_thumbnails(source_path, media_type):
+        return None
+    return path
+
+def shutdown_thumbnail_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
@@ -0,0 +1,138 @@
+import asyncio
+import hashlib
+import os
+from typing import AsyncIterator, NamedTuple, Optional, Tuple
+from fastapi import HTTPException, Request, UploadFile
+from fastapi.responses import FileResponse, Response
+
+# Streaming upload storage
+#
+# Uploaded files are copied to disk in fixed-size chunks instead of being read into
+# memory whole, so memory use per upload is bounded by UPLOAD_CHUNK_SIZE whatever the
+# file size. Disk writes run in a worker thread to keep them off the event loop, the
+# SHA-256 is computed as the chunks go by, and uploads over MAX_UPLOAD_BYTES are
+# rejected (and the partial file removed) as soon as the limit is crossed.
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(512 * 1024 * 1024)))
+DOWNLOAD_CACHE_CONTROL = "private, max-age=3600"
+
+class StoredFile(NamedTuple):
+    path: str
+    size: int  # Bytes actually written
+    sha256: str
+
+def _too_large(max_bytes: int) -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"File is larger than the {max_bytes // (1024 * 1024)} MB upload limit"
+    )
+
+async def hash_upload(file: UploadFile, max_bytes: int = MAX_UPLOAD_BYTES) -> Tuple[int, str]:
+    """Read an uploaded file chunk by chunk without storing it; returns (size, sha256)"""
+    digest = hashlib.sha256()
+    size = 0
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_bytes:
+            raise _too_large(max_bytes)
+        await asyncio.to_thread(digest.update, chunk)
+    return size, digest.hexdigest()
+
+async def save_upload(file: UploadFile, file_path: str, max_bytes: int = MAX_UPLOAD_BYTES) -> StoredFile:
+    """Stream an uploaded file to file_path; raises 413 if it is larger than max_bytes"""
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    out = await asyncio.to_thread(open, file_path, "wb")
+    try:
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise _too_large(max_bytes)
+            digest.update(chunk)
+            await asyncio.to_thread(out.write, chunk)
+    except BaseException:
+        await asyncio.to_thread(out.close)
+        await asyncio.to_thread(remove_file, file_path)
+        raise
+    await asyncio.to_thread(out.close)
+    return StoredFile(file_path, size, digest.hexdigest())
+
+async def write_stream_at(path: str, offset: int, stream: AsyncIterator[bytes], max_bytes: int) -> int:
+    """Write a byte stream into an existing file starting at offset, as the bytes arrive.
+
+    Returns the number of bytes written; raises 413 once the stream goes past max_bytes.
+    """
+    fd = await asyncio.to_thread(os.open, path, os.O_WRONLY)
+    written = 0
+    try:
+        async for piece in stream:
+            if written + len(piece) > max_bytes:
+                raise HTTPException(status_code=413, detail="Chunk is larger than expected")
+            await asyncio.to_thread(os.pwrite, fd, piece, offset + written)
+            written += len(piece)
+    finally:
+        await asyncio.to_thread(os.close, fd)
+    return written
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+async def hash_file(path: str) -> str:
+    """SHA-256 of a file on disk, computed in a worker thread"""
+    return await asyncio.to_thread(_hash_file, path)
+
+def remove_file(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in tags)
+
+async def file_response(
+    request: Request,
+    file_path: str,
+    etag: Optional[str],
+    media_type: Optional[str],
+    filename: str
+) -> Response:
+    """Serve a stored file for download.
+
+    Files with a content hash (or another version tag passed as etag) get a strong ETag
+    and a 304 when the client already has that version, without touching the disk. FileResponse handles Range requests (for
+    seeking through large scans) and hands the file to the server with pathsend when
+    the server supports it.
+    """
+    headers = {"Cache-Control": DOWNLOAD_CACHE_CONTROL}
+    if etag:
+        headers["ETag"] = f'"{etag}"'
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+
+    if not await asyncio.to_thread(os.path.isfile, file_path):
+        raise HTTPException(status_code=404, detail="File not found")
+
+    return FileResponse(
+        file_path,
+        media_type=media_type,
+        filename=filename,
+        content_disposition_type="inline",
+        headers=headers
+    )
@@ -0,0 +1,91 @@
+from tortoise import timezone
+from tortoise.exceptions import IntegrityError
+from tortoise.signals import pre_save, post_save, post_delete
+from backend.models import Patient, Practitioner, UserDirectory
+
+# User directory sync
+#
+# Every write to Patient or Practitioner upserts the matching user_directory row, so the
+# auth endpoints can resolve an email to its table, id, role, phones and password hash
+# with one indexed lookup instead of querying both tables and re-deriving the role.
+# Emails are unique across both tables: a write whose email the directory already maps
+# to another user is rejected before the user row is touched. Run the write inside
+# in_transaction() so the user row and its directory row commit or roll back together.
+
+def practitioner_role(practitioner: Practitioner) -> str:
+    """Derive pharmacist/laborist/practitioner from the license number or specialty"""
+    license_number = ""
+    if practitioner.identifier:
+        for identifier in practitioner.identifier:
+            if identifier.get("system") == "license":
+                license_number = identifier.get("value", "")
+                break
+    
+    # Check if pharmacist by license number or specialty
+    is_pharmacist = (
+        license_number.startswith('F') or 
+        (practitioner.specialty and "Pharmacy" in practitioner.specialty)
+    )
+    
+    # Check if laborist by license number or specialty
+    is_laborist = (
+        license_number.startswith('L') or 
+        (practitioner.specialty and "Laboratory" in practitioner.specialty)
+    )
+    
+    if is_pharmacist:
+        return "pharmacist"
+    elif is_laborist:
+        return "laborist"
+    return "practitioner"
+
+def display_name(user) -> str:
+    """Extract name text from the FHIR HumanName structure"""
+    if isinstance(user.name, list) and len(user.name) > 0:
+        return user.name[0].get("text", "")
+    elif isinstance(user.name, dict):
+        return user.name.get("text", "")
+    return ""
+
+def user_model(entry: UserDirectory):
+    return Patient if entry.user_table == "patient" else Practitioner
+
+async def sync_user(user, using_db=None):
+    """Upsert the directory row for a patient or practitioner.
+
+    A plain UPDATE-then-INSERT rather than update_or_create: post_save listeners run
+    concurrently, and interleaved update_or_create savepoints on one transaction fail.
+    """
+    is_patient = isinstance(user, Patient)
+    key = {"user_table": "patient" if is_patient else "practitioner", "user_id": user.id}
+    fields = {
+        "email": user.email,
+        "role": "patient" if is_patient else practitioner_role(user),
+        "display_name": display_name(user),
+        "phones": [t.get("value") for t in (user.telecom or []) if t.get("value")],
+        "password_hash": user.password_hash,
+        "active": user.active,
+        "updated_at": timezone.now(),
+    }
+    if not await UserDirectory.filter(**key).using_db(using_db).update(**fields):
+        await UserDirectory.create(**key, **fields, using_db=using_db)
+
+@pre_save(Patient, Practitioner)
+async def _check_email_available(sender, instance, using_db, update_fields):
+    if update_fields and "email" not in update_fields:
+        return
+    taken = await UserDirectory.filter(email=instance.email).exclude(
+        user_table="patient" if sender is Patient else "practitioner", user_id=instance.id
+    ).using_db(using_db).exists()
+    if taken:
+        raise IntegrityError(f"Email already registered: {instance.email}")
+
+@post_save(Patient, Practitioner)
+async def _sync_saved_user(sender, instance, created, using_db, update_fields):
+    await sync_user(instance, using_db)
+
+@post_delete(Patient, Practitioner)
+async def _remove_deleted_user(sender, instance, using_db):
+    await UserDirectory.filter(
+        user_table="patient" if sender is Patient else "practitioner", user_id=instance.id
+    ).using_db(using_db).delete()
@@ -0,0 +1,4 @@
+import os
+
+# Keep benchmarks off the on-disk verification code store shared with the dev server
+os.environ.setdefault("VERIFICATION_STORE", "memory")
@@ -0,0 +1,41 @@
+import os
+import statistics
+import tempfile
+import time
+from contextlib import asynccontextmanager
+from tortoise import Tortoise, connections
+from backend.search import ensure_search_indexes
+
+# Shared helpers for the scripts in this package. Each benchmark seeds a fresh
+# on-disk SQLite database (a file, so page cache and journal behave as in
+# production) and reports the median of several timed runs.
+
+@asynccontextmanager
+async def bench_database():
+    """A fresh SQLite file with every table and search index, removed afterwards"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.sqlite3")
+        await Tortoise.init(config={
+            "connections": {"default": f"sqlite://{path}"},
+            "apps": {"models": {"models": ["backend.models"], "default_connection": "default"}},
+        })
+        await Tortoise.generate_schemas()
+        await ensure_search_indexes()
+        try:
+            yield connections.get("default")
+        finally:
+            await Tortoise.close_connections()
+
+async def measure(run, repeat: int = 20, warmup: int = 2) -> float:
+    """Median wall time of ``await run()`` in milliseconds"""
+    for _ in range(warmup):
+        await run()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+def report(label: str, milliseconds: float):
+    print(f"{label:<48} {milliseconds:>10.2f} ms")
@@ -0,0 +1,86 @@
+"""Benchmark GET /patients/{id}/comprehensive: per-section queries vs ?single_query=true.
+
+Seeds one patient per requested size with that many child rows spread evenly over
+the chart sections (medical records, allergies, medications, vitals, diagnoses,
+procedures, notes, family history, lab and imaging results, documents), next to
+BACKGROUND_PATIENTS patients with BACKGROUND_ROWS rows each. It then times the
+endpoint handler for every sized patient on each path. No social history is
+seeded: the default path cannot serialize one (it passes a pydantic model where a
+dict is expected).
+
+    python -m benchmarks.comprehensive_record              # 10, 1,000 and 10,000 child rows
+    python -m benchmarks.comprehensive_record 50 5000      # other sizes
+"""
+import asyncio
+import itertools
+import sys
+from datetime import date, datetime, timedelta
+from backend.models import (
+    Patient, Practitioner, MedicalRecord, PatientAllergy, PatientMedication, VitalSigns,
+    Diagnosis, MedicalProcedure, ClinicalNote, FamilyHistory, LabResult,
+    ImagingResult, MedicalDocument
+)
+from backend.routers.medical_records import get_comprehensive_medical_record
+from benchmarks.common import bench_database, measure, report
+
+CHILD_ROWS = [10, 1000, 10000]
+BACKGROUND_PATIENTS = 100
+BACKGROUND_ROWS = 100
+
+def chart_rows(patient, doctor, count: int):
+    """count rows for patient, one section after another"""
+    return [row for i, row in zip(range(count), section_rows(patient, doctor))]
+
+def section_rows(patient, doctor):
+    start = datetime(2025, 1, 1)
+    for i in itertools.count():
+        when = start + timedelta(minutes=i)
+        yield MedicalRecord(patient=patient, created_by=doctor, record_type="consultation", title=f"Visit {i}",
+                            date_of_service=when, department="Internal Medicine", facility="Main Campus")
+        yield PatientAllergy(patient=patient, allergen=f"Allergen {i}", allergen_type="drug", reaction="Rash", severity="mild")
+        yield PatientMedication(patient=patient, medication_name=f"Medication {i}", dosage="10 mg", frequency="daily",
+                                route="oral", start_date=date(2025, 1, 1), prescribed_by=doctor, indication="Hypertension")
+        yield VitalSigns(patient=patient, recorded_by=doctor, measurement_date=when)
+        yield Diagnosis(patient=patient, diagnosed_by=doctor, diagnosis_name=f"Diagnosis {i}", diagnosis_type="primary")
+        yield MedicalProcedure(patient=patient, performed_by=doctor, procedure_name=f"Procedure {i}",
+                               procedure_type="diagnostic", procedure_date=when)
+        yield ClinicalNote(patient=patient, author=doctor, note_type="progress", note_date=when, note_content="Stable. " * 40)
+        yield FamilyHistory(patient=patient, relationship="mother", condition=f"Condition {i}")
+        yield LabResult(patient=patient, test_name="CBC", component_name=f"Component {i}", result_value="5.0",
+                        test_date=when, reported_date=when, performing_lab="Main Lab")
+        yield ImagingResult(patient=patient, study_type="X-Ray", body_region="Chest", findings="Clear lungs.",
+                            impression="Normal", study_date=when, reported_date=when, radiologist=doctor, facility="Main Campus")
+        yield MedicalDocument(patient=patient, uploaded_by=doctor, document_type="lab_result", title=f"Report {i}",
+                              file_name=f"report{i}.pdf", original_filename=f"report{i}.pdf", file_path=f"uploads/report{i}.pdf",
+                              file_type="pdf", file_size=1024, mime_type="application/pdf")
+
+async def seed(sizes):
+    doctor = await Practitioner.create(name=[{"text": "Bench Doctor"}], email="doctor@bench.test", password_hash="x")
+    counts = [BACKGROUND_ROWS] * BACKGROUND_PATIENTS + list(sizes)
+    patients = [
+        await Patient.create(name={"text": f"Patient {i}"}, email=f"patient{i}@bench.test",
+                             birth_date=date(1980, 1, 1), password_hash="x")
+        for i in range(len(counts))
+    ]
+    by_model = {}
+    for patient, count in zip(patients, counts):
+        for row in chart_rows(patient, doctor, count):
+            by_model.setdefault(type(row), []).append(row)
+    for model, rows in by_model.items():
+        await model.bulk_create(rows, batch_size=1000)
+    return doctor, patients[BACKGROUND_PATIENTS:]
+
+async def main(sizes):
+    async with bench_database():
+        doctor, patients = await seed(sizes)
+        print(f"{BACKGROUND_PATIENTS} background patients x {BACKGROUND_ROWS} child rows")
+        for count, patient in zip(sizes, patients):
+            # The per-row serialization of large charts takes seconds, so fewer runs there
+            repeat = 20 if count <= 1000 else 3
+            for label, single_query in (("per-section queries", False), ("single_query=true", True)):
+                milliseconds = await measure(lambda: get_comprehensive_medical_record(
+                    patient.id, single_query=single_query, current_practitioner=doctor), repeat=repeat, warmup=1)
+                report(f"{count} child rows: {label}", milliseconds)
+
+if __name__ == "__main__":
+    asyncio.run(main([int(size) for size in sys.argv[1:]] or CHILD_ROWS))
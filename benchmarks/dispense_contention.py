@@ -0,0 +1,108 @@
+"""Stress POST /prescriptions/{id}/dispense with DISPENSERS parallel dispensers on one SKU.
+
+Each round stocks one medicine with START_STOCK units in a single lot and writes
+DISPENSERS pending prescriptions for QUANTITY units each, more than the stock can
+cover. All of them are then dispensed at once. A dispense either takes its full
+quantity or is refused with "Insufficient stock". After every round the benchmark
+asserts that the medicine's stock equals START_STOCK minus the dispensed units, that
+its lots agree, and that neither went negative.
+
+Lock waits are the time each dispense waits to open its transaction. The SQLite
+connection runs one transaction at a time, so this is the queueing the guarded
+UPDATEs cost under contention.
+
+    python -m benchmarks.dispense_contention
+"""
+import asyncio
+import statistics
+import time
+from contextlib import asynccontextmanager
+from datetime import date
+from decimal import Decimal
+from fastapi import HTTPException
+from tortoise.functions import Sum
+from backend.models import Medicine, MedicineLot, Patient, Practitioner, Prescription, PrescriptionDispense
+from backend.routers import pharmacy
+from benchmarks.common import bench_database, report
+
+DISPENSERS = 50
+ROUNDS = 20
+START_STOCK = 100
+QUANTITY = 3
+
+lock_waits = []
+
+def timed_in_transaction(in_transaction):
+    """Wrap in_transaction to record how long each caller waits to enter the block"""
+    @asynccontextmanager
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        async with in_transaction(*args, **kwargs) as connection:
+            lock_waits.append((time.perf_counter() - started) * 1000)
+            yield connection
+    return wrapper
+
+async def stock_round(number: int, patient: Patient, doctor: Practitioner) -> list:
+    medicine = await Medicine.create(
+        name=f"Contended {number}", generic_name="Contended", manufacturer="Aura Labs", dosage_form="tablet",
+        strength="10 mg", category="analgesic", unit_price=Decimal("2.50"), current_stock=START_STOCK,
+        minimum_stock=10, expiry_date=date(2030, 1, 1), batch_number=f"C{number}",
+    )
+    await MedicineLot.create(medicine=medicine, batch_number=f"C{number}", expiry_date=date(2030, 1, 1),
+                             quantity=START_STOCK)
+    await Prescription.bulk_create([
+        Prescription(patient=patient, prescriber=doctor, medicine=medicine, dosage="1 tablet", frequency="daily",
+                     duration="3 days", quantity_prescribed=QUANTITY)
+        for _ in range(DISPENSERS)
+    ])
+    return medicine, await Prescription.filter(medicine=medicine).values_list("id", flat=True)
+
+async def dispense(prescription_id: int, pharmacist_id: int) -> bool:
+    try:
+        await pharmacy.dispense_prescription(
+            prescription_id, PrescriptionDispense(pharmacist_id=pharmacist_id, quantity_dispensed=QUANTITY),
+            current_user={"role": "pharmacist"},
+        )
+    except HTTPException as exc:
+        assert exc.detail == "Insufficient stock", exc.detail
+        return False
+    return True
+
+async def check_stock(medicine: Medicine, dispensed: int):
+    stock = (await Medicine.get(id=medicine.id)).current_stock
+    lots = (await MedicineLot.filter(medicine=medicine).annotate(total=Sum("quantity")).first().values("total"))["total"]
+    assert stock == START_STOCK - dispensed * QUANTITY, (stock, dispensed)
+    assert lots == stock, (lots, stock)
+    assert stock >= 0 and await MedicineLot.filter(medicine=medicine, quantity__lt=0).count() == 0
+    assert await Prescription.filter(medicine=medicine, status="dispensed").count() == dispensed
+
+async def main():
+    async with bench_database():
+        patient = await Patient.create(name={"text": "Bench Patient"}, email="patient@bench.test", password_hash="x")
+        doctor = await Practitioner.create(name=[{"text": "Bench Doctor"}], email="doctor@bench.test", password_hash="x")
+        pharmacist = await Practitioner.create(name=[{"text": "Bench Pharmacist"}], email="pharmacist@bench.test",
+                                               password_hash="x")
+        pharmacy.in_transaction = timed_in_transaction(pharmacy.in_transaction)
+
+        round_times, dispensed_total = [], 0
+        for number in range(ROUNDS):
+            medicine, prescription_ids = await stock_round(number, patient, doctor)
+            started = time.perf_counter()
+            outcomes = await asyncio.gather(*(dispense(pid, pharmacist.id) for pid in prescription_ids))
+            round_times.append((time.perf_counter() - started) * 1000)
+            await check_stock(medicine, sum(outcomes))
+            dispensed_total += sum(outcomes)
+
+        attempts = ROUNDS * DISPENSERS
+        print(f"{ROUNDS} rounds of {DISPENSERS} parallel dispenses of {QUANTITY} units "
+              f"against {START_STOCK} units of one medicine")
+        print(f"{dispensed_total} dispensed, {attempts - dispensed_total} refused, stock never negative")
+        print(f"throughput: {attempts / (sum(round_times) / 1000):.0f} dispenses/s")
+        report("round wall time (median)", statistics.median(round_times))
+        waits = statistics.quantiles(lock_waits, n=100)
+        report("lock wait p50", waits[49])
+        report("lock wait p99", waits[98])
+        report("lock wait max", max(lock_waits))
+
+if __name__ == "__main__":
+    asyncio.run(main())
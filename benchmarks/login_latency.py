@@ -0,0 +1,94 @@
+"""Benchmark POST /auth/token with bcrypt in the password hashing pool vs inline.
+
+Registers USERS accounts, then fires CONCURRENT_LOGINS logins at once while a
+probe calls a cheap authenticated endpoint (/auth/principal-cache/stats as a
+practitioner) every PROBE_INTERVAL. Reports logins per second and the probe's
+p50/p99 latency during the storm. Inline hashing runs every bcrypt verify on the loop, so other
+requests stall until the burst ends; the pool keeps the loop free and overlaps
+hashes on PASSWORD_HASH_WORKERS threads. Uses the real cost factor unless
+BCRYPT_ROUNDS is set.
+
+    python -m benchmarks.login_latency
+"""
+import asyncio
+import statistics
+import time
+import httpx
+from backend import auth
+from backend.main import app
+from benchmarks.common import bench_database, report
+
+USERS = 16
+CONCURRENT_LOGINS = 32
+PROBE_ENDPOINT = "/auth/principal-cache/stats"
+PROBE_INTERVAL = 0.01
+
+async def inline_verify_and_update_password(password: str, hashed: str):
+    return auth.pwd_context.verify_and_update(password, hashed)
+
+async def probe(client: httpx.AsyncClient, headers: dict, latencies: list, stop: asyncio.Event):
+    """Call PROBE_ENDPOINT on a PROBE_INTERVAL schedule until stop is set.
+
+    Latency is measured from the scheduled send time, so time a request spends waiting
+    for a blocked event loop to start it counts too.
+    """
+    scheduled = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+        response = await client.get(PROBE_ENDPOINT, headers=headers)
+        assert response.status_code == 200, response.text
+        latencies.append((time.perf_counter() - scheduled) * 1000)
+        scheduled = max(scheduled + PROBE_INTERVAL, time.perf_counter())
+
+async def login_storm(client: httpx.AsyncClient, probe_headers: dict):
+    """Logins per second, and the probe latencies (ms) recorded during the storm"""
+    async def login(i: int):
+        response = await client.post("/auth/token", data={"username": f"user{i}@bench.test", "password": "secret"})
+        assert response.status_code == 200, response.text
+
+    probe_latencies, stop = [], asyncio.Event()
+    prober = asyncio.create_task(probe(client, probe_headers, probe_latencies, stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(login(i % USERS) for i in range(CONCURRENT_LOGINS)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await prober
+    return CONCURRENT_LOGINS / elapsed, probe_latencies
+
+def percentile(values: list, p: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[p - 1]
+
+async def main():
+    async with bench_database():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for i in range(USERS):
+                response = await client.post("/auth/register", json={
+                    "name": f"User {i}", "email": f"user{i}@bench.test", "password": "secret",
+                    "phone": "0100", "dateOfBirth": "1990-01-01",
+                })
+                assert response.status_code == 200, response.text
+
+            response = await client.post("/auth/register", json={
+                "name": "Probe", "email": "probe@bench.test", "password": "secret", "phone": "0100",
+                "licenseNumber": "D1",
+            })
+            assert response.status_code == 200, response.text
+            response = await client.post("/auth/token", data={"username": "probe@bench.test", "password": "secret"})
+            probe_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+            print(f"{CONCURRENT_LOGINS} concurrent logins, bcrypt rounds={auth.BCRYPT_ROUNDS}, "
+                  f"pool workers={auth.PASSWORD_HASH_WORKERS}")
+            pooled = auth.verify_and_update_password
+            for label, verify in (("inline", inline_verify_and_update_password), ("thread pool", pooled)):
+                auth.verify_and_update_password = verify
+                logins_per_second, probe_latencies = await login_storm(client, probe_headers)
+                print(f"{label}: {logins_per_second:.1f} logins/s, {len(probe_latencies)} probe requests")
+                report(f"{label}: {PROBE_ENDPOINT} p50", percentile(probe_latencies, 50))
+                report(f"{label}: {PROBE_ENDPOINT} p99", percentile(probe_latencies, 99))
+            auth.verify_and_update_password = pooled
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,49 @@
+"""Benchmark patient search (laborist /patients/search/) on PATIENTS synthetic patients.
+
+Fills patient_search directly with generated names, national IDs, phones and emails
+(the FTS triggers index them as on a real write). One patient in five is called
+Mohamed, so common prefixes match hundreds of thousands of rows. Reports the median
+latency of search_patient_ids for name, prefix, number and email queries.
+
+    python -m benchmarks.patient_search
+"""
+import asyncio
+from backend.patient_search import search_patient_ids
+from benchmarks.common import bench_database, measure, report
+
+PATIENTS = 1000000
+PAGE_SIZE = 10
+QUERIES = ["m", "moh", "mohamed", "mohamed sa", "sara", "zz", "2980101", "0100 555", "user4242@", "example.org"]
+
+FIRST_NAMES = ["mohamed"] * 4 + ["ahmed", "sara", "mona", "omar", "youssef", "nour", "karim", "laila",
+                                 "hana", "tarek", "salma", "ali", "fatma", "hassan", "amira", "zeyad"]
+LAST_NAMES = ["salem", "hassan", "mostafa", "ibrahim", "fathy", "saad", "nabil", "kamal", "adel", "samir"]
+
+SEED_SQL = """
+    WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < ?),
+    first(k, name) AS (SELECT key, value FROM json_each(?)),
+    last(k, name) AS (SELECT key, value FROM json_each(?))
+    INSERT INTO patient_search (id, display_name, name_folded, identifiers, phones, email)
+    SELECT i, f.name || ' ' || l.name || ' ' || i, f.name || ' ' || l.name || ' ' || i,
+        printf('2980101%07d', i), printf('20100%07d', i * 7919 % 10000000),
+        printf('user%d@example.%s', i, CASE i % 3 WHEN 0 THEN 'org' ELSE 'com' END)
+    FROM n
+    JOIN first AS f ON f.k = i % ?
+    JOIN last AS l ON l.k = i / ? % ?
+"""
+
+async def main():
+    async with bench_database() as db:
+        await db.execute_query(SEED_SQL, [
+            PATIENTS, json_list(FIRST_NAMES), json_list(LAST_NAMES),
+            len(FIRST_NAMES), len(FIRST_NAMES), len(LAST_NAMES),
+        ])
+        print(f"{PATIENTS} patients, {PATIENTS // 5} named Mohamed, page size {PAGE_SIZE}")
+        for query in QUERIES:
+            report(f"search {query!r}", await measure(lambda: search_patient_ids(query, PAGE_SIZE)))
+
+def json_list(values) -> str:
+    return "[" + ", ".join(f'"{value}"' for value in values) + "]"
+
+if __name__ == "__main__":
+    asyncio.run(main())
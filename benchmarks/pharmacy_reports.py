@@ -0,0 +1,98 @@
+"""Benchmark the pharmacy reports against the per-row Python aggregation they replaced.
+
+Seeds MEDICINES medicines with two lots each and PRESCRIPTIONS dispensed prescriptions
+spread over DAYS days, then builds the daily sales rollups with the same SQL as the
+rollup migration's backfill. Compares:
+
+- inventory totals: INVENTORY_TOTALS_SQL vs loading every active medicine and summing
+  in Python (the original /reports/inventory/ code)
+- sales report: /reports/sales/ over the rollups vs loading every dispensed prescription
+  with its medicine and summing in Python (the original /reports/sales/ code)
+
+    python -m benchmarks.pharmacy_reports
+"""
+import asyncio
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from backend.models import Medicine, MedicineLot, Patient, Practitioner, Prescription
+from backend.routers.pharmacy import INVENTORY_TOTALS_SQL, get_sales_report
+from benchmarks.common import bench_database, measure, report
+
+MEDICINES = 50000
+PRESCRIPTIONS = 100000
+DAYS = 365
+
+ROLLUP_BACKFILL_SQL = """
+    INSERT INTO daily_sales_rollup (day, medicine_id, quantity, amount, prescriptions)
+    SELECT substr(p.dispensed_date, 1, 10), p.medicine_id, SUM(p.quantity_dispensed),
+        ROUND(SUM(CAST(m.unit_price AS REAL) * p.quantity_dispensed), 2), COUNT(*)
+    FROM prescriptions AS p
+    JOIN medicines AS m ON m.id = p.medicine_id
+    WHERE p.status = 'dispensed' AND p.dispensed_date IS NOT NULL
+    GROUP BY substr(p.dispensed_date, 1, 10), p.medicine_id
+"""
+
+async def seed(db):
+    today = date.today()
+    await Medicine.bulk_create([
+        Medicine(name=f"Medicine {i:05d}", generic_name=f"Generic {i}", manufacturer=f"Maker {i % 40}",
+                 dosage_form="tablet", strength="10 mg", category=f"Category {i % 25}",
+                 unit_price=Decimal(f"{1 + i % 97}.{i % 100:02d}"), current_stock=i % 300, minimum_stock=20,
+                 expiry_date=today + timedelta(days=i % 700 - 100), batch_number=f"B{i}")
+        for i in range(MEDICINES)
+    ], batch_size=1000)
+    medicine_ids = await Medicine.all().values_list("id", flat=True)
+    await MedicineLot.bulk_create([
+        MedicineLot(medicine_id=medicine_id, batch_number=f"L{medicine_id}-{n}",
+                    expiry_date=today + timedelta(days=(medicine_id * 7 + n * 300) % 800 - 200), quantity=50)
+        for medicine_id in medicine_ids for n in range(2)
+    ], batch_size=1000)
+
+    patient = await Patient.create(name={"text": "Bench Patient"}, email="patient@bench.test", password_hash="x")
+    doctor = await Practitioner.create(name=[{"text": "Bench Doctor"}], email="doctor@bench.test", password_hash="x")
+    start = datetime.now() - timedelta(days=DAYS)
+    await Prescription.bulk_create([
+        Prescription(patient=patient, prescriber=doctor, pharmacist=doctor, medicine_id=medicine_ids[i % MEDICINES],
+                     dosage="1 tablet", frequency="daily", duration="7 days", quantity_prescribed=7,
+                     quantity_dispensed=1 + i % 7, status="dispensed",
+                     dispensed_date=start + timedelta(minutes=i * DAYS * 24 * 60 // PRESCRIPTIONS))
+        for i in range(PRESCRIPTIONS)
+    ], batch_size=1000)
+    await db.execute_query(ROLLUP_BACKFILL_SQL)
+
+async def inventory_totals_in_python():
+    medicines = await Medicine.filter(active=True)
+    today = date.today()
+    return {
+        "total_medicines": len(medicines),
+        "low_stock_count": len([m for m in medicines if m.current_stock <= m.minimum_stock]),
+        "expired_count": len([m for m in medicines if m.expiry_date < today]),
+        "total_value": sum(float(m.unit_price) * m.current_stock for m in medicines),
+    }
+
+async def sales_in_python():
+    prescriptions = await Prescription.filter(status="dispensed").prefetch_related("medicine")
+    total_sales, medicine_sales = 0, {}
+    for prescription in prescriptions:
+        sale_amount = float(prescription.medicine.unit_price) * prescription.quantity_dispensed
+        total_sales += sale_amount
+        sales = medicine_sales.setdefault(prescription.medicine.name, {"quantity": 0, "amount": 0})
+        sales["quantity"] += prescription.quantity_dispensed
+        sales["amount"] += sale_amount
+    return {"total_sales": total_sales, "total_prescriptions": len(prescriptions), "medicine_sales": medicine_sales}
+
+async def main():
+    async with bench_database() as db:
+        await seed(db)
+        print(f"{MEDICINES} medicines, {2 * MEDICINES} lots, {PRESCRIPTIONS} dispensed prescriptions over {DAYS} days")
+
+        totals_sql = lambda: db.execute_query_dict(INVENTORY_TOTALS_SQL, [date.today().isoformat()])
+        report("inventory totals: Python over every medicine", await measure(inventory_totals_in_python, repeat=5))
+        report("inventory totals: SQL aggregate", await measure(totals_sql))
+
+        sales_rollups = lambda: get_sales_report(current_user={}, start_date=None, end_date=None, group_by="medicine")
+        report("sales report: Python over every prescription", await measure(sales_in_python, repeat=3, warmup=1))
+        report("sales report: daily rollups", await measure(sales_rollups))
+
+if __name__ == "__main__":
+    asyncio.run(main())
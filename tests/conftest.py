@@ -0,0 +1,67 @@
+import os
+
+# Settings read at import time: keep tests off the real stores and make bcrypt cheap
+os.environ.setdefault("VERIFICATION_STORE", "memory")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+import httpx
+import pytest
+from contextlib import contextmanager
+from tortoise import Tortoise, connections
+from backend.main import app
+from backend.search import ensure_search_indexes
+
+TEST_DB = {
+    "connections": {"default": "sqlite://:memory:"},
+    "apps": {"models": {"models": ["backend.models"], "default_connection": "default"}},
+}
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+@pytest.fixture
+async def db():
+    """A fresh in-memory database with every table and search index"""
+    await Tortoise.init(config=TEST_DB)
+    await Tortoise.generate_schemas()
+    await ensure_search_indexes()
+    yield connections.get("default")
+    await Tortoise.close_connections()
+
+@pytest.fixture
+async def client(db):
+    """The API on the test database (app startup and shutdown hooks are not run)"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        yield http
+
+async def register(client, email: str, license_number: str = "", **fields) -> dict:
+    """Register a user (license F... pharmacist, L... laborist, other practitioner,
+    none patient) and return auth headers for them"""
+    payload = {"name": email.split("@")[0], "email": email, "password": "secret", "phone": "0100", **fields}
+    if license_number:
+        payload["licenseNumber"] = license_number
+    else:
+        payload.setdefault("dateOfBirth", "1990-01-01")
+    response = await client.post("/auth/register", json=payload)
+    assert response.status_code == 200, response.text
+    response = await client.post("/auth/token", data={"username": email, "password": "secret"})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+@contextmanager
+def count_queries(connection):
+    """Count the SELECT statements run on a connection inside the block"""
+    queries = []
+    execute_query = connection.execute_query
+
+    async def counting(query, values=None):
+        queries.append(query)
+        return await execute_query(query, values)
+
+    connection.execute_query = counting
+    try:
+        yield queries
+    finally:
+        del connection.execute_query
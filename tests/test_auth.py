@@ -0,0 +1,31 @@
+import pytest
+from backend.auth import create_access_token, get_current_practitioner, principal_cache
+from tests.conftest import register
+
+pytestmark = pytest.mark.anyio
+
+async def test_principal_cache_stats_are_staff_only(client):
+    patient = await register(client, "patient@example.com")
+    staff = [
+        await register(client, "doctor@example.com", license_number="D100"),
+        await register(client, "pharmacist@example.com", license_number="F100"),
+        await register(client, "laborist@example.com", license_number="L100"),
+    ]
+
+    assert (await client.get("/auth/principal-cache/stats", headers=patient)).status_code == 403
+    for headers in staff:
+        response = await client.get("/auth/principal-cache/stats", headers=headers)
+        assert response.status_code == 200
+        assert set(response.json()) == {"size", "maxsize", "hits", "misses"}
+
+async def test_current_practitioner_is_not_the_cached_instance(client):
+    await register(client, "doctor@example.com", license_number="D100")
+    principal_cache.clear()
+    token = create_access_token({"sub": "doctor@example.com", "id": 1, "role": "practitioner"})
+
+    first = await get_current_practitioner(token)
+    first.email = "changed@example.com"
+    second = await get_current_practitioner(token)
+
+    assert second is not first
+    assert second.email == "doctor@example.com"
@@ -0,0 +1,96 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+import pytest
+from backend.alerts import alert_broker
+from backend.models import Medicine, MedicineLot, Patient, Practitioner, Prescription
+from tests.conftest import register
+
+pytestmark = pytest.mark.anyio
+
+async def stocked_medicine(name: str, stock: int) -> Medicine:
+    medicine = await Medicine.create(
+        name=name, generic_name=name, manufacturer="Aura Labs", dosage_form="tablet", strength="10 mg",
+        category="analgesic", unit_price=Decimal("2.50"), current_stock=stock, expiry_date=date(2030, 1, 1),
+        batch_number="B1",
+    )
+    await MedicineLot.create(medicine=medicine, batch_number="B1", expiry_date=date(2030, 1, 1), quantity=stock)
+    return medicine
+
+async def prescribe(medicine: Medicine, quantity: int) -> Prescription:
+    patient = await Patient.first()
+    doctor = await Practitioner.get(email="doctor@example.com")
+    return await Prescription.create(
+        patient=patient, prescriber=doctor, medicine=medicine, dosage="1 tablet", frequency="daily",
+        duration="7 days", quantity_prescribed=quantity,
+    )
+
+@pytest.fixture
+async def pharmacist(client):
+    await register(client, "patient@example.com")
+    await register(client, "doctor@example.com", license_number="D100")
+    headers = await register(client, "pharmacist@example.com", license_number="F100")
+    pharmacist_id = (await Practitioner.get(email="pharmacist@example.com")).id
+    return headers, pharmacist_id
+
+async def test_uncovered_group_rolls_back_only_its_own_items(client, pharmacist):
+    headers, pharmacist_id = pharmacist
+    covered = await stocked_medicine("Covered", 10)
+    short = await stocked_medicine("Short", 3)
+    later = await stocked_medicine("Later", 10)
+    first, second, third = await prescribe(covered, 5), await prescribe(short, 5), await prescribe(later, 4)
+
+    response = await client.post("/api/pharmacy/prescriptions/dispense-batch", headers=headers, json={
+        "pharmacist_id": pharmacist_id,
+        "items": [
+            {"prescription_id": first.id, "quantity_dispensed": 5},
+            {"prescription_id": second.id, "quantity_dispensed": 5},
+            {"prescription_id": third.id, "quantity_dispensed": 4},
+        ],
+    })
+
+    assert response.status_code == 200, response.text
+    assert [item["status"] for item in response.json()["results"]] == ["dispensed", "failed", "dispensed"]
+    statuses = {p.id: p.status for p in await Prescription.all()}
+    assert statuses == {first.id: "dispensed", second.id: "pending", third.id: "dispensed"}
+    stock = {m.name: m.current_stock for m in await Medicine.all()}
+    assert stock == {"Covered": 5, "Short": 3, "Later": 6}
+    lots = {lot.medicine_id: lot.quantity for lot in await MedicineLot.all()}
+    assert lots == {covered.id: 5, short.id: 3, later.id: 6}
+
+@pytest.mark.parametrize("quantity", [0, -5])
+async def test_non_positive_quantities_are_rejected(client, pharmacist, quantity):
+    headers, pharmacist_id = pharmacist
+    medicine = await stocked_medicine("Stocked", 10)
+    prescription = await prescribe(medicine, 5)
+
+    batch = await client.post("/api/pharmacy/prescriptions/dispense-batch", headers=headers, json={
+        "pharmacist_id": pharmacist_id, "items": [{"prescription_id": prescription.id, "quantity_dispensed": quantity}],
+    })
+    single = await client.post(f"/api/pharmacy/prescriptions/{prescription.id}/dispense", headers=headers, json={
+        "pharmacist_id": pharmacist_id, "quantity_dispensed": quantity,
+    })
+
+    assert batch.status_code == 422
+    assert single.status_code == 422
+    assert (await Medicine.get(id=medicine.id)).current_stock == 10
+
+async def test_concurrent_dispenses_publish_a_threshold_crossing_once(client, pharmacist):
+    headers, pharmacist_id = pharmacist
+    medicine = await stocked_medicine("Crossing", 20)  # minimum_stock defaults to 10
+    prescriptions = [await prescribe(medicine, 4) for _ in range(5)]
+    alerts = asyncio.Queue()
+    alert_broker._subscribers.add(alerts)
+    try:
+        responses = await asyncio.gather(*(
+            client.post(f"/api/pharmacy/prescriptions/{prescription.id}/dispense", headers=headers, json={
+                "pharmacist_id": pharmacist_id, "quantity_dispensed": 4,
+            })
+            for prescription in prescriptions
+        ))
+    finally:
+        alert_broker._subscribers.discard(alerts)
+
+    assert [response.status_code for response in responses] == [200] * 5
+    published = [alerts.get_nowait()[1] for _ in range(alerts.qsize())]
+    assert [(alert["type"], alert["current_stock"]) for alert in published] == [("low_stock", 8)]
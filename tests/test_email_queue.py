@@ -0,0 +1,78 @@
+import asyncio
+import smtplib
+from email.mime.text import MIMEText
+import pytest
+from backend import auth
+from backend.email_queue import EmailQueue
+from tests.conftest import register
+
+pytestmark = pytest.mark.anyio
+
+class StubSMTP:
+    """Records sent messages; fails the first ``failures`` sends with a refused recipient"""
+    sessions = 0
+
+    def __init__(self, failures: int = 0):
+        StubSMTP.sessions += 1
+        self.failures = failures
+        self.sent = []
+
+    def noop(self):
+        return (250, b"OK")
+
+    def send_message(self, message):
+        if self.failures:
+            self.failures -= 1
+            raise smtplib.SMTPRecipientsRefused({message["To"]: (450, b"try later")})
+        self.sent.append(message)
+
+    def quit(self):
+        pass
+
+def message(to: str) -> MIMEText:
+    msg = MIMEText("code")
+    msg["To"] = to
+    return msg
+
+def stub_queue(monkeypatch, failures: int = 0, **options) -> tuple:
+    queue = EmailQueue("smtp.test", 25, backoff_seconds=0, **options)
+    StubSMTP.sessions = 0
+    session = StubSMTP(failures)
+    monkeypatch.setattr(queue, "_open_session", lambda: session)
+    return queue, session
+
+async def test_queue_drains_over_one_reused_session(monkeypatch):
+    queue, session = stub_queue(monkeypatch, workers=1, batch_size=3)
+    for i in range(7):
+        queue.enqueue(message(f"user{i}@example.com"))
+    await queue.stop()
+
+    assert [m["To"] for m in session.sent] == [f"user{i}@example.com" for i in range(7)]
+    assert queue.sent == 7
+    assert StubSMTP.sessions == 1
+
+async def test_refused_messages_are_retried(monkeypatch):
+    queue, session = stub_queue(monkeypatch, failures=1, workers=1)
+    queue.enqueue(message("user@example.com"))
+    await asyncio.sleep(0.05)
+    await queue.stop()
+
+    assert [m["To"] for m in session.sent] == ["user@example.com"]
+    assert queue.failed == 0
+
+async def test_enqueue_raises_when_full(monkeypatch):
+    queue, _ = stub_queue(monkeypatch, maxsize=1)
+    queue.enqueue(message("first@example.com"))
+    with pytest.raises(asyncio.QueueFull):
+        queue.enqueue(message("second@example.com"))
+    await queue.stop()
+
+async def test_send_reset_code_returns_503_when_queue_is_full(client, monkeypatch):
+    await register(client, "patient@example.com")
+
+    def full(msg):
+        raise asyncio.QueueFull
+    monkeypatch.setattr(auth.email_queue, "enqueue", full)
+
+    response = await client.post("/auth/send-reset-code", json={"email": "patient@example.com", "mobileNumber": "0100"})
+    assert response.status_code == 503
@@ -0,0 +1,99 @@
+import re
+from contextlib import contextmanager
+from datetime import date
+import pytest
+from backend.models import Appointment, ClinicalNote, LabTest, Patient, Practitioner, Prescription, Scan, VitalSigns
+from backend.routers.appointments import get_appointments
+from backend.routers.laborist import get_laborist_appointments
+from backend.routers.medical_records import (
+    COMPREHENSIVE_SECTIONS, get_comprehensive_medical_record, get_patient_clinical_notes, get_patient_vital_signs
+)
+
+pytestmark = pytest.mark.anyio
+
+# Filtered keyset pages as the list endpoints build them: equality filters, then
+# ``id > cursor ORDER BY id LIMIT page + 1``. Each must seek an index that already
+# yields rows in id order, without sorting the matches in a temp B-tree.
+KEYSET_PAGES = [
+    (Prescription, {"status": "pending"}),
+    (Prescription, {"patient_id": 1}),
+    (Prescription, {"status": "pending", "patient_id": 1}),
+    (LabTest, {"laborist_id": 1}),
+    (LabTest, {"laborist_id": 1, "status": "pending", "urgent": True}),
+    (LabTest, {"patient_id": 1}),
+    (Scan, {"laborist_id": 1}),
+    (Scan, {"laborist_id": 1, "status": "pending"}),
+    (Scan, {"patient_id": 1}),
+]
+
+@pytest.mark.parametrize("model, filters", KEYSET_PAGES, ids=lambda value: "-".join(value) if isinstance(value, dict) else value.__name__)
+async def test_filtered_keyset_page_uses_index_order(db, model, filters):
+    page = model.filter(**filters).filter(id__gt=100).order_by("id").limit(51)
+    plan = await db.execute_query_dict("EXPLAIN QUERY PLAN " + page.sql(params_inline=True))
+    details = [step["detail"] for step in plan]
+    assert any("USING INDEX" in detail for detail in details), details
+    assert not any("TEMP B-TREE" in detail for detail in details), details
+
+# Router handlers run against the test database; every statement they issue on these
+# tables must search an index rather than scan the table or sort its rows.
+INDEXED_TABLES = {
+    model._meta.db_table
+    for model in [Appointment, VitalSigns, ClinicalNote, *(section[1] for section in COMPREHENSIVE_SECTIONS)]
+}
+TABLE_STEP = re.compile(r"^(?:SCAN|SEARCH) (\w+)")
+
+ROUTER_QUERIES = {
+    "appointments-doctor-date": lambda doctor, patient: get_appointments(
+        current_user={"role": "practitioner", "id": doctor.id}, patient_id=None, doctor_id=None, date=date.today()),
+    "appointments-patient-date": lambda doctor, patient: get_appointments(
+        current_user={"role": "patient", "id": patient.id}, patient_id=None, doctor_id=None, date=date.today()),
+    "laborist-appointments-date": lambda doctor, patient: get_laborist_appointments(
+        current_user={"role": "laborist", "id": doctor.id}, date=date.today()),
+    "vital-signs": lambda doctor, patient: get_patient_vital_signs(patient.id, limit=10, current_practitioner=doctor),
+    "clinical-notes": lambda doctor, patient: get_patient_clinical_notes(
+        patient.id, note_type=None, limit=20, current_practitioner=doctor),
+    "clinical-notes-by-type": lambda doctor, patient: get_patient_clinical_notes(
+        patient.id, note_type="progress", limit=20, current_practitioner=doctor),
+    "comprehensive-record": lambda doctor, patient: get_comprehensive_medical_record(
+        patient.id, single_query=False, current_practitioner=doctor),
+    "comprehensive-record-single-query": lambda doctor, patient: get_comprehensive_medical_record(
+        patient.id, single_query=True, current_practitioner=doctor),
+}
+
+@contextmanager
+def capture_queries(connection):
+    """Record the (SQL, values) of every statement run on a connection inside the block"""
+    queries = []
+
+    def capturing(execute):
+        async def run(query, values=None):
+            queries.append((query, values))
+            return await execute(query, values)
+        return run
+
+    connection.execute_query = capturing(connection.execute_query)
+    connection.execute_query_dict = capturing(connection.execute_query_dict)
+    try:
+        yield queries
+    finally:
+        del connection.execute_query, connection.execute_query_dict
+
+@pytest.mark.parametrize("handler", ROUTER_QUERIES.values(), ids=ROUTER_QUERIES.keys())
+async def test_router_queries_use_indexes(db, handler):
+    doctor = await Practitioner.create(name=[{"text": "Doctor"}], email="doctor@example.com", password_hash="x")
+    patient = await Patient.create(name={"text": "Patient"}, email="patient@example.com", password_hash="x")
+
+    with capture_queries(db) as queries:
+        await handler(doctor, patient)
+
+    checked = set()
+    for query, values in queries:
+        plan = await db.execute_query_dict("EXPLAIN QUERY PLAN " + query, values)
+        details = [step["detail"] for step in plan]
+        for detail in details:
+            table = TABLE_STEP.match(detail)
+            if table and table.group(1) in INDEXED_TABLES:
+                checked.add(table.group(1))
+                assert "USING INDEX" in detail or "USING COVERING INDEX" in detail, details
+        assert not any("TEMP B-TREE" in detail for detail in details), details
+    assert checked, "handler issued no query on an indexed table"
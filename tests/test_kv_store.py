@@ -0,0 +1,51 @@
+import sqlite3
+import pytest
+from backend.kv_store import ExpiringStore, MemoryExpiringStore, SQLiteExpiringStore
+
+pytestmark = pytest.mark.anyio
+
+def test_base_store_is_abstract():
+    with pytest.raises(TypeError):
+        ExpiringStore()
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return MemoryExpiringStore(max_entries=3)
+    return SQLiteExpiringStore(str(tmp_path / "kv.sqlite3"), max_entries=3, sweep_every=100)
+
+async def test_expired_values_are_not_returned(store):
+    await store.set("live", {"code": "123456"}, 60)
+    await store.set("expired", {"code": "654321"}, -1)
+    assert await store.get("live") == {"code": "123456"}
+    assert await store.get("expired") is None
+    await store.delete("live")
+    assert await store.get("live") is None
+
+async def test_cap_is_enforced_on_every_insert(store):
+    for i in range(10):
+        await store.set(f"key{i}", i, 60 + i)
+    assert [await store.get(f"key{i}") for i in range(10)] == [None] * 7 + [7, 8, 9]
+    if isinstance(store, SQLiteExpiringStore):
+        with sqlite3.connect(store.path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM kv_store").fetchone()[0] == 3
+
+async def test_sqlite_writes_track_the_row_count_without_counting(tmp_path):
+    path = str(tmp_path / "kv.sqlite3")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE kv_store (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)")
+        conn.executemany("INSERT INTO kv_store VALUES (?, '0', 1e12)", [("old1",), ("old2",)])
+    store = SQLiteExpiringStore(path, max_entries=5, sweep_every=3)
+    statements = []
+    store._connect().set_trace_callback(statements.append)
+
+    await store.set("a", 1, 60)
+    await store.set("a", 2, 60)
+    await store.set("expired", 3, -1)
+    await store.set("b", 4, 60)
+    await store.delete("old1")
+
+    assert not any("COUNT(" in statement for statement in statements), statements
+    with sqlite3.connect(path) as conn:
+        entries = conn.execute("SELECT entries FROM kv_store_meta").fetchone()[0]
+        assert entries == conn.execute("SELECT COUNT(*) FROM kv_store").fetchone()[0] == 3
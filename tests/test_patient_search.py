@@ -0,0 +1,39 @@
+import pytest
+from backend import patient_search
+from backend.models import Patient
+from backend.patient_search import search_patient_ids
+
+pytestmark = pytest.mark.anyio
+
+async def create_patient(name: str, email: str, phone: str = "", national_id: str = "") -> Patient:
+    return await Patient.create(
+        name=[{"use": "official", "text": name}], email=email, password_hash="x",
+        telecom=[{"system": "phone", "value": phone}], identifier=[{"system": "national_id", "value": national_id}],
+    )
+
+async def test_leading_name_match_survives_the_candidate_cap(db, monkeypatch):
+    monkeypatch.setattr(patient_search, "SEARCH_CANDIDATES", 100)
+    for i in range(150):
+        await create_patient(f"Aaron Abbot{i:03d}", f"aaron{i}@example.com")
+    abigail = await create_patient("Abigail Stone", "abigail@example.com")
+
+    ids = await search_patient_ids("ab", 10)
+
+    assert ids[0] == abigail.id
+    assert len(ids) == 10
+
+async def test_email_matches_are_kept(db):
+    jane = await create_patient("Jane Roe", "Jane.Roe@Clinic.org")
+    john = await create_patient("John Smith", "jsmith@example.com")
+
+    assert await search_patient_ids("jane.roe@clinic.org", 10) == [jane.id]
+    assert await search_patient_ids("example.com", 10) == [john.id]
+    assert await search_patient_ids("clinic", 10) == [jane.id]
+
+async def test_name_id_and_phone_matches_come_before_email_matches(db):
+    smith = await create_patient("Mary Smith", "mary@example.com", phone="+20 100 555 1234", national_id="29801011234567")
+    other = await create_patient("Other Person", "smithers@example.com")
+
+    assert await search_patient_ids("smith", 10) == [smith.id, other.id]
+    assert await search_patient_ids("0100 555", 10) == [smith.id]
+    assert await search_patient_ids("2980101", 10) == [smith.id]
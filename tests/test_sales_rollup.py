@@ -0,0 +1,29 @@
+from datetime import date
+from decimal import Decimal
+import pytest
+from backend.models import Medicine
+from backend.routers.pharmacy import get_sales_report, record_daily_sale
+
+pytestmark = pytest.mark.anyio
+
+async def create_medicine(name: str, unit_price: str) -> Medicine:
+    return await Medicine.create(
+        name=name, generic_name=name, manufacturer="Aura Labs", dosage_form="tablet", strength="10 mg",
+        category="analgesic", unit_price=Decimal(unit_price), expiry_date=date(2030, 1, 1), batch_number="B1",
+    )
+
+async def test_sales_report_sums_rollup_inserts_and_updates(db):
+    first = await create_medicine("Alpha", "0.10")
+    second = await create_medicine("Beta", "0.10")
+    day = date(2026, 1, 1)
+    await record_daily_sale(db, day, first, 3)
+    await record_daily_sale(db, day, second, 3)
+    await record_daily_sale(db, day, second, 3)
+    await record_daily_sale(db, day, second, -3)
+
+    amounts = await db.execute_query_dict("SELECT amount FROM daily_sales_rollup ORDER BY medicine_id")
+    assert [float(row["amount"]) for row in amounts] == [0.3, 0.3]
+
+    report = await get_sales_report(current_user={}, start_date=None, end_date=None, group_by="medicine")
+    assert report["total_sales"] == 0.6
+    assert report["medicine_sales"] == {"Alpha": {"quantity": 3, "amount": 0.3}, "Beta": {"quantity": 3, "amount": 0.3}}
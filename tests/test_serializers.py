@@ -0,0 +1,30 @@
+from datetime import date
+import pytest
+from backend.models import Appointment, Patient, Practitioner
+from backend.serializers import serialize_appointments
+from tests.conftest import count_queries
+
+pytestmark = pytest.mark.anyio
+
+async def test_appointment_listing_runs_constant_queries(db):
+    doctors = [
+        await Practitioner.create(name=[{"text": f"Doctor {i}"}], email=f"doctor{i}@example.com", password_hash="x")
+        for i in range(5)
+    ]
+    patients = [
+        await Patient.create(name=[{"text": f"Patient {i}"}], email=f"patient{i}@example.com", password_hash="x")
+        for i in range(20)
+    ]
+    await Appointment.bulk_create([
+        Appointment(patient=patients[i % 20], doctor=doctors[i % 5], date=date(2026, 1, 1), time="09:00", reason="checkup")
+        for i in range(1000)
+    ])
+
+    with count_queries(db) as queries:
+        appointments = await Appointment.all()
+        results = await serialize_appointments(appointments)
+
+    assert len(results) == 1000
+    assert len(queries) == 3
+    assert results[0]["doctorDetails"]["email"] == "doctor0@example.com"
+    assert results[1]["patientDetails"]["email"] == "patient1@example.com"
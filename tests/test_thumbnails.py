@@ -0,0 +1,34 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+from PIL import Image
+from backend import thumbnails
+
+pytestmark = pytest.mark.anyio
+
+@pytest.fixture
+def image_file(tmp_path):
+    path = str(tmp_path / "scan.png")
+    Image.new("RGB", (300, 200), "white").save(path)
+    yield path
+    thumbnails.shutdown_thumbnail_pool()
+
+def die(*args):
+    os._exit(1)  # As a worker killed for running out of memory would
+
+async def test_dead_worker_does_not_break_later_renders(image_file, monkeypatch):
+    render = thumbnails._render_thumbnails
+    monkeypatch.setattr(thumbnails, "_pool", ProcessPoolExecutor(max_workers=1))
+    monkeypatch.setattr(thumbnails, "_render_thumbnails", die)
+    assert not await thumbnails.generate_thumbnails(image_file, "image/png")
+    assert thumbnails._pool is None
+
+    monkeypatch.setattr(thumbnails, "_render_thumbnails", render)
+    assert await thumbnails.generate_thumbnails(image_file, "image/png")
+    assert os.path.exists(thumbnails.thumbnail_path(image_file, "small"))
+
+async def test_oversized_images_are_refused_before_decoding(image_file, monkeypatch):
+    monkeypatch.setattr(thumbnails, "THUMBNAIL_MAX_PIXELS", 300 * 200 - 1)
+    with pytest.raises(Image.DecompressionBombError):
+        thumbnails._render_thumbnails(image_file, "image/png", (("small", 128),))
+    assert not os.path.exists(thumbnails.thumbnail_path(image_file, "small"))
@@ -0,0 +1,30 @@
+import asyncio
+from datetime import timedelta
+import pytest
+from tortoise import timezone
+from backend.main import start_upload_session_collector, stop_upload_session_collector
+from backend.models import Patient, Practitioner, UploadSession
+from backend.routers.laborist import UPLOAD_SESSION_TTL
+
+pytestmark = pytest.mark.anyio
+
+async def test_startup_collects_sessions_abandoned_by_a_previous_run(db):
+    patient = await Patient.create(name={"text": "Patient"}, email="patient@example.com", password_hash="x")
+    laborist = await Practitioner.create(name=[{"text": "Laborist"}], email="laborist@example.com", password_hash="x")
+    sessions = [
+        await UploadSession.create(patient=patient, uploaded_by=laborist, file_name=f"scan{i}.dcm",
+                                   file_type="application/dicom", total_size=1024, chunk_size=1024)
+        for i in range(2)
+    ]
+    await UploadSession.filter(id=sessions[0].id).update(updated_at=timezone.now() - UPLOAD_SESSION_TTL - timedelta(minutes=1))
+
+    await start_upload_session_collector()
+    try:
+        for _ in range(50):
+            if not await UploadSession.exists(id=sessions[0].id):
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await stop_upload_session_collector()
+
+    assert await UploadSession.all().values_list("id", flat=True) == [sessions[1].id]
@@ -0,0 +1,32 @@
+import pytest
+from backend.models import Patient, Practitioner, UserDirectory
+from tests.conftest import register
+
+pytestmark = pytest.mark.anyio
+
+async def test_email_owned_by_other_table_is_rejected_without_orphan(client):
+    await register(client, "shared@example.com", license_number="D100")
+
+    response = await client.post("/patients/", json={
+        "name": {"text": "Duplicate"}, "email": "shared@example.com", "password_hash": "x",
+    })
+
+    assert response.status_code == 422
+    assert await Patient.filter(email="shared@example.com").count() == 0
+    assert await UserDirectory.filter(email="shared@example.com").values_list("user_table", flat=True) == ["practitioner"]
+
+async def test_saving_own_email_is_allowed(client):
+    await register(client, "doctor@example.com", license_number="D100")
+    doctor = await Practitioner.get(email="doctor@example.com")
+    doctor.telecom = [{"system": "phone", "value": "0200"}]
+    await doctor.save()
+    assert (await UserDirectory.get(email="doctor@example.com")).phones == ["0200"]
+
+async def test_inactive_user_cannot_log_in(client):
+    await register(client, "patient@example.com")
+    patient = await Patient.get(email="patient@example.com")
+    patient.active = False
+    await patient.save()
+
+    response = await client.post("/auth/token", data={"username": "patient@example.com", "password": "secret"})
+    assert response.status_code == 403